@@ -0,0 +1,16 @@
+from data import generate_signal_values
+from registry import benchmark
+
+from grisera.time_series.time_series_model import TimeSeriesOut, Type
+
+
+@benchmark()
+def time_series_out_construction(size: int):
+    signal_values = generate_signal_values(size, Type.timestamp)
+    return lambda: TimeSeriesOut(id=1, type=Type.timestamp, signal_values=signal_values)
+
+
+@benchmark()
+def time_series_out_serialization(size: int):
+    time_series = TimeSeriesOut(id=1, type=Type.epoch, signal_values=generate_signal_values(size, Type.epoch))
+    return lambda: time_series.json()
@@ -0,0 +1,58 @@
+from fastapi import FastAPI
+
+from data import generate_time_series
+from in_memory_service import InMemoryTimeSeriesService, InMemoryServiceFactory, call_app
+from registry import benchmark
+
+from grisera.services.service import service
+from grisera.time_series.time_series_model import Type
+from grisera.time_series.time_series_router import router as time_series_router
+
+
+def create_app(*time_series):
+    time_series_service = InMemoryTimeSeriesService(persist_saved=False)
+    for single_time_series in time_series:
+        time_series_service.add_time_series(single_time_series)
+    service.service_factory = InMemoryServiceFactory(time_series_service)
+    app = FastAPI()
+    app.include_router(time_series_router)
+    return app
+
+
+@benchmark(max_size=10 ** 6)
+def router_get_time_series(size: int):
+    app = create_app(generate_time_series(size, Type.timestamp))
+    return lambda: call_app(app, "GET", "/time_series/0", query_string="depth=0")
+
+
+@benchmark(max_size=10 ** 6)
+def router_create_time_series(size: int):
+    time_series = generate_time_series(size, Type.timestamp)
+    body = {"type": "Timestamp", "signal_values": [
+        {"timestamp": signal_value["timestamp"]["properties"][0]["value"],
+         "signal_value": {"value": signal_value["signal_value"]["properties"][0]["value"]}}
+        for signal_value in time_series.signal_values]}
+    app = create_app()
+    return lambda: call_app(app, "POST", "/time_series", body)
+
+
+@benchmark(max_size=10 ** 6)
+def router_transform_time_series_resample(size: int):
+    app = create_app(generate_time_series(size, Type.timestamp))
+    body = {"name": "resample_nearest", "source_time_series_ids": [0],
+            "additional_properties": [{"key": "period", "value": "10"}]}
+    return lambda: call_app(app, "POST", "/time_series/transformation", body)
+
+
+@benchmark(max_size=10 ** 6)
+def router_transform_time_series_pipeline(size: int):
+    time_series_x = generate_time_series(size, Type.timestamp, seed=1)
+    time_series_y = generate_time_series(size, Type.timestamp, seed=2, id_offset=2 * size + 2)
+    time_series_y.id = 1
+    app = create_app(time_series_x, time_series_y)
+    period = [{"key": "period", "value": "10"}]
+    body = {"source_time_series_ids": [0, 1], "steps": [
+        {"name": "resample_nearest", "inputs": [0], "additional_properties": period},
+        {"name": "resample_nearest", "inputs": [1], "additional_properties": period},
+        {"name": "quadrants", "inputs": [2, 3]}]}
+    return lambda: call_app(app, "POST", "/time_series/transformation/pipeline", body)
@@ -0,0 +1,82 @@
+from data import generate_time_series
+from registry import benchmark
+
+from grisera.property.property_model import PropertyIn
+from grisera.time_series.time_series_model import Type, TransformationType
+from grisera.time_series.transformation.TimeSeriesTransformationBandPower import TimeSeriesTransformationBandPower
+from grisera.time_series.transformation.TimeSeriesTransformationQuadrants import TimeSeriesTransformationQuadrants
+from grisera.time_series.transformation.TimeSeriesTransformationResample import TimeSeriesTransformationResample
+from grisera.time_series.transformation.TimeSeriesTransformationResampleLinear import \
+    TimeSeriesTransformationResampleLinear
+from grisera.time_series.transformation.TimeSeriesTransformationResamplePrevious import \
+    TimeSeriesTransformationResamplePrevious
+from grisera.time_series.transformation.TimeSeriesTransformationWindow import TimeSeriesTransformationWindow
+from grisera.time_series.transformation.multidimensional.TimeSeriesTransformationMultidimensional import \
+    TimeSeriesTransformationMultidimensional
+
+
+@benchmark()
+def resample_nearest_timestamp(size: int):
+    time_series = [generate_time_series(size, Type.timestamp)]
+    return lambda: TimeSeriesTransformationResample().transform(time_series, [PropertyIn(key="period", value="10")])
+
+
+@benchmark()
+def resample_nearest_epoch(size: int):
+    time_series = [generate_time_series(size, Type.epoch)]
+    return lambda: TimeSeriesTransformationResample().transform(time_series, [PropertyIn(key="period", value="10")])
+
+
+@benchmark()
+def resample_linear_timestamp(size: int):
+    time_series = [generate_time_series(size, Type.timestamp)]
+    return lambda: TimeSeriesTransformationResampleLinear().transform(time_series,
+                                                                      [PropertyIn(key="period", value="10")])
+
+
+@benchmark()
+def resample_previous_epoch(size: int):
+    time_series = [generate_time_series(size, Type.epoch)]
+    return lambda: TimeSeriesTransformationResamplePrevious().transform(time_series,
+                                                                        [PropertyIn(key="period", value="10")])
+
+
+@benchmark()
+def window_mean_sliding(size: int):
+    time_series = [generate_time_series(size, Type.timestamp)]
+    properties = [PropertyIn(key="window", value="1000"), PropertyIn(key="step", value="100")]
+    return lambda: TimeSeriesTransformationWindow(TransformationType.WINDOW_MEAN).transform(time_series, properties)
+
+
+@benchmark()
+def window_max_sliding(size: int):
+    time_series = [generate_time_series(size, Type.timestamp)]
+    properties = [PropertyIn(key="window", value="1000"), PropertyIn(key="step", value="100")]
+    return lambda: TimeSeriesTransformationWindow(TransformationType.WINDOW_MAX).transform(time_series, properties)
+
+
+@benchmark()
+def band_power_timestamp(size: int):
+    time_series = [generate_time_series(size, Type.timestamp)]
+    return lambda: TimeSeriesTransformationBandPower().transform_bands(time_series, None)
+
+
+@benchmark()
+def quadrants_timestamp(size: int):
+    time_series = [generate_time_series(size, Type.timestamp, seed=1),
+                   generate_time_series(size, Type.timestamp, seed=1, id_offset=2 * size + 2)]
+    return lambda: TimeSeriesTransformationQuadrants().transform(time_series, None)
+
+
+@benchmark()
+def quadrants_epoch(size: int):
+    time_series = [generate_time_series(size, Type.epoch, seed=1),
+                   generate_time_series(size, Type.epoch, seed=1, id_offset=2 * size + 2)]
+    return lambda: TimeSeriesTransformationQuadrants().transform(time_series, None)
+
+
+@benchmark()
+def multidimensional_timestamp(size: int):
+    time_series = [generate_time_series(size, Type.timestamp, seed=2, id_offset=index * (2 * size + 2))
+                   for index in range(3)]
+    return lambda: TimeSeriesTransformationMultidimensional().transform(time_series)
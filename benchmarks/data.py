@@ -0,0 +1,61 @@
+import math
+import random
+
+from grisera.time_series.time_series_model import TimeSeriesOut, Type
+
+
+def generate_signal_values(size: int, series_type: Type = Type.timestamp, period: int = 4, seed: int = 0,
+                           id_offset: int = 0):
+    """
+    Generate signal values of a synthetic signal in the format returned by services
+
+    The signal is a sine wave with noise sampled every `period` milliseconds with a small jitter. Epoch signal
+    values last half of the period.
+
+    Args:
+        size (int): Number of signal values
+        series_type (Type): Type of the time series
+        period (int): Mean difference between timestamps in milliseconds
+        seed (int): Seed of random generator
+        id_offset (int): First node id
+
+    Returns:
+        List of signal values
+    """
+    generator = random.Random(seed)
+    signal_values = []
+    timestamp = 0
+    for index in range(size):
+        timestamp += period + generator.randint(-period // 4, period // 4) if index > 0 else 0
+        value = round(100 * math.sin(index / 50) + generator.gauss(0, 10), 3)
+        node_id = id_offset + 2 * index
+        if series_type == Type.timestamp:
+            timestamp_properties = [{"key": "timestamp", "value": timestamp}]
+        else:
+            timestamp_properties = [{"key": "start_timestamp", "value": timestamp},
+                                    {"key": "end_timestamp", "value": timestamp + period // 2}]
+        signal_values.append({
+            "signal_value": {"labels": ["Signal Value"], "id": node_id + 1,
+                             "properties": [{"key": "value", "value": value}]},
+            "timestamp": {"labels": ["Timestamp"], "id": node_id, "properties": timestamp_properties}
+        })
+    return signal_values
+
+
+def generate_time_series(size: int, series_type: Type = Type.timestamp, period: int = 4, seed: int = 0,
+                         id_offset: int = 0):
+    """
+    Generate synthetic time series
+
+    Args:
+        size (int): Number of signal values
+        series_type (Type): Type of the time series
+        period (int): Mean difference between timestamps in milliseconds
+        seed (int): Seed of random generator
+        id_offset (int): First node id
+
+    Returns:
+        Time series object
+    """
+    return TimeSeriesOut(id=id_offset, type=series_type,
+                         signal_values=generate_signal_values(size, series_type, period, seed, id_offset + 1))
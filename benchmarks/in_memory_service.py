@@ -0,0 +1,118 @@
+import asyncio
+import json
+from typing import Union, Optional
+
+from grisera.models.not_found_model import NotFoundByIdModel
+from grisera.services.not_implemented_service_factory import NotImplementedServiceFactory
+from grisera.time_series.time_series_model import TimeSeriesIn, TimeSeriesOut, TimeSeriesTransformationIn, Type, \
+    TimeSeriesTransformationPipelineIn
+from grisera.time_series.time_series_service import TimeSeriesService
+from grisera.time_series.transformation.TimeSeriesTransformationFactory import TimeSeriesTransformationFactory
+from grisera.time_series.transformation.TimeSeriesTransformationPipeline import TimeSeriesTransformationPipeline
+
+
+class InMemoryTimeSeriesService(TimeSeriesService):
+    """
+    Time series service keeping time series in a dictionary, used to benchmark routers without a database
+
+    Attributes:
+        time_series (dict): Time series by id
+        persist_saved (bool): Keep saved time series, disabled to not grow memory during repeated benchmark runs
+    """
+
+    def __init__(self, persist_saved: bool = True):
+        self.time_series = {}
+        self.next_id = 0
+        self.persist_saved = persist_saved
+
+    def add_time_series(self, time_series: TimeSeriesOut):
+        self.time_series[time_series.id] = time_series
+        self.next_id = max(self.next_id, int(time_series.id) + 1)
+        return time_series
+
+    def save_time_series(self, time_series: TimeSeriesIn):
+        time_series_id = self.next_id
+        self.next_id += 1
+        signal_values = []
+        for index, signal in enumerate(time_series.signal_values):
+            if time_series.type == Type.timestamp:
+                timestamp_properties = [{"key": "timestamp", "value": signal.timestamp}]
+            else:
+                timestamp_properties = [{"key": "start_timestamp", "value": signal.start_timestamp},
+                                        {"key": "end_timestamp", "value": signal.end_timestamp}]
+            signal_values.append({
+                "signal_value": {"id": f"{time_series_id}.{index}",
+                                 "properties": [{"key": "value", "value": signal.signal_value.value}]},
+                "timestamp": {"id": f"{time_series_id}.{index}.t", "properties": timestamp_properties}
+            })
+        new_time_series = TimeSeriesOut(id=time_series_id, type=time_series.type,
+                                        additional_properties=time_series.additional_properties,
+                                        signal_values=signal_values)
+        return self.add_time_series(new_time_series) if self.persist_saved else new_time_series
+
+    def transform_time_series(self, time_series_transformation: TimeSeriesTransformationIn):
+        source_time_series = [self.time_series[int(time_series_id)]
+                              for time_series_id in time_series_transformation.source_time_series_ids]
+        transformation = TimeSeriesTransformationFactory().get_transformation(time_series_transformation.name)
+        new_time_series, _ = transformation.transform(source_time_series,
+                                                      time_series_transformation.additional_properties)
+        return self.save_time_series(new_time_series)
+
+    def transform_time_series_pipeline(self, pipeline: TimeSeriesTransformationPipelineIn):
+        source_time_series = [self.time_series[int(time_series_id)]
+                              for time_series_id in pipeline.source_time_series_ids]
+        new_time_series, _ = TimeSeriesTransformationPipeline().run(source_time_series, pipeline.steps)
+        return self.save_time_series(new_time_series)
+
+    def get_time_series(self, time_series_id: Union[int, str], depth: int = 0,
+                        signal_min_value: Optional[int] = None,
+                        signal_max_value: Optional[int] = None):
+        if int(time_series_id) not in self.time_series:
+            return NotFoundByIdModel(id=time_series_id, errors={"errors": "time series not found"})
+        return self.time_series[int(time_series_id)]
+
+
+class InMemoryServiceFactory(NotImplementedServiceFactory):
+    def __init__(self, time_series_service: InMemoryTimeSeriesService):
+        self.time_series_service = time_series_service
+
+    def get_time_series_service(self) -> TimeSeriesService:
+        return self.time_series_service
+
+
+def call_app(app, method: str, path: str, body=None, query_string: str = ""):
+    """
+    Call ASGI application in process without a server
+
+    Args:
+        app: ASGI application
+        method (str): HTTP method
+        path (str): Request path
+        body: Object sent as JSON body
+        query_string (str): Query string without leading question mark
+
+    Returns:
+        Tuple of status code and response body
+    """
+    request_body = json.dumps(body).encode() if body is not None else b""
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method, "scheme": "http",
+             "path": path, "root_path": "", "query_string": query_string.encode(), "server": ("benchmark", 80),
+             "headers": [(b"content-type", b"application/json")]}
+    messages = []
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": request_body, "more_body": False}
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    status = next(message["status"] for message in messages if message["type"] == "http.response.start")
+    response_body = b"".join(message.get("body", b"") for message in messages
+                             if message["type"] == "http.response.body")
+    return status, response_body
@@ -0,0 +1,24 @@
+BENCHMARKS = {}
+
+
+def benchmark(name: str = None, max_size: int = None):
+    """
+    Register benchmark function
+
+    Benchmark function takes number of signal values and returns function to be timed. Everything done before
+    returning the timed function is the setup and is not measured.
+
+    Args:
+        name (str): Name of benchmark, function name by default
+        max_size (int): The greatest number of signal values this benchmark is run with
+
+    Returns:
+        Decorator registering benchmark function
+    """
+
+    def decorator(function):
+        function.max_size = max_size
+        BENCHMARKS[name or function.__name__] = function
+        return function
+
+    return decorator
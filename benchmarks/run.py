@@ -0,0 +1,117 @@
+"""
+Run benchmarks of grisera time series transformations, models and routers
+
+Usage:
+    python benchmarks/run.py [--sizes 1000,10000,100000] [--repeat 5] [--filter quadrants]
+                             [--output results.json] [--compare baseline.json] [--threshold 1.2]
+
+Every benchmark is run for each size (number of signal values) up to its maximal size. Synthetic data is generated
+with fixed seeds, so results of two runs on the same machine are comparable. When a baseline file is given,
+benchmarks with median time greater than baseline median multiplied by threshold are reported as regressions and
+the script exits with status 1.
+"""
+import argparse
+import gc
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+BENCHMARK_MODULES = ["bench_transformations", "bench_models", "bench_routers"]
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from registry import BENCHMARKS  # noqa: E402
+
+
+def measure(function, repeat: int):
+    """
+    Measure execution times of function
+
+    Args:
+        function: Function to be measured
+        repeat (int): Number of measurements
+
+    Returns:
+        List of execution times in seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return timings
+
+
+def run(sizes, repeat: int, name_filter: str = None):
+    results = []
+    for name, benchmark_function in BENCHMARKS.items():
+        if name_filter is not None and name_filter not in name:
+            continue
+        for size in sizes:
+            if benchmark_function.max_size is not None and size > benchmark_function.max_size:
+                continue
+            timed_function = benchmark_function(size)
+            timings = measure(timed_function, repeat)
+            result = {"name": name, "size": size, "min": min(timings), "median": statistics.median(timings),
+                      "repeat": repeat}
+            results.append(result)
+            print(f"{name:<45} {size:>10} {result['min'] * 1000:>12.3f} ms {result['median'] * 1000:>12.3f} ms",
+                  flush=True)
+            del timed_function
+    return results
+
+
+def compare(results, baseline_results, threshold: float):
+    baseline = {(result["name"], result["size"]): result for result in baseline_results}
+    regressions = []
+    for result in results:
+        baseline_result = baseline.get((result["name"], result["size"]))
+        if baseline_result is not None and result["median"] > baseline_result["median"] * threshold:
+            regressions.append(result)
+            print(f"REGRESSION {result['name']} size={result['size']}: "
+                  f"{baseline_result['median'] * 1000:.3f} ms -> {result['median'] * 1000:.3f} ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run grisera benchmarks")
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="comma separated numbers of signal values, up to 10000000")
+    parser.add_argument("--repeat", type=int, default=5, help="number of measurements of each benchmark")
+    parser.add_argument("--filter", dest="name_filter", help="run only benchmarks with names containing this text")
+    parser.add_argument("--output", help="write results to JSON file")
+    parser.add_argument("--compare", help="JSON file with baseline results")
+    parser.add_argument("--threshold", type=float, default=1.2, help="allowed ratio of median to baseline median")
+    args = parser.parse_args()
+
+    for module_name in BENCHMARK_MODULES:
+        importlib.import_module(module_name)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    print(f"{'benchmark':<45} {'size':>10} {'min':>15} {'median':>15}")
+    results = run(sizes, args.repeat, args.name_filter)
+
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump({"python": platform.python_version(), "platform": platform.platform(),
+                       "results": results}, file, indent=2)
+
+    if args.compare is not None:
+        with open(args.compare) as file:
+            baseline_results = json.load(file)["results"]
+        if compare(results, baseline_results, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,100 +1,245 @@
-from .activity.activity_model import *
-from .activity.activity_router import ActivityRouter, router as activity_router
-from .activity.activity_service import ActivityService
-
-from .activity_execution.activity_execution_model import *
-from .activity_execution.activity_execution_router import ActivityExecutionRouter, router as activity_execution_router
-from .activity_execution.activity_execution_service import ActivityExecutionService
-
-from .appearance.appearance_model import *
-from .appearance.appearance_router import AppearanceRouter, router as appearance_router
-from .appearance.appearance_service import AppearanceService
-
-from .arrangement.arrangement_model import *
-from .arrangement.arrangement_router import ArrangementRouter, router as arrangement_router
-from .arrangement.arrangement_service import ArrangementService
-
-from .channel.channel_model import Type as ChannelType, ChannelIn, BasicChannelOut, ChannelOut, ChannelsOut
-from .channel.channel_router import ChannelRouter, router as channel_router
-from .channel.channel_service import ChannelService
-
-from .experiment.experiment_model import *
-from .experiment.experiment_router import ExperimentRouter, router as experiment_router
-from .experiment.experiment_service import ExperimentService
-
-from .helpers.hateoas import prepare_links, get_links
-from .helpers.helpers import create_stub_from_response
-
-from .life_activity.life_activity_model import *
-from .life_activity.life_activity_router import LifeActivityRouter, router as life_activity_router
-from .life_activity.life_activity_service import LifeActivityService
-
-from .measure.measure_model import *
-from .measure.measure_router import MeasureRouter, router as measure_router
-from .measure.measure_service import MeasureService
-
-from .measure_name.measure_name_model import *
-from .measure_name.measure_name_router import MeasureNameRouter, router as measure_name_router
-from .measure_name.measure_name_service import MeasureNameService
-
-from .modality.modality_model import *
-from .modality.modality_router import ModalityRouter, router as modality_router
-from .modality.modality_service import ModalityService
-
-from .models.base_model_out import BaseModelOut
-from .models.not_found_model import NotFoundByIdModel
-from .models.relation_information_model import RelationInformation
-
-from .observable_information.observable_information_model import *
-from .observable_information.observable_information_router import ObservableInformationRouter, router as observable_information_router
-from .observable_information.observable_information_service import ObservableInformationService
-
-from .participant.participant_model import *
-from .participant.participant_router import ParticipantRouter, router as participant_router
-from .participant.participant_service import ParticipantService
-
-from .participant_state.participant_state_model import *
-from .participant_state.participant_state_router import ParticipantStateRouter, router as participant_state_router
-from .participant_state.participant_state_service import ParticipantStateService
-
-from .participation.participation_model import *
-from .participation.participation_router import ParticipationRouter, router as participation_router
-from .participation.participation_service import ParticipationService
-
-from .personality.personality_model import *
-from .personality.personality_router import PersonalityRouter, router as personality_router
-from .personality.personality_service import PersonalityService
-
-from .property.property_model import PropertyIn
-
-from .recording.recording_model import *
-from .recording.recording_router import RecordingRouter, router as recording_router
-from .recording.recording_service import RecordingService
-
-from .registered_channel.registered_channel_model import *
-from .registered_channel.registered_channel_router import RegisteredChannelRouter, router as registered_channel_router
-from .registered_channel.registered_channel_service import RegisteredChannelService
-
-from .registered_data.registered_data_model import *
-from .registered_data.registered_data_router import RegisteredDataRouter, router as registered_data_router
-from .registered_data.registered_data_service import RegisteredDataService
-
-from .scenario.scenario_model import *
-from .scenario.scenario_router import ScenarioRouter, router as scenario_router
-from .scenario.scenario_service import ScenarioService
-
-from .services.service_factory import ServiceFactory
-from .services.service import Service, service as abstract_service
-from .services.not_implemented_service_factory import NotImplementedServiceFactory
-
-from .time_series.transformation.multidimensional.TimeSeriesTransformationMultidimensional import TimeSeriesTransformationMultidimensional
-
-from .time_series.transformation.TimeSeriesTransformation import TimeSeriesTransformation
-from .time_series.transformation.TimeSeriesTransformationFactory import TimeSeriesTransformationFactory
-from .time_series.transformation.TimeSeriesTransformationQuadrants import TimeSeriesTransformationQuadrants
-from .time_series.transformation.TimeSeriesTransformationResample import TimeSeriesTransformationResample
-
-from .time_series.time_series_model import *
-from .time_series.time_series_router import TimeSeriesRouter, router as time_series_router
-from .time_series.time_series_service import TimeSeriesService
-from .time_series.ts_helpers import get_node_property, get_additional_parameter
+"""
+Grisera api package
+
+Public names are loaded lazily, so importing a single model or transformation does not import all routers,
+services and FastAPI. Every name listed in `_EXPORTS` is imported from its module on first access.
+"""
+import importlib
+import importlib.util
+
+# Module path -> exported names. Tuple entries are (exported name, name in module) pairs for aliased names.
+_EXPORTS = {
+    ".activity.activity_model": [
+        "ActivitiesOut", "Activity", "ActivityIn", "ActivityOut", "ActivityPropertyIn", "BasicActivityOut"
+    ],
+    ".activity.activity_router": ["ActivityRouter", ("activity_router", "router")],
+    ".activity.activity_service": ["ActivityService"],
+
+    ".activity_execution.activity_execution_model": [
+        "ActivityExecutionIn", "ActivityExecutionOut", "ActivityExecutionPropertyIn", "ActivityExecutionRelationIn",
+        "ActivityExecutionsOut", "BasicActivityExecutionOut"
+    ],
+    ".activity_execution.activity_execution_router": [
+        "ActivityExecutionRouter", ("activity_execution_router", "router")
+    ],
+    ".activity_execution.activity_execution_service": ["ActivityExecutionService"],
+
+    ".appearance.appearance_model": [
+        "AppearanceOcclusionIn", "AppearanceOcclusionOut", "AppearanceSomatotypeIn", "AppearanceSomatotypeOut",
+        "AppearancesOut", "BasicAppearanceOcclusionOut", "BasicAppearanceSomatotypeOut", "FacialHair"
+    ],
+    ".appearance.appearance_router": ["AppearanceRouter", ("appearance_router", "router")],
+    ".appearance.appearance_service": ["AppearanceService"],
+
+    ".arrangement.arrangement_model": [
+        "Arrangement", "ArrangementIn", "ArrangementOut", "ArrangementsOut", "BasicArrangementOut"
+    ],
+    ".arrangement.arrangement_router": ["ArrangementRouter", ("arrangement_router", "router")],
+    ".arrangement.arrangement_service": ["ArrangementService"],
+
+    ".channel.channel_model": [("ChannelType", "Type"), "ChannelIn", "BasicChannelOut", "ChannelOut", "ChannelsOut"],
+    ".channel.channel_router": ["ChannelRouter", ("channel_router", "router")],
+    ".channel.channel_service": ["ChannelService"],
+
+    ".experiment.experiment_archive": ["ExperimentExporter", "ExperimentImporter"],
+    ".experiment.experiment_model": ["BasicExperimentOut", "ExperimentImportOut", "ExperimentIn", "ExperimentOut",
+                                     "ExperimentsOut"],
+    ".experiment.experiment_router": ["ExperimentRouter", ("experiment_router", "router")],
+    ".experiment.experiment_service": ["ExperimentService"],
+
+    ".helpers.hateoas": ["prepare_links", "get_links"],
+    ".helpers.helpers": ["create_stub_from_response", "get_node_id", "get_related_nodes", "get_relation_ids"],
+    ".helpers.profiling": ["ProfilingMiddleware", "profile_phase"],
+
+    ".job.job_handlers": ["JOB_HANDLERS", "TRANSFORM_TIME_SERIES", "CASCADE_DELETE"],
+    ".job.job_model": ["JobOut", "JobStatus"],
+    ".job.job_queue": ["JobQueue", "InMemoryJobQueue", "SQLiteJobQueue"],
+    ".job.job_router": ["JobRouter", ("job_router", "router")],
+    ".job.job_service": ["JobService", "get_job_service", "job_service"],
+
+    ".life_activity.life_activity_model": [
+        "BasicLifeActivityOut", "LifeActivitiesOut", "LifeActivity", "LifeActivityIn", "LifeActivityOut"
+    ],
+    ".life_activity.life_activity_router": ["LifeActivityRouter", ("life_activity_router", "router")],
+    ".life_activity.life_activity_service": ["LifeActivityService"],
+
+    ".measure.measure_model": [
+        "BasicMeasureOut", "MeasureIn", "MeasureOut", "MeasurePropertyIn", "MeasureRelationIn", "MeasuresOut"
+    ],
+    ".measure.measure_router": ["MeasureRouter", ("measure_router", "router")],
+    ".measure.measure_service": ["MeasureService"],
+
+    ".measure_name.measure_name_model": [
+        "BasicMeasureNameOut", "MeasureName", "MeasureNameIn", "MeasureNameOut", "MeasureNamesOut"
+    ],
+    ".measure_name.measure_name_router": ["MeasureNameRouter", ("measure_name_router", "router")],
+    ".measure_name.measure_name_service": ["MeasureNameService"],
+
+    ".modality.modality_model": ["BasicModalityOut", "ModalitiesOut", "Modality", "ModalityIn", "ModalityOut"],
+    ".modality.modality_router": ["ModalityRouter", ("modality_router", "router")],
+    ".modality.modality_service": ["ModalityService"],
+
+    ".models.base_model_out": ["BaseModelOut"],
+    ".models.bulk_model": ["BulkCreateOut", "BulkUpdateOut", "RelationshipUpdateIn"],
+    ".models.cascade_delete_model": ["CascadeDeleteOut", "CascadeDeleteJobIn"],
+    ".models.not_found_model": ["NotFoundByIdModel"],
+    ".models.relation_information_model": ["RelationInformation"],
+
+    ".observable_information.observable_information_model": [
+        "BasicObservableInformationOut", "ObservableInformationIn", "ObservableInformationOut",
+        "ObservableInformationsOut"
+    ],
+    ".observable_information.observable_information_router": [
+        "ObservableInformationRouter", ("observable_information_router", "router")
+    ],
+    ".observable_information.observable_information_service": ["ObservableInformationService"],
+
+    ".participant.participant_model": [
+        "BasicParticipantOut", "ParticipantIn", "ParticipantOut", "ParticipantsOut", "ParticipantTimelineOut", "Sex",
+        "TimelineActivityExecutionOut", "TimelineRecordingOut"
+    ],
+    ".participant.participant_router": ["ParticipantRouter", ("participant_router", "router")],
+    ".participant.participant_service": ["ParticipantService"],
+    ".participant.participant_timeline": ["ParticipantTimelineReader"],
+
+    ".participant_state.participant_state_model": [
+        "BasicParticipantStateOut", "ParticipantStateIn", "ParticipantStateOut", "ParticipantStatePropertyIn",
+        "ParticipantStateRelationIn", "ParticipantStatesOut"
+    ],
+    ".participant_state.participant_state_router": ["ParticipantStateRouter", ("participant_state_router", "router")],
+    ".participant_state.participant_state_service": ["ParticipantStateService"],
+
+    ".participation.participation_model": [
+        "BasicParticipationOut", "ParticipationIn", "ParticipationOut", "ParticipationsOut"
+    ],
+    ".participation.participation_router": ["ParticipationRouter", ("participation_router", "router")],
+    ".participation.participation_service": ["ParticipationService"],
+
+    ".personality.personality_model": [
+        "BasicPersonalityBigFiveOut", "BasicPersonalityPanasOut", "PersonalitiesOut", "PersonalityBigFiveIn",
+        "PersonalityBigFiveOut", "PersonalityPanasIn", "PersonalityPanasOut"
+    ],
+    ".personality.personality_router": ["PersonalityRouter", ("personality_router", "router")],
+    ".personality.personality_service": ["PersonalityService"],
+
+    ".property.property_model": ["PropertyIn"],
+
+    ".recording.recording_model": [
+        "BasicRecordingOut", "RecordingIn", "RecordingOut", "RecordingPropertyIn", "RecordingRelationIn",
+        "RecordingsOut"
+    ],
+    ".recording.recording_router": ["RecordingRouter", ("recording_router", "router")],
+    ".recording.recording_service": ["RecordingService"],
+
+    ".registered_channel.registered_channel_model": [
+        "BasicRegisteredChannelOut", "RegisteredChannelIn", "RegisteredChannelOut", "RegisteredChannelsOut"
+    ],
+    ".registered_channel.registered_channel_router": [
+        "RegisteredChannelRouter", ("registered_channel_router", "router")
+    ],
+    ".registered_channel.registered_channel_service": ["RegisteredChannelService"],
+
+    ".registered_data.registered_data_model": [
+        "BasicRegisteredDataOut", "RegisteredDataIn", "RegisteredDataNodesOut", "RegisteredDataOut"
+    ],
+    ".registered_data.registered_data_router": ["RegisteredDataRouter", ("registered_data_router", "router")],
+    ".registered_data.registered_data_service": ["RegisteredDataService"],
+
+    ".scenario.scenario_model": [
+        "OrderChangeIn", "OrderChangeOut", "ScenarioActivityExecutionsIn", "ScenarioIn", "ScenarioOut",
+        "ScenarioReorderIn", "ScenarioReorderOut"
+    ],
+    ".scenario.scenario_router": ["ScenarioRouter", ("scenario_router", "router")],
+    ".scenario.scenario_cache": [
+        "ScenarioCache", "CachedScenarioService", "CachedActivityExecutionService", "CachedExperimentService"
+    ],
+    ".scenario.scenario_order": ["ScenarioOrder"],
+    ".scenario.scenario_service": ["ScenarioService"],
+
+    ".services.service_factory": ["ServiceFactory"],
+    ".services.service": ["Service", ("abstract_service", "service")],
+    ".services.not_implemented_service_factory": ["NotImplementedServiceFactory"],
+    ".services.cascade_delete": ["CascadeDeleter"],
+
+    ".time_series.transformation.multidimensional.TimeSeriesTransformationMultidimensional": [
+        "TimeSeriesTransformationMultidimensional"
+    ],
+    ".time_series.transformation.TimeSeriesTransformation": ["TimeSeriesTransformation"],
+    ".time_series.transformation.TimeSeriesTransformationBandPower": ["TimeSeriesTransformationBandPower"],
+    ".time_series.transformation.TimeSeriesTransformationExecutor": ["TimeSeriesTransformationExecutor"],
+    ".time_series.transformation.TimeSeriesTransformationFactory": ["TimeSeriesTransformationFactory"],
+    ".time_series.transformation.TimeSeriesTransformationPipeline": ["TimeSeriesTransformationPipeline"],
+    ".time_series.transformation.TimeSeriesTransformationQuadrants": ["TimeSeriesTransformationQuadrants"],
+    ".time_series.transformation.TimeSeriesTransformationInterpolation": ["TimeSeriesTransformationInterpolation"],
+    ".time_series.transformation.TimeSeriesTransformationRegistry": [
+        "TimeSeriesTransformationRegistry", "TransformationCapabilities", "register_transformation",
+        "transformation_registry"
+    ],
+    ".time_series.transformation.TimeSeriesTransformationResample": ["TimeSeriesTransformationResample"],
+    ".time_series.transformation.TimeSeriesTransformationResampleLinear": ["TimeSeriesTransformationResampleLinear"],
+    ".time_series.transformation.TimeSeriesTransformationResamplePrevious": [
+        "TimeSeriesTransformationResamplePrevious"
+    ],
+    ".time_series.transformation.TimeSeriesTransformationWindow": [
+        "TimeSeriesTransformationWindow", "WINDOW_TRANSFORMATIONS"
+    ],
+    ".time_series.time_series_model": [
+        "BasicTimeSeriesOut", "SignalIn", "SignalValueNodesIn", "TimeSeriesIn", "TimeSeriesMultidimensionalOut",
+        "TimeSeriesNodesOut", "TimeSeriesOut", "TimeSeriesPropertyIn", "TimeSeriesRelationIn",
+        "TimeSeriesTransformationIn", "TimeSeriesTransformationPipelineIn", "TimeSeriesTransformationStepIn",
+        "TimeSeriesTransformationRelationshipIn", "TimeSeriesWindowOut", "TimeSeriesStatisticsOut",
+        "TimeSeriesStatisticsListOut", "TimestampNodesIn",
+        "TransformationType", "Type", "DownsamplingMethod", "TimeSeriesTransformationState"
+    ],
+    ".time_series.time_series_router": ["TimeSeriesRouter", ("time_series_router", "router")],
+    ".time_series.time_series_service": ["TimeSeriesService"],
+    ".time_series.ts_helpers": ["get_node_property", "get_additional_parameter"],
+    ".time_series.ts_columns": ["SignalColumns", "ColumnSignalValues", "get_timestamp_labels"],
+    ".time_series.ts_shared_memory": ["SharedSignalColumns", "SharedColumnsHandle", "read_shared_columns"],
+    ".time_series.ts_signal_store": ["SignalStore", "get_value_kind"],
+    ".time_series.ts_spectral": ["FREQUENCY_BANDS", "FFTPlan", "compute_band_powers", "get_band_bins"],
+    ".time_series.ts_downsampling": [
+        "select_time_range", "downsample_min_max", "downsample_lttb", "select_signal_values"
+    ],
+    ".time_series.ts_pyramid": ["TimeSeriesPyramid", "PyramidLevel"],
+    ".time_series.ts_filter": [
+        "FilterOperator", "FilterCondition", "TimeSeriesFilter", "parse_time_series_filter", "estimate_selectivity"
+    ],
+    ".time_series.ts_statistics": [
+        "TDigest", "TimeSeriesStatistics", "compute_time_series_statistics", "parse_percentiles"
+    ],
+}
+
+_LAZY_ATTRIBUTES = {}
+for _module_name, _names in _EXPORTS.items():
+    for _name in _names:
+        _exported_name, _attribute_name = _name if isinstance(_name, tuple) else (_name, _name)
+        _LAZY_ATTRIBUTES[_exported_name] = (_module_name, _attribute_name)
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    """
+    Import module of the public name on first access and cache the value in the package namespace
+
+    Args:
+        name (str): Accessed name
+
+    Returns:
+        Value of the public name
+    """
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attribute_name = _LAZY_ATTRIBUTES[name]
+        value = getattr(importlib.import_module(module_name, __name__), attribute_name)
+    elif not name.startswith("__") and importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        # Subpackages were available as attributes when all modules were imported eagerly
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
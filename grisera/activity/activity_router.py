@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.activity.activity_model import ActivityIn
 from grisera.activity.activity_model import ActivityOut, ActivitiesOut
@@ -7,6 +7,7 @@ from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
 
 from grisera.helpers.hateoas import get_links
+from grisera.models.bulk_model import BulkCreateOut
 from grisera.models.not_found_model import NotFoundByIdModel
 from grisera.services.service import service
 from grisera.services.service_factory import ServiceFactory
@@ -42,6 +43,26 @@ class ActivityRouter:
 
         return create_response
 
+    @router.post(
+        "/activities/bulk",
+        tags=["activities"],
+        response_model=BulkCreateOut[ActivityOut],
+    )
+    async def create_activities(self, activities: List[ActivityIn], response: Response):
+        """
+        Create many activities in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[ActivityOut].from_results(
+            self.activity_service.save_activities(activities)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
     @router.get(
         "/activities/{activity_id}",
         tags=["activities"],
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 from grisera.activity.activity_model import ActivityIn
 
 
@@ -20,6 +20,21 @@ class ActivityService:
         """
         raise Exception("Reference to an abstract class.")
 
+    def save_activities(self, activities: List[ActivityIn]):
+        """
+        Send request to graph api to create many new activities
+
+        Implementations should create all activities in one transaction. By default activities are saved one by one with
+        save_activity.
+
+        Args:
+            activities (List[ActivityIn]): Activities to be added
+
+        Returns:
+            List of results of request as activity objects, in order of activities
+        """
+        return [self.save_activity(activity) for activity in activities]
+
     def get_activities(self):
         """
         Send request to graph api to get all activities
@@ -1,9 +1,10 @@
-from typing import Union
+from typing import Union, List
 
 from fastapi import Response, Depends
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
 from grisera.helpers.hateoas import get_links
+from grisera.models.bulk_model import BulkCreateOut, BulkUpdateOut, RelationshipUpdateIn
 from grisera.models.not_found_model import NotFoundByIdModel
 from grisera.activity_execution.activity_execution_model import (
     ActivityExecutionIn,
@@ -52,6 +53,48 @@ class ActivityExecutionRouter:
 
         return create_response
 
+    @router.post(
+        "/activity_executions/bulk",
+        tags=["activity executions"],
+        response_model=BulkCreateOut[ActivityExecutionOut],
+    )
+    async def create_activity_executions(self, activity_executions: List[ActivityExecutionIn], response: Response):
+        """
+        Create many activity executions in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[ActivityExecutionOut].from_results(
+            self.activity_execution_service.save_activity_executions(activity_executions)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.put(
+        "/activity_executions/relationships",
+        tags=["activity executions"],
+        response_model=BulkUpdateOut[ActivityExecutionOut],
+    )
+    async def update_activity_execution_relationships_bulk(
+        self, updates: List[RelationshipUpdateIn[ActivityExecutionRelationIn]], response: Response
+    ):
+        """
+        Update relationships of many activity executions at once, returning result of updating each one
+        """
+        update_response = BulkUpdateOut[ActivityExecutionOut].from_results(
+            self.activity_execution_service.update_activity_execution_relationships_bulk(updates)
+        )
+        if update_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        update_response.links = get_links(router)
+
+        return update_response
+
     @router.get(
         "/activity_executions",
         tags=["activity executions"],
@@ -1,7 +1,8 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.activity_execution.activity_execution_model import ActivityExecutionPropertyIn, ActivityExecutionRelationIn, \
     ActivityExecutionIn
+from grisera.models.bulk_model import RelationshipUpdateIn
 
 
 class ActivityExecutionService:
@@ -22,6 +23,21 @@ class ActivityExecutionService:
         """
         raise Exception("Reference to an abstract class.")
 
+    def save_activity_executions(self, activity_executions: List[ActivityExecutionIn]):
+        """
+        Send request to graph api to create many new activity executions
+
+        Implementations should create all activity executions in one transaction. By default activity executions are
+        saved one by one with save_activity_execution.
+
+        Args:
+            activity_executions (List[ActivityExecutionIn]): Activity executions to be added
+
+        Returns:
+            List of results of request as activity execution objects, in order of activity executions
+        """
+        return [self.save_activity_execution(activity_execution) for activity_execution in activity_executions]
+
     def get_activity_executions(self):
         """
         Send request to graph api to get activity executions
@@ -78,3 +94,19 @@ class ActivityExecutionService:
             Result of request as activity execution object
         """
         raise Exception("Reference to an abstract class.")
+
+    def update_activity_execution_relationships_bulk(self, updates: List[RelationshipUpdateIn]):
+        """
+        Send request to graph api to update relationships of many activity executions
+
+        Implementations can collect referenced ids of all updates with collect_referenced_ids, validate each of them
+        once and apply all updates in one transaction. By default updates are applied one by one with
+        update_activity_execution_relationships.
+
+        Args:
+            updates (List[RelationshipUpdateIn]): Ids of activity executions with relationships to update
+
+        Returns:
+            List of results of request as activity execution objects, in order of updates
+        """
+        return [self.update_activity_execution_relationships(update.id, update.relationships) for update in updates]
@@ -1,7 +1,7 @@
 from fastapi import Response, Depends
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from typing import Union
+from typing import Union, List
 from grisera.helpers.hateoas import get_links
 from grisera.appearance.appearance_model import (
     AppearanceOcclusionIn,
@@ -11,6 +11,7 @@ from grisera.appearance.appearance_model import (
     AppearancesOut,
 )
 
+from grisera.models.bulk_model import BulkCreateOut
 from grisera.models.not_found_model import NotFoundByIdModel
 from grisera.services.service import service
 from grisera.services.service_factory import ServiceFactory
@@ -51,6 +52,26 @@ class AppearanceRouter:
 
         return create_response
 
+    @router.post(
+        "/appearance/occlusion_model/bulk",
+        tags=["appearance"],
+        response_model=BulkCreateOut[AppearanceOcclusionOut],
+    )
+    async def create_appearances_occlusion(self, appearances: List[AppearanceOcclusionIn], response: Response):
+        """
+        Create many appearance occlusion models in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[AppearanceOcclusionOut].from_results(
+            self.appearance_service.save_appearances_occlusion(appearances)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
     @router.post(
         "/appearance/somatotype_model",
         tags=["appearance"],
@@ -72,6 +93,26 @@ class AppearanceRouter:
 
         return create_response
 
+    @router.post(
+        "/appearance/somatotype_model/bulk",
+        tags=["appearance"],
+        response_model=BulkCreateOut[AppearanceSomatotypeOut],
+    )
+    async def create_appearances_somatotype(self, appearances: List[AppearanceSomatotypeIn], response: Response):
+        """
+        Create many appearance somatotype models in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[AppearanceSomatotypeOut].from_results(
+            self.appearance_service.save_appearances_somatotype(appearances)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
     @router.get("/appearance", tags=["appearance"], response_model=AppearancesOut)
     async def get_appearances(self, response: Response):
         """
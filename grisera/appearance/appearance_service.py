@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.appearance.appearance_model import AppearanceOcclusionIn, AppearanceSomatotypeIn
 
@@ -21,6 +21,21 @@ class AppearanceService:
         """
         raise Exception("save_appearance_occlusion not implemented yet")
 
+    def save_appearances_occlusion(self, appearances: List[AppearanceOcclusionIn]):
+        """
+        Send request to graph api to create many new appearance occlusion models
+
+        Implementations should create all appearance occlusion models in one transaction. By default appearance
+        occlusion models are saved one by one with save_appearance_occlusion.
+
+        Args:
+            appearances (List[AppearanceOcclusionIn]): Appearance occlusion models to be added
+
+        Returns:
+            List of results of request as appearance occlusion model objects, in order of appearance occlusion models
+        """
+        return [self.save_appearance_occlusion(appearance) for appearance in appearances]
+
     def save_appearance_somatotype(self, appearance: AppearanceSomatotypeIn):
         """
         Send request to graph api to create new appearance somatotype model
@@ -33,6 +48,21 @@ class AppearanceService:
         """
         raise Exception("save_appearance_somatotype not implemented yet")
 
+    def save_appearances_somatotype(self, appearances: List[AppearanceSomatotypeIn]):
+        """
+        Send request to graph api to create many new appearance somatotype models
+
+        Implementations should create all appearance somatotype models in one transaction. By default appearance
+        somatotype models are saved one by one with save_appearance_somatotype.
+
+        Args:
+            appearances (List[AppearanceSomatotypeIn]): Appearance somatotype models to be added
+
+        Returns:
+            List of results of request as appearance somatotype model objects, in order of appearance somatotype models
+        """
+        return [self.save_appearance_somatotype(appearance) for appearance in appearances]
+
     def get_appearance(self, appearance_id: Union[int, str], depth: int = 0):
         """
         Send request to graph api to get given appearance
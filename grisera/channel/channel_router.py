@@ -1,10 +1,11 @@
-from typing import Union
+from typing import Union, List
 
 from fastapi import Response, Depends
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
 from grisera.helpers.hateoas import get_links
 from grisera.channel.channel_model import ChannelOut, ChannelsOut, ChannelIn
+from grisera.models.bulk_model import BulkCreateOut
 from grisera.models.not_found_model import NotFoundByIdModel
 from grisera.services.service import service
 from grisera.services.service_factory import ServiceFactory
@@ -42,6 +43,26 @@ class ChannelRouter:
 
         return create_response
 
+    @router.post(
+        "/channels/bulk",
+        tags=["channels"],
+        response_model=BulkCreateOut[ChannelOut],
+    )
+    async def create_channels(self, channels: List[ChannelIn], response: Response):
+        """
+        Create many channels in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[ChannelOut].from_results(
+            self.channel_service.save_channels(channels)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
     @router.get(
         "/channels/{channel_id}",
         tags=["channels"],
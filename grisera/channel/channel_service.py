@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.channel.channel_model import ChannelIn
 
@@ -21,6 +21,21 @@ class ChannelService:
         """
         raise Exception("save_channel not implemented yet")
 
+    def save_channels(self, channels: List[ChannelIn]):
+        """
+        Send request to graph api to create many new channels
+
+        Implementations should create all channels in one transaction. By default channels are saved one by one with
+        save_channel.
+
+        Args:
+            channels (List[ChannelIn]): Channels to be added
+
+        Returns:
+            List of results of request as channel objects, in order of channels
+        """
+        return [self.save_channel(channel) for channel in channels]
+
     def get_channels(self):
         """
         Send request to graph api to get all channels
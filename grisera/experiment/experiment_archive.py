@@ -0,0 +1,345 @@
+import base64
+import json
+from typing import Union, Optional, Iterator, List, Dict
+
+from grisera.activity_execution.activity_execution_model import ActivityExecutionIn
+from grisera.experiment.experiment_model import ExperimentIn
+from grisera.helpers.helpers import get_node_id, get_related_nodes, get_relation_ids
+from grisera.observable_information.observable_information_model import ObservableInformationIn
+from grisera.participant.participant_model import ParticipantIn
+from grisera.participant_state.participant_state_model import ParticipantStateIn
+from grisera.participation.participation_model import ParticipationIn
+from grisera.recording.recording_model import RecordingIn
+from grisera.services.service_factory import ServiceFactory
+from grisera.time_series.time_series_model import TimeSeriesIn, SignalIn, SignalValueNodesIn, Type
+from grisera.time_series.ts_columns import SignalColumns
+from grisera.time_series.ts_shared_memory import encode_column, decode_column, INTEGER_COLUMN, FLOAT_COLUMN, \
+    STRING_COLUMN, PICKLED_COLUMN
+
+ARCHIVE_FORMAT = "grisera-experiment"
+ARCHIVE_VERSION = 1
+DEFAULT_CHUNK_SIZE = 65536
+
+# Labels of nodes in order they are written and imported, so referenced nodes are always created first
+EXPERIMENT = "Experiment"
+PARTICIPANT = "Participant"
+PARTICIPANT_STATE = "ParticipantState"
+ACTIVITY_EXECUTION = "ActivityExecution"
+PARTICIPATION = "Participation"
+RECORDING = "Recording"
+OBSERVABLE_INFORMATION = "ObservableInformation"
+TIME_SERIES = "TimeSeries"
+NODE_MODELS = {EXPERIMENT: ExperimentIn, PARTICIPANT: ParticipantIn, PARTICIPANT_STATE: ParticipantStateIn,
+               ACTIVITY_EXECUTION: ActivityExecutionIn, PARTICIPATION: ParticipationIn, RECORDING: RecordingIn,
+               OBSERVABLE_INFORMATION: ObservableInformationIn, TIME_SERIES: TimeSeriesIn}
+
+# Relation fields referring to nodes of the archive, other relations refer to shared nodes like activities,
+# channels or measures and are kept unchanged
+ARCHIVED_RELATIONS = {"participant_id": PARTICIPANT, "participant_state_id": PARTICIPANT_STATE,
+                      "activity_execution_id": ACTIVITY_EXECUTION, "participation_id": PARTICIPATION,
+                      "recording_id": RECORDING, "observable_information_id": OBSERVABLE_INFORMATION,
+                      "observable_information_ids": OBSERVABLE_INFORMATION}
+
+# Relation fields referring to shared nodes with fields of related nodes returned by reads with depth
+SHARED_RELATIONS = {"activity_id": "activity", "arrangement_id": "arrangements",
+                    "registered_channel_id": "registered_channel", "modality_id": "modality",
+                    "life_activity_id": "life_activity", "personality_ids": "personalities",
+                    "appearance_ids": "appearances", "measure_id": "measure"}
+
+JSON_COLUMN = "json"
+
+
+def _encode_archive_column(column) -> list:
+    encoding, data, offsets = encode_column(column)
+    if encoding == PICKLED_COLUMN:
+        # Archives are read from clients, so mixed columns are stored as JSON instead of pickles
+        return [JSON_COLUMN, json.dumps(list(column)), ""]
+    return [encoding, base64.b64encode(data).decode(), base64.b64encode(offsets).decode()]
+
+
+def _decode_archive_column(encoded_column: list) -> list:
+    encoding, data, offsets = encoded_column
+    if encoding == JSON_COLUMN:
+        return json.loads(data)
+    if encoding not in (INTEGER_COLUMN, FLOAT_COLUMN, STRING_COLUMN):
+        raise ValueError(f"column encoding {encoding} is unknown")
+    return decode_column(encoding, base64.b64decode(data), base64.b64decode(offsets))
+
+
+class ExperimentExporter:
+    """
+    Class writing experiment with its scenario, participants, participations, recordings, observable informations
+    and time series as a line-delimited JSON archive
+
+    The first line is a header, then each line is a node record with label, id and properties in dependency order.
+    Signal values follow their time series as records of binary columns (base64 encoded), at most chunk_size
+    signal values each. Nodes without signal values are collected first, signal values are read one time series
+    at a time and written in chunks, so memory use is bounded by the largest time series.
+
+    Attributes:
+        service_factory (ServiceFactory): Factory of services used to read nodes
+        chunk_size (int): The greatest number of signal values in one record
+    """
+
+    def __init__(self, service_factory: ServiceFactory, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.service_factory = service_factory
+        self.chunk_size = chunk_size
+
+    def collect(self, experiment_id: Union[int, str]):
+        """
+        Read nodes of experiment without signal values
+
+        Args:
+            experiment_id (Union[int, str]): Id of exported experiment
+
+        Returns:
+            Tuple of nodes (dictionary of properties by id by label) and errors, if experiment cannot be read
+        """
+        experiment = self.service_factory.get_experiment_service().get_experiment(experiment_id)
+        if experiment.errors is not None:
+            return None, experiment.errors
+        nodes = {label: {} for label in NODE_MODELS}
+        self._add_node(nodes, EXPERIMENT, experiment)
+
+        # Relations are taken from traversal, because nodes read with depth contain related nodes instead of ids
+        scenario = self.service_factory.get_scenario_service().get_scenario_by_experiment(experiment_id)
+        activity_execution_ids = [get_node_id(activity_execution)
+                                  for activity_execution in scenario.activity_executions or []] \
+            if scenario.errors is None else []
+        participation_parents = {}
+        for activity_execution_id in activity_execution_ids:
+            activity_execution = self.service_factory.get_activity_execution_service() \
+                .get_activity_execution(activity_execution_id, 1)
+            if self._add_node(nodes, ACTIVITY_EXECUTION, activity_execution):
+                for participation in get_related_nodes(activity_execution, "participations"):
+                    participation_parents.setdefault(get_node_id(participation), activity_execution_id)
+
+        recording_parents = {}
+        for participation_id, activity_execution_id in participation_parents.items():
+            participation = self.service_factory.get_participation_service().get_participation(participation_id, 1)
+            participant_states = get_related_nodes(participation, "participant_state")
+            participant_state_id = get_node_id(participant_states[0]) if participant_states else None
+            if not self._add_node(nodes, PARTICIPATION, participation, activity_execution_id=activity_execution_id,
+                                  participant_state_id=participant_state_id):
+                continue
+            for recording in get_related_nodes(participation, "recordings"):
+                recording_parents.setdefault(get_node_id(recording), participation_id)
+            if participant_state_id is None or participant_state_id in nodes[PARTICIPANT_STATE]:
+                continue
+            participant_state = self.service_factory.get_participant_state_service() \
+                .get_participant_state(participant_state_id, 1)
+            participants = get_related_nodes(participant_state, "participant")
+            participant_id = get_node_id(participants[0]) if participants else None
+            if participant_id is not None and participant_id not in nodes[PARTICIPANT]:
+                self._add_node(nodes, PARTICIPANT, self.service_factory.get_participant_service()
+                               .get_participant(participant_id))
+            self._add_node(nodes, PARTICIPANT_STATE, participant_state, participant_id=participant_id)
+
+        observable_information_parents = {}
+        for recording_id, participation_id in recording_parents.items():
+            recording = self.service_factory.get_recording_service().get_recording(recording_id, 1)
+            if self._add_node(nodes, RECORDING, recording, participation_id=participation_id):
+                for observable_information in get_related_nodes(recording, "observable_informations"):
+                    observable_information_parents.setdefault(get_node_id(observable_information), recording_id)
+
+        for observable_information_id, recording_id in observable_information_parents.items():
+            observable_information = self.service_factory.get_observable_information_service() \
+                .get_observable_information(observable_information_id, 1)
+            if not self._add_node(nodes, OBSERVABLE_INFORMATION, observable_information, recording_id=recording_id):
+                continue
+            for time_series in get_related_nodes(observable_information, "timeSeries"):
+                nodes[TIME_SERIES].setdefault(get_node_id(time_series), []).append(observable_information_id)
+        return nodes, None
+
+    def iter_lines(self, nodes: Dict[str, dict]) -> Iterator[bytes]:
+        """
+        Write archive of collected nodes, reading signal values of time series one by one
+
+        Args:
+            nodes (Dict[str, dict]): Nodes returned by collect
+
+        Returns:
+            Iterator of archive lines
+        """
+        yield self._line({"format": ARCHIVE_FORMAT, "version": ARCHIVE_VERSION})
+        for label, nodes_by_id in nodes.items():
+            if label == TIME_SERIES:
+                continue
+            for node_id, properties in nodes_by_id.items():
+                yield self._line({"record": "node", "label": label, "id": node_id, "properties": properties})
+
+        time_series_service = self.service_factory.get_time_series_service()
+        for time_series_id, observable_information_ids in nodes[TIME_SERIES].items():
+            time_series = time_series_service.get_time_series(time_series_id)
+            if time_series.errors is not None:
+                continue
+            properties = time_series.dict(include=set(TimeSeriesIn.__fields__) - {"signal_values"})
+            properties.update(get_relation_ids(time_series, {"measure_id": "measure"}))
+            if len(observable_information_ids) > 1:
+                properties.update(observable_information_id=None, observable_information_ids=observable_information_ids)
+            else:
+                properties.update(observable_information_id=observable_information_ids[0],
+                                  observable_information_ids=None)
+            yield self._line({"record": "node", "label": TIME_SERIES, "id": time_series_id,
+                              "properties": properties})
+            columns = SignalColumns.from_time_series(time_series)
+            for first_index in range(0, len(columns), self.chunk_size):
+                chunk = columns.slice(first_index, first_index + self.chunk_size)
+                record = {"record": "signal_values", "time_series_id": time_series_id, "type": columns.type.value,
+                          "timestamps": _encode_archive_column(chunk.timestamps),
+                          "values": _encode_archive_column(chunk.values)}
+                if chunk.end_timestamps is not chunk.timestamps:
+                    record["end_timestamps"] = _encode_archive_column(chunk.end_timestamps)
+                yield self._line(record)
+
+    @staticmethod
+    def _add_node(nodes: Dict[str, dict], label: str, node, **relations):
+        if node is None or getattr(node, "errors", None) is not None:
+            return False
+        fields = set(NODE_MODELS[label].__fields__)
+        properties = node.dict(include=fields)
+        properties.update({field: related_id for field, related_id
+                           in get_relation_ids(node, SHARED_RELATIONS).items() if field in fields})
+        properties.update(relations)
+        nodes[label][get_node_id(node)] = properties
+        return True
+
+    @staticmethod
+    def _line(record: dict):
+        return (json.dumps(record, default=str, separators=(",", ":")) + "\n").encode()
+
+
+class ExperimentImporter:
+    """
+    Class creating experiment from archive written by ExperimentExporter, line by line
+
+    Nodes are created in archive order with relations to archived nodes mapped to ids of created nodes. Relations to
+    archived nodes which were not created are dropped and reported in errors. Activity executions are added to
+    scenario of the new experiment in archive order. Signal values of time series are gathered until the next node
+    record and saved with their time series.
+
+    Attributes:
+        service_factory (ServiceFactory): Factory of services used to create nodes
+        ids (Dict[str, Dict[str, Union[int, str]]]): Ids of created nodes by archived ids by label
+        errors (List[dict]): Labels, archived ids and errors of nodes which were not created
+    """
+
+    def __init__(self, service_factory: ServiceFactory):
+        self.service_factory = service_factory
+        self.ids: Dict[str, Dict[str, Union[int, str]]] = {label: {} for label in NODE_MODELS}
+        self.errors: List[dict] = []
+        self._header_read = False
+        self._last_activity_execution_id = None
+        self._time_series: Optional[tuple] = None
+
+    def import_line(self, line: Union[bytes, str]):
+        """
+        Import one line of archive
+
+        Args:
+            line (Union[bytes, str]): Line of archive
+        """
+        if not line.strip():
+            return
+        record = json.loads(line)
+        if not self._header_read:
+            if record.get("format") != ARCHIVE_FORMAT or record.get("version") != ARCHIVE_VERSION:
+                raise ValueError("Archive format is not supported")
+            self._header_read = True
+            return
+        if record["record"] == "signal_values":
+            if self._time_series is None or self._time_series[0] != record["time_series_id"]:
+                raise ValueError("Signal values should follow their time series")
+            self._add_signal_values(record)
+            return
+        if record["record"] != "node" or record["label"] not in NODE_MODELS:
+            raise ValueError("Archive record is unknown")
+        self._save_time_series()
+        properties = self._map_relations(record["label"], record["id"], record["properties"])
+        if record["label"] == TIME_SERIES:
+            self._time_series = (record["id"], properties, [])
+        else:
+            self._save_node(record["label"], record["id"], properties)
+
+    def finish(self):
+        """
+        Save the last time series of archive
+
+        Returns:
+            Id of created experiment
+        """
+        self._save_time_series()
+        if not self._header_read:
+            raise ValueError("Archive is empty")
+        return next(iter(self.ids[EXPERIMENT].values()), None)
+
+    def _map_relations(self, node_label: str, node_id, properties: dict):
+        # Relations to archived nodes which were not created are dropped, because archived ids could refer to
+        # unrelated nodes of this database
+        mapped_properties = dict(properties)
+        for field, label in ARCHIVED_RELATIONS.items():
+            value = mapped_properties.get(field)
+            if value is None:
+                continue
+            related_ids = value if isinstance(value, list) else [value]
+            missing_ids = [related_id for related_id in related_ids if str(related_id) not in self.ids[label]]
+            if missing_ids:
+                self.errors.append({"label": node_label, "id": node_id,
+                                    "errors": f"{field} {', '.join(map(str, missing_ids))} was not created"})
+            mapped_ids = [self.ids[label][str(related_id)] for related_id in related_ids
+                          if str(related_id) in self.ids[label]]
+            if isinstance(value, list):
+                mapped_properties[field] = mapped_ids
+            else:
+                mapped_properties[field] = mapped_ids[0] if mapped_ids else None
+        return mapped_properties
+
+    def _save_node(self, label: str, node_id, properties: dict):
+        model = NODE_MODELS[label](**properties)
+        if label == EXPERIMENT:
+            result = self.service_factory.get_experiment_service().save_experiment(model)
+        elif label == PARTICIPANT:
+            result = self.service_factory.get_participant_service().save_participant(model)
+        elif label == PARTICIPANT_STATE:
+            result = self.service_factory.get_participant_state_service().save_participant_state(model)
+        elif label == ACTIVITY_EXECUTION:
+            previous_id = self._last_activity_execution_id if self._last_activity_execution_id is not None \
+                else next(iter(self.ids[EXPERIMENT].values()), None)
+            if previous_id is None:
+                self.errors.append({"label": label, "id": node_id, "errors": "experiment was not created"})
+                return
+            result = self.service_factory.get_scenario_service().add_activity_execution(previous_id, model)
+            if result.errors is None:
+                self._last_activity_execution_id = result.id
+        elif label == PARTICIPATION:
+            result = self.service_factory.get_participation_service().save_participation(model)
+        elif label == RECORDING:
+            result = self.service_factory.get_recording_service().save_recording(model)
+        elif label == OBSERVABLE_INFORMATION:
+            result = self.service_factory.get_observable_information_service().save_observable_information(model)
+        else:
+            result = self.service_factory.get_time_series_service().save_time_series(model)
+        if result.errors is not None:
+            self.errors.append({"label": label, "id": node_id, "errors": result.errors})
+            return
+        self.ids[label][str(node_id)] = result.id
+
+    def _add_signal_values(self, record: dict):
+        timestamps = _decode_archive_column(record["timestamps"])
+        values = _decode_archive_column(record["values"])
+        if Type(record["type"]) == Type.timestamp:
+            signal_values = [SignalIn(timestamp=timestamp, signal_value=SignalValueNodesIn(value=value))
+                             for timestamp, value in zip(timestamps, values)]
+        else:
+            end_timestamps = _decode_archive_column(record["end_timestamps"])
+            signal_values = [SignalIn(start_timestamp=start_timestamp, end_timestamp=end_timestamp,
+                                      signal_value=SignalValueNodesIn(value=value))
+                             for start_timestamp, end_timestamp, value in zip(timestamps, end_timestamps, values)]
+        self._time_series[2].extend(signal_values)
+
+    def _save_time_series(self):
+        if self._time_series is None:
+            return
+        time_series_id, properties, signal_values = self._time_series
+        self._time_series = None
+        self._save_node(TIME_SERIES, time_series_id, dict(properties, signal_values=signal_values))
@@ -1,4 +1,4 @@
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Dict
 
 from pydantic import BaseModel
 
@@ -52,6 +52,19 @@ class ExperimentsOut(BaseModelOut):
     experiments: List[BasicExperimentOut] = []
 
 
+class ExperimentImportOut(BaseModelOut):
+    """
+    Model of experiment created from archive to send to client as a result of request
+
+    Attributes:
+    experiment_id (Optional[Union[int, str]]): Id of created experiment
+    ids (Dict[str, Dict[str, Union[int, str]]]): Ids of created nodes by archived ids by label
+    """
+
+    experiment_id: Optional[Union[int, str]]
+    ids: Dict[str, Dict[str, Union[int, str]]] = {}
+
+
 # Circular import exception prevention
 from grisera.activity_execution.activity_execution_model import ActivityExecutionOut
 
@@ -1,10 +1,18 @@
-from fastapi import Response, Depends
+from fastapi import Response, Depends, Request
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
 from grisera.helpers.hateoas import get_links
-from typing import Union
-from grisera.experiment.experiment_model import ExperimentIn, ExperimentOut, ExperimentsOut
+from typing import Union, List
+from grisera.experiment.experiment_archive import ExperimentExporter, ExperimentImporter
+from grisera.experiment.experiment_model import ExperimentIn, ExperimentOut, ExperimentsOut, ExperimentImportOut
+from grisera.models.bulk_model import BulkCreateOut
+from grisera.job.job_handlers import CASCADE_DELETE
+from grisera.job.job_model import JobOut
+from grisera.job.job_service import JobService, get_job_service
+from grisera.models.cascade_delete_model import CascadeDeleteOut, CascadeDeleteJobIn
 from grisera.models.not_found_model import NotFoundByIdModel
+from grisera.services.cascade_delete import CascadeDeleter, EXPERIMENT
 from grisera.services.service import service
 from grisera.services.service_factory import ServiceFactory
 
@@ -18,10 +26,17 @@ class ExperimentRouter:
 
     Attributes:
         experiment_service (ExperimentService): Service instance for experiments
+        cascade_deleter (CascadeDeleter): Deleter of nodes with their dependent nodes
+        job_service (JobService): Service instance for jobs executing long-running operations
+        service_factory (ServiceFactory): Factory of services used to export and import experiments
     """
 
-    def __init__(self, service_factory: ServiceFactory = Depends(service.get_service_factory)):
+    def __init__(self, service_factory: ServiceFactory = Depends(service.get_service_factory),
+                 job_service: JobService = Depends(get_job_service)):
         self.experiment_service = service_factory.get_experiment_service()
+        self.cascade_deleter = CascadeDeleter(service_factory)
+        self.job_service = job_service
+        self.service_factory = service_factory
 
     @router.post("/experiments", tags=["experiments"], response_model=ExperimentOut)
     async def create_experiment(self, experiment: ExperimentIn, response: Response):
@@ -37,6 +52,75 @@ class ExperimentRouter:
 
         return create_response
 
+    @router.post(
+        "/experiments/bulk",
+        tags=["experiments"],
+        response_model=BulkCreateOut[ExperimentOut],
+    )
+    async def create_experiments(self, experiments: List[ExperimentIn], response: Response):
+        """
+        Create many experiments in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[ExperimentOut].from_results(
+            self.experiment_service.save_experiments(experiments)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.post("/experiments/import", tags=["experiments"], response_model=ExperimentImportOut)
+    async def import_experiment(self, request: Request, response: Response):
+        """
+        Create experiment with its scenario, participants, participations, recordings, observable informations and
+        time series from archive written by export endpoint. Archive is read line by line from request body.
+        """
+        importer = ExperimentImporter(self.service_factory)
+        try:
+            pending = b""
+            async for body_chunk in request.stream():
+                lines = (pending + body_chunk).split(b"\n")
+                pending = lines.pop()
+                for line in lines:
+                    importer.import_line(line)
+            importer.import_line(pending)
+            experiment_id = importer.finish()
+        except (ValueError, KeyError, TypeError) as error:
+            response.status_code = 422
+            return ExperimentImportOut(ids=importer.ids, errors=str(error), links=get_links(router))
+
+        import_response = ExperimentImportOut(experiment_id=experiment_id, ids=importer.ids,
+                                              errors=importer.errors if importer.errors else None)
+        if import_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        import_response.links = get_links(router)
+
+        return import_response
+
+    @router.get(
+        "/experiments/{experiment_id}/export",
+        tags=["experiments"],
+        response_model=NotFoundByIdModel,
+        responses={200: {"content": {"application/x-ndjson": {}}}},
+    )
+    async def export_experiment(self, experiment_id: Union[int, str], response: Response):
+        """
+        Export experiment with its scenario, participants, participations, recordings, observable informations and
+        time series as a stream of JSON lines. Signal values are written as binary columns in chunks.
+        """
+        exporter = ExperimentExporter(self.service_factory)
+        nodes, errors = exporter.collect(experiment_id)
+        if errors is not None:
+            response.status_code = 404
+            return NotFoundByIdModel(id=experiment_id, errors=errors, links=get_links(router))
+
+        return StreamingResponse(exporter.iter_lines(nodes), media_type="application/x-ndjson")
+
     @router.get(
         "/experiments/{experiment_id}",
         tags=["experiments"],
@@ -92,6 +176,53 @@ class ExperimentRouter:
 
         return get_response
 
+    @router.delete(
+        "/experiments/{experiment_id}/cascade",
+        tags=["experiments"],
+        response_model=CascadeDeleteOut,
+    )
+    async def delete_experiment_cascade(
+        self, experiment_id: Union[int, str], response: Response, dry_run: bool = False
+    ):
+        """
+        Delete experiment with activity executions of its scenario and their participations, recordings, observable
+        informations, time series and signal values. Nodes are deleted starting from dependent ones. With dry_run nodes
+        which would be deleted are only counted.
+        """
+        delete_response = self.cascade_deleter.delete_experiment(experiment_id, dry_run)
+        if delete_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        delete_response.links = get_links(router)
+
+        return delete_response
+
+    @router.delete(
+        "/experiments/{experiment_id}/cascade/jobs",
+        tags=["experiments"],
+        response_model=JobOut,
+        status_code=202,
+    )
+    async def delete_experiment_cascade_job(
+        self, experiment_id: Union[int, str], response: Response, dry_run: bool = False
+    ):
+        """
+        Queue job deleting experiment with its dependent nodes as DELETE /experiments/{experiment_id}/cascade, for
+        deletions too long to wait for the response. Progress of the job is read from GET /jobs/{job_id} and its
+        result is the cascade delete object.
+        """
+        delete_response = self.job_service.submit_job(
+            CASCADE_DELETE, CascadeDeleteJobIn(label=EXPERIMENT, id=experiment_id, dry_run=dry_run)
+        )
+        if delete_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        delete_response.links = get_links(router)
+
+        return delete_response
+
     @router.put(
         "/experiments/{experiment_id}",
         tags=["experiments"],
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.experiment.experiment_model import ExperimentIn
 
@@ -21,6 +21,21 @@ class ExperimentService:
         """
         raise Exception("save_experiment not implemented yet")
 
+    def save_experiments(self, experiments: List[ExperimentIn]):
+        """
+        Send request to graph api to create many new experiments
+
+        Implementations should create all experiments in one transaction. By default experiments are saved one by one
+        with save_experiment.
+
+        Args:
+            experiments (List[ExperimentIn]): Experiments to be added
+
+        Returns:
+            List of results of request as experiment objects, in order of experiments
+        """
+        return [self.save_experiment(experiment) for experiment in experiments]
+
     def get_experiments(self):
         """
         Send request to graph api to get experiments
@@ -9,3 +9,77 @@ def create_stub_from_response(response, id_key='id', properties=[]):
                 stub['additional_properties'].append({'key': prop['key'], 'value': prop['value']})
 
     return stub
+
+
+def collect_referenced_ids(relationships: list):
+    """
+    Collect distinct ids referenced by relationship models, so each referenced node is validated once
+
+    Args:
+        relationships (list): Relationship models with fields ending with _id or _ids
+
+    Returns:
+        Dictionary of sets of referenced ids by field name
+    """
+    referenced_ids = {}
+    for relationship in relationships:
+        for field, value in relationship.dict(exclude_none=True).items():
+            if field.endswith("_id"):
+                referenced_ids.setdefault(field, set()).add(value)
+            elif field.endswith("_ids"):
+                referenced_ids.setdefault(field, set()).update(element for element in value if element is not None)
+    return referenced_ids
+
+
+def get_node_id(node):
+    """
+    Get id of node returned by service, either model or dictionary
+
+    Args:
+        node: Model or dictionary of node
+
+    Returns:
+        Id of node or None
+    """
+    return node.get("id") if isinstance(node, dict) else getattr(node, "id", None)
+
+
+def get_related_nodes(node, field: str) -> list:
+    """
+    Get nodes related to node returned by service with depth, either single or many
+
+    Args:
+        node: Model or dictionary of node
+        field (str): Name of field with related nodes
+
+    Returns:
+        List of related nodes, empty if there are none
+    """
+    related = node.get(field) if isinstance(node, dict) else getattr(node, field, None)
+    if related is None:
+        return []
+    return related if isinstance(related, list) else [related]
+
+
+def get_relation_ids(node, relations: dict) -> dict:
+    """
+    Get ids of nodes related to node returned by service, either from id fields or from related nodes, because
+    nodes read with depth contain related nodes instead of ids
+
+    Args:
+        node: Model or dictionary of node
+        relations (dict): Names of fields with related nodes by names of id fields, fields ending with _ids get
+            lists of ids
+
+    Returns:
+        Dictionary of ids of related nodes by names of id fields
+    """
+    relation_ids = {}
+    for id_field, related_field in relations.items():
+        value = node.get(id_field) if isinstance(node, dict) else getattr(node, id_field, None)
+        if not value:
+            related_ids = [get_node_id(related_node) for related_node in get_related_nodes(node, related_field)
+                           if get_node_id(related_node) is not None]
+            value = related_ids if id_field.endswith("_ids") else next(iter(related_ids), None)
+        relation_ids[id_field] = value
+    return relation_ids
@@ -0,0 +1,287 @@
+import json
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Dict, Tuple, List
+
+PROFILE_HEADER = "x-grisera-profile"
+PROFILE_ID_HEADER = "x-grisera-profile-id"
+
+# Frames which mark the phase of request processing, checked from the innermost frame outwards
+PHASE_FRAMES = {
+    "get_links": "links",
+    "serialize_response": "serialization",
+    "solve_dependencies": "validation",
+    "request_body_to_args": "validation",
+    "request_params_to_args": "validation",
+    "run_endpoint_function": "service",
+}
+
+# Id of the profiled request handled in the current context, requests which are not profiled have no id
+_profiled_request_id: ContextVar[Optional[str]] = ContextVar("grisera_profiled_request_id", default=None)
+
+_explicit_phases: Dict[str, List[str]] = {}
+
+
+@contextmanager
+def profile_phase(name: str):
+    """
+    Tag code executed inside the context as the given phase in the request profile.
+    Explicit phases take precedence over phases recognised from frame names.
+    Phases are kept per profiled request, so concurrent requests on the same thread do not share them.
+
+    Args:
+        name (str): Name of the phase
+    """
+    request_id = _profiled_request_id.get()
+    if request_id is None:
+        yield
+        return
+    phases = _explicit_phases.setdefault(request_id, [])
+    phases.append(name)
+    try:
+        yield
+    finally:
+        phases.pop()
+        if not phases:
+            _explicit_phases.pop(request_id, None)
+
+
+class RequestSampler:
+    """
+    Sampling profiler collecting stacks of a single thread in a background thread
+
+    When the anchor frame is given, only stacks containing it are collected. The event loop thread runs
+    many requests, so the frame of the request coroutine is used as the anchor to skip samples taken while
+    other requests are running.
+
+    Attributes:
+        thread_id (int): Identity of sampled thread
+        interval (float): Time between samples in seconds
+        request_id (Optional[str]): Id of the profiled request, used to read its explicit phases
+        anchor_frame: Frame which must be on the sampled stack
+        stacks (Dict[Tuple[str, ...], int]): Number of samples of each stack, root frame first
+        sample_count (int): Number of collected samples
+        duration (float): Time of sampling in seconds
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005, request_id: Optional[str] = None,
+                 anchor_frame=None):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.request_id = request_id
+        self.anchor_frame = anchor_frame
+        self.stacks: Dict[Tuple[str, ...], int] = {}
+        self.sample_count = 0
+        self.duration = 0.0
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="grisera-profiler", daemon=True)
+        self._started_at = 0.0
+
+    def start(self):
+        """
+        Start sampling
+        """
+        self._started_at = time.perf_counter()
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop sampling and wait for the sampling thread to finish
+        """
+        self._stop_event.set()
+        self._thread.join()
+        self.duration = time.perf_counter() - self._started_at
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = self._collect_stack(frame)
+            if stack is None:
+                continue
+            self.stacks[stack] = self.stacks.get(stack, 0) + 1
+            self.sample_count += 1
+
+    def _collect_stack(self, frame) -> Optional[Tuple[str, ...]]:
+        frames = []
+        phase = None
+        anchored = self.anchor_frame is None
+        while frame is not None:
+            anchored = anchored or frame is self.anchor_frame
+            code = frame.f_code
+            if phase is None:
+                phase = PHASE_FRAMES.get(code.co_name)
+            frames.append(f"{code.co_name} ({_short_filename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        if not anchored:
+            return None
+        explicit_phases = _explicit_phases.get(self.request_id) if self.request_id is not None else None
+        if explicit_phases:
+            phase = explicit_phases[-1]
+        frames.append(f"[{phase or 'other'}]")
+        frames.reverse()
+        return tuple(frames)
+
+
+def _short_filename(filename: str):
+    parts = filename.replace("\\", "/").split("/")
+    return "/".join(parts[-2:])
+
+
+def write_collapsed(sampler: RequestSampler, path: str):
+    """
+    Write samples in collapsed stack format accepted by flamegraph.pl and speedscope
+
+    Args:
+        sampler (RequestSampler): Stopped sampler
+        path (str): Destination file path
+    """
+    with open(path, "w") as file:
+        for stack, count in sampler.stacks.items():
+            file.write(f"{';'.join(frame.replace(';', ':') for frame in stack)} {count}\n")
+
+
+def write_speedscope(sampler: RequestSampler, path: str, name: str):
+    """
+    Write samples in speedscope sampled profile format
+
+    Args:
+        sampler (RequestSampler): Stopped sampler
+        path (str): Destination file path
+        name (str): Name of the profile
+    """
+    frame_indexes: Dict[str, int] = {}
+    samples = []
+    weights = []
+    # Samples are delayed by the GIL, so the measured time per sample is used instead of the requested interval
+    sample_duration = sampler.duration / sampler.sample_count if sampler.sample_count else sampler.interval
+    for stack, count in sampler.stacks.items():
+        samples.append([frame_indexes.setdefault(frame, len(frame_indexes)) for frame in stack])
+        weights.append(count * sample_duration * 1000)
+    profile = {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": [{"name": frame} for frame in frame_indexes]},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "milliseconds",
+            "startValue": 0,
+            "endValue": sampler.duration * 1000,
+            "samples": samples,
+            "weights": weights,
+        }],
+        "name": name,
+        "exporter": "grisera",
+    }
+    with open(path, "w") as file:
+        json.dump(profile, file)
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware profiling requests with a sampling profiler and dumping flamegraph files to a local directory.
+
+    A request is profiled when profiling is enabled for all requests or when it contains the `X-Grisera-Profile`
+    header. Profiling is rate limited, so at most one request is profiled at the same time and consecutive
+    profiles are at least `min_interval` seconds apart. The id of the written profile is returned in the
+    `X-Grisera-Profile-Id` response header.
+
+    Each sampled stack starts with a phase tag (validation, service, links, serialization or other).
+
+    Only the event loop thread is sampled and samples are kept only while the profiled request's own task is
+    running, so other requests handled concurrently on the loop do not appear in the profile. Work which the
+    request hands off to other threads is not sampled.
+
+    Attributes:
+        app: Wrapped ASGI application
+        output_dir (str): Directory for profile files
+        enabled (bool): Profile every request, not only requests with the header
+        allow_header (bool): Allow enabling profiling with the request header
+        min_interval (float): Minimal number of seconds between the start of two profiles
+        sampling_interval (float): Time between samples in seconds
+        formats (List[str]): Output formats, "collapsed" and/or "speedscope"
+    """
+
+    def __init__(self, app, output_dir: str = "profiles", enabled: bool = False, allow_header: bool = True,
+                 min_interval: float = 10.0, sampling_interval: float = 0.005,
+                 formats: Optional[List[str]] = None):
+        self.app = app
+        self.output_dir = output_dir
+        self.enabled = enabled
+        self.allow_header = allow_header
+        self.min_interval = min_interval
+        self.sampling_interval = sampling_interval
+        self.formats = formats if formats is not None else ["collapsed", "speedscope"]
+        self._lock = threading.Lock()
+        self._active = False
+        self._last_profile_time = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._is_requested(scope) or not self._acquire():
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = self._profile_id(scope)
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (PROFILE_ID_HEADER.encode(), profile_id.encode())]
+            await send(message)
+
+        sampler = RequestSampler(threading.get_ident(), self.sampling_interval, profile_id, sys._getframe())
+        token = _profiled_request_id.set(profile_id)
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            sampler.stop()
+            _profiled_request_id.reset(token)
+            _explicit_phases.pop(profile_id, None)
+            try:
+                self._write(sampler, profile_id)
+            finally:
+                self._release()
+
+    def _is_requested(self, scope):
+        if self.enabled:
+            return True
+        if not self.allow_header:
+            return False
+        for key, value in scope.get("headers", []):
+            if key.decode("latin-1").lower() == PROFILE_HEADER:
+                return value.decode("latin-1").lower() not in ("", "0", "false", "no")
+        return False
+
+    def _acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._active or (self._last_profile_time is not None
+                                and now - self._last_profile_time < self.min_interval):
+                return False
+            self._active = True
+            self._last_profile_time = now
+            return True
+
+    def _release(self):
+        with self._lock:
+            self._active = False
+
+    @staticmethod
+    def _profile_id(scope):
+        path = re.sub(r"[^A-Za-z0-9]+", "_", scope.get("path", "")).strip("_")
+        return f"{time.strftime('%Y%m%d-%H%M%S')}-{int(time.time() * 1000) % 1000:03d}-{scope.get('method', '')}-{path}"
+
+    def _write(self, sampler: RequestSampler, profile_id: str):
+        os.makedirs(self.output_dir, exist_ok=True)
+        base_path = os.path.join(self.output_dir, profile_id)
+        if "collapsed" in self.formats:
+            write_collapsed(sampler, base_path + ".folded")
+        if "speedscope" in self.formats:
+            write_speedscope(sampler, base_path + ".speedscope.json", profile_id)
@@ -0,0 +1,52 @@
+from typing import Callable
+
+from grisera.models.cascade_delete_model import CascadeDeleteJobIn
+from grisera.services.cascade_delete import CascadeDeleter
+from grisera.services.service_factory import ServiceFactory
+from grisera.time_series.time_series_model import TimeSeriesTransformationIn
+
+TRANSFORM_TIME_SERIES = "transform_time_series"
+CASCADE_DELETE = "cascade_delete"
+
+
+def transform_time_series(service_factory: ServiceFactory, arguments: dict, report_progress: Callable[[float], None]):
+    """
+    Create new transformed time series in database
+
+    Args:
+        service_factory (ServiceFactory): Factory of services used by job
+        arguments (dict): Time series transformation as dictionary
+        report_progress (Callable[[float], None]): Function saving fraction of operation already done
+
+    Returns:
+        Transformed time series without signal values, which can be read by its id
+    """
+    time_series_transformation = TimeSeriesTransformationIn(**arguments)
+    report_progress(0)
+    result = service_factory.get_time_series_service().transform_time_series(time_series_transformation)
+    return result.copy(exclude={"signal_values"})
+
+
+def cascade_delete(service_factory: ServiceFactory, arguments: dict, report_progress: Callable[[float], None]):
+    """
+    Delete node with its dependent nodes from database
+
+    Args:
+        service_factory (ServiceFactory): Factory of services used by job
+        arguments (dict): Label, id and dry run flag of deleted node as dictionary
+        report_progress (Callable[[float], None]): Function saving fraction of operation already done
+
+    Returns:
+        Result of deletion as cascade delete object
+    """
+    cascade_delete_job = CascadeDeleteJobIn(**arguments)
+    report_progress(0)
+    return CascadeDeleter(service_factory, report_progress=report_progress).delete(
+        cascade_delete_job.label, cascade_delete_job.id, cascade_delete_job.dry_run)
+
+
+# Operations which can be executed by jobs by their names
+JOB_HANDLERS = {
+    TRANSFORM_TIME_SERIES: transform_time_series,
+    CASCADE_DELETE: cascade_delete,
+}
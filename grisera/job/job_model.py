@@ -0,0 +1,46 @@
+from enum import Enum
+from typing import Optional, Any
+
+from grisera.models.base_model_out import BaseModelOut
+
+
+class JobStatus(str, Enum):
+    """
+    The state of job
+
+    Attributes:
+        queued (str): Job waits for a free worker
+        running (str): Job is executed by worker
+        succeeded (str): Job finished and its result is available
+        failed (str): Job finished with errors
+    """
+
+    queued = "queued"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+
+
+class JobOut(BaseModelOut):
+    """
+    Model of job executing long-running operation outside of request to send to client as a result of request
+
+    Attributes:
+        id (Optional[str]): Id of job
+        name (Optional[str]): Name of operation executed by job
+        status (Optional[JobStatus]): State of job
+        progress (float): Fraction of operation already done, from 0 to 1
+        result (Optional[Any]): Result of operation, when job succeeded
+        created_at (Optional[float]): Time of submitting job as seconds since epoch
+        started_at (Optional[float]): Time of starting job by worker as seconds since epoch
+        finished_at (Optional[float]): Time of finishing job as seconds since epoch
+    """
+
+    id: Optional[str]
+    name: Optional[str]
+    status: Optional[JobStatus]
+    progress: float = 0
+    result: Optional[Any]
+    created_at: Optional[float]
+    started_at: Optional[float]
+    finished_at: Optional[float]
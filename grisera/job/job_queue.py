@@ -0,0 +1,250 @@
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing
+from typing import Optional
+
+from grisera.job.job_model import JobOut, JobStatus
+
+JOB_FIELDS = ["id", "name", "arguments", "status", "progress", "result", "errors", "created_at", "started_at",
+              "finished_at"]
+
+
+class JobQueue:
+    """
+    Abstract class to handle queue of jobs shared by API and workers
+
+    Arguments, results and errors of jobs are JSON compatible values, so jobs can be kept outside of the process.
+    Running jobs are owned by the worker which took them and the worker sends heartbeats while executing them.
+    """
+
+    def put(self, name: str, arguments: dict):
+        """
+        Add job to the end of queue
+
+        Args:
+            name (str): Name of operation executed by job
+            arguments (dict): Arguments of operation
+
+        Returns:
+            Added job
+        """
+        raise Exception("put not implemented yet")
+
+    def take(self, timeout: float, worker_id: Optional[str] = None):
+        """
+        Take the oldest queued job and mark it as running by given worker
+
+        Args:
+            timeout (float): The longest time in seconds to wait for a queued job
+            worker_id (Optional[str]): Id of worker taking job
+
+        Returns:
+            Tuple of id, name and arguments of job or None if no job was queued in time
+        """
+        raise Exception("take not implemented yet")
+
+    def heartbeat(self, job_id: str, worker_id: Optional[str] = None):
+        """
+        Mark running job as still executed by its worker
+
+        By default heartbeats are ignored, which is enough for queues kept in memory of the process executing jobs.
+        Queues shared by processes should requeue running jobs without heartbeat for too long, because their
+        workers were stopped before finishing them, and ignore heartbeats of workers which no longer own the job.
+
+        Args:
+            job_id (str): Id of job
+            worker_id (Optional[str]): Id of worker executing job
+        """
+        pass
+
+    def update(self, job_id: str, worker_id: Optional[str] = None, **changes):
+        """
+        Change state of job
+
+        When worker id is given, the job is changed only if it is still owned by the worker, so a worker whose job
+        was queued again and taken by another worker does not overwrite its state.
+
+        Args:
+            job_id (str): Id of job
+            worker_id (Optional[str]): Id of worker executing job
+            changes: New values of status, progress, result, errors or finished_at
+        """
+        raise Exception("update not implemented yet")
+
+    def get(self, job_id: str) -> Optional[JobOut]:
+        """
+        Get state of job
+
+        Args:
+            job_id (str): Id of job
+
+        Returns:
+            Job or None if it does not exist
+        """
+        raise Exception("get not implemented yet")
+
+    @staticmethod
+    def _new_job(name: str, arguments: dict):
+        return {"id": uuid.uuid4().hex, "name": name, "arguments": arguments, "status": JobStatus.queued.value,
+                "progress": 0, "result": None, "errors": None, "created_at": time.time(), "started_at": None,
+                "finished_at": None}
+
+    @staticmethod
+    def _job_out(job: dict):
+        return JobOut(**{field: value for field, value in job.items() if field in JOB_FIELDS and field != "arguments"})
+
+
+class InMemoryJobQueue(JobQueue):
+    """
+    Queue of jobs kept in memory of the process, lost on restart
+
+    Finished jobs are forgotten in order of finishing when there are more than max_finished_jobs of them.
+
+    Attributes:
+        max_finished_jobs (int): The greatest number of finished jobs kept with their results
+    """
+
+    def __init__(self, max_finished_jobs: int = 1000):
+        self.max_finished_jobs = max_finished_jobs
+        self._jobs = {}
+        self._queued_ids = []
+        self._finished_ids = []
+        self._condition = threading.Condition()
+
+    def put(self, name: str, arguments: dict):
+        job = self._new_job(name, arguments)
+        with self._condition:
+            self._jobs[job["id"]] = job
+            self._queued_ids.append(job["id"])
+            self._condition.notify()
+        return self._job_out(job)
+
+    def take(self, timeout: float, worker_id: Optional[str] = None):
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._queued_ids, timeout):
+                return None
+            job = self._jobs[self._queued_ids.pop(0)]
+            job.update(status=JobStatus.running.value, started_at=time.time(), worker_id=worker_id)
+            return job["id"], job["name"], job["arguments"]
+
+    def update(self, job_id: str, worker_id: Optional[str] = None, **changes):
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None or worker_id is not None and job.get("worker_id") != worker_id:
+                return
+            job.update(changes)
+            if job["status"] in (JobStatus.succeeded.value, JobStatus.failed.value):
+                job["arguments"] = None
+                self._finished_ids.append(job_id)
+                while len(self._finished_ids) > self.max_finished_jobs:
+                    self._jobs.pop(self._finished_ids.pop(0), None)
+
+    def get(self, job_id: str):
+        with self._condition:
+            job = self._jobs.get(job_id)
+            return self._job_out(job) if job is not None else None
+
+
+class SQLiteJobQueue(JobQueue):
+    """
+    Queue of jobs kept in SQLite database, shared by processes using the same file and kept after restart
+
+    Jobs are claimed in a write transaction, so each job is taken by one worker. Workers poll the database for
+    queued jobs every poll_interval seconds. Before claiming, running jobs without heartbeat of their worker for
+    stale_timeout seconds are queued again, so jobs of stopped or killed workers are executed by other workers.
+
+    Attributes:
+        path (str): Path of database file
+        poll_interval (float): Time in seconds between checks for queued jobs
+        stale_timeout (float): Time in seconds without heartbeat after which running job is queued again
+    """
+
+    def __init__(self, path: str, poll_interval: float = 0.5, stale_timeout: float = 60.0):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.stale_timeout = stale_timeout
+        with closing(self._connect()) as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS jobs (id TEXT PRIMARY KEY, name TEXT, arguments TEXT, "
+                               "status TEXT, progress REAL, result TEXT, errors TEXT, created_at REAL, "
+                               "started_at REAL, finished_at REAL, worker_id TEXT, heartbeat_at REAL)")
+            columns = [row[1] for row in connection.execute("PRAGMA table_info(jobs)")]
+            # Databases created before workers owned jobs get the missing columns
+            for column, column_type in (("worker_id", "TEXT"), ("heartbeat_at", "REAL")):
+                if column not in columns:
+                    connection.execute(f"ALTER TABLE jobs ADD COLUMN {column} {column_type}")
+            connection.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+
+    def put(self, name: str, arguments: dict):
+        job = self._new_job(name, arguments)
+        with closing(self._connect()) as connection:
+            connection.execute(f"INSERT INTO jobs ({', '.join(JOB_FIELDS)}) "
+                               f"VALUES ({', '.join('?' * len(JOB_FIELDS))})", self._to_row(job))
+        return self._job_out(job)
+
+    def take(self, timeout: float, worker_id: Optional[str] = None):
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self._claim(worker_id)
+            if job is not None or time.monotonic() >= deadline:
+                return job
+            time.sleep(min(self.poll_interval, max(deadline - time.monotonic(), 0)))
+
+    def update(self, job_id: str, worker_id: Optional[str] = None, **changes):
+        if not changes:
+            return
+        fields = list(changes)
+        values = [json.dumps(changes[field]) if field in ("result", "errors") else changes[field] for field in fields]
+        if changes.get("status") in (JobStatus.succeeded.value, JobStatus.failed.value):
+            fields.append("arguments")
+            values.append(None)
+        condition = "id = ?" if worker_id is None else "id = ? AND worker_id = ?"
+        condition_values = [job_id] if worker_id is None else [job_id, worker_id]
+        with closing(self._connect()) as connection:
+            connection.execute(f"UPDATE jobs SET {', '.join(f'{field} = ?' for field in fields)} WHERE {condition}",
+                               [*values, *condition_values])
+
+    def get(self, job_id: str):
+        with closing(self._connect()) as connection:
+            row = connection.execute(f"SELECT {', '.join(JOB_FIELDS)} FROM jobs WHERE id = ?", [job_id]).fetchone()
+        return self._job_out(self._from_row(row)) if row is not None else None
+
+    def heartbeat(self, job_id: str, worker_id: Optional[str] = None):
+        condition = "" if worker_id is None else " AND worker_id = ?"
+        with closing(self._connect()) as connection:
+            connection.execute(f"UPDATE jobs SET heartbeat_at = ? WHERE id = ? AND status = ?{condition}",
+                               [time.time(), job_id, JobStatus.running.value,
+                                *([] if worker_id is None else [worker_id])])
+
+    def _claim(self, worker_id: Optional[str]):
+        now = time.time()
+        with closing(self._connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("UPDATE jobs SET status = ?, started_at = NULL, progress = 0, worker_id = NULL, "
+                               "heartbeat_at = NULL WHERE status = ? AND COALESCE(heartbeat_at, started_at) < ?",
+                               [JobStatus.queued.value, JobStatus.running.value, now - self.stale_timeout])
+            row = connection.execute("SELECT id, name, arguments FROM jobs WHERE status = ? ORDER BY created_at "
+                                     "LIMIT 1", [JobStatus.queued.value]).fetchone()
+            if row is not None:
+                connection.execute("UPDATE jobs SET status = ?, started_at = ?, worker_id = ?, heartbeat_at = ? "
+                                   "WHERE id = ?", [JobStatus.running.value, now, worker_id, now, row[0]])
+            connection.execute("COMMIT")
+        return (row[0], row[1], json.loads(row[2])) if row is not None else None
+
+    def _connect(self):
+        # Connections are not shared between threads of workers and requests, statements are committed at once
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    @staticmethod
+    def _to_row(job: dict):
+        return [json.dumps(job[field]) if field in ("arguments", "result", "errors") else job[field]
+                for field in JOB_FIELDS]
+
+    @staticmethod
+    def _from_row(row):
+        job = dict(zip(JOB_FIELDS, row))
+        for field in ("arguments", "result", "errors"):
+            job[field] = json.loads(job[field]) if job[field] is not None else None
+        return job
@@ -0,0 +1,36 @@
+from fastapi import Response, Depends
+from fastapi_utils.cbv import cbv
+from fastapi_utils.inferring_router import InferringRouter
+
+from grisera.helpers.hateoas import get_links
+from grisera.job.job_model import JobOut
+from grisera.job.job_service import JobService, get_job_service
+
+router = InferringRouter()
+
+
+@cbv(router)
+class JobRouter:
+    """
+    Class for routing job based requests
+
+    Attributes:
+        job_service (JobService): Service instance for jobs
+    """
+
+    def __init__(self, job_service: JobService = Depends(get_job_service)):
+        self.job_service = job_service
+
+    @router.get("/jobs/{job_id}", tags=["jobs"], response_model=JobOut)
+    async def get_job(self, job_id: str, response: Response):
+        """
+        Get state of job. Result of operation is available when job succeeded and errors when it failed.
+        """
+        get_response = self.job_service.get_job(job_id)
+        if get_response.status is None:
+            response.status_code = 404
+
+        # add links from hateoas
+        get_response.links = get_links(router)
+
+        return get_response
@@ -0,0 +1,180 @@
+import json
+import threading
+import time
+import uuid
+from typing import Optional, Callable
+
+from pydantic import BaseModel
+
+from grisera.job.job_handlers import JOB_HANDLERS
+from grisera.job.job_model import JobOut, JobStatus
+from grisera.job.job_queue import JobQueue, InMemoryJobQueue
+from grisera.services.service import service
+
+
+class JobService:
+    """
+    Class to submit jobs executing long-running operations and to read their progress and results
+
+    Jobs are kept in a queue and executed by a pool of worker threads of the process, started on the first
+    submitted job. Number of workers limits how many heavy operations run at the same time, independently of
+    requests served by API. Services used by jobs come from the service factory configured for API.
+
+    Each started pool of workers has its own stop event, so workers of a stopped pool which are still finishing
+    their jobs are never restarted by the next pool. Workers send heartbeats of their running jobs every
+    heartbeat_interval seconds and keep working after errors of the queue.
+
+    Attributes:
+        queue (JobQueue): Queue of jobs
+        worker_count (int): Number of worker threads
+        heartbeat_interval (float): Time in seconds between heartbeats of running job
+        handlers (Dict[str, Callable]): Operations executed by jobs by their names
+    """
+
+    def __init__(self, queue: Optional[JobQueue] = None, worker_count: int = 2, heartbeat_interval: float = 10.0):
+        self.queue = queue if queue is not None else InMemoryJobQueue()
+        self.worker_count = worker_count
+        self.heartbeat_interval = heartbeat_interval
+        self.handlers = dict(JOB_HANDLERS)
+        self._workers = []
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+
+    def configure(self, queue: JobQueue, worker_count: Optional[int] = None):
+        """
+        Replace queue of jobs, stopping workers using the previous one
+
+        Args:
+            queue (JobQueue): New queue of jobs
+            worker_count (Optional[int]): New number of worker threads
+        """
+        self.stop()
+        self.queue = queue
+        if worker_count is not None:
+            self.worker_count = worker_count
+
+    def register_handler(self, name: str, handler: Callable):
+        """
+        Add operation which can be executed by jobs
+
+        Args:
+            name (str): Name of operation
+            handler (Callable): Function called with service factory, arguments and function reporting progress,
+                returning result model
+        """
+        self.handlers[name] = handler
+
+    def submit_job(self, name: str, arguments: BaseModel):
+        """
+        Queue job executing operation
+
+        Args:
+            name (str): Name of operation
+            arguments (BaseModel): Arguments of operation
+
+        Returns:
+            Result of request as job object
+        """
+        if name not in self.handlers:
+            return JobOut(name=name, errors=f"job {name} is not supported")
+        job = self.queue.put(name, json.loads(arguments.json()))
+        self.start()
+        return job
+
+    def get_job(self, job_id: str):
+        """
+        Get progress and result of job
+
+        Args:
+            job_id (str): Id of job
+
+        Returns:
+            Result of request as job object
+        """
+        job = self.queue.get(job_id)
+        return job if job is not None else JobOut(id=job_id, errors=f"job {job_id} not found")
+
+    def start(self):
+        """
+        Start worker threads, if they are not running
+        """
+        with self._lock:
+            if self._workers:
+                return
+            self._stopped = threading.Event()
+            pool_id = uuid.uuid4().hex
+            self._workers = [threading.Thread(target=self._work, args=(self.queue, self._stopped,
+                                                                       f"{pool_id}-{index}"),
+                                              daemon=True, name=f"grisera-job-worker-{index}")
+                             for index in range(self.worker_count)]
+            for worker in self._workers:
+                worker.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stop worker threads after they finish their current jobs
+
+        Workers still running after timeout finish their current jobs and exit, also when new workers are started.
+
+        Args:
+            timeout (Optional[float]): The longest time in seconds to wait for each worker
+        """
+        with self._lock:
+            self._stopped.set()
+            for worker in self._workers:
+                worker.join(timeout)
+            self._workers = []
+
+    def _work(self, queue: JobQueue, stopped: threading.Event, worker_id: str):
+        while not stopped.is_set():
+            try:
+                job = queue.take(timeout=1, worker_id=worker_id)
+                if job is not None:
+                    self._execute(queue, worker_id, *job)
+            except Exception:
+                # Errors of queue, e.g. of unavailable database, must not end the worker, taking is retried later
+                stopped.wait(1)
+
+    def _execute(self, queue: JobQueue, worker_id: str, job_id: str, name: str, arguments: dict):
+        def report_progress(progress: float):
+            queue.update(job_id, worker_id, progress=progress)
+
+        finished = threading.Event()
+        heartbeat = threading.Thread(target=self._send_heartbeats, args=(queue, worker_id, job_id, finished),
+                                     daemon=True, name=f"grisera-job-heartbeat-{job_id}")
+        heartbeat.start()
+        try:
+            result = self.handlers[name](service.get_service_factory(), arguments, report_progress)
+        except Exception as exception:
+            queue.update(job_id, worker_id, status=JobStatus.failed.value, errors=str(exception),
+                         finished_at=time.time())
+            return
+        finally:
+            finished.set()
+        if result.errors is not None:
+            errors = json.loads(json.dumps(result.errors, default=str))
+            queue.update(job_id, worker_id, status=JobStatus.failed.value, errors=errors, finished_at=time.time())
+            return
+        queue.update(job_id, worker_id, status=JobStatus.succeeded.value, progress=1,
+                     result=json.loads(result.json(exclude={"errors", "links"})), finished_at=time.time())
+
+    def _send_heartbeats(self, queue: JobQueue, worker_id: str, job_id: str, finished: threading.Event):
+        while not finished.wait(self.heartbeat_interval):
+            try:
+                queue.heartbeat(job_id, worker_id)
+            except Exception:
+                # Missed heartbeat is sent again after the next interval
+                pass
+
+
+job_service = JobService()
+
+
+def get_job_service():
+    """
+    Get job service shared by routers
+
+    Returns:
+        Job service
+    """
+    return job_service
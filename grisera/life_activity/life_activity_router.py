@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 from fastapi import Response, Depends
 from fastapi_utils.cbv import cbv
@@ -9,6 +9,7 @@ from grisera.life_activity.life_activity_model import (
     LifeActivityOut,
     LifeActivitiesOut,
 )
+from grisera.models.bulk_model import BulkCreateOut
 from grisera.models.not_found_model import NotFoundByIdModel
 from grisera.services.service import service
 from grisera.services.service_factory import ServiceFactory
@@ -48,6 +49,26 @@ class LifeActivityRouter:
 
         return create_response
 
+    @router.post(
+        "/life_activities/bulk",
+        tags=["life_activities"],
+        response_model=BulkCreateOut[LifeActivityOut],
+    )
+    async def create_life_activities(self, life_activities: List[LifeActivityIn], response: Response):
+        """
+        Create many life activities in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[LifeActivityOut].from_results(
+            self.life_activity_service.save_life_activities(life_activities)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
     @router.get(
         "/life_activities/{life_activity_id}",
         tags=["life activities"],
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.life_activity.life_activity_model import LifeActivityIn
 
@@ -21,6 +21,21 @@ class LifeActivityService:
         """
         raise Exception("save_life_activity not implemented yet")
 
+    def save_life_activities(self, life_activities: List[LifeActivityIn]):
+        """
+        Send request to graph api to create many new life activities
+
+        Implementations should create all life activities in one transaction. By default life activities are saved one
+        by one with save_life_activity.
+
+        Args:
+            life_activities (List[LifeActivityIn]): Life activities to be added
+
+        Returns:
+            List of results of request as life activity objects, in order of life activities
+        """
+        return [self.save_life_activity(life_activity) for life_activity in life_activities]
+
     def get_life_activities(self):
         """
         Send request to graph api to get all life activities
@@ -9,7 +9,8 @@ from grisera.measure.measure_model import (
     MeasurePropertyIn,
     MeasureRelationIn,
 )
-from typing import Union
+from typing import Union, List
+from grisera.models.bulk_model import BulkCreateOut, BulkUpdateOut, RelationshipUpdateIn
 from grisera.models.not_found_model import NotFoundByIdModel
 from grisera.services.service import service
 from grisera.services.service_factory import ServiceFactory
@@ -44,6 +45,48 @@ class MeasureRouter:
 
         return create_response
 
+    @router.post(
+        "/measures/bulk",
+        tags=["measures"],
+        response_model=BulkCreateOut[MeasureOut],
+    )
+    async def create_measures(self, measures: List[MeasureIn], response: Response):
+        """
+        Create many measures in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[MeasureOut].from_results(
+            self.measure_service.save_measures(measures)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.put(
+        "/measures/relationships",
+        tags=["measures"],
+        response_model=BulkUpdateOut[MeasureOut],
+    )
+    async def update_measure_relationships_bulk(
+        self, updates: List[RelationshipUpdateIn[MeasureRelationIn]], response: Response
+    ):
+        """
+        Update relationships of many measures at once, returning result of updating each one
+        """
+        update_response = BulkUpdateOut[MeasureOut].from_results(
+            self.measure_service.update_measure_relationships_bulk(updates)
+        )
+        if update_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        update_response.links = get_links(router)
+
+        return update_response
+
     @router.get("/measures", tags=["measures"], response_model=MeasuresOut)
     async def get_measures(self, response: Response):
         """
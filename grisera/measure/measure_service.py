@@ -1,6 +1,7 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.measure.measure_model import MeasurePropertyIn, MeasureIn, MeasureRelationIn
+from grisera.models.bulk_model import RelationshipUpdateIn
 
 
 class MeasureService:
@@ -21,6 +22,21 @@ class MeasureService:
         """
         raise Exception("save_measure not implemented yet")
 
+    def save_measures(self, measures: List[MeasureIn]):
+        """
+        Send request to graph api to create many new measures
+
+        Implementations should create all measures in one transaction. By default measures are saved one by one with
+        save_measure.
+
+        Args:
+            measures (List[MeasureIn]): Measures to be added
+
+        Returns:
+            List of results of request as measure objects, in order of measures
+        """
+        return [self.save_measure(measure) for measure in measures]
+
     def get_measures(self):
         """
         Send request to graph api to get measures
@@ -81,3 +97,19 @@ class MeasureService:
             Result of request as measure object
         """
         raise Exception("update_measure_relationships not implemented yet")
+
+    def update_measure_relationships_bulk(self, updates: List[RelationshipUpdateIn]):
+        """
+        Send request to graph api to update relationships of many measures
+
+        Implementations can collect referenced ids of all updates with collect_referenced_ids, validate each of them
+        once and apply all updates in one transaction. By default updates are applied one by one with
+        update_measure_relationships.
+
+        Args:
+            updates (List[RelationshipUpdateIn]): Ids of measures with relationships to update
+
+        Returns:
+            List of results of request as measure objects, in order of updates
+        """
+        return [self.update_measure_relationships(update.id, update.relationships) for update in updates]
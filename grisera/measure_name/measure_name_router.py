@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 from fastapi import Response, Depends
 from fastapi_utils.cbv import cbv
@@ -9,6 +9,7 @@ from grisera.measure_name.measure_name_model import (
     MeasureNameOut,
     MeasureNamesOut,
 )
+from grisera.models.bulk_model import BulkCreateOut
 from grisera.models.not_found_model import NotFoundByIdModel
 from grisera.services.service import service
 from grisera.services.service_factory import ServiceFactory
@@ -48,6 +49,26 @@ class MeasureNameRouter:
 
         return create_response
 
+    @router.post(
+        "/measure_names/bulk",
+        tags=["measure names"],
+        response_model=BulkCreateOut[MeasureNameOut],
+    )
+    async def create_measure_names(self, measure_names: List[MeasureNameIn], response: Response):
+        """
+        Create many measure names in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[MeasureNameOut].from_results(
+            self.measure_name_service.save_measure_names(measure_names)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
     @router.get(
         "/measure_names/{measure_name_id}",
         tags=["measure names"],
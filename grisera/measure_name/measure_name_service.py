@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.measure_name.measure_name_model import MeasureNameIn
 
@@ -22,6 +22,21 @@ class MeasureNameService:
 
         raise Exception("save_measure_name not implemented yet")
 
+    def save_measure_names(self, measure_names: List[MeasureNameIn]):
+        """
+        Send request to graph api to create many new measure names
+
+        Implementations should create all measure names in one transaction. By default measure names are saved one by
+        one with save_measure_name.
+
+        Args:
+            measure_names (List[MeasureNameIn]): Measure names to be added
+
+        Returns:
+            List of results of request as measure name objects, in order of measure names
+        """
+        return [self.save_measure_name(measure_name) for measure_name in measure_names]
+
     def get_measure_names(self):
         """
         Send request to graph api to get all measure names
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 from fastapi import Response, Depends
 from fastapi_utils.cbv import cbv
@@ -7,6 +7,7 @@ from grisera.modality.modality_model import ModalityIn
 from grisera.helpers.hateoas import get_links
 from grisera.modality.modality_model import ModalityOut, ModalitiesOut
 
+from grisera.models.bulk_model import BulkCreateOut
 from grisera.models.not_found_model import NotFoundByIdModel
 from grisera.services.service import service
 from grisera.services.service_factory import ServiceFactory
@@ -44,6 +45,26 @@ class ModalityRouter:
 
         return create_response
 
+    @router.post(
+        "/modalities/bulk",
+        tags=["modalities"],
+        response_model=BulkCreateOut[ModalityOut],
+    )
+    async def create_modalities(self, modalities: List[ModalityIn], response: Response):
+        """
+        Create many modalities in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[ModalityOut].from_results(
+            self.modality_service.save_modalities(modalities)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
     @router.get(
         "/modalities/{modality_id}",
         tags=["modalities"],
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.modality.modality_model import ModalityIn
 
@@ -21,6 +21,21 @@ class ModalityService:
         """
         raise Exception("save_modality not implemented yet")
 
+    def save_modalities(self, modalities: List[ModalityIn]):
+        """
+        Send request to graph api to create many new modalities
+
+        Implementations should create all modalities in one transaction. By default modalities are saved one by one with
+        save_modality.
+
+        Args:
+            modalities (List[ModalityIn]): Modalities to be added
+
+        Returns:
+            List of results of request as modality objects, in order of modalities
+        """
+        return [self.save_modality(modality) for modality in modalities]
+
     def get_modalities(self):
         """
         Send request to graph api to get all modalities
@@ -0,0 +1,65 @@
+from typing import Generic, List, TypeVar, Union
+
+from pydantic.generics import GenericModel
+
+from grisera.models.base_model_out import BaseModelOut
+from grisera.models.not_found_model import NotFoundByIdModel
+
+ModelOut = TypeVar("ModelOut")
+RelationIn = TypeVar("RelationIn")
+
+
+class BulkCreateOut(GenericModel, BaseModelOut, Generic[ModelOut]):
+    """
+    Model of result of creating many entities in one request
+
+    Attributes:
+        results (List[ModelOut]): Results of creating each entity, in order of request, with their own errors
+        error_count (int): Number of entities which were not created
+        errors (Optional[Any]): Indexes of entities which were not created with their errors
+    """
+
+    results: List[ModelOut] = []
+    error_count: int = 0
+
+    @classmethod
+    def from_results(cls, results: list):
+        """
+        Create bulk result from results of creating each entity
+
+        Args:
+            results (list): Results of creating each entity
+
+        Returns:
+            New bulk result, with errors if any entity was not created
+        """
+        errors = [{"index": index, "errors": result.errors} for index, result in enumerate(results)
+                  if result.errors is not None]
+        return cls(results=results, error_count=len(errors), errors=errors if errors else None)
+
+
+class BulkUpdateOut(BulkCreateOut[ModelOut], Generic[ModelOut]):
+    """
+    Model of result of updating many entities in one request
+
+    Attributes:
+        results (List[Union[ModelOut, NotFoundByIdModel]]): Results of updating each entity, in order of request,
+            with their own errors
+        error_count (int): Number of entities which were not updated
+        errors (Optional[Any]): Indexes of entities which were not updated with their errors
+    """
+
+    results: List[Union[ModelOut, NotFoundByIdModel]] = []
+
+
+class RelationshipUpdateIn(GenericModel, Generic[RelationIn]):
+    """
+    Model of relationships of one entity to update in bulk request
+
+    Attributes:
+        id (Union[int, str]): Id of updated entity
+        relationships (RelationIn): Relationships to update
+    """
+
+    id: Union[int, str]
+    relationships: RelationIn
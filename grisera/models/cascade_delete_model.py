@@ -0,0 +1,44 @@
+from typing import Dict, List, Union
+
+from pydantic import BaseModel
+
+from grisera.models.base_model_out import BaseModelOut
+
+
+class CascadeDeleteJobIn(BaseModel):
+    """
+    Model of arguments of job deleting node with its dependent nodes
+
+    Attributes:
+        label (str): Label of deleted node
+        id (Union[int, str]): Id of deleted node
+        dry_run (bool): Only find nodes which would be deleted
+    """
+
+    label: str
+    id: Union[int, str]
+    dry_run: bool = False
+
+
+class CascadeDeleteOut(BaseModelOut):
+    """
+    Model of result of deleting node with its dependent nodes
+
+    Attributes:
+        id (Union[int, str]): Id of deleted node
+        dry_run (bool): Whether nodes were only found, without deleting them
+        nodes (Dict[str, List[Union[int, str]]]): Ids of dependent nodes and the node itself by label, in order of
+            deletion
+        kept (Dict[str, List[Union[int, str]]]): Ids of dependent nodes by label which are not deleted, because nodes
+            which are not deleted still refer to them, only their relationships to deleted nodes are removed
+        planned (Dict[str, int]): Number of nodes to delete by label, with signal values
+        deleted (Dict[str, int]): Number of deleted nodes by label, with signal values
+        errors (Optional[Any]): Label, id and errors of node which was not deleted, deletion stops at the first one
+    """
+
+    id: Union[int, str] = None
+    dry_run: bool = False
+    nodes: Dict[str, List[Union[int, str]]] = {}
+    kept: Dict[str, List[Union[int, str]]] = {}
+    planned: Dict[str, int] = {}
+    deleted: Dict[str, int] = {}
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 from fastapi import Response, Depends
 from fastapi_utils.cbv import cbv
@@ -10,6 +10,7 @@ from grisera.observable_information.observable_information_model import (
     ObservableInformationsOut,
 )
 
+from grisera.models.bulk_model import BulkCreateOut, BulkUpdateOut, RelationshipUpdateIn
 from grisera.models.not_found_model import NotFoundByIdModel
 from grisera.services.service import service
 from grisera.services.service_factory import ServiceFactory
@@ -53,6 +54,48 @@ class ObservableInformationRouter:
 
         return create_response
 
+    @router.post(
+        "/observable_information/bulk",
+        tags=["observable information"],
+        response_model=BulkCreateOut[ObservableInformationOut],
+    )
+    async def create_observable_informations(self, observable_informations: List[ObservableInformationIn], response: Response):
+        """
+        Create many observable informations in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[ObservableInformationOut].from_results(
+            self.observable_information_service.save_observable_informations(observable_informations)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.put(
+        "/observable_information/relationships",
+        tags=["observable information"],
+        response_model=BulkUpdateOut[ObservableInformationOut],
+    )
+    async def update_observable_information_relationships_bulk(
+        self, updates: List[RelationshipUpdateIn[ObservableInformationIn]], response: Response
+    ):
+        """
+        Update relationships of many observable informations at once, returning result of updating each one
+        """
+        update_response = BulkUpdateOut[ObservableInformationOut].from_results(
+            self.observable_information_service.update_observable_information_relationships_bulk(updates)
+        )
+        if update_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        update_response.links = get_links(router)
+
+        return update_response
+
     @router.get(
         "/observable_information",
         tags=["observable information"],
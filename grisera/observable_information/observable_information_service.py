@@ -1,6 +1,7 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.observable_information.observable_information_model import ObservableInformationIn
+from grisera.models.bulk_model import RelationshipUpdateIn
 
 
 class ObservableInformationService:
@@ -21,6 +22,21 @@ class ObservableInformationService:
         """
         raise Exception("save_observable_information not implemented yet")
 
+    def save_observable_informations(self, observable_informations: List[ObservableInformationIn]):
+        """
+        Send request to graph api to create many new observable informations
+
+        Implementations should create all observable informations in one transaction. By default observable informations
+        are saved one by one with save_observable_information.
+
+        Args:
+            observable_informations (List[ObservableInformationIn]): Observable informations to be added
+
+        Returns:
+            List of results of request as observable information objects, in order of observable informations
+        """
+        return [self.save_observable_information(observable_information) for observable_information in observable_informations]
+
     def get_observable_informations(self):
         """
         Send request to graph api to get observable information
@@ -61,3 +77,19 @@ class ObservableInformationService:
             Result of request as observable information object
         """
         raise Exception("update_observable_information_relationships not implemented yet")
+
+    def update_observable_information_relationships_bulk(self, updates: List[RelationshipUpdateIn]):
+        """
+        Send request to graph api to update relationships of many observable informations
+
+        Implementations can collect referenced ids of all updates with collect_referenced_ids, validate each of them
+        once and apply all updates in one transaction. By default updates are applied one by one with
+        update_observable_information_relationships.
+
+        Args:
+            updates (List[RelationshipUpdateIn]): Ids of observable informations with relationships to update
+
+        Returns:
+            List of results of request as observable information objects, in order of updates
+        """
+        return [self.update_observable_information_relationships(update.id, update.relationships) for update in updates]
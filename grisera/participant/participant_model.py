@@ -75,7 +75,72 @@ class ParticipantsOut(BaseModelOut):
     participants: List[BasicParticipantOut] = []
 
 
+class TimelineRecordingOut(BaseModel):
+    """
+    Model of recording in participant timeline with time ranges of its time series
+
+    Attributes:
+        recording_id (Optional[Union[int, str]]): Id of recording
+        registered_channel_id (Optional[Union[int, str]]): Id of registered channel of recording
+        start_timestamp (Optional[int]): Timestamp of the earliest signal value of recording
+        end_timestamp (Optional[int]): End timestamp of the latest signal value of recording
+        time_series (List[TimeSeriesWindowOut]): Time ranges of time series of observable informations of recording
+    """
+
+    recording_id: Optional[Union[int, str]]
+    registered_channel_id: Optional[Union[int, str]]
+    start_timestamp: Optional[int]
+    end_timestamp: Optional[int]
+    time_series: "List[TimeSeriesWindowOut]" = []
+
+
+class TimelineActivityExecutionOut(BaseModel):
+    """
+    Model of activity execution in participant timeline with recordings of participation
+
+    Attributes:
+        activity_execution_id (Optional[Union[int, str]]): Id of activity execution
+        activity_id (Optional[Union[int, str]]): Id of activity of activity execution
+        arrangement_id (Optional[Union[int, str]]): Id of arrangement of activity execution
+        participation_id (Optional[Union[int, str]]): Id of participation of participant in activity execution
+        participant_state_id (Optional[Union[int, str]]): Id of participant state of participation
+        start_timestamp (Optional[int]): Timestamp of the earliest signal value of participation
+        end_timestamp (Optional[int]): End timestamp of the latest signal value of participation
+        recordings (List[TimelineRecordingOut]): Recordings of participation
+    """
+
+    activity_execution_id: Optional[Union[int, str]]
+    activity_id: Optional[Union[int, str]]
+    arrangement_id: Optional[Union[int, str]]
+    participation_id: Optional[Union[int, str]]
+    participant_state_id: Optional[Union[int, str]]
+    start_timestamp: Optional[int]
+    end_timestamp: Optional[int]
+    recordings: List[TimelineRecordingOut] = []
+
+
+class ParticipantTimelineOut(BaseModelOut):
+    """
+    Model of participant timeline to send to client as a result of request
+
+    Activity executions are ordered by their start timestamps, those without signal values are at the end.
+
+    Attributes:
+        participant_id (Optional[Union[int, str]]): Id of participant
+        start_timestamp (Optional[int]): Timestamp of the earliest signal value of participant
+        end_timestamp (Optional[int]): End timestamp of the latest signal value of participant
+        activity_executions (List[TimelineActivityExecutionOut]): Activity executions of participant
+    """
+
+    participant_id: Optional[Union[int, str]]
+    start_timestamp: Optional[int]
+    end_timestamp: Optional[int]
+    activity_executions: List[TimelineActivityExecutionOut] = []
+
+
 # Circular import exception prevention
 from grisera.participant_state.participant_state_model import ParticipantStateOut
+from grisera.time_series.time_series_model import TimeSeriesWindowOut
 
 ParticipantOut.update_forward_refs()
+TimelineRecordingOut.update_forward_refs()
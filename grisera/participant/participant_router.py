@@ -2,13 +2,20 @@ from fastapi import Response, Depends
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
 from grisera.helpers.hateoas import get_links
-from typing import Union
+from typing import Union, List
 from grisera.participant.participant_model import (
     ParticipantIn,
     ParticipantOut,
     ParticipantsOut,
+    ParticipantTimelineOut,
 )
+from grisera.models.bulk_model import BulkCreateOut
+from grisera.job.job_handlers import CASCADE_DELETE
+from grisera.job.job_model import JobOut
+from grisera.job.job_service import JobService, get_job_service
+from grisera.models.cascade_delete_model import CascadeDeleteOut, CascadeDeleteJobIn
 from grisera.models.not_found_model import NotFoundByIdModel
+from grisera.services.cascade_delete import CascadeDeleter, PARTICIPANT
 from grisera.services.service import service
 from grisera.services.service_factory import ServiceFactory
 
@@ -22,10 +29,15 @@ class ParticipantRouter:
 
     Attributes:
         participant_service (ParticipantService): Service instance for participants
+        cascade_deleter (CascadeDeleter): Deleter of nodes with their dependent nodes
+        job_service (JobService): Service instance for jobs executing long-running operations
     """
 
-    def __init__(self, service_factory: ServiceFactory = Depends(service.get_service_factory)):
+    def __init__(self, service_factory: ServiceFactory = Depends(service.get_service_factory),
+                 job_service: JobService = Depends(get_job_service)):
         self.participant_service = service_factory.get_participant_service()
+        self.cascade_deleter = CascadeDeleter(service_factory)
+        self.job_service = job_service
 
     @router.post("/participants", tags=["participants"], response_model=ParticipantOut)
     async def create_participant(self, participant: ParticipantIn, response: Response):
@@ -45,6 +57,30 @@ class ParticipantRouter:
 
         return create_response
 
+    @router.post(
+        "/participants/bulk",
+        tags=["participants"],
+        response_model=BulkCreateOut[ParticipantOut],
+    )
+    async def create_participants(self, participants: List[ParticipantIn], response: Response):
+        """
+        Create many participants in database at once, returning result of creating each one
+        """
+        for participant in participants:
+            if participant.date_of_birth is not None:
+                participant.date_of_birth = participant.date_of_birth.__str__()
+
+        create_response = BulkCreateOut[ParticipantOut].from_results(
+            self.participant_service.save_participants(participants)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
     @router.get("/participants", tags=["participants"], response_model=ParticipantsOut)
     async def get_participants(self, response: Response):
         """
@@ -80,6 +116,26 @@ class ParticipantRouter:
 
         return get_response
 
+    @router.get(
+        "/participants/{participant_id}/timeline",
+        tags=["participants"],
+        response_model=ParticipantTimelineOut,
+    )
+    async def get_participant_timeline(self, participant_id: Union[str, int], response: Response):
+        """
+        Get activity executions of participant with recordings of participations and time ranges of their time
+        series, ordered by start timestamp. Signal values are not returned.
+        """
+
+        get_response = self.participant_service.get_participant_timeline(participant_id)
+        if get_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        get_response.links = get_links(router)
+
+        return get_response
+
     @router.delete(
         "/participants/{participant_id}",
         tags=["participants"],
@@ -100,6 +156,53 @@ class ParticipantRouter:
 
         return get_response
 
+    @router.delete(
+        "/participants/{participant_id}/cascade",
+        tags=["participants"],
+        response_model=CascadeDeleteOut,
+    )
+    async def delete_participant_cascade(
+        self, participant_id: Union[int, str], response: Response, dry_run: bool = False
+    ):
+        """
+        Delete participant with participant states and their participations, recordings, observable informations, time
+        series and signal values. Nodes are deleted starting from dependent ones. With dry_run nodes which would be
+        deleted are only counted.
+        """
+        delete_response = self.cascade_deleter.delete_participant(participant_id, dry_run)
+        if delete_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        delete_response.links = get_links(router)
+
+        return delete_response
+
+    @router.delete(
+        "/participants/{participant_id}/cascade/jobs",
+        tags=["participants"],
+        response_model=JobOut,
+        status_code=202,
+    )
+    async def delete_participant_cascade_job(
+        self, participant_id: Union[int, str], response: Response, dry_run: bool = False
+    ):
+        """
+        Queue job deleting participant with its dependent nodes as DELETE /participants/{participant_id}/cascade, for
+        deletions too long to wait for the response. Progress of the job is read from GET /jobs/{job_id} and its
+        result is the cascade delete object.
+        """
+        delete_response = self.job_service.submit_job(
+            CASCADE_DELETE, CascadeDeleteJobIn(label=PARTICIPANT, id=participant_id, dry_run=dry_run)
+        )
+        if delete_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        delete_response.links = get_links(router)
+
+        return delete_response
+
     @router.put(
         "/participants/{participant_id}",
         tags=["participants"],
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.participant.participant_model import ParticipantIn
 
@@ -21,6 +21,21 @@ class ParticipantService:
         """
         raise Exception("save_participant not implemented yet")
 
+    def save_participants(self, participants: List[ParticipantIn]):
+        """
+        Send request to graph api to create many new participants
+
+        Implementations should create all participants in one transaction. By default participants are saved one by one
+        with save_participant.
+
+        Args:
+            participants (List[ParticipantIn]): Participants to be added
+
+        Returns:
+            List of results of request as participant objects, in order of participants
+        """
+        return [self.save_participant(participant) for participant in participants]
+
     def get_participants(self):
         """
         Send request to graph api to get participants
@@ -43,6 +58,26 @@ class ParticipantService:
         """
         raise Exception("get_participant not implemented yet")
 
+    def get_participant_timeline(self, participant_id: Union[int, str]):
+        """
+        Send request to graph api to get timeline of participant: activity executions the participant took part in,
+        with recordings of participations and time ranges of their time series
+
+        Implementations should read the whole subgraph of participant with one query. By default it is read level
+        by level with ParticipantTimelineReader using services of the configured service factory.
+
+        Args:
+            participant_id (int | str): identity of participant
+
+        Returns:
+            Result of request as participant timeline object
+        """
+        # Imported here, because service factory modules import this module
+        from grisera.participant.participant_timeline import ParticipantTimelineReader
+        from grisera.services.service import service
+
+        return ParticipantTimelineReader(service.get_service_factory()).get_timeline(participant_id)
+
     def delete_participant(self, participant_id: Union[int, str]):
         """
         Send request to graph api to delete given participant
@@ -0,0 +1,137 @@
+from typing import Union, Dict, List
+
+from grisera.helpers.helpers import get_node_id, get_related_nodes, get_relation_ids
+from grisera.participant.participant_model import ParticipantTimelineOut, TimelineActivityExecutionOut, \
+    TimelineRecordingOut
+from grisera.services.service_factory import ServiceFactory
+
+
+def _get_range(elements: list):
+    start_timestamps = [element.start_timestamp for element in elements if element.start_timestamp is not None]
+    end_timestamps = [element.end_timestamp for element in elements if element.end_timestamp is not None]
+    return min(start_timestamps, default=None), max(end_timestamps, default=None)
+
+
+class ParticipantTimelineReader:
+    """
+    Class reading timeline of participant: activity executions the participant took part in, with recordings of
+    participations and time ranges of their time series
+
+    The subgraph is read level by level: participant states, participations, activity executions, recordings,
+    observable informations and time series. Ids of each level are planned from the previous one and deduplicated, so every node is read
+    once with depth 1 and time series are read as windows, without signal values.
+
+    Attributes:
+        service_factory (ServiceFactory): Factory of services used to read nodes
+    """
+
+    def __init__(self, service_factory: ServiceFactory):
+        self.service_factory = service_factory
+
+    def get_timeline(self, participant_id: Union[int, str]):
+        """
+        Read timeline of participant
+
+        Args:
+            participant_id (Union[int, str]): Id of participant
+
+        Returns:
+            Result of request as participant timeline object
+        """
+        participant = self.service_factory.get_participant_service().get_participant(participant_id, 1)
+        if participant.errors is not None:
+            return ParticipantTimelineOut(participant_id=participant_id, errors=participant.errors)
+
+        participant_states = self._read_level(
+            self.service_factory.get_participant_state_service().get_participant_state,
+            self._plan_level([participant], "participant_states"))
+        participations = self._read_level(self.service_factory.get_participation_service().get_participation,
+                                          self._plan_level(participant_states.values(), "participations"))
+        activity_executions_by_id = self._read_level(
+            self.service_factory.get_activity_execution_service().get_activity_execution,
+            self._plan_level(participations.values(), "activity_execution"))
+        recordings = self._read_level(self.service_factory.get_recording_service().get_recording,
+                                      self._plan_level(participations.values(), "recordings"))
+        observable_informations = self._read_level(
+            self.service_factory.get_observable_information_service().get_observable_information,
+            self._plan_level(recordings.values(), "observable_informations"))
+        time_series_windows = self._read_windows(self._plan_level(observable_informations.values(), "timeSeries"))
+
+        participant_state_ids = self._get_parent_ids(participant_states.values(), "participations")
+        activity_executions = []
+        for participation_id, participation in participations.items():
+            timeline_recordings = [self._get_recording(recordings[str(get_node_id(recording))],
+                                                       observable_informations, time_series_windows)
+                                   for recording in get_related_nodes(participation, "recordings")
+                                   if str(get_node_id(recording)) in recordings]
+            start_timestamp, end_timestamp = _get_range(timeline_recordings)
+            # Activity executions read with depth contain their activities and arrangements
+            activity_execution = next(iter(get_related_nodes(participation, "activity_execution")), {})
+            activity_execution = activity_executions_by_id.get(str(get_node_id(activity_execution)),
+                                                               activity_execution)
+            activity_executions.append(TimelineActivityExecutionOut(
+                activity_execution_id=get_node_id(activity_execution),
+                **get_relation_ids(activity_execution, {"activity_id": "activity", "arrangement_id": "arrangements"}),
+                participation_id=get_node_id(participation),
+                participant_state_id=participant_state_ids.get(participation_id),
+                start_timestamp=start_timestamp, end_timestamp=end_timestamp, recordings=timeline_recordings))
+
+        activity_executions.sort(key=lambda element: (element.start_timestamp is None, element.start_timestamp or 0))
+        start_timestamp, end_timestamp = _get_range(activity_executions)
+        return ParticipantTimelineOut(participant_id=participant_id, start_timestamp=start_timestamp,
+                                      end_timestamp=end_timestamp, activity_executions=activity_executions)
+
+    @staticmethod
+    def _plan_level(nodes, field: str) -> List[Union[int, str]]:
+        # Ids of related nodes in order of first appearance, each node once
+        node_ids = {}
+        for node in nodes:
+            for related_node in get_related_nodes(node, field):
+                related_id = get_node_id(related_node)
+                if related_id is not None:
+                    node_ids.setdefault(str(related_id), related_id)
+        return list(node_ids.values())
+
+    @staticmethod
+    def _read_level(get_node, node_ids: List[Union[int, str]]) -> Dict[str, object]:
+        # Nodes removed in the meantime are skipped
+        nodes = {}
+        for node_id in node_ids:
+            node = get_node(node_id, 1)
+            if node.errors is None:
+                nodes[str(node_id)] = node
+        return nodes
+
+    def _read_windows(self, time_series_ids: List[Union[int, str]]):
+        time_series_service = self.service_factory.get_time_series_service()
+        windows = {}
+        for time_series_id in time_series_ids:
+            window = time_series_service.get_time_series_window(time_series_id)
+            if window.errors is None:
+                windows[str(time_series_id)] = window
+        return windows
+
+    @staticmethod
+    def _get_parent_ids(parents, field: str) -> Dict[str, Union[int, str]]:
+        parent_ids = {}
+        for parent in parents:
+            for node in get_related_nodes(parent, field):
+                parent_ids.setdefault(str(get_node_id(node)), get_node_id(parent))
+        return parent_ids
+
+    @staticmethod
+    def _get_recording(recording, observable_informations: Dict[str, object], time_series_windows: Dict[str, object]):
+        windows = []
+        for observable_information in get_related_nodes(recording, "observable_informations"):
+            observable_information = observable_informations.get(str(get_node_id(observable_information)))
+            if observable_information is None:
+                continue
+            observable_information_id = get_node_id(observable_information)
+            for time_series in get_related_nodes(observable_information, "timeSeries"):
+                window = time_series_windows.get(str(get_node_id(time_series)))
+                if window is not None:
+                    windows.append(window.copy(update={"observable_information_id": observable_information_id}))
+        start_timestamp, end_timestamp = _get_range(windows)
+        return TimelineRecordingOut(recording_id=get_node_id(recording),
+                                    **get_relation_ids(recording, {"registered_channel_id": "registered_channel"}),
+                                    start_timestamp=start_timestamp, end_timestamp=end_timestamp, time_series=windows)
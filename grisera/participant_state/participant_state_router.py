@@ -9,7 +9,8 @@ from grisera.participant_state.participant_state_model import (
     ParticipantStatePropertyIn,
     ParticipantStateRelationIn,
 )
-from typing import Union
+from typing import Union, List
+from grisera.models.bulk_model import BulkCreateOut, BulkUpdateOut, RelationshipUpdateIn
 from grisera.models.not_found_model import NotFoundByIdModel
 from grisera.services.service import service
 from grisera.services.service_factory import ServiceFactory
@@ -52,6 +53,48 @@ class ParticipantStateRouter:
 
         return create_response
 
+    @router.post(
+        "/participant_state/bulk",
+        tags=["participant state"],
+        response_model=BulkCreateOut[ParticipantStateOut],
+    )
+    async def create_participant_states(self, participant_states: List[ParticipantStateIn], response: Response):
+        """
+        Create many participant states in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[ParticipantStateOut].from_results(
+            self.participant_state_service.save_participant_states(participant_states)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.put(
+        "/participant_state/relationships",
+        tags=["participant state"],
+        response_model=BulkUpdateOut[ParticipantStateOut],
+    )
+    async def update_participant_state_relationships_bulk(
+        self, updates: List[RelationshipUpdateIn[ParticipantStateRelationIn]], response: Response
+    ):
+        """
+        Update relationships of many participant states at once, returning result of updating each one
+        """
+        update_response = BulkUpdateOut[ParticipantStateOut].from_results(
+            self.participant_state_service.update_participant_state_relationships_bulk(updates)
+        )
+        if update_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        update_response.links = get_links(router)
+
+        return update_response
+
     @router.get(
         "/participant_state",
         tags=["participant state"],
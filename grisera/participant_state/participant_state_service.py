@@ -1,7 +1,8 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.participant_state.participant_state_model import ParticipantStatePropertyIn, ParticipantStateIn, \
     ParticipantStateRelationIn
+from grisera.models.bulk_model import RelationshipUpdateIn
 
 
 class ParticipantStateService:
@@ -22,6 +23,21 @@ class ParticipantStateService:
         """
         raise Exception("save_participant_state not implemented yet")
 
+    def save_participant_states(self, participant_states: List[ParticipantStateIn]):
+        """
+        Send request to graph api to create many new participant states
+
+        Implementations should create all participant states in one transaction. By default participant states are saved
+        one by one with save_participant_state.
+
+        Args:
+            participant_states (List[ParticipantStateIn]): Participant states to be added
+
+        Returns:
+            List of results of request as participant state objects, in order of participant states
+        """
+        return [self.save_participant_state(participant_state) for participant_state in participant_states]
+
     def get_participant_states(self):
         """
         Send request to graph api to get participant states
@@ -83,3 +99,19 @@ class ParticipantStateService:
             Result of request as participant state object
         """
         raise Exception("update_participant_state_relationships not implemented yet")
+
+    def update_participant_state_relationships_bulk(self, updates: List[RelationshipUpdateIn]):
+        """
+        Send request to graph api to update relationships of many participant states
+
+        Implementations can collect referenced ids of all updates with collect_referenced_ids, validate each of them
+        once and apply all updates in one transaction. By default updates are applied one by one with
+        update_participant_state_relationships.
+
+        Args:
+            updates (List[RelationshipUpdateIn]): Ids of participant states with relationships to update
+
+        Returns:
+            List of results of request as participant state objects, in order of updates
+        """
+        return [self.update_participant_state_relationships(update.id, update.relationships) for update in updates]
@@ -1,9 +1,10 @@
-from typing import Union
+from typing import Union, List
 
 from fastapi import Response, Depends
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
 from grisera.helpers.hateoas import get_links
+from grisera.models.bulk_model import BulkCreateOut, BulkUpdateOut, RelationshipUpdateIn
 from grisera.models.not_found_model import NotFoundByIdModel
 from grisera.participation.participation_model import (
     ParticipationIn,
@@ -46,6 +47,48 @@ class ParticipationRouter:
 
         return create_response
 
+    @router.post(
+        "/participations/bulk",
+        tags=["participations"],
+        response_model=BulkCreateOut[ParticipationOut],
+    )
+    async def create_participations(self, participations: List[ParticipationIn], response: Response):
+        """
+        Create many participations in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[ParticipationOut].from_results(
+            self.participation_service.save_participations(participations)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.put(
+        "/participations/relationships",
+        tags=["participations"],
+        response_model=BulkUpdateOut[ParticipationOut],
+    )
+    async def update_participation_relationships_bulk(
+        self, updates: List[RelationshipUpdateIn[ParticipationIn]], response: Response
+    ):
+        """
+        Update relationships of many participations at once, returning result of updating each one
+        """
+        update_response = BulkUpdateOut[ParticipationOut].from_results(
+            self.participation_service.update_participation_relationships_bulk(updates)
+        )
+        if update_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        update_response.links = get_links(router)
+
+        return update_response
+
     @router.get(
         "/participations", tags=["participations"], response_model=ParticipationsOut
     )
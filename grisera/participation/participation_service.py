@@ -1,6 +1,7 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.participation.participation_model import ParticipationIn
+from grisera.models.bulk_model import RelationshipUpdateIn
 
 
 class ParticipationService:
@@ -21,6 +22,21 @@ class ParticipationService:
         """
         raise Exception("save_participation not implemented yet")
 
+    def save_participations(self, participations: List[ParticipationIn]):
+        """
+        Send request to graph api to create many new participations
+
+        Implementations should create all participations in one transaction. By default participations are saved one by
+        one with save_participation.
+
+        Args:
+            participations (List[ParticipationIn]): Participations to be added
+
+        Returns:
+            List of results of request as participation objects, in order of participations
+        """
+        return [self.save_participation(participation) for participation in participations]
+
     def get_participations(self):
         """
         Send request to graph api to get participations
@@ -61,3 +77,19 @@ class ParticipationService:
             Result of request as participation object
         """
         raise Exception("update_participation_relationships not implemented yet")
+
+    def update_participation_relationships_bulk(self, updates: List[RelationshipUpdateIn]):
+        """
+        Send request to graph api to update relationships of many participations
+
+        Implementations can collect referenced ids of all updates with collect_referenced_ids, validate each of them
+        once and apply all updates in one transaction. By default updates are applied one by one with
+        update_participation_relationships.
+
+        Args:
+            updates (List[RelationshipUpdateIn]): Ids of participations with relationships to update
+
+        Returns:
+            List of results of request as participation objects, in order of updates
+        """
+        return [self.update_participation_relationships(update.id, update.relationships) for update in updates]
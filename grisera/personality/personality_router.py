@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 from fastapi import Response, Depends
 from fastapi_utils.cbv import cbv
@@ -12,6 +12,7 @@ from grisera.personality.personality_model import (
     PersonalitiesOut,
 )
 
+from grisera.models.bulk_model import BulkCreateOut
 from grisera.models.not_found_model import NotFoundByIdModel
 from grisera.services.service import service
 from grisera.services.service_factory import ServiceFactory
@@ -54,6 +55,26 @@ class PersonalityRouter:
 
         return create_response
 
+    @router.post(
+        "/personality/big_five_model/bulk",
+        tags=["personality"],
+        response_model=BulkCreateOut[PersonalityBigFiveOut],
+    )
+    async def create_personalities_big_five(self, personalities: List[PersonalityBigFiveIn], response: Response):
+        """
+        Create many personality big five models in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[PersonalityBigFiveOut].from_results(
+            self.personality_service.save_personalities_big_five(personalities)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
     @router.post(
         "/personality/panas_model",
         tags=["personality"],
@@ -75,6 +96,26 @@ class PersonalityRouter:
 
         return create_response
 
+    @router.post(
+        "/personality/panas_model/bulk",
+        tags=["personality"],
+        response_model=BulkCreateOut[PersonalityPanasOut],
+    )
+    async def create_personalities_panas(self, personalities: List[PersonalityPanasIn], response: Response):
+        """
+        Create many personality panas models in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[PersonalityPanasOut].from_results(
+            self.personality_service.save_personalities_panas(personalities)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
     @router.get(
         "/personality/{personality_id}",
         tags=["personality"],
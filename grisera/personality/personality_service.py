@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.personality.personality_model import PersonalityBigFiveIn, PersonalityPanasIn
 
@@ -21,6 +21,21 @@ class PersonalityService:
         """
         raise Exception("save_personality_big_five not implemented yet")
 
+    def save_personalities_big_five(self, personalities: List[PersonalityBigFiveIn]):
+        """
+        Send request to graph api to create many new personality big five models
+
+        Implementations should create all personality big five models in one transaction. By default personality big
+        five models are saved one by one with save_personality_big_five.
+
+        Args:
+            personalities (List[PersonalityBigFiveIn]): Personality big five models to be added
+
+        Returns:
+            List of results of request as personality big five model objects, in order of personality big five models
+        """
+        return [self.save_personality_big_five(personality) for personality in personalities]
+
     def save_personality_panas(self, personality: PersonalityPanasIn):
         """
         Send request to graph api to create new personality panas model
@@ -33,6 +48,21 @@ class PersonalityService:
         """
         raise Exception("save_personality_panas not implemented yet")
 
+    def save_personalities_panas(self, personalities: List[PersonalityPanasIn]):
+        """
+        Send request to graph api to create many new personality panas models
+
+        Implementations should create all personality panas models in one transaction. By default personality panas
+        models are saved one by one with save_personality_panas.
+
+        Args:
+            personalities (List[PersonalityPanasIn]): Personality panas models to be added
+
+        Returns:
+            List of results of request as personality panas model objects, in order of personality panas models
+        """
+        return [self.save_personality_panas(personality) for personality in personalities]
+
     def get_personality(self, personality_id: Union[int, str], depth: int = 0):
         """
         Send request to graph api to get given personality
@@ -1,9 +1,14 @@
-from typing import Union
+from typing import Union, List
 
 from fastapi import Response, Depends
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
 from grisera.helpers.hateoas import get_links
+from grisera.models.bulk_model import BulkCreateOut, BulkUpdateOut, RelationshipUpdateIn
+from grisera.job.job_handlers import CASCADE_DELETE
+from grisera.job.job_model import JobOut
+from grisera.job.job_service import JobService, get_job_service
+from grisera.models.cascade_delete_model import CascadeDeleteOut, CascadeDeleteJobIn
 from grisera.models.not_found_model import NotFoundByIdModel
 from grisera.recording.recording_model import (
     RecordingPropertyIn,
@@ -12,6 +17,7 @@ from grisera.recording.recording_model import (
     RecordingOut,
     RecordingsOut,
 )
+from grisera.services.cascade_delete import CascadeDeleter, RECORDING
 from grisera.services.service import service
 from grisera.services.service_factory import ServiceFactory
 
@@ -25,10 +31,15 @@ class RecordingRouter:
 
     Attributes:
         recording_service (RecordingService): Service instance for recording
+        cascade_deleter (CascadeDeleter): Deleter of nodes with their dependent nodes
+        job_service (JobService): Service instance for jobs executing long-running operations
     """
 
-    def __init__(self, service_factory: ServiceFactory = Depends(service.get_service_factory)):
+    def __init__(self, service_factory: ServiceFactory = Depends(service.get_service_factory),
+                 job_service: JobService = Depends(get_job_service)):
         self.recording_service = service_factory.get_recording_service()
+        self.cascade_deleter = CascadeDeleter(service_factory)
+        self.job_service = job_service
 
     @router.post("/recordings", tags=["recordings"], response_model=RecordingOut)
     async def create_recording(self, recording: RecordingIn, response: Response):
@@ -44,6 +55,48 @@ class RecordingRouter:
 
         return create_response
 
+    @router.post(
+        "/recordings/bulk",
+        tags=["recordings"],
+        response_model=BulkCreateOut[RecordingOut],
+    )
+    async def create_recordings(self, recordings: List[RecordingIn], response: Response):
+        """
+        Create many recordings in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[RecordingOut].from_results(
+            self.recording_service.save_recordings(recordings)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.put(
+        "/recordings/relationships",
+        tags=["recordings"],
+        response_model=BulkUpdateOut[RecordingOut],
+    )
+    async def update_recording_relationships_bulk(
+        self, updates: List[RelationshipUpdateIn[RecordingRelationIn]], response: Response
+    ):
+        """
+        Update relationships of many recordings at once, returning result of updating each one
+        """
+        update_response = BulkUpdateOut[RecordingOut].from_results(
+            self.recording_service.update_recording_relationships_bulk(updates)
+        )
+        if update_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        update_response.links = get_links(router)
+
+        return update_response
+
     @router.get("/recordings", tags=["recordings"], response_model=RecordingsOut)
     async def get_recordings(self, response: Response):
         """
@@ -97,6 +150,52 @@ class RecordingRouter:
 
         return get_response
 
+    @router.delete(
+        "/recordings/{recording_id}/cascade",
+        tags=["recordings"],
+        response_model=CascadeDeleteOut,
+    )
+    async def delete_recording_cascade(
+        self, recording_id: Union[int, str], response: Response, dry_run: bool = False
+    ):
+        """
+        Delete recording with observable informations, time series and signal values. Nodes are deleted starting from
+        dependent ones. With dry_run nodes which would be deleted are only counted.
+        """
+        delete_response = self.cascade_deleter.delete_recording(recording_id, dry_run)
+        if delete_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        delete_response.links = get_links(router)
+
+        return delete_response
+
+    @router.delete(
+        "/recordings/{recording_id}/cascade/jobs",
+        tags=["recordings"],
+        response_model=JobOut,
+        status_code=202,
+    )
+    async def delete_recording_cascade_job(
+        self, recording_id: Union[int, str], response: Response, dry_run: bool = False
+    ):
+        """
+        Queue job deleting recording with its dependent nodes as DELETE /recordings/{recording_id}/cascade, for
+        deletions too long to wait for the response. Progress of the job is read from GET /jobs/{job_id} and its
+        result is the cascade delete object.
+        """
+        delete_response = self.job_service.submit_job(
+            CASCADE_DELETE, CascadeDeleteJobIn(label=RECORDING, id=recording_id, dry_run=dry_run)
+        )
+        if delete_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        delete_response.links = get_links(router)
+
+        return delete_response
+
     @router.put(
         "/recordings/{recording_id}",
         tags=["recordings"],
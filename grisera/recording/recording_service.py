@@ -1,6 +1,7 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.recording.recording_model import RecordingPropertyIn, RecordingIn, RecordingRelationIn
+from grisera.models.bulk_model import RelationshipUpdateIn
 
 
 class RecordingService:
@@ -21,6 +22,21 @@ class RecordingService:
         """
         raise Exception("save_recording not implemented yet")
 
+    def save_recordings(self, recordings: List[RecordingIn]):
+        """
+        Send request to graph api to create many new recordings
+
+        Implementations should create all recordings in one transaction. By default recordings are saved one by one with
+        save_recording.
+
+        Args:
+            recordings (List[RecordingIn]): Recordings to be added
+
+        Returns:
+            List of results of request as recording objects, in order of recordings
+        """
+        return [self.save_recording(recording) for recording in recordings]
+
     def get_recordings(self):
         """
         Send request to graph api to get recordings
@@ -72,3 +88,19 @@ class RecordingService:
             Result of request as recording object
         """
         raise Exception("update_recording_relationships not implemented yet")
+
+    def update_recording_relationships_bulk(self, updates: List[RelationshipUpdateIn]):
+        """
+        Send request to graph api to update relationships of many recordings
+
+        Implementations can collect referenced ids of all updates with collect_referenced_ids, validate each of them
+        once and apply all updates in one transaction. By default updates are applied one by one with
+        update_recording_relationships.
+
+        Args:
+            updates (List[RelationshipUpdateIn]): Ids of recordings with relationships to update
+
+        Returns:
+            List of results of request as recording objects, in order of updates
+        """
+        return [self.update_recording_relationships(update.id, update.relationships) for update in updates]
@@ -1,9 +1,10 @@
-from typing import Union
+from typing import Union, List
 
 from fastapi import Response, Depends
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
 from grisera.helpers.hateoas import get_links
+from grisera.models.bulk_model import BulkCreateOut, BulkUpdateOut, RelationshipUpdateIn
 from grisera.models.not_found_model import NotFoundByIdModel
 from grisera.registered_channel.registered_channel_model import (
     RegisteredChannelIn,
@@ -51,6 +52,48 @@ class RegisteredChannelRouter:
 
         return create_response
 
+    @router.post(
+        "/registered_channels/bulk",
+        tags=["registered channels"],
+        response_model=BulkCreateOut[RegisteredChannelOut],
+    )
+    async def create_registered_channels(self, registered_channels: List[RegisteredChannelIn], response: Response):
+        """
+        Create many registered channels in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[RegisteredChannelOut].from_results(
+            self.registered_channel_service.save_registered_channels(registered_channels)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.put(
+        "/registered_channels/relationships",
+        tags=["registered channels"],
+        response_model=BulkUpdateOut[RegisteredChannelOut],
+    )
+    async def update_registered_channel_relationships_bulk(
+        self, updates: List[RelationshipUpdateIn[RegisteredChannelIn]], response: Response
+    ):
+        """
+        Update relationships of many registered channels at once, returning result of updating each one
+        """
+        update_response = BulkUpdateOut[RegisteredChannelOut].from_results(
+            self.registered_channel_service.update_registered_channel_relationships_bulk(updates)
+        )
+        if update_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        update_response.links = get_links(router)
+
+        return update_response
+
     @router.get(
         "/registered_channels",
         tags=["registered channels"],
@@ -1,6 +1,7 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.registered_channel.registered_channel_model import RegisteredChannelIn
+from grisera.models.bulk_model import RelationshipUpdateIn
 
 
 class RegisteredChannelService:
@@ -21,6 +22,21 @@ class RegisteredChannelService:
         """
         raise Exception("save_registered_channel not implemented yet")
 
+    def save_registered_channels(self, registered_channels: List[RegisteredChannelIn]):
+        """
+        Send request to graph api to create many new registered channels
+
+        Implementations should create all registered channels in one transaction. By default registered channels are
+        saved one by one with save_registered_channel.
+
+        Args:
+            registered_channels (List[RegisteredChannelIn]): Registered channels to be added
+
+        Returns:
+            List of results of request as registered channel objects, in order of registered channels
+        """
+        return [self.save_registered_channel(registered_channel) for registered_channel in registered_channels]
+
     def get_registered_channels(self):
         """
         Send request to graph api to get registered channels
@@ -68,3 +84,19 @@ class RegisteredChannelService:
             Result of request as registered channel object
         """
         raise Exception("update_registered_channel_relationships not implemented yet")
+
+    def update_registered_channel_relationships_bulk(self, updates: List[RelationshipUpdateIn]):
+        """
+        Send request to graph api to update relationships of many registered channels
+
+        Implementations can collect referenced ids of all updates with collect_referenced_ids, validate each of them
+        once and apply all updates in one transaction. By default updates are applied one by one with
+        update_registered_channel_relationships.
+
+        Args:
+            updates (List[RelationshipUpdateIn]): Ids of registered channels with relationships to update
+
+        Returns:
+            List of results of request as registered channel objects, in order of updates
+        """
+        return [self.update_registered_channel_relationships(update.id, update.relationships) for update in updates]
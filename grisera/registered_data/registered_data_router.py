@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 from fastapi import Response, Depends
 from fastapi_utils.cbv import cbv
@@ -9,6 +9,7 @@ from grisera.registered_data.registered_data_model import (
     RegisteredDataOut,
     RegisteredDataNodesOut,
 )
+from grisera.models.bulk_model import BulkCreateOut
 from grisera.models.not_found_model import NotFoundByIdModel
 from grisera.services.service import service
 from grisera.services.service_factory import ServiceFactory
@@ -48,6 +49,26 @@ class RegisteredDataRouter:
 
         return create_response
 
+    @router.post(
+        "/registered_data/bulk",
+        tags=["registered data"],
+        response_model=BulkCreateOut[RegisteredDataOut],
+    )
+    async def create_registered_data_items(self, registered_data_items: List[RegisteredDataIn], response: Response):
+        """
+        Create many registered data items in database at once, returning result of creating each one
+        """
+        create_response = BulkCreateOut[RegisteredDataOut].from_results(
+            self.registered_data_service.save_registered_data_items(registered_data_items)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
     @router.get(
         "/registered_data/{registered_data_id}",
         tags=["registered data"],
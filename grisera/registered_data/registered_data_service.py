@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, List
 
 from grisera.registered_data.registered_data_model import RegisteredDataIn
 
@@ -21,6 +21,21 @@ class RegisteredDataService:
         """
         raise Exception("save_registered_data not implemented yet")
 
+    def save_registered_data_items(self, registered_data_items: List[RegisteredDataIn]):
+        """
+        Send request to graph api to create many new registered data items
+
+        Implementations should create all registered data items in one transaction. By default registered data items are
+        saved one by one with save_registered_data.
+
+        Args:
+            registered_data_items (List[RegisteredDataIn]): Registered data items to be added
+
+        Returns:
+            List of results of request as registered data item objects, in order of registered data items
+        """
+        return [self.save_registered_data(registered_data) for registered_data in registered_data_items]
+
     def get_registered_data_nodes(self):
         """
         Send request to graph api to get registered_data_nodes
@@ -0,0 +1,407 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Union, Optional, List
+
+from grisera.activity_execution.activity_execution_model import ActivityExecutionIn, ActivityExecutionPropertyIn, \
+    ActivityExecutionRelationIn
+from grisera.activity_execution.activity_execution_service import ActivityExecutionService
+from grisera.experiment.experiment_model import ExperimentIn
+from grisera.experiment.experiment_service import ExperimentService
+from grisera.models.bulk_model import RelationshipUpdateIn
+from grisera.scenario.scenario_model import ScenarioIn, OrderChangeIn, ScenarioReorderIn
+from grisera.scenario.scenario_order import ScenarioOrder
+from grisera.scenario.scenario_service import ScenarioService
+
+
+class ScenarioCache:
+    """
+    Cache of materialized scenarios keyed by experiment
+
+    For each experiment the cache keeps ids of activity executions in scenario order and scenario responses by
+    depth. Reverse index maps activity executions to experiments, so scenario of activity execution is found
+    without walking the chain. Entries are evicted in least recently used order and expire after time_to_live,
+    which bounds staleness when other processes change scenarios.
+
+    Every invalidation increments generation of the cache. Readers take the generation before reading scenario
+    from database and pass it to put, which ignores scenarios read before any later invalidation. Activity
+    executions of uncached scenarios cannot be mapped to their experiments, so the generation is shared by all
+    experiments and a change of one scenario only skips caching of scenarios read at the same time.
+
+    Attributes:
+        max_size (int): The greatest number of cached experiments
+        time_to_live (Optional[float]): Seconds after which entry expires, never if None
+    """
+
+    def __init__(self, max_size: int = 1024, time_to_live: Optional[float] = None):
+        self.max_size = max_size
+        self.time_to_live = time_to_live
+        self._entries = OrderedDict()
+        self._experiment_by_activity_execution = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_generation(self):
+        """
+        Get number of invalidations so far, taken by readers before reading scenario from database
+
+        Returns:
+            Generation of the cache
+        """
+        with self._lock:
+            return self._generation
+
+    def put(self, experiment_id: Union[int, str], activity_execution_ids: List[Union[int, str]],
+            generation: Optional[int] = None):
+        """
+        Cache order of activity executions in scenario, dropping cached responses of experiment
+
+        Args:
+            experiment_id (Union[int, str]): Id of experiment where scenario starts
+            activity_execution_ids (List[Union[int, str]]): Ids of activity executions in scenario order
+            generation (Optional[int]): Generation taken before reading scenario, nothing is cached if the cache
+                was invalidated since then
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._remove(self._key(experiment_id))
+            self._entries[self._key(experiment_id)] = (time.monotonic(), list(activity_execution_ids), {})
+            for activity_execution_id in activity_execution_ids:
+                self._experiment_by_activity_execution[self._key(activity_execution_id)] = experiment_id
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def put_response(self, experiment_id: Union[int, str], depth: int, response, generation: Optional[int] = None):
+        """
+        Cache scenario response of given depth, if order of the scenario is cached
+
+        Args:
+            experiment_id (Union[int, str]): Id of experiment where scenario starts
+            depth (int): Depth of response
+            response: Scenario response
+            generation (Optional[int]): Generation taken before reading scenario, nothing is cached if the cache
+                was invalidated since then
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            entry = self._get_entry(experiment_id)
+            if entry is not None:
+                entry[2][depth] = response
+
+    def get_activity_execution_ids(self, experiment_id: Union[int, str]) -> Optional[List[Union[int, str]]]:
+        """
+        Get cached ids of activity executions in scenario order
+
+        Args:
+            experiment_id (Union[int, str]): Id of experiment where scenario starts
+
+        Returns:
+            List of activity execution ids or None if not cached
+        """
+        with self._lock:
+            entry = self._get_entry(experiment_id)
+            return list(entry[1]) if entry is not None else None
+
+    def get_response(self, experiment_id: Union[int, str], depth: int):
+        """
+        Get cached scenario response of given depth
+
+        Args:
+            experiment_id (Union[int, str]): Id of experiment where scenario starts
+            depth (int): Depth of response
+
+        Returns:
+            Scenario response or None if not cached
+        """
+        with self._lock:
+            entry = self._get_entry(experiment_id)
+            return entry[2].get(depth) if entry is not None else None
+
+    def get_experiment_id(self, element_id: Union[int, str]):
+        """
+        Get experiment of cached scenario containing given experiment or activity execution
+
+        Args:
+            element_id (Union[int, str]): Id of experiment or activity execution
+
+        Returns:
+            Id of experiment or None if not cached
+        """
+        with self._lock:
+            if self._get_entry(element_id) is not None:
+                return element_id
+            experiment_id = self._experiment_by_activity_execution.get(self._key(element_id))
+            if experiment_id is None or self._get_entry(experiment_id) is None:
+                return None
+            return experiment_id
+
+    def invalidate(self, element_id: Union[int, str]):
+        """
+        Drop cached scenario containing given experiment or activity execution
+
+        Args:
+            element_id (Union[int, str]): Id of experiment or activity execution
+        """
+        with self._lock:
+            self._generation += 1
+            key = self._key(element_id)
+            if key not in self._entries:
+                experiment_id = self._experiment_by_activity_execution.get(key)
+                key = self._key(experiment_id) if experiment_id is not None else key
+            self._remove(key)
+
+    def clear(self):
+        """
+        Drop all cached scenarios
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._experiment_by_activity_execution.clear()
+
+    @staticmethod
+    def _key(element_id: Union[int, str]):
+        # Ids of the same node may come as numbers or strings
+        return str(element_id)
+
+    def _get_entry(self, experiment_id: Union[int, str]):
+        key = self._key(experiment_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self.time_to_live is not None and time.monotonic() - entry[0] > self.time_to_live:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            for activity_execution_id in entry[1]:
+                self._experiment_by_activity_execution.pop(self._key(activity_execution_id), None)
+
+
+class CachedScenarioService(ScenarioService):
+    """
+    Scenario service serving scenarios from ScenarioCache and delegating other requests to wrapped service
+
+    Scenario of experiment is cached on the first read and dropped by requests changing it: adding, moving and
+    deleting activity executions. Service factories wrap their scenario service once, so the cache is shared by
+    requests of the process. Activity execution and experiment services should be wrapped with
+    CachedActivityExecutionService and CachedExperimentService sharing the cache, so their changes of nodes
+    contained in responses drop them too. Cache is invalidated after changes are made and reads which started
+    before an invalidation are not cached, so concurrent reads do not cache scenario from before the change.
+
+    Responses deeper than max_depth contain nodes changed through other services, e.g. participations, so they
+    are not cached, while order of the scenario still is.
+
+    Attributes:
+        scenario_service (ScenarioService): Wrapped service
+        cache (ScenarioCache): Cache of scenarios
+        max_depth (int): The greatest depth of cached responses
+    """
+
+    def __init__(self, scenario_service: ScenarioService, cache: Optional[ScenarioCache] = None, max_depth: int = 0):
+        self.scenario_service = scenario_service
+        self.cache = cache if cache is not None else ScenarioCache()
+        self.max_depth = max_depth
+
+    def save_scenario(self, scenario: ScenarioIn):
+        result = self.scenario_service.save_scenario(scenario)
+        if scenario.experiment_id is not None:
+            self.cache.invalidate(scenario.experiment_id)
+        return result
+
+    def add_activity_execution(self, previous_id: Union[int, str], activity_execution: ActivityExecutionIn):
+        result = self.scenario_service.add_activity_execution(previous_id, activity_execution)
+        self.cache.invalidate(previous_id)
+        return result
+
+    def add_activity_executions(self, previous_id: Union[int, str],
+                                activity_executions: List[ActivityExecutionIn]):
+        result = self.scenario_service.add_activity_executions(previous_id, activity_executions)
+        self.cache.invalidate(previous_id)
+        return result
+
+    def change_order_middle_with_last(self, middle_id: Union[int, str], last_id: Union[int, str],
+                                      middle_relationships, last_relationships):
+        result = self.scenario_service.change_order_middle_with_last(middle_id, last_id, middle_relationships,
+                                                                     last_relationships)
+        self.cache.invalidate(middle_id)
+        return result
+
+    def change_order_middle_with_middle(self, middle_id: Union[int, str], last_id: Union[int, str],
+                                        middle_relationships, last_relationships):
+        result = self.scenario_service.change_order_middle_with_middle(middle_id, last_id, middle_relationships,
+                                                                       last_relationships)
+        self.cache.invalidate(middle_id)
+        return result
+
+    def what_order(self, previous_relationships, activity_execution_relationships):
+        return self.scenario_service.what_order(previous_relationships, activity_execution_relationships)
+
+    def swap_order_in_relationships_array(self, relationships, element_id: Union[int, str]):
+        return self.scenario_service.swap_order_in_relationships_array(relationships, element_id)
+
+    def change_order(self, order_change: OrderChangeIn):
+        result = self.scenario_service.change_order(order_change)
+        self.cache.invalidate(order_change.previous_id)
+        self.cache.invalidate(order_change.activity_execution_id)
+        return result
+
+    def reorder_scenario(self, scenario_reorder: ScenarioReorderIn):
+        result = self.scenario_service.reorder_scenario(scenario_reorder)
+        self.cache.invalidate(scenario_reorder.experiment_id)
+        return result
+
+    def delete_activity_execution(self, activity_execution_id: Union[int, str]):
+        result = self.scenario_service.delete_activity_execution(activity_execution_id)
+        self.cache.invalidate(activity_execution_id)
+        return result
+
+    def get_scenario(self, element_id: Union[int, str], depth: int = 0):
+        experiment_id = self.cache.get_experiment_id(element_id)
+        if experiment_id is not None:
+            return self.get_scenario_by_experiment(experiment_id, depth)
+        generation = self.cache.get_generation()
+        result = self.scenario_service.get_scenario(element_id, depth)
+        self._put(result, depth, generation)
+        return result.copy() if result.errors is None else result
+
+    def get_scenario_by_experiment(self, experiment_id: Union[int, str], depth: int = 0):
+        cached = self.cache.get_response(experiment_id, depth)
+        if cached is not None:
+            # Routers set links of returned objects, so cached responses are shared only as copies
+            return cached.copy()
+        generation = self.cache.get_generation()
+        result = self.scenario_service.get_scenario_by_experiment(experiment_id, depth)
+        self._put(result, depth, generation, experiment_id)
+        return result.copy() if result.errors is None else result
+
+    def get_scenario_by_activity_execution(self, activity_execution_id: Union[int, str], depth: int = 0):
+        experiment_id = self.cache.get_experiment_id(activity_execution_id)
+        if experiment_id is not None:
+            return self.get_scenario_by_experiment(experiment_id, depth)
+        generation = self.cache.get_generation()
+        result = self.scenario_service.get_scenario_by_activity_execution(activity_execution_id, depth)
+        self._put(result, depth, generation)
+        return result.copy() if result.errors is None else result
+
+    def get_scenario_order(self, experiment_id: Union[int, str]):
+        activity_execution_ids = self.cache.get_activity_execution_ids(experiment_id)
+        if activity_execution_ids is not None:
+            return ScenarioOrder.from_chain(activity_execution_ids)
+        return super().get_scenario_order(experiment_id)
+
+    def get_scenario_after_activity_execution(self, activity_execution_id: Union[int, str], activity_executions: [],
+                                              depth: int = 0):
+        return self.scenario_service.get_scenario_after_activity_execution(activity_execution_id,
+                                                                           activity_executions, depth)
+
+    def get_scenario_before_activity_execution(self, activity_execution_id: Union[int, str], activity_executions: [],
+                                               depth: int = 0):
+        return self.scenario_service.get_scenario_before_activity_execution(activity_execution_id,
+                                                                            activity_executions, depth)
+
+    def _put(self, result, depth: int, generation: int, experiment_id: Optional[Union[int, str]] = None):
+        if result.errors is not None:
+            return
+        if experiment_id is None:
+            if result.experiment is None or result.experiment.id is None:
+                return
+            experiment_id = result.experiment.id
+        if self.cache.get_activity_execution_ids(experiment_id) is None:
+            self.cache.put(experiment_id, [activity_execution.id
+                                           for activity_execution in result.activity_executions or []], generation)
+        if depth <= self.max_depth:
+            self.cache.put_response(experiment_id, depth, result, generation)
+
+
+class CachedActivityExecutionService(ActivityExecutionService):
+    """
+    Activity execution service dropping cached scenarios containing changed activity executions and delegating
+    requests to wrapped service
+
+    Attributes:
+        activity_execution_service (ActivityExecutionService): Wrapped service
+        cache (ScenarioCache): Cache of scenarios shared with CachedScenarioService
+    """
+
+    def __init__(self, activity_execution_service: ActivityExecutionService, cache: ScenarioCache):
+        self.activity_execution_service = activity_execution_service
+        self.cache = cache
+
+    def save_activity_execution(self, activity_execution: ActivityExecutionIn):
+        return self.activity_execution_service.save_activity_execution(activity_execution)
+
+    def save_activity_executions(self, activity_executions: List[ActivityExecutionIn]):
+        return self.activity_execution_service.save_activity_executions(activity_executions)
+
+    def get_activity_executions(self):
+        return self.activity_execution_service.get_activity_executions()
+
+    def get_activity_execution(self, activity_execution_id: Union[int, str], depth: int = 0):
+        return self.activity_execution_service.get_activity_execution(activity_execution_id, depth)
+
+    def delete_activity_execution(self, activity_execution_id: Union[int, str]):
+        result = self.activity_execution_service.delete_activity_execution(activity_execution_id)
+        self.cache.invalidate(activity_execution_id)
+        return result
+
+    def update_activity_execution(self, activity_execution_id: Union[int, str],
+                                  activity_execution: ActivityExecutionPropertyIn):
+        result = self.activity_execution_service.update_activity_execution(activity_execution_id, activity_execution)
+        self.cache.invalidate(activity_execution_id)
+        return result
+
+    def update_activity_execution_relationships(self, activity_execution_id: Union[int, str],
+                                                activity_execution: ActivityExecutionRelationIn):
+        result = self.activity_execution_service.update_activity_execution_relationships(activity_execution_id,
+                                                                                         activity_execution)
+        self.cache.invalidate(activity_execution_id)
+        return result
+
+    def update_activity_execution_relationships_bulk(self, updates: List[RelationshipUpdateIn]):
+        result = self.activity_execution_service.update_activity_execution_relationships_bulk(updates)
+        for update in updates:
+            self.cache.invalidate(update.id)
+        return result
+
+
+class CachedExperimentService(ExperimentService):
+    """
+    Experiment service dropping cached scenarios of changed experiments and delegating requests to wrapped service
+
+    Attributes:
+        experiment_service (ExperimentService): Wrapped service
+        cache (ScenarioCache): Cache of scenarios shared with CachedScenarioService
+    """
+
+    def __init__(self, experiment_service: ExperimentService, cache: ScenarioCache):
+        self.experiment_service = experiment_service
+        self.cache = cache
+
+    def save_experiment(self, experiment: ExperimentIn):
+        return self.experiment_service.save_experiment(experiment)
+
+    def save_experiments(self, experiments: List[ExperimentIn]):
+        return self.experiment_service.save_experiments(experiments)
+
+    def get_experiments(self):
+        return self.experiment_service.get_experiments()
+
+    def get_experiment(self, experiment_id: Union[int, str], depth: int = 0):
+        return self.experiment_service.get_experiment(experiment_id, depth)
+
+    def delete_experiment(self, experiment_id: Union[int, str]):
+        result = self.experiment_service.delete_experiment(experiment_id)
+        self.cache.invalidate(experiment_id)
+        return result
+
+    def update_experiment(self, experiment_id: Union[int, str], experiment: ExperimentIn):
+        result = self.experiment_service.update_experiment(experiment_id, experiment)
+        self.cache.invalidate(experiment_id)
+        return result
@@ -1,4 +1,4 @@
-from typing import Union, List, Optional
+from typing import Union, List, Optional, Tuple
 
 from pydantic import BaseModel
 
@@ -50,6 +50,49 @@ class OrderChangeOut(BaseModelOut):
     """
 
 
+class ScenarioActivityExecutionsIn(BaseModel):
+    """
+    Model of activity executions to add to scenario at once
+
+    Attributes:
+    activity_executions (List[ActivityExecutionIn]): Activity executions in order they should follow previous one
+    """
+
+    activity_executions: List[ActivityExecutionIn]
+
+
+class ScenarioReorderIn(BaseModel):
+    """
+    Model of new order of all activity executions in scenario
+
+    Attributes:
+    experiment_id (Union[int, str]): Id of experiment where scenario starts
+    activity_execution_ids (List[Union[int, str]]): Ids of all activity executions of scenario in new order
+    """
+
+    experiment_id: Union[int, str]
+    activity_execution_ids: List[Union[int, str]]
+
+
+class ScenarioReorderOut(BaseModelOut):
+    """
+    Model of applied order of scenario
+
+    Attributes:
+    activity_execution_ids (List[Union[int, str]]): Ids of activity executions in new order
+    moved_activity_execution_ids (List[Union[int, str]]): Ids of activity executions which were moved
+    removed_relationships (List[Tuple[Union[int, str], Union[int, str]]]): Removed relationships of scenario
+        chain as (start node id, end node id) pairs
+    created_relationships (List[Tuple[Union[int, str], Union[int, str]]]): Created relationships of scenario
+        chain as (start node id, end node id) pairs
+    """
+
+    activity_execution_ids: List[Union[int, str]] = []
+    moved_activity_execution_ids: List[Union[int, str]] = []
+    removed_relationships: List[Tuple[Union[int, str], Union[int, str]]] = []
+    created_relationships: List[Tuple[Union[int, str], Union[int, str]]] = []
+
+
 # Circular import exception prevention
 from grisera.activity_execution.activity_execution_model import ActivityExecutionOut
 from grisera.experiment.experiment_model import ExperimentOut
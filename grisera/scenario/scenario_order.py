@@ -0,0 +1,319 @@
+from bisect import bisect_left
+from typing import Union, Optional, Iterable, List, Dict, Sequence
+
+ORDER_PROPERTY = "scenario_order"
+RANK_GAP = 1 << 16
+
+
+class ScenarioOrder:
+    """
+    Order of activity executions in scenario kept as integer ranks with gaps, maintained alongside the chain of
+    relationships between experiment and activity executions
+
+    Ranks are stored by services as ORDER_PROPERTY of activity executions. Positions, relative order and slices
+    before or after activity execution are found by binary search over ranks instead of walking the chain.
+    Inserted and moved activity executions get rank in the middle of the gap between their neighbours, so usually
+    only one rank changes. When the gap is exhausted all ranks are spread evenly again.
+
+    Attributes:
+        gap (int): Difference between ranks of neighbouring activity executions after spreading ranks
+    """
+
+    def __init__(self, ranks: Optional[Dict[Union[int, str], int]] = None, gap: int = RANK_GAP):
+        self.gap = gap
+        ordered = sorted((ranks or {}).items(), key=lambda item: item[1])
+        self._ids = [activity_execution_id for activity_execution_id, _ in ordered]
+        self._ranks = [rank for _, rank in ordered]
+        self._rank_by_id = dict(ordered)
+        assert len(set(self._ranks)) == len(self._ranks), "Ranks of activity executions should be unique"
+
+    @classmethod
+    def from_chain(cls, activity_execution_ids: Iterable[Union[int, str]], gap: int = RANK_GAP):
+        """
+        Create order with evenly spread ranks from activity executions in chain order
+
+        Args:
+            activity_execution_ids (Iterable[Union[int, str]]): Ids of activity executions starting from experiment
+            gap (int): Difference between ranks of neighbouring activity executions
+
+        Returns:
+            New scenario order
+        """
+        return cls({activity_execution_id: (index + 1) * gap
+                    for index, activity_execution_id in enumerate(activity_execution_ids)}, gap)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, activity_execution_id: Union[int, str]):
+        return activity_execution_id in self._rank_by_id
+
+    def __iter__(self):
+        return iter(list(self._ids))
+
+    def get_ids(self) -> List[Union[int, str]]:
+        """
+        Get ids of activity executions in scenario order
+
+        Returns:
+            List of activity execution ids
+        """
+        return list(self._ids)
+
+    def get_ranks(self) -> Dict[Union[int, str], int]:
+        """
+        Get ranks of all activity executions
+
+        Returns:
+            Dictionary of ranks by activity execution id
+        """
+        return dict(self._rank_by_id)
+
+    def get_rank(self, activity_execution_id: Union[int, str]):
+        """
+        Get rank of activity execution
+
+        Args:
+            activity_execution_id (Union[int, str]): Id of activity execution
+
+        Returns:
+            Rank of activity execution
+        """
+        if activity_execution_id not in self._rank_by_id:
+            raise KeyError(f"activity execution {activity_execution_id} is not in scenario")
+        return self._rank_by_id[activity_execution_id]
+
+    def get_position(self, activity_execution_id: Union[int, str]):
+        """
+        Get position of activity execution in scenario, starting from 0
+
+        Args:
+            activity_execution_id (Union[int, str]): Id of activity execution
+
+        Returns:
+            Position of activity execution
+        """
+        return bisect_left(self._ranks, self.get_rank(activity_execution_id))
+
+    def is_before(self, first_id: Union[int, str], second_id: Union[int, str]):
+        """
+        Check order of two activity executions
+
+        Args:
+            first_id (Union[int, str]): Id of the first activity execution
+            second_id (Union[int, str]): Id of the second activity execution
+
+        Returns:
+            True when the first activity execution is earlier in scenario
+        """
+        return self.get_rank(first_id) < self.get_rank(second_id)
+
+    def get_before(self, activity_execution_id: Union[int, str]) -> List[Union[int, str]]:
+        """
+        Get activity executions earlier in scenario than given one
+
+        Args:
+            activity_execution_id (Union[int, str]): Id of activity execution
+
+        Returns:
+            List of activity execution ids in scenario order
+        """
+        return self._ids[:self.get_position(activity_execution_id)]
+
+    def get_after(self, activity_execution_id: Union[int, str]) -> List[Union[int, str]]:
+        """
+        Get activity executions later in scenario than given one
+
+        Args:
+            activity_execution_id (Union[int, str]): Id of activity execution
+
+        Returns:
+            List of activity execution ids in scenario order
+        """
+        return self._ids[self.get_position(activity_execution_id) + 1:]
+
+    def get_previous(self, activity_execution_id: Union[int, str]):
+        """
+        Get activity execution directly before given one
+
+        Args:
+            activity_execution_id (Union[int, str]): Id of activity execution
+
+        Returns:
+            Id of previous activity execution or None when given one follows experiment
+        """
+        position = self.get_position(activity_execution_id)
+        return self._ids[position - 1] if position > 0 else None
+
+    def get_next(self, activity_execution_id: Union[int, str]):
+        """
+        Get activity execution directly after given one
+
+        Args:
+            activity_execution_id (Union[int, str]): Id of activity execution
+
+        Returns:
+            Id of next activity execution or None when given one is the last
+        """
+        position = self.get_position(activity_execution_id) + 1
+        return self._ids[position] if position < len(self._ids) else None
+
+    def insert_after(self, previous_id: Optional[Union[int, str]], activity_execution_id: Union[int, str]):
+        """
+        Insert activity execution after given one
+
+        Args:
+            previous_id (Optional[Union[int, str]]): Id of previous activity execution, None to insert directly
+                after experiment
+            activity_execution_id (Union[int, str]): Id of inserted activity execution
+
+        Returns:
+            Dictionary of changed ranks by activity execution id, to be saved by service
+        """
+        assert activity_execution_id not in self._rank_by_id, \
+            f"activity execution {activity_execution_id} is already in scenario"
+        position = 0 if previous_id is None else self.get_position(previous_id) + 1
+        lower = self._ranks[position - 1] if position > 0 else 0
+        upper = self._ranks[position] if position < len(self._ranks) else lower + 2 * self.gap
+        if upper - lower < 2:
+            self._ids.insert(position, activity_execution_id)
+            self._ranks.insert(position, 0)
+            return self._spread()
+        rank = (lower + upper) // 2
+        self._ids.insert(position, activity_execution_id)
+        self._ranks.insert(position, rank)
+        self._rank_by_id[activity_execution_id] = rank
+        return {activity_execution_id: rank}
+
+    def move_after(self, previous_id: Optional[Union[int, str]], activity_execution_id: Union[int, str]):
+        """
+        Move activity execution after given one
+
+        Args:
+            previous_id (Optional[Union[int, str]]): Id of new previous activity execution, None to move directly
+                after experiment
+            activity_execution_id (Union[int, str]): Id of moved activity execution
+
+        Returns:
+            Dictionary of changed ranks by activity execution id, to be saved by service
+        """
+        assert previous_id != activity_execution_id, "Activity execution cannot be moved after itself"
+        if self.get_previous(activity_execution_id) == previous_id:
+            return {}
+        self.remove(activity_execution_id)
+        return self.insert_after(previous_id, activity_execution_id)
+
+    def reorder(self, activity_execution_ids: Sequence[Union[int, str]]):
+        """
+        Change order of all activity executions, moving only those outside of the longest subsequence already in
+        order
+
+        Args:
+            activity_execution_ids (Sequence[Union[int, str]]): Ids of all activity executions in new order
+
+        Returns:
+            Dictionary of changed ranks by activity execution id, to be saved by service
+        """
+        original_ranks = dict(self._rank_by_id)
+        changed_ranks = {}
+        for activity_execution_id, previous_id in plan_reorder(self._ids, activity_execution_ids):
+            changed_ranks.update(self.move_after(previous_id, activity_execution_id))
+        return {activity_execution_id: rank for activity_execution_id, rank in changed_ranks.items()
+                if original_ranks[activity_execution_id] != rank}
+
+    def remove(self, activity_execution_id: Union[int, str]):
+        """
+        Remove activity execution from scenario, ranks of other activity executions do not change
+
+        Args:
+            activity_execution_id (Union[int, str]): Id of removed activity execution
+        """
+        position = self.get_position(activity_execution_id)
+        del self._ids[position]
+        del self._ranks[position]
+        del self._rank_by_id[activity_execution_id]
+
+    def _spread(self):
+        changed_ranks = {}
+        for index, activity_execution_id in enumerate(self._ids):
+            rank = (index + 1) * self.gap
+            self._ranks[index] = rank
+            if self._rank_by_id.get(activity_execution_id) != rank:
+                self._rank_by_id[activity_execution_id] = rank
+                changed_ranks[activity_execution_id] = rank
+        return changed_ranks
+
+
+def get_longest_increasing_subsequence(sequence: Sequence[int]) -> List[int]:
+    """
+    Find the longest strictly increasing subsequence in O(n log n) time
+
+    Args:
+        sequence (Sequence[int]): Numbers
+
+    Returns:
+        Indexes of elements of the subsequence in ascending order
+    """
+    tail_values = []
+    tail_indexes = []
+    predecessors = [-1] * len(sequence)
+    for index, value in enumerate(sequence):
+        length = bisect_left(tail_values, value)
+        predecessors[index] = tail_indexes[length - 1] if length > 0 else -1
+        if length == len(tail_values):
+            tail_values.append(value)
+            tail_indexes.append(index)
+        else:
+            tail_values[length] = value
+            tail_indexes[length] = index
+    subsequence = []
+    index = tail_indexes[-1] if tail_indexes else -1
+    while index != -1:
+        subsequence.append(index)
+        index = predecessors[index]
+    return subsequence[::-1]
+
+
+def plan_reorder(current_ids: Sequence[Union[int, str]], new_ids: Sequence[Union[int, str]]):
+    """
+    Plan the least number of moves changing order of activity executions
+
+    Activity executions forming the longest subsequence already in new order stay in place, others are moved in
+    new order directly after their new predecessors.
+
+    Args:
+        current_ids (Sequence[Union[int, str]]): Ids of activity executions in current order
+        new_ids (Sequence[Union[int, str]]): Ids of the same activity executions in new order
+
+    Returns:
+        List of (activity execution id, id of previous activity execution or None for experiment) moves
+    """
+    current_positions = {activity_execution_id: position for position, activity_execution_id
+                         in enumerate(current_ids)}
+    assert len(new_ids) == len(current_positions) and set(new_ids) == set(current_positions), \
+        "New order should contain each activity execution of scenario once"
+    kept = set(get_longest_increasing_subsequence([current_positions[activity_execution_id]
+                                                   for activity_execution_id in new_ids]))
+    return [(activity_execution_id, new_ids[index - 1] if index > 0 else None)
+            for index, activity_execution_id in enumerate(new_ids) if index not in kept]
+
+
+def get_chain_changes(experiment_id: Union[int, str], current_ids: Sequence[Union[int, str]],
+                      new_ids: Sequence[Union[int, str]]):
+    """
+    Compute relationships of scenario chain to remove and to create when changing order of activity executions
+
+    Args:
+        experiment_id (Union[int, str]): Id of experiment where scenario starts
+        current_ids (Sequence[Union[int, str]]): Ids of activity executions in current order
+        new_ids (Sequence[Union[int, str]]): Ids of activity executions in new order
+
+    Returns:
+        Tuple of removed and created lists of (start node id, end node id) relationships
+    """
+    current_links = list(zip([experiment_id, *current_ids], current_ids))
+    new_links = list(zip([experiment_id, *new_ids], new_ids))
+    current_link_set = set(current_links)
+    new_link_set = set(new_links)
+    return [link for link in current_links if link not in new_link_set], \
+        [link for link in new_links if link not in current_link_set]
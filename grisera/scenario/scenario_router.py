@@ -9,10 +9,14 @@ from grisera.scenario.scenario_model import (
     ScenarioOut,
     OrderChangeIn,
     OrderChangeOut,
+    ScenarioActivityExecutionsIn,
+    ScenarioReorderIn,
+    ScenarioReorderOut,
 )
 from grisera.activity_execution.activity_execution_model import (
     ActivityExecutionOut,
     ActivityExecutionIn,
+    ActivityExecutionsOut,
 )
 from grisera.services.service import service
 from grisera.services.service_factory import ServiceFactory
@@ -71,6 +75,31 @@ class ScenarioRouter:
 
         return create_response
 
+    @router.post(
+        "/scenarios/{previous_id}/activity_executions",
+        tags=["scenarios"],
+        response_model=ActivityExecutionsOut,
+    )
+    async def add_activity_executions(
+        self,
+        previous_id: Union[int, str],
+        activity_executions: ScenarioActivityExecutionsIn,
+        response: Response,
+    ):
+        """
+        Add many activity executions to scenario one after another, starting after previous_id
+        """
+        create_response = self.scenario_service.add_activity_executions(
+            previous_id, activity_executions.activity_executions
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
     @router.put("/scenarios", tags=["scenarios"], response_model=OrderChangeOut)
     async def change_order(self, order_change: OrderChangeIn, response: Response):
         """
@@ -85,6 +114,21 @@ class ScenarioRouter:
 
         return put_response
 
+    @router.put("/scenarios/order", tags=["scenarios"], response_model=ScenarioReorderOut)
+    async def reorder_scenario(self, scenario_reorder: ScenarioReorderIn, response: Response):
+        """
+        Change order of all activity executions in scenario at once. Only activity executions outside of the
+        longest subsequence already in new order are moved.
+        """
+        put_response = self.scenario_service.reorder_scenario(scenario_reorder)
+        if put_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        put_response.links = get_links(router)
+
+        return put_response
+
     @router.delete(
         "/scenarios/{activity_execution_id}",
         tags=["scenarios"],
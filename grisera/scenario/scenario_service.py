@@ -1,7 +1,8 @@
-from typing import Union
+from typing import Union, List
 
-from grisera.scenario.scenario_model import ScenarioIn, OrderChangeIn
-from grisera.activity_execution.activity_execution_model import ActivityExecutionIn
+from grisera.scenario.scenario_model import ScenarioIn, OrderChangeIn, ScenarioReorderIn, ScenarioReorderOut
+from grisera.scenario.scenario_order import ScenarioOrder, plan_reorder, get_chain_changes
+from grisera.activity_execution.activity_execution_model import ActivityExecutionIn, ActivityExecutionsOut
 
 
 class ScenarioService:
@@ -35,6 +36,31 @@ class ScenarioService:
         """
         raise Exception("add_activity_execution not implemented yet")
 
+    def add_activity_executions(self, previous_id: Union[int, str],
+                                activity_executions: List[ActivityExecutionIn]):
+        """
+        Send request to graph api to add activity executions to scenario one after another
+
+        Implementations should create all activity executions and relationships of the chain in one transaction.
+        By default activity executions are added one by one with add_activity_execution.
+
+        Args:
+            previous_id (int | str): identity of previous activity_execution or experiment
+            activity_executions (List[ActivityExecutionIn]): Activity executions to be added in scenario order
+
+        Returns:
+            Result of request as activity executions object
+        """
+        created_activity_executions = []
+        for activity_execution in activity_executions:
+            created_activity_execution = self.add_activity_execution(previous_id, activity_execution)
+            if created_activity_execution.errors is not None:
+                return ActivityExecutionsOut(activity_executions=created_activity_executions,
+                                             errors=created_activity_execution.errors)
+            created_activity_executions.append(created_activity_execution)
+            previous_id = created_activity_execution.id
+        return ActivityExecutionsOut(activity_executions=created_activity_executions)
+
     def change_order_middle_with_last(self, middle_id: Union[int, str], last_id: Union[int, str],
                                       middle_relationships, last_relationships):
         """
@@ -87,6 +113,27 @@ class ScenarioService:
         """
         raise Exception("swap_order_in_relationships_array not implemented yet")
 
+    def get_scenario_order(self, experiment_id: Union[int, str]):
+        """
+        Get order of activity executions in scenario which starts in experiment
+
+        Implementations should keep ranks of ScenarioOrder as ORDER_PROPERTY of activity executions, update
+        ranks returned by insert_after and move_after together with relationships of the chain and answer
+        what_order, get_scenario_before_activity_execution and get_scenario_after_activity_execution with it
+        instead of walking the chain. By default the order is created from the chain.
+
+        Args:
+            experiment_id (int | str): identity of experiment where scenario starts
+
+        Returns:
+            Scenario order or object with errors
+        """
+        scenario = self.get_scenario_by_experiment(experiment_id)
+        if scenario.errors is not None:
+            return scenario
+        return ScenarioOrder.from_chain(activity_execution.id
+                                        for activity_execution in scenario.activity_executions or [])
+
     def change_order(self, order_change: OrderChangeIn):
         """
         Send request to graph api to change order in scenario
@@ -99,6 +146,47 @@ class ScenarioService:
         """
         raise Exception("change_order not implemented yet")
 
+    def reorder_scenario(self, scenario_reorder: ScenarioReorderIn):
+        """
+        Send request to graph api to change order of all activity executions in scenario
+
+        Only activity executions outside of the longest subsequence already in new order are moved. Implementations
+        should remove and create relationships returned by get_chain_changes and save ranks changed by
+        ScenarioOrder.reorder in one transaction. By default moves are applied one by one with change_order.
+
+        Args:
+            scenario_reorder (ScenarioReorderIn): Experiment and ids of activity executions in new order
+
+        Returns:
+            Result of request as applied order object
+        """
+        scenario_order = self.get_scenario_order(scenario_reorder.experiment_id)
+        if not isinstance(scenario_order, ScenarioOrder):
+            return ScenarioReorderOut(errors=scenario_order.errors)
+        current_ids = scenario_order.get_ids()
+        # Ids in request may be parsed as strings, so they are matched with ids of scenario by text
+        current_ids_by_text = {str(activity_execution_id): activity_execution_id
+                               for activity_execution_id in current_ids}
+        new_ids = [current_ids_by_text.get(str(activity_execution_id), activity_execution_id)
+                   for activity_execution_id in scenario_reorder.activity_execution_ids]
+        if len(new_ids) != len(current_ids) or set(new_ids) != set(current_ids):
+            return ScenarioReorderOut(errors="new order should contain each activity execution of scenario once")
+
+        moves = plan_reorder(current_ids, new_ids)
+        for activity_execution_id, previous_id in moves:
+            change_response = self.change_order(OrderChangeIn(
+                previous_id=previous_id if previous_id is not None else scenario_reorder.experiment_id,
+                activity_execution_id=activity_execution_id))
+            if change_response.errors is not None:
+                return ScenarioReorderOut(errors=change_response.errors)
+        removed_relationships, created_relationships = get_chain_changes(scenario_reorder.experiment_id,
+                                                                         current_ids, new_ids)
+        return ScenarioReorderOut(activity_execution_ids=new_ids,
+                                  moved_activity_execution_ids=[activity_execution_id
+                                                                for activity_execution_id, _ in moves],
+                                  removed_relationships=removed_relationships,
+                                  created_relationships=created_relationships)
+
     def delete_activity_execution(self, activity_execution_id: Union[int, str]):
         """
         Send request to graph api to delete activity_execution from scenario
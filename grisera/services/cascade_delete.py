@@ -0,0 +1,275 @@
+from typing import Union, Dict, Callable, Optional
+
+from grisera.helpers.helpers import get_node_id, get_related_nodes
+from grisera.models.cascade_delete_model import CascadeDeleteOut
+from grisera.services.service_factory import ServiceFactory
+from grisera.time_series.time_series_model import TimeSeriesRelationIn
+
+DEFAULT_BATCH_SIZE = 10000
+
+# Labels of nodes in order they are deleted, so dependent nodes are always deleted before nodes they depend on
+TIME_SERIES = "TimeSeries"
+OBSERVABLE_INFORMATION = "ObservableInformation"
+RECORDING = "Recording"
+PARTICIPATION = "Participation"
+PARTICIPANT_STATE = "ParticipantState"
+ACTIVITY_EXECUTION = "ActivityExecution"
+PARTICIPANT = "Participant"
+EXPERIMENT = "Experiment"
+DELETE_ORDER = [TIME_SERIES, OBSERVABLE_INFORMATION, RECORDING, PARTICIPATION, PARTICIPANT_STATE, ACTIVITY_EXECUTION,
+                PARTICIPANT, EXPERIMENT]
+SIGNAL_VALUE = "SignalValue"
+
+# Fields of nodes read with depth 1 containing their dependent nodes
+DEPENDENT_NODES = {
+    PARTICIPANT: [(PARTICIPANT_STATE, "participant_states")],
+    PARTICIPANT_STATE: [(PARTICIPATION, "participations")],
+    ACTIVITY_EXECUTION: [(PARTICIPATION, "participations")],
+    PARTICIPATION: [(RECORDING, "recordings")],
+    RECORDING: [(OBSERVABLE_INFORMATION, "observable_informations")],
+    OBSERVABLE_INFORMATION: [(TIME_SERIES, "timeSeries")],
+}
+
+
+class CascadeDeleter:
+    """
+    Class deleting node together with nodes depending on it
+
+    Dependent nodes are found first: activity executions of experiment scenario, participant states of participant,
+    their participations, recordings, observable informations, time series and signal values. Then nodes are
+    deleted in DELETE_ORDER, so a failed deletion never leaves nodes without the nodes they depend on and can be
+    retried. Signal values of time series are deleted in batches of at most batch_size before the time series, so
+    no single request to graph api deletes unbounded number of nodes. Participants, activities, channels and other
+    nodes shared between experiments are never deleted by experiment or recording. Time series of many observable
+    informations are deleted only with all of them, otherwise only their relationships to deleted observable
+    informations are removed.
+
+    Attributes:
+        service_factory (ServiceFactory): Factory of services used to find and delete nodes
+        batch_size (int): The greatest number of signal values deleted by one request
+        report_progress (Optional[Callable[[float], None]]): Function called with fraction of planned nodes and
+            signal values already deleted
+    """
+
+    def __init__(self, service_factory: ServiceFactory, batch_size: int = DEFAULT_BATCH_SIZE,
+                 report_progress: Optional[Callable[[float], None]] = None):
+        self.service_factory = service_factory
+        self.batch_size = batch_size
+        self.report_progress = report_progress
+
+    def delete(self, label: str, node_id: Union[int, str], dry_run: bool = False):
+        """
+        Delete experiment, participant, recording or time series with its dependent nodes
+
+        Args:
+            label (str): Label of node, one of EXPERIMENT, PARTICIPANT, RECORDING and TIME_SERIES
+            node_id (Union[int, str]): Id of node
+            dry_run (bool): Only find nodes which would be deleted
+
+        Returns:
+            Result of deletion as cascade delete object
+        """
+        if label == EXPERIMENT:
+            return self.delete_experiment(node_id, dry_run)
+        if label in (PARTICIPANT, RECORDING, TIME_SERIES):
+            return self._delete_from(label, node_id, dry_run)
+        return CascadeDeleteOut(id=node_id, dry_run=dry_run, errors=f"cascade delete of {label} is not supported")
+
+    def delete_experiment(self, experiment_id: Union[int, str], dry_run: bool = False):
+        """
+        Delete experiment with activity executions of its scenario and their dependent nodes
+
+        Args:
+            experiment_id (Union[int, str]): Id of experiment
+            dry_run (bool): Only find nodes which would be deleted
+
+        Returns:
+            Result of deletion as cascade delete object
+        """
+        experiment = self.service_factory.get_experiment_service().get_experiment(experiment_id)
+        if experiment.errors is not None:
+            return CascadeDeleteOut(id=experiment_id, dry_run=dry_run, errors=experiment.errors)
+        nodes = {label: {} for label in DELETE_ORDER}
+        nodes[EXPERIMENT][str(experiment_id)] = experiment_id
+        scenario = self.service_factory.get_scenario_service().get_scenario_by_experiment(experiment_id)
+        if scenario.errors is None:
+            self._collect(nodes, ACTIVITY_EXECUTION, [get_node_id(activity_execution)
+                                                      for activity_execution in scenario.activity_executions or []])
+        return self._delete(experiment_id, nodes, dry_run, EXPERIMENT)
+
+    def delete_participant(self, participant_id: Union[int, str], dry_run: bool = False):
+        """
+        Delete participant with participant states and their dependent nodes
+
+        Args:
+            participant_id (Union[int, str]): Id of participant
+            dry_run (bool): Only find nodes which would be deleted
+
+        Returns:
+            Result of deletion as cascade delete object
+        """
+        return self._delete_from(PARTICIPANT, participant_id, dry_run)
+
+    def delete_recording(self, recording_id: Union[int, str], dry_run: bool = False):
+        """
+        Delete recording with observable informations, time series and signal values
+
+        Args:
+            recording_id (Union[int, str]): Id of recording
+            dry_run (bool): Only find nodes which would be deleted
+
+        Returns:
+            Result of deletion as cascade delete object
+        """
+        return self._delete_from(RECORDING, recording_id, dry_run)
+
+    def delete_time_series(self, time_series_id: Union[int, str], dry_run: bool = False):
+        """
+        Delete time series with signal values
+
+        Args:
+            time_series_id (Union[int, str]): Id of time series
+            dry_run (bool): Only find nodes which would be deleted
+
+        Returns:
+            Result of deletion as cascade delete object
+        """
+        return self._delete_from(TIME_SERIES, time_series_id, dry_run)
+
+    def _delete_from(self, label: str, node_id: Union[int, str], dry_run: bool):
+        nodes = {node_label: {} for node_label in DELETE_ORDER}
+        errors = self._collect(nodes, label, [node_id])
+        if errors is not None:
+            return CascadeDeleteOut(id=node_id, dry_run=dry_run, errors=errors)
+        return self._delete(node_id, nodes, dry_run, label)
+
+    def _collect(self, nodes: Dict[str, dict], label: str, node_ids: list):
+        # Returns errors of the first node which was not found, dependent nodes deleted in the meantime are skipped
+        for node_id in node_ids:
+            if node_id is None or str(node_id) in nodes[label]:
+                continue
+            if label == TIME_SERIES:
+                # Time series are not read, because reading them reads all of their signal values
+                nodes[label][str(node_id)] = node_id
+                continue
+            node = self._get_node(label, node_id)
+            if node.errors is not None:
+                return node.errors
+            nodes[label][str(node_id)] = node_id
+            for dependent_label, field in DEPENDENT_NODES[label]:
+                self._collect(nodes, dependent_label, [get_node_id(dependent_node)
+                                                       for dependent_node in get_related_nodes(node, field)])
+        return None
+
+    def _get_node(self, label: str, node_id: Union[int, str]):
+        if label == PARTICIPANT:
+            return self.service_factory.get_participant_service().get_participant(node_id, 1)
+        if label == PARTICIPANT_STATE:
+            return self.service_factory.get_participant_state_service().get_participant_state(node_id, 1)
+        if label == ACTIVITY_EXECUTION:
+            return self.service_factory.get_activity_execution_service().get_activity_execution(node_id, 1)
+        if label == PARTICIPATION:
+            return self.service_factory.get_participation_service().get_participation(node_id, 1)
+        if label == RECORDING:
+            return self.service_factory.get_recording_service().get_recording(node_id, 1)
+        return self.service_factory.get_observable_information_service().get_observable_information(node_id, 1)
+
+    def _plan_time_series(self, nodes: Dict[str, dict], root_label: str):
+        # Returns signal value counts of deleted time series and remaining observable informations of kept ones
+        time_series_service = self.service_factory.get_time_series_service()
+        signal_value_counts = {}
+        kept = {}
+        for key, time_series_id in list(nodes[TIME_SERIES].items()):
+            if root_label != TIME_SERIES:
+                observable_information_ids = time_series_service.get_time_series_observable_information_ids(
+                    time_series_id)
+                if observable_information_ids is None:
+                    return None, None, f"time series {time_series_id} not found"
+                remaining_ids = [observable_information_id for observable_information_id
+                                 in observable_information_ids
+                                 if str(observable_information_id) not in nodes[OBSERVABLE_INFORMATION]]
+                if remaining_ids:
+                    kept[time_series_id] = remaining_ids
+                    del nodes[TIME_SERIES][key]
+                    continue
+            signal_value_count = time_series_service.count_time_series_signal_values(time_series_id)
+            if signal_value_count is None:
+                return None, None, f"time series {time_series_id} not found"
+            signal_value_counts[key] = signal_value_count
+        return signal_value_counts, kept, None
+
+    def _delete(self, node_id: Union[int, str], nodes: Dict[str, dict], dry_run: bool, root_label: str):
+        signal_value_counts, kept, errors = self._plan_time_series(nodes, root_label)
+        if errors is not None:
+            return CascadeDeleteOut(id=node_id, dry_run=dry_run, errors=errors)
+        result = CascadeDeleteOut(id=node_id, dry_run=dry_run,
+                                  nodes={label: list(nodes[label].values()) for label in DELETE_ORDER if nodes[label]},
+                                  kept={TIME_SERIES: list(kept)} if kept else {})
+        result.planned = {label: len(node_ids) for label, node_ids in result.nodes.items()}
+        result.planned[SIGNAL_VALUE] = sum(signal_value_counts.values())
+        result.deleted = {label: 0 for label in result.planned}
+        if dry_run:
+            return result
+
+        time_series_service = self.service_factory.get_time_series_service()
+        for time_series_id, remaining_ids in kept.items():
+            updated_time_series = time_series_service.update_time_series_relationships(
+                time_series_id, TimeSeriesRelationIn(observable_information_ids=remaining_ids))
+            if updated_time_series.errors is not None:
+                result.errors = {"label": TIME_SERIES, "id": time_series_id, "errors": updated_time_series.errors}
+                return result
+        for time_series_id, signal_value_count in zip(result.nodes.get(TIME_SERIES, []),
+                                                      signal_value_counts.values()):
+            errors = self._delete_time_series(time_series_id, signal_value_count, result.deleted, result.planned)
+            if errors is not None:
+                result.errors = {"label": TIME_SERIES, "id": time_series_id, "errors": errors}
+                return result
+        for label in DELETE_ORDER[1:]:
+            for dependent_id in result.nodes.get(label, []):
+                deleted_node = self._delete_node(label, dependent_id)
+                if deleted_node.errors is not None:
+                    result.errors = {"label": label, "id": dependent_id, "errors": deleted_node.errors}
+                    return result
+                result.deleted[label] += 1
+                self._report_progress(result.deleted, result.planned)
+        return result
+
+    def _delete_time_series(self, time_series_id: Union[int, str], signal_value_count: int, deleted: Dict[str, int],
+                            planned: Dict[str, int]):
+        time_series_service = self.service_factory.get_time_series_service()
+        batch_deleted = 0
+        while batch_deleted < signal_value_count:
+            batch_count = time_series_service.delete_time_series_signal_values(time_series_id, self.batch_size)
+            if batch_count == 0:
+                break
+            batch_deleted += batch_count
+            deleted[SIGNAL_VALUE] += batch_count
+            self._report_progress(deleted, planned)
+        deleted_time_series = time_series_service.delete_time_series(time_series_id)
+        if deleted_time_series.errors is not None:
+            return deleted_time_series.errors
+        # Signal values which were not deleted in batches are deleted with their time series
+        deleted[SIGNAL_VALUE] += max(signal_value_count - batch_deleted, 0)
+        deleted[TIME_SERIES] += 1
+        self._report_progress(deleted, planned)
+        return None
+
+    def _report_progress(self, deleted: Dict[str, int], planned: Dict[str, int]):
+        if self.report_progress is not None:
+            self.report_progress(sum(deleted.values()) / max(sum(planned.values()), 1))
+
+    def _delete_node(self, label: str, node_id: Union[int, str]):
+        if label == OBSERVABLE_INFORMATION:
+            return self.service_factory.get_observable_information_service().delete_observable_information(node_id)
+        if label == RECORDING:
+            return self.service_factory.get_recording_service().delete_recording(node_id)
+        if label == PARTICIPATION:
+            return self.service_factory.get_participation_service().delete_participation(node_id)
+        if label == PARTICIPANT_STATE:
+            return self.service_factory.get_participant_state_service().delete_participant_state(node_id)
+        if label == ACTIVITY_EXECUTION:
+            # Activity executions are deleted through scenario, which keeps the chain of experiment consistent
+            return self.service_factory.get_scenario_service().delete_activity_execution(node_id)
+        if label == PARTICIPANT:
+            return self.service_factory.get_participant_service().delete_participant(node_id)
+        return self.service_factory.get_experiment_service().delete_experiment(node_id)
@@ -1,7 +1,7 @@
 from enum import Enum
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict
 
-from pydantic import BaseModel
+from pydantic import BaseModel, validator
 
 from grisera.models.base_model_out import BaseModelOut
 from grisera.property.property_model import PropertyIn
@@ -13,7 +13,28 @@ class TransformationType(str, Enum):
     """
 
     RESAMPLE_NEAREST = "resample_nearest"
+    RESAMPLE_LINEAR = "resample_linear"
+    RESAMPLE_PREVIOUS = "resample_previous"
     QUADRANTS = "quadrants"
+    WINDOW_MEAN = "window_mean"
+    WINDOW_MIN = "window_min"
+    WINDOW_MAX = "window_max"
+    WINDOW_STD = "window_std"
+    WINDOW_COUNT = "window_count"
+    BAND_POWER = "band_power"
+
+
+class DownsamplingMethod(str, Enum):
+    """
+    The algorithm used to reduce number of returned signal values
+
+    Attributes:
+        min_max (str): Minimal and maximal signal value from each time bucket
+        lttb (str): Largest-Triangle-Three-Buckets
+    """
+
+    min_max = "min_max"
+    lttb = "lttb"
 
 
 class TimestampNodesIn(BaseModel):
@@ -88,24 +109,122 @@ class TimeSeriesPropertyIn(BaseModel):
     additional_properties: Optional[List[PropertyIn]]
 
 
+def _check_transformation_name(name: Union[TransformationType, str]):
+    # Imported here, because transformation modules import this module
+    from grisera.time_series.transformation.TimeSeriesTransformationFactory import transformation_registry
+
+    if not transformation_registry.is_registered(name):
+        raise ValueError(transformation_registry.get_unknown_message(name))
+    return name
+
+
+def _check_input_count(name: Union[TransformationType, str], input_count: int):
+    # Imported here, because transformation modules import this module
+    from grisera.time_series.transformation.TimeSeriesTransformationFactory import transformation_registry
+
+    transformation_registry.check_input_count(name, input_count)
+
+
+def _check_source_count(source_time_series_ids: List[Union[str, int]], values: dict):
+    if "name" in values:
+        _check_input_count(values["name"], len(source_time_series_ids))
+    return source_time_series_ids
+
+
+def _check_step_input_counts(steps: list, values: dict):
+    # Steps without inputs take all source time series if first, otherwise output of the previous step
+    for step_index, step in enumerate(steps):
+        if step.inputs is not None:
+            _check_input_count(step.name, len(step.inputs))
+        elif step_index > 0:
+            _check_input_count(step.name, 1)
+        elif "source_time_series_ids" in values:
+            _check_input_count(step.name, len(values["source_time_series_ids"]))
+    return steps
+
+
 class TimeSeriesTransformationIn(BaseModel):
     """
     Model of time series transformation to acquire from client
 
     Attributes:
-        name (TransformationType): Name of the transformation
+        name (Union[TransformationType, str]): Name of built-in or registered transformation
         source_time_series_ids (List[int]): Ids of source time series
         destination_observable_information_id (Optional[int]): Id of destination observable information
         destination_measure_id (Optional[int]): Id of destination measure
+        destination_time_series_id (Optional[Union[int, str]]): Id of time series created by previous run of the
+            same transformation, new signal values are transformed incrementally and appended to it
+        final (bool): Transform remaining signal values of incremental transformation, which could still be
+            changed by appended signal values
         additional_properties (Optional[List[PropertyIn]]): Additional properties for transformation
     """
 
-    name: TransformationType
+    name: Union[TransformationType, str]
     source_time_series_ids: List[Union[str, int]]
     destination_observable_information_id: Optional[int]
     destination_measure_id: Optional[int]
+    destination_time_series_id: Optional[Union[int, str]]
+    final: bool = False
     additional_properties: Optional[List[PropertyIn]]
 
+    _check_name = validator("name", allow_reuse=True)(_check_transformation_name)
+    _check_sources = validator("source_time_series_ids", allow_reuse=True)(_check_source_count)
+
+
+class TimeSeriesTransformationStepIn(BaseModel):
+    """
+    Model of single step of time series transformation pipeline
+
+    Attributes:
+        name (Union[TransformationType, str]): Name of built-in or registered transformation
+        inputs (Optional[List[int]]): Indexes of input time series, source time series are numbered first and
+            output of step i gets number len(source_time_series_ids) + i. Defaults to all source time series for
+            the first step and to output of the previous step for the following ones
+        additional_properties (Optional[List[PropertyIn]]): Additional properties for transformation
+    """
+
+    name: Union[TransformationType, str]
+    inputs: Optional[List[int]]
+    additional_properties: Optional[List[PropertyIn]]
+
+    _check_name = validator("name", allow_reuse=True)(_check_transformation_name)
+
+
+class TimeSeriesTransformationPipelineIn(BaseModel):
+    """
+    Model of time series transformation pipeline to acquire from client
+
+    Attributes:
+        source_time_series_ids (List[Union[str, int]]): Ids of source time series
+        steps (List[TimeSeriesTransformationStepIn]): Transformations executed in order, only output of the last
+            one is saved
+        destination_observable_information_id (Optional[int]): Id of destination observable information
+        destination_measure_id (Optional[int]): Id of destination measure
+    """
+
+    source_time_series_ids: List[Union[str, int]]
+    steps: List[TimeSeriesTransformationStepIn]
+    destination_observable_information_id: Optional[int]
+    destination_measure_id: Optional[int]
+
+    _check_steps = validator("steps", allow_reuse=True)(_check_step_input_counts)
+
+
+class TimeSeriesTransformationState(BaseModel):
+    """
+    Resumable state of incremental time series transformation persisted between calls
+
+    Attributes:
+        processed_counts (List[int]): Number of processed signal values of each source time series
+        next_timestamp (Optional[int]): Next output timestamp of transformations with regular output
+        pending_signal_values (List[list]): Processed signal values of each source time series which can still
+            affect future output, e.g. not matched yet or needed to find the nearest signal value
+    """
+
+    processed_counts: List[int] = []
+    next_timestamp: Optional[int]
+    pending_signal_values: List[list] = []
+
 
 class TimeSeriesTransformationRelationshipIn(BaseModel):
     """
@@ -189,6 +308,81 @@ class TimeSeriesNodesOut(BaseModelOut):
     time_series_nodes: List[BasicTimeSeriesOut] = []
 
 
+class TimeSeriesWindowOut(BaseModelOut):
+    """
+    Model of time range covered by time series, without its signal values, to send to client as a result of request
+
+    Attributes:
+        id (Optional[Union[int, str]]): Id of time series
+        type (Optional[Type]): Type of the signal
+        measure_id (Optional[Union[int, str]]): Id of measure of time series
+        observable_information_id (Optional[Union[int, str]]): Id of observable information of time series
+        start_timestamp (Optional[int]): Timestamp of the first signal value, None for empty time series
+        end_timestamp (Optional[int]): End timestamp of the last signal value, None for empty time series
+        signal_value_count (int): Number of signal values
+    """
+
+    id: Optional[Union[int, str]]
+    type: Optional[Type]
+    measure_id: Optional[Union[int, str]]
+    observable_information_id: Optional[Union[int, str]]
+    start_timestamp: Optional[int]
+    end_timestamp: Optional[int]
+    signal_value_count: int = 0
+
+
+class TimeSeriesStatisticsOut(BaseModelOut):
+    """
+    Model of statistics of signal values of time series to send to client as a result of request
+
+    Attributes:
+        id (Optional[Union[int, str]]): Id of time series
+        type (Optional[Type]): Type of the signal
+        count (int): Number of signal values
+        numeric_count (int): Number of signal values with numeric values, used by statistics of values
+        mean (Optional[float]): Mean of values
+        std (Optional[float]): Standard deviation of values
+        min_value (Optional[float]): The smallest value
+        max_value (Optional[float]): The greatest value
+        percentiles (Dict[str, float]): Estimated percentiles of values by percent, e.g. "50" for median
+        start_timestamp (Optional[int]): Timestamp of the first signal value
+        end_timestamp (Optional[int]): End timestamp of the last signal value
+        duration (Optional[int]): Difference between end timestamp and timestamp of the first signal value
+        mean_interval (Optional[float]): Mean difference between timestamps of consecutive signal values
+        interval_std (Optional[float]): Standard deviation of differences between timestamps of consecutive signal
+            values
+        irregularity (Optional[float]): Ratio of interval_std to mean_interval, 0 for regularly spaced signal
+    """
+
+    id: Optional[Union[int, str]]
+    type: Optional[Type]
+    count: int = 0
+    numeric_count: int = 0
+    mean: Optional[float]
+    std: Optional[float]
+    min_value: Optional[float]
+    max_value: Optional[float]
+    percentiles: Dict[str, float] = {}
+    start_timestamp: Optional[int]
+    end_timestamp: Optional[int]
+    duration: Optional[int]
+    mean_interval: Optional[float]
+    interval_std: Optional[float]
+    irregularity: Optional[float]
+
+
+class TimeSeriesStatisticsListOut(BaseModelOut):
+    """
+    Model of statistics of many time series to send to client as a result of request
+
+    Attributes:
+        time_series_statistics (List[TimeSeriesStatisticsOut]): Statistics of each time series, with their own
+            errors
+    """
+
+    time_series_statistics: List[TimeSeriesStatisticsOut] = []
+
+
 # Circular import exception prevention
 from grisera.measure.measure_model import MeasureOut
 from grisera.observable_information.observable_information_model import ObservableInformationOut
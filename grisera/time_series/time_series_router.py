@@ -1,11 +1,16 @@
-from typing import Union, Optional
+from typing import Union, Optional, List
 
-from fastapi import Response, Depends
+from fastapi import Response, Depends, Query
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
+from starlette.datastructures import QueryParams
 from starlette.requests import Request
 
 from grisera.helpers.hateoas import get_links
+from grisera.job.job_handlers import TRANSFORM_TIME_SERIES, CASCADE_DELETE
+from grisera.job.job_model import JobOut
+from grisera.job.job_service import JobService, get_job_service
+from grisera.services.cascade_delete import CascadeDeleter, TIME_SERIES
 from grisera.services.service import service
 from grisera.time_series.time_series_model import (
     TimeSeriesIn,
@@ -14,10 +19,17 @@ from grisera.time_series.time_series_model import (
     TimeSeriesPropertyIn,
     TimeSeriesRelationIn,
     TimeSeriesTransformationIn,
-    TimeSeriesMultidimensionalOut
+    TimeSeriesTransformationPipelineIn,
+    TimeSeriesMultidimensionalOut,
+    TimeSeriesStatisticsListOut,
+    DownsamplingMethod
 )
+from grisera.models.bulk_model import BulkCreateOut, BulkUpdateOut, RelationshipUpdateIn
+from grisera.models.cascade_delete_model import CascadeDeleteOut, CascadeDeleteJobIn
 from grisera.models.not_found_model import NotFoundByIdModel
 from grisera.services.service_factory import ServiceFactory
+from grisera.time_series.ts_filter import parse_time_series_filter, FILTER_FORMAT_PARAMETER
+from grisera.time_series.ts_statistics import parse_percentiles
 
 router = InferringRouter()
 
@@ -29,10 +41,15 @@ class TimeSeriesRouter:
 
     Attributes:
         time_series_service (TimeSeriesService): Service instance for time series
+        cascade_deleter (CascadeDeleter): Deleter of nodes with their dependent nodes
+        job_service (JobService): Service instance for jobs executing long-running operations
     """
 
-    def __init__(self, service_factory: ServiceFactory = Depends(service.get_service_factory)):
+    def __init__(self, service_factory: ServiceFactory = Depends(service.get_service_factory),
+                 job_service: JobService = Depends(get_job_service)):
         self.time_series_service = service_factory.get_time_series_service()
+        self.cascade_deleter = CascadeDeleter(service_factory)
+        self.job_service = job_service
 
     @router.post("/time_series", tags=["time series"], response_model=TimeSeriesOut)
     async def create_time_series(self, time_series: TimeSeriesIn, response: Response):
@@ -53,6 +70,28 @@ class TimeSeriesRouter:
 
         return create_response
 
+    @router.post(
+        "/time_series/bulk",
+        tags=["time series"],
+        response_model=BulkCreateOut[TimeSeriesOut],
+    )
+    async def create_time_series_bulk(self, time_series: List[TimeSeriesIn], response: Response):
+        """
+        Create many time series in database at once, returning result of creating each one
+
+        Signal values of each time series follow the rules of POST /time_series.
+        """
+        create_response = BulkCreateOut[TimeSeriesOut].from_results(
+            self.time_series_service.save_time_series_bulk(time_series)
+        )
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
     @router.post("/time_series/transformation", tags=["time series"],
                  response_model=Union[TimeSeriesOut, NotFoundByIdModel])
     async def transform_time_series(self, time_series_transformation: TimeSeriesTransformationIn, response: Response):
@@ -66,9 +105,28 @@ class TimeSeriesRouter:
             - period (required) - difference between output timestamps
             - start_timestamp - first output timestamp (default 0)
             - end_timestamp - last output timestamp will be less than end_timestamp (default last input end timestamp + period)
+        - resample_linear, resample_previous:
+            - period (required) - difference between output timestamps
+            - start_timestamp - output timestamps are start_timestamp + k * period, those before the first input signal value are skipped (default 0)
+            - end_timestamp - last output timestamp will be less than end_timestamp (default last input end timestamp + 1)
         - quadrants:
             - origin_x - X value of the center point of coordinate system (default 0)
             - origin_y - Y value of the center point of coordinate system (default 0)
+        - window_mean, window_min, window_max, window_std, window_count:
+            - window (required) - duration of each window
+            - step - difference between starts of consecutive windows, less than window for sliding windows whose output signal values overlap (default window)
+            - start_timestamp - start of the first window (default 0)
+            - end_timestamp - every window will start before end_timestamp (default last input begin timestamp + 1)
+        - band_power (regularly spaced input):
+            - bands - comma separated names of delta, theta, alpha, beta and gamma bands (default theta,alpha,beta); the request creates time series of the first band, POST /time_series/transformation/outputs of every band
+            - low_frequency, high_frequency - custom band in Hz, both required
+            - window_size - number of samples of each window, power of two (default 256)
+            - step_size - number of samples between starts of consecutive windows, less than window_size for overlapping output signal values (default window_size)
+            - sampling_period - period of input signal values (default median difference of timestamps)
+
+        For live recordings pass destination_time_series_id of time series created by the previous request with the
+        same parameters. Only signal values appended to source time series since then are transformed and appended
+        to the destination time series. Set final to true after the last signal value has been appended.
 
         To read about the implementation details go to TimeSeriesTransformation docstring documentation.
         """
@@ -82,6 +140,93 @@ class TimeSeriesRouter:
 
         return create_response
 
+    @router.post("/time_series/transformation/outputs", tags=["time series"], response_model=TimeSeriesNodesOut)
+    async def transform_time_series_outputs(self, time_series_transformation: TimeSeriesTransformationIn,
+                                            response: Response):
+        """
+        Create new time series in database for every output of transformation
+
+        Transformations and parameters are described in POST /time_series/transformation. band_power creates one
+        time series per band, in order of bands with the custom band last, other transformations one time series.
+        """
+
+        create_response = self.time_series_service.transform_time_series_outputs(time_series_transformation)
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.post("/time_series/transformation/pipeline", tags=["time series"],
+                 response_model=Union[TimeSeriesOut, NotFoundByIdModel])
+    async def transform_time_series_pipeline(self, pipeline: TimeSeriesTransformationPipelineIn,
+                                             response: Response):
+        """
+        Create new time series in database transformed by a chain of transformations
+
+        Steps are executed in order without saving intermediate time series. Each step accepts the transformation
+        names and parameters described in POST /time_series/transformation. Inputs of a step are indexes of source
+        time series (numbered from 0) and outputs of previous steps (numbered after source time series).
+        Without inputs the first step takes all source time series and every other step the previous output.
+
+        For example resample_nearest of two time series followed by quadrants:
+        steps = [{"name": "resample_nearest", "inputs": [0], ...}, {"name": "resample_nearest", "inputs": [1], ...},
+        {"name": "quadrants", "inputs": [2, 3]}]
+        """
+
+        create_response = self.time_series_service.transform_time_series_pipeline(pipeline)
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.post("/time_series/transformation/jobs", tags=["time series"], response_model=JobOut, status_code=202)
+    async def transform_time_series_job(self, time_series_transformation: TimeSeriesTransformationIn,
+                                        response: Response):
+        """
+        Queue job creating new transformed time series in database, for transformations too long to wait for the
+        response. Transformation names and parameters are described in POST /time_series/transformation.
+
+        Progress of the job is read from GET /jobs/{job_id}. Result of succeeded job is the transformed time series
+        without signal values.
+        """
+
+        create_response = self.job_service.submit_job(TRANSFORM_TIME_SERIES, time_series_transformation)
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.put(
+        "/time_series/relationships",
+        tags=["time series"],
+        response_model=BulkUpdateOut[TimeSeriesOut],
+    )
+    async def update_time_series_relationships_bulk(
+        self, updates: List[RelationshipUpdateIn[TimeSeriesRelationIn]], response: Response
+    ):
+        """
+        Update relationships of many time series at once, returning result of updating each one
+        """
+        update_response = BulkUpdateOut[TimeSeriesOut].from_results(
+            self.time_series_service.update_time_series_relationships_bulk(updates)
+        )
+        if update_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        update_response.links = get_links(router)
+
+        return update_response
+
     @router.get("/time_series", tags=["time series"], response_model=TimeSeriesNodesOut)
     async def get_time_series_nodes(self, response: Response, request: Request,
                                     entityname_property_name: Optional[str] = None,
@@ -99,7 +244,18 @@ class TimeSeriesRouter:
         The list of available parameters is not limited to the given below.
 
         This request allows filtering time series by id or any property from entities connected to time series.
-        The format of this generic GET filter parameter is: `entityname_property_name`.
+        Filter parameter name is entity name and property name joined with underscore, e.g. `participant_sex=male` or
+        `recording_id=1`. The `entityname_property_name` parameter only documents this format and is ignored.
+
+        Optional operator can be appended to parameter name after double underscore, e.g.
+        `participant_date_of_birth__gte=1990-01-01`.
+
+        Values of ids and numeric properties (participantstate_age) are compared as numbers, other values as strings.
+
+        Supported operators:
+        - eq (default), ne, lt, lte, gt, gte
+        - between - two comma separated values, e.g. `participantstate_age__between=20,30`
+        - in - comma separated values, e.g. `recording_id__in=1,2,3`
 
         Supported entity names:
         - observableinformation
@@ -115,7 +271,60 @@ class TimeSeriesRouter:
         - registereddata
         """
 
-        get_response = self.time_series_service.get_time_series_nodes(request.query_params)
+        try:
+            query_filter = parse_time_series_filter(request.query_params.multi_items(),
+                                                    self.time_series_service.get_entity_cardinalities())
+        except ValueError as error:
+            response.status_code = 422
+            return TimeSeriesNodesOut(errors=str(error), links=get_links(router))
+
+        get_response = self.time_series_service.get_time_series_nodes_by_filter(query_filter, request.query_params)
+
+        # add links from hateoas
+        get_response.links = get_links(router)
+
+        return get_response
+
+    @router.get("/time_series/stats", tags=["time series"], response_model=TimeSeriesStatisticsListOut)
+    async def get_time_series_statistics(self, response: Response, request: Request,
+                                         time_series_ids: Optional[str] = None,
+                                         percentiles: Optional[str] = None):
+        """
+        Get statistics of signal values of many time series computed without returning signal values: count, mean,
+        standard deviation, minimum, maximum, estimated percentiles, duration and irregularity of intervals between
+        timestamps.
+
+        Time series are given either as comma separated time_series_ids or selected by filter parameters described
+        in GET /time_series. Percentiles are comma separated numbers from 0 to 100 (default 5,25,50,75,95).
+        """
+
+        try:
+            parsed_percentiles = parse_percentiles(percentiles)
+            filter_params = [(key, value) for key, value in request.query_params.multi_items()
+                             if key not in ("time_series_ids", "percentiles", FILTER_FORMAT_PARAMETER)]
+            query_filter = parse_time_series_filter(filter_params, self.time_series_service.get_entity_cardinalities())
+            if time_series_ids is None and not filter_params:
+                raise ValueError("time_series_ids or filter parameters are required")
+            if time_series_ids is not None and filter_params:
+                raise ValueError("time_series_ids cannot be combined with filter parameters")
+        except ValueError as error:
+            response.status_code = 422
+            return TimeSeriesStatisticsListOut(errors=str(error), links=get_links(router))
+
+        if time_series_ids is not None:
+            # Ids are converted like path parameters, numbers first
+            ids = [element.strip() for element in time_series_ids.split(",") if element.strip()]
+            ids = [int(time_series_id) if time_series_id.isdigit() else time_series_id for time_series_id in ids]
+        else:
+            nodes = self.time_series_service.get_time_series_nodes_by_filter(query_filter, QueryParams(filter_params))
+            if nodes.errors is not None:
+                response.status_code = 422
+                return TimeSeriesStatisticsListOut(errors=nodes.errors, links=get_links(router))
+            ids = [time_series.id for time_series in nodes.time_series_nodes]
+
+        get_response = TimeSeriesStatisticsListOut(time_series_statistics=[
+            self.time_series_service.get_time_series_statistics(time_series_id, parsed_percentiles)
+            for time_series_id in ids])
 
         # add links from hateoas
         get_response.links = get_links(router)
@@ -130,16 +339,33 @@ class TimeSeriesRouter:
     async def get_time_series(
         self, time_series_id: Union[int, str], depth: int, response: Response,
         signal_min_value: Optional[int] = None,
-        signal_max_value: Optional[int] = None
+        signal_max_value: Optional[int] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        max_points: Optional[int] = Query(default=None, ge=2),
+        downsampling: DownsamplingMethod = DownsamplingMethod.min_max
     ):
         """
         Get time series by id from database with signal values. Depth attribute specifies how many models will be traversed to create the
         response.
 
         Signal values will be filtered using minimum and maximum value if present.
+
+        Only signal values from start_timestamp (inclusive) to end_timestamp (exclusive) are returned if present.
+        Epoch signal values overlapping this window are returned.
+
+        If there are more than max_points signal values, they are downsampled with one of methods:
+        - min_max - signal values with minimal and maximal value from max_points / 2 time buckets (default)
+        - lttb - Largest-Triangle-Three-Buckets algorithm
         """
 
-        get_response = self.time_series_service.get_time_series(time_series_id, depth, signal_min_value, signal_max_value)
+        if start_timestamp is None and end_timestamp is None and max_points is None:
+            get_response = self.time_series_service.get_time_series(time_series_id, depth, signal_min_value,
+                                                                    signal_max_value)
+        else:
+            get_response = self.time_series_service.get_time_series_view(time_series_id, depth, signal_min_value,
+                                                                         signal_max_value, start_timestamp,
+                                                                         end_timestamp, max_points, downsampling)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -191,6 +417,52 @@ class TimeSeriesRouter:
 
         return get_response
 
+    @router.delete(
+        "/time_series/{time_series_id}/cascade",
+        tags=["time series"],
+        response_model=CascadeDeleteOut,
+    )
+    async def delete_time_series_cascade(
+        self, time_series_id: Union[int, str], response: Response, dry_run: bool = False
+    ):
+        """
+        Delete time series with signal values, which are deleted in bounded batches. Nodes are deleted starting from
+        dependent ones. With dry_run nodes which would be deleted are only counted.
+        """
+        delete_response = self.cascade_deleter.delete_time_series(time_series_id, dry_run)
+        if delete_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        delete_response.links = get_links(router)
+
+        return delete_response
+
+    @router.delete(
+        "/time_series/{time_series_id}/cascade/jobs",
+        tags=["time series"],
+        response_model=JobOut,
+        status_code=202,
+    )
+    async def delete_time_series_cascade_job(
+        self, time_series_id: Union[int, str], response: Response, dry_run: bool = False
+    ):
+        """
+        Queue job deleting time series with its dependent nodes as DELETE /time_series/{time_series_id}/cascade, for
+        deletions too long to wait for the response. Progress of the job is read from GET /jobs/{job_id} and its
+        result is the cascade delete object.
+        """
+        delete_response = self.job_service.submit_job(
+            CASCADE_DELETE, CascadeDeleteJobIn(label=TIME_SERIES, id=time_series_id, dry_run=dry_run)
+        )
+        if delete_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        delete_response.links = get_links(router)
+
+        return delete_response
+
     @router.put(
         "/time_series/{time_series_id}",
         tags=["time series"],
@@ -3,7 +3,16 @@ from typing import Union, Optional, List
 from starlette.datastructures import QueryParams
 
 from grisera.time_series.time_series_model import TimeSeriesPropertyIn, TimeSeriesIn, TimeSeriesRelationIn, \
-    TimeSeriesTransformationIn
+    TimeSeriesTransformationIn, TimeSeriesTransformationPipelineIn, DownsamplingMethod, TimeSeriesWindowOut, \
+    TimeSeriesStatisticsOut, TimeSeriesNodesOut
+from grisera.helpers.helpers import get_relation_ids
+from grisera.time_series.ts_columns import SignalColumns
+from grisera.time_series.ts_downsampling import select_signal_values
+from grisera.time_series.ts_filter import TimeSeriesFilter
+from grisera.time_series.ts_pyramid import TimeSeriesPyramid
+from grisera.time_series.ts_statistics import compute_time_series_statistics
+from grisera.time_series.transformation.TimeSeriesTransformationFactory import TimeSeriesTransformationFactory
+from grisera.models.bulk_model import RelationshipUpdateIn
 
 
 class TimeSeriesService:
@@ -16,6 +25,13 @@ class TimeSeriesService:
         """
         Send request to graph api to create new time series
 
+        Implementations may build TimeSeriesPyramid from saved signal values and store it next to the time series,
+        so coarse reads and resampling do not have to read all signal values.
+
+        Instead of creating signal value nodes in the graph, implementations may append signal values to
+        SignalStore under the id of the time series node, keeping only metadata in the graph. Time series read
+        with SignalStore.read_time_series are transformed without copying signal values.
+
         Args:
             time_series (TimeSeriesIn): Time series to be added
 
@@ -24,10 +40,34 @@ class TimeSeriesService:
         """
         raise Exception("save_time_series not implemented yet")
 
+    def save_time_series_bulk(self, time_series: List[TimeSeriesIn]):
+        """
+        Send request to graph api to create many new time series
+
+        Implementations should create all time series in one transaction. By default time series are saved one by one
+        with save_time_series.
+
+        Args:
+            time_series (List[TimeSeriesIn]): Time series to be added
+
+        Returns:
+            List of results of request as time series objects, in order of time series
+        """
+        return [self.save_time_series(single_time_series) for single_time_series in time_series]
+
     def transform_time_series(self, time_series_transformation: TimeSeriesTransformationIn):
         """
         Send request to graph api to create new transformed time series
 
+        Implementations storing TimeSeriesPyramid of time series should build it for the new time series and pass
+        the stored pyramid of source time series to TimeSeriesTransformationResample.transform_with_pyramid.
+        Large time series can be transformed in parallel chunks with TimeSeriesTransformationExecutor.
+
+        When destination_time_series_id is given, implementations should load TimeSeriesTransformationState stored
+        with the destination time series, pass signal values of source time series after state.processed_counts to
+        TimeSeriesTransformation.transform_incremental, append returned signal values to the destination time series
+        and store the new state.
+
         Args:
             time_series_transformation (TimeSeriesTransformationIn): Time series transformation parameters
 
@@ -36,6 +76,50 @@ class TimeSeriesService:
         """
         raise Exception("transform_time_series not implemented yet")
 
+    def transform_time_series_outputs(self, time_series_transformation: TimeSeriesTransformationIn):
+        """
+        Send request to graph api to create new time series for every output of transformation, e.g. for every
+        frequency band of band_power
+
+        Implementations should compute all outputs from source time series at once with
+        TimeSeriesTransformation.transform_outputs. By default transform_time_series is called with parameters of
+        each output from TimeSeriesTransformation.get_output_parameters.
+
+        Args:
+            time_series_transformation (TimeSeriesTransformationIn): Time series transformation parameters
+
+        Returns:
+            Result of request as list of time series nodes objects, in order of outputs
+        """
+        if time_series_transformation.destination_time_series_id is not None:
+            return TimeSeriesNodesOut(errors="destination_time_series_id is not supported for many outputs")
+        transformation = TimeSeriesTransformationFactory.get_transformation(time_series_transformation.name)
+        try:
+            output_parameters = transformation.get_output_parameters(time_series_transformation.additional_properties)
+        except (AssertionError, ValueError) as error:
+            return TimeSeriesNodesOut(errors=str(error))
+        results = [self.transform_time_series(time_series_transformation.copy(
+            update={"additional_properties": output_properties})) for output_properties in output_parameters]
+        errors = [result.errors for result in results if result.errors is not None]
+        return TimeSeriesNodesOut(time_series_nodes=[result for result in results if result.errors is None],
+                                  errors=errors if errors else None)
+
+    def transform_time_series_pipeline(self, pipeline: TimeSeriesTransformationPipelineIn):
+        """
+        Send request to graph api to create new time series transformed by a chain of transformations
+
+        Implementations should pass source time series to TimeSeriesTransformationPipeline.run, which transforms
+        large time series in parallel chunks, and save only the resulting time series with its relationships to
+        signal values of source time series.
+
+        Args:
+            pipeline (TimeSeriesTransformationPipelineIn): Time series transformation pipeline parameters
+
+        Returns:
+            Result of request as time series object
+        """
+        raise Exception("transform_time_series_pipeline not implemented yet")
+
     def get_time_series_nodes(self, params: QueryParams = None):
         """
         Send request to graph api to get time series nodes
@@ -48,6 +132,36 @@ class TimeSeriesService:
         """
         raise Exception("get_time_series_nodes not implemented yet")
 
+    def get_time_series_nodes_by_filter(self, query_filter: TimeSeriesFilter, params: QueryParams = None):
+        """
+        Send request to graph api to get time series nodes matching parsed filter
+
+        Filter conditions are ordered from the most selective, so implementations should start traversal from
+        the first entity in query_filter.entity_order. By default the request is handled by get_time_series_nodes
+        with raw parameters.
+
+        Args:
+            query_filter (TimeSeriesFilter): Parsed and validated filter
+            params (QueryParams): Get parameters
+
+        Returns:
+            Result of request as list of time series nodes objects
+        """
+        return self.get_time_series_nodes(params)
+
+    def get_entity_cardinalities(self):
+        """
+        Send request to graph api to count nodes of entities which time series can be filtered by
+
+        Counts are used to order conditions of time series filters. By default they are unknown and conditions are
+        ordered by ENTITY_FAN_OUT. Implementations should return counts keyed by entity names of ENTITY_FAN_OUT,
+        e.g. cached from graph api statistics, because they are read for every filtered request.
+
+        Returns:
+            Number of nodes of each entity or None if counts are unknown
+        """
+        return None
+
     def get_time_series(self, time_series_id: Union[int, str], depth: int = 0,
                         signal_min_value: Optional[int] = None,
                         signal_max_value: Optional[int] = None):
@@ -65,6 +179,64 @@ class TimeSeriesService:
         """
         raise Exception("get_time_series not implemented yet")
 
+    def get_time_series_view(self, time_series_id: Union[int, str], depth: int = 0,
+                             signal_min_value: Optional[int] = None,
+                             signal_max_value: Optional[int] = None,
+                             start_timestamp: Optional[int] = None,
+                             end_timestamp: Optional[int] = None,
+                             max_points: Optional[int] = None,
+                             downsampling: DownsamplingMethod = DownsamplingMethod.min_max):
+        """
+        Send request to graph api to get given time series with signal values from time window, downsampled to
+        the given number of points
+
+        By default the whole time series is read with get_time_series and signal values are selected with
+        select_signal_values. When min-max downsampling is requested without value filters and
+        get_time_series_pyramid returns a pyramid with more buckets than max_points in the time window, points are
+        taken from the pyramid instead, so implementations returning signal values lazily, e.g. from
+        SignalStore.read_time_series, never touch raw signal values. Implementations should read only signal values
+        from the time window and may use engines from ts_downsampling module on them.
+
+        Args:
+            time_series_id (int | str): identity of time series
+            depth: (int): specifies how many related entities will be traversed to create the response
+            signal_min_value (Optional[int]): Filter signal values by min value
+            signal_max_value (Optional[int]): Filter signal values by max value
+            start_timestamp (Optional[int]): Return signal values from this timestamp
+            end_timestamp (Optional[int]): Return signal values before this timestamp
+            max_points (Optional[int]): The greatest number of returned signal values
+            downsampling (DownsamplingMethod): Algorithm used when there are more than max_points signal values
+
+        Returns:
+            Result of request as time series object
+        """
+        time_series = self.get_time_series(time_series_id, depth, signal_min_value, signal_max_value)
+        if time_series.errors is not None:
+            return time_series
+        if max_points is not None and downsampling == DownsamplingMethod.min_max and signal_min_value is None \
+                and signal_max_value is None:
+            pyramid = self.get_time_series_pyramid(time_series_id)
+            if pyramid is not None and pyramid.can_downsample(start_timestamp, end_timestamp, max_points):
+                return time_series.copy(update={"signal_values": pyramid.downsample_min_max(
+                    start_timestamp, end_timestamp, max_points)})
+        # Time series returned by get_time_series may be cached by implementations, so it is not modified
+        return time_series.copy(update={"signal_values": select_signal_values(
+            time_series.signal_values, time_series.type, start_timestamp, end_timestamp, max_points, downsampling)})
+
+    def get_time_series_pyramid(self, time_series_id: Union[int, str]) -> Optional[TimeSeriesPyramid]:
+        """
+        Send request to graph api to get TimeSeriesPyramid stored with given time series
+
+        By default no pyramids are stored.
+
+        Args:
+            time_series_id (int | str): identity of time series
+
+        Returns:
+            Pyramid of time series or None if it is not stored
+        """
+        return None
+
     def get_time_series_multidimensional(self, time_series_ids: List[Union[int, str]]):
         """
         Send request to graph api to get given time series
@@ -89,6 +261,110 @@ class TimeSeriesService:
         """
         raise Exception("delete_time_series not implemented yet")
 
+    def get_time_series_observable_information_ids(self, time_series_id: Union[int, str]):
+        """
+        Send request to graph api to get ids of observable informations related to given time series
+
+        By default the time series is read with all of its signal values, so implementations should override it with
+        a query reading only relationships. It is called by CascadeDeleter to keep time series shared with
+        observable informations which are not deleted.
+
+        Args:
+            time_series_id (int | str): identity of time series
+
+        Returns:
+            List of ids of observable informations or None if time series was not found
+        """
+        time_series = self.get_time_series(time_series_id, 1)
+        if time_series.errors is not None:
+            return None
+        relation_ids = get_relation_ids(time_series, {"observable_information_id": "observable_informations",
+                                                      "observable_information_ids": "observable_informations"})
+        observable_information_ids = list(relation_ids["observable_information_ids"] or [])
+        if relation_ids["observable_information_id"] is not None and \
+                relation_ids["observable_information_id"] not in observable_information_ids:
+            observable_information_ids.append(relation_ids["observable_information_id"])
+        return observable_information_ids
+
+    def count_time_series_signal_values(self, time_series_id: Union[int, str]):
+        """
+        Send request to graph api to count signal values of given time series
+
+        By default the time series is read with all of its signal values, so implementations should override it with
+        a query counting signal values in graph api. It is called by CascadeDeleter for every deleted time series.
+
+        Args:
+            time_series_id (int | str): identity of time series
+
+        Returns:
+            Number of signal values or None if time series was not found
+        """
+        time_series = self.get_time_series(time_series_id)
+        if time_series.errors is not None:
+            return None
+        return len(time_series.signal_values or [])
+
+    def get_time_series_window(self, time_series_id: Union[int, str]):
+        """
+        Send request to graph api to get time range and number of signal values of given time series
+
+        By default the time series is read with all signal values, which graph api could avoid by reading only the
+        first and the last one.
+
+        Args:
+            time_series_id (int | str): identity of time series
+
+        Returns:
+            Result of request as time series window object
+        """
+        time_series = self.get_time_series(time_series_id)
+        if time_series.errors is not None:
+            return TimeSeriesWindowOut(id=time_series_id, errors=time_series.errors)
+        columns = SignalColumns.from_time_series(time_series)
+        return TimeSeriesWindowOut(id=time_series_id, type=time_series.type, measure_id=time_series.measure_id,
+                                   observable_information_id=time_series.observable_information_id,
+                                   start_timestamp=columns.timestamps[0] if len(columns) else None,
+                                   end_timestamp=columns.end_timestamps[-1] if len(columns) else None,
+                                   signal_value_count=len(columns))
+
+    def get_time_series_statistics(self, time_series_id: Union[int, str], percentiles: List[float]):
+        """
+        Send request to graph api to compute statistics of signal values of given time series
+
+        By default the time series is read with get_time_series and statistics are computed in one pass by
+        compute_time_series_statistics. Implementations should compute them where signal values are stored, e.g. by
+        adding columns read from SignalStore in chunks to TimeSeriesStatistics, so signal values are never read at
+        once.
+
+        Args:
+            time_series_id (int | str): identity of time series
+            percentiles (List[float]): Estimated percentiles, from 0 to 100
+
+        Returns:
+            Result of request as time series statistics object
+        """
+        time_series = self.get_time_series(time_series_id)
+        if time_series.errors is not None:
+            return TimeSeriesStatisticsOut(id=time_series_id, errors=time_series.errors)
+        return compute_time_series_statistics(time_series, percentiles)
+
+    def delete_time_series_signal_values(self, time_series_id: Union[int, str], limit: int):
+        """
+        Send request to graph api to delete at most limit signal values of given time series, so large time series
+        can be deleted in bounded batches before the time series itself
+
+        By default no signal values are deleted separately and they are deleted with time series by
+        delete_time_series.
+
+        Args:
+            time_series_id (int | str): identity of time series
+            limit (int): The greatest number of deleted signal values
+
+        Returns:
+            Number of deleted signal values
+        """
+        return 0
+
     def update_time_series(self, time_series_id: Union[int, str], time_series: TimeSeriesPropertyIn):
         """
         Send request to graph api to update given time series
@@ -115,3 +391,19 @@ class TimeSeriesService:
             Result of request as time series object
         """
         raise Exception("update_time_series_relationships not implemented yet")
+
+    def update_time_series_relationships_bulk(self, updates: List[RelationshipUpdateIn]):
+        """
+        Send request to graph api to update relationships of many time series
+
+        Implementations can collect referenced ids of all updates with collect_referenced_ids, validate each of them
+        once and apply all updates in one transaction. By default updates are applied one by one with
+        update_time_series_relationships.
+
+        Args:
+            updates (List[RelationshipUpdateIn]): Ids of time series with relationships to update
+
+        Returns:
+            List of results of request as time series objects, in order of updates
+        """
+        return [self.update_time_series_relationships(update.id, update.relationships) for update in updates]
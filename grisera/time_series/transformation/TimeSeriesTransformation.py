@@ -1,7 +1,7 @@
 from typing import List, Optional
 
 from grisera.property.property_model import PropertyIn
-from grisera.time_series.time_series_model import TimeSeriesOut
+from grisera.time_series.time_series_model import TimeSeriesOut, TimeSeriesTransformationState
 
 
 class TimeSeriesTransformation:
@@ -22,3 +22,76 @@ class TimeSeriesTransformation:
             New time series object
         """
         raise Exception("transform not implemented yet")
+
+    def get_output_parameters(self, additional_properties: Optional[List[PropertyIn]]):
+        """
+        Get parameters of each output time series, so transform called with them creates only that output
+
+        By default transformation has one output.
+
+        Args:
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+
+        Returns:
+            List of transformation parameters of each output
+        """
+        return [additional_properties]
+
+    def transform_outputs(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]]):
+        """
+        Transform time series data into all output time series
+
+        By default transform is called with parameters of each output from get_output_parameters. Transformations
+        with many outputs should compute them together.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series to be transformed
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+
+        Returns:
+            List of tuples of new time series object and id mapping of each output
+        """
+        return [self.transform(time_series, output_properties)
+                for output_properties in self.get_output_parameters(additional_properties)]
+
+    def transform_incremental(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]],
+                              state: Optional[TimeSeriesTransformationState], final: bool = False):
+        """
+        Transform signal values appended to time series since the previous call
+
+        Only new signal values are processed, so output is appended in O(number of new signal values) time.
+        Concatenated output of all calls, the last one with final flag, equals the output of transform method.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series with signal values appended after the ones counted in
+                state.processed_counts
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters, the same in every call
+            state (Optional[TimeSeriesTransformationState]): State returned by the previous call, None in the
+                first call
+            final (bool): Transform also signal values which could be changed by future signal values
+
+        Returns:
+            New time series object with appended signal values, id mapping and new state
+        """
+        raise Exception("transform_incremental not implemented yet")
+
+    def split(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]],
+              chunk_count: int):
+        """
+        Split transformation into independent chunks of output
+
+        Every chunk gets ranges of signal values needed to compute its part of output, including neighbouring
+        signal values and overlapping windows at boundaries, and parameters limiting output to its part. Concatenated output of
+        all chunks transformed in order equals output of transform method, except for floating point rounding of
+        aggregates computed from running sums.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series to be transformed
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+            chunk_count (int): The greatest number of chunks
+
+        Returns:
+            List of (list of (first index, index after the last) tuples of each time series, transformation
+            parameters) tuples
+        """
+        raise Exception("split not implemented yet")
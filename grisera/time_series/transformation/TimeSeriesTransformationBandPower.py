@@ -0,0 +1,162 @@
+import statistics
+from typing import List, Optional
+
+from grisera.property.property_model import PropertyIn
+from grisera.time_series.ts_columns import SignalColumns
+from grisera.time_series.ts_helpers import get_additional_parameter
+from grisera.time_series.ts_spectral import FREQUENCY_BANDS, FFTPlan, get_band_bins, compute_band_powers
+from grisera.time_series.time_series_model import TimeSeriesOut, TimeSeriesIn, Type, SignalIn, TransformationType, \
+    SignalValueNodesIn
+from grisera.time_series.transformation.TimeSeriesTransformation import TimeSeriesTransformation
+from grisera.time_series.transformation.TimeSeriesTransformationRegistry import register_transformation
+
+
+CUSTOM_BAND = "custom"
+
+
+@register_transformation(TransformationType.BAND_POWER, vectorized=True)
+class TimeSeriesTransformationBandPower(TimeSeriesTransformation):
+    """
+    Class with logic of time series spectral band power transformation
+
+    """
+
+    def transform(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]]):
+        """
+        Transform time series data.
+
+        Get power of the first given frequency band in windows of regularly spaced signal values. Use parameters
+        from get_output_parameters to get other bands or transform_outputs to get all of them at once.
+        See transform_bands.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series to be transformed
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+
+        Returns:
+            New time series object
+        """
+        return next(iter(self.transform_bands(time_series, additional_properties).values()))
+
+    def get_output_parameters(self, additional_properties: Optional[List[PropertyIn]]):
+        """
+        Get parameters of time series of each frequency band
+
+        Args:
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+
+        Returns:
+            List of transformation parameters selecting single band, in order of bands
+        """
+        common_properties = [additional_property for additional_property in additional_properties or []
+                             if additional_property.key not in ("bands", "low_frequency", "high_frequency")]
+        output_parameters = []
+        for band_name, (low_frequency, high_frequency) in self._get_bands(additional_properties).items():
+            if band_name == CUSTOM_BAND:
+                band_properties = [PropertyIn(key="low_frequency", value=str(low_frequency)),
+                                   PropertyIn(key="high_frequency", value=str(high_frequency))]
+            else:
+                band_properties = [PropertyIn(key="bands", value=band_name)]
+            output_parameters.append(common_properties + band_properties)
+        return output_parameters
+
+    def transform_outputs(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]]):
+        """
+        Transform time series data into one time series per frequency band, computing FFT of each window once
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series to be transformed
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+
+        Returns:
+            List of tuples of new time series object and id mapping, in order of bands
+        """
+        return list(self.transform_bands(time_series, additional_properties).values())
+
+    def transform_bands(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]]):
+        """
+        Transform time series data into one time series per frequency band.
+
+        Signal values are split into windows of window_size samples starting every step_size samples. Power of
+        every band is computed from one FFT of mean removed, Hann windowed samples of each window. FFT plan
+        (permutation, twiddle factors and window coefficients) is computed once for all windows of the batch.
+        Windows containing gaps longer than half of the sampling period are skipped.
+
+        Output Epoch signal values span from the first to the last timestamp of the window and are mapped to ids
+        of all samples of the window. By default windows do not overlap; with step_size less than window_size
+        output signal values overlap, unlike time series created by clients.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series to be transformed
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+
+        Returns:
+            Dictionary of band names and tuples of new time series object and id mapping
+        """
+        assert len(time_series) == 1, "Number of time series should equals 1 for band power transformation"
+        window_size = get_additional_parameter(additional_properties, "window_size")
+        window_size = int(window_size) if window_size is not None else 256
+        step_size = get_additional_parameter(additional_properties, "step_size")
+        step_size = int(step_size) if step_size is not None else window_size
+        assert step_size > 0, "step_size additional parameter should be positive"
+        selected_bands = self._get_bands(additional_properties)
+
+        columns = SignalColumns.from_time_series(time_series[0])
+        sampling_period = get_additional_parameter(additional_properties, "sampling_period")
+        if sampling_period is not None:
+            sampling_period = float(sampling_period)
+        elif len(columns) > 1:
+            sampling_period = statistics.median(columns.timestamps[index + 1] - columns.timestamps[index]
+                                                for index in range(len(columns) - 1))
+        else:
+            sampling_period = 1.0
+        assert sampling_period > 0, "Signal values should be regularly spaced"
+        # Timestamps are in milliseconds
+        sampling_frequency = 1000 / sampling_period
+
+        plan = FFTPlan(window_size)
+        band_bins = get_band_bins(selected_bands, window_size, sampling_frequency)
+        values = columns.numeric_values()
+        timestamps = columns.timestamps
+        max_span = (window_size - 1 + 0.5) * sampling_period
+
+        new_signal_values = {band_name: [] for band_name in selected_bands}
+        new_signal_values_id_mapping = []
+        for first_index in range(0, len(columns) - window_size + 1, step_size):
+            last_index = first_index + window_size - 1
+            if timestamps[last_index] - timestamps[first_index] > max_span:
+                continue
+            powers = compute_band_powers(plan, values[first_index:last_index + 1], band_bins, sampling_frequency)
+            for band_name, power in powers.items():
+                new_signal_values[band_name].append(SignalIn(signal_value=SignalValueNodesIn(value=power),
+                                                             start_timestamp=timestamps[first_index],
+                                                             end_timestamp=timestamps[last_index]))
+            new_signal_values_id_mapping.append(list(columns.ids[first_index:last_index + 1]))
+
+        result = {}
+        for band_name in selected_bands:
+            band_properties = list(additional_properties) if additional_properties is not None else []
+            band_properties.append(PropertyIn(key="transformation_name", value=TransformationType.BAND_POWER))
+            band_properties.append(PropertyIn(key="band", value=band_name))
+            result[band_name] = (TimeSeriesIn(type=Type.epoch,
+                                              additional_properties=band_properties,
+                                              signal_values=new_signal_values[band_name]
+                                              ), new_signal_values_id_mapping)
+        return result
+
+    @staticmethod
+    def _get_bands(additional_properties: Optional[List[PropertyIn]]):
+        bands = get_additional_parameter(additional_properties, "bands")
+        band_names = bands.split(",") if bands is not None else ["theta", "alpha", "beta"]
+        for band_name in band_names:
+            assert band_name in FREQUENCY_BANDS, f"band {band_name} is unknown"
+        selected_bands = {band_name: FREQUENCY_BANDS[band_name] for band_name in band_names}
+        low_frequency = get_additional_parameter(additional_properties, "low_frequency")
+        high_frequency = get_additional_parameter(additional_properties, "high_frequency")
+        assert (low_frequency is None) == (high_frequency is None), \
+            "low_frequency and high_frequency additional parameters should be given together"
+        if low_frequency is None:
+            return selected_bands
+        custom_band = (float(low_frequency), float(high_frequency))
+        assert 0 <= custom_band[0] < custom_band[1], "low_frequency should be less than high_frequency"
+        return {CUSTOM_BAND: custom_band} if bands is None else dict(selected_bands, **{CUSTOM_BAND: custom_band})
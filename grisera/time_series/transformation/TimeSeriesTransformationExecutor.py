@@ -0,0 +1,158 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from typing import List, Optional
+
+from grisera.property.property_model import PropertyIn
+from grisera.time_series.ts_chunks import slice_time_series
+from grisera.time_series.ts_columns import SignalColumns, ColumnSignalValues
+from grisera.time_series.ts_shared_memory import SharedSignalColumns, SharedColumnsHandle, read_shared_columns
+from grisera.time_series.time_series_model import TimeSeriesOut, TimeSeriesIn, SignalIn, SignalValueNodesIn
+from grisera.time_series.transformation.TimeSeriesTransformationFactory import TimeSeriesTransformationFactory
+
+
+def _transform_chunk(transformation_name: str, time_series: List[TimeSeriesOut],
+                     additional_properties: Optional[List[PropertyIn]]):
+    return TimeSeriesTransformationFactory.get_transformation(transformation_name).transform(time_series,
+                                                                                             additional_properties)
+
+
+def _transform_shared_chunk(transformation_name: str, shared_ranges: List[tuple],
+                            additional_properties: Optional[List[PropertyIn]]):
+    time_series = []
+    for handle, first_index, last_index in shared_ranges:
+        columns = read_shared_columns(handle, first_index, last_index)
+        # Vectorized transformations read the columns back without creating signal values
+        time_series.append(TimeSeriesOut.construct(type=handle.type, signal_values=ColumnSignalValues(columns)))
+    new_time_series, new_signal_values_id_mapping = _transform_chunk(transformation_name, time_series,
+                                                                     additional_properties)
+    # Output is returned as plain columns, which are pickled much faster than signal models
+    signal_values = new_time_series.signal_values
+    return (new_time_series.type, new_time_series.additional_properties,
+            [signal.timestamp for signal in signal_values],
+            [signal.start_timestamp for signal in signal_values],
+            [signal.end_timestamp for signal in signal_values],
+            [signal.signal_value.value for signal in signal_values],
+            [signal.signal_value.additional_properties for signal in signal_values]), new_signal_values_id_mapping
+
+
+def _unpack_chunk_result(packed_time_series: tuple):
+    time_series_type, additional_properties, timestamps, start_timestamps, end_timestamps, values, \
+        value_properties = packed_time_series
+    # Signal values were validated in worker process
+    signal_values = [SignalIn.construct(timestamp=timestamp, start_timestamp=start_timestamp,
+                                        end_timestamp=end_timestamp,
+                                        signal_value=SignalValueNodesIn.construct(
+                                            value=value, additional_properties=properties))
+                     for timestamp, start_timestamp, end_timestamp, value, properties
+                     in zip(timestamps, start_timestamps, end_timestamps, values, value_properties)]
+    return TimeSeriesIn.construct(type=time_series_type, additional_properties=additional_properties,
+                                  signal_values=signal_values)
+
+
+class TimeSeriesTransformationExecutor:
+    """
+    Class executing single transformation of large time series in parallel chunks
+
+    Transformations declaring chunkable capability are split into chunks of output with split method, chunks are
+    transformed in a process pool and their output and id mappings are concatenated in chunk order, so the result
+    is the same as of transform method. Other transformations and small time series are transformed in the current
+    process.
+
+    Input time series are passed to workers as signal columns in shared memory segments, which are freed when the
+    transformation completes or fails. Workers copy only ranges of their chunks.
+
+    Attributes:
+        max_workers (int): Number of worker processes
+        min_chunk_size (int): The least number of input signal values per chunk
+        use_shared_memory (bool): Pass input in shared memory instead of pickling signal values of chunks
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, min_chunk_size: int = 100000, mp_context=None,
+                 use_shared_memory: bool = True):
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count() or 1
+        self.min_chunk_size = min_chunk_size
+        self.mp_context = mp_context
+        self.use_shared_memory = use_shared_memory
+        self._pool = None
+
+    def transform(self, transformation_name: str, time_series: List[TimeSeriesOut],
+                  additional_properties: Optional[List[PropertyIn]]):
+        """
+        Transform time series data, in parallel when possible
+
+        Args:
+            transformation_name (str): Name of transformation
+            time_series (List[TimeSeriesOut]): Time series to be transformed
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+
+        Returns:
+            New time series object and id mapping
+        """
+        transformation = TimeSeriesTransformationFactory.get_transformation(transformation_name)
+        capabilities = TimeSeriesTransformationFactory.get_capabilities(transformation_name)
+        signal_value_count = sum(len(single_time_series.signal_values) for single_time_series in time_series)
+        chunk_count = min(self.max_workers, signal_value_count // self.min_chunk_size)
+        if not capabilities.chunkable or chunk_count < 2:
+            return transformation.transform(time_series, additional_properties)
+
+        chunks = transformation.split(time_series, additional_properties, chunk_count)
+        if len(chunks) < 2:
+            return transformation.transform(time_series, additional_properties)
+        names = [transformation_name] * len(chunks)
+        chunk_properties = [properties for _, properties in chunks]
+        if not self.use_shared_memory:
+            chunk_time_series = [[slice_time_series(single_time_series, first_index, last_index)
+                                  for single_time_series, (first_index, last_index) in zip(time_series, ranges)]
+                                 for ranges, _ in chunks]
+            results = list(self._get_pool().map(_transform_chunk, names, chunk_time_series, chunk_properties))
+            return self._stitch(results, additional_properties)
+
+        with ExitStack() as stack:
+            handles: List[SharedColumnsHandle] = [
+                stack.enter_context(SharedSignalColumns(SignalColumns.from_time_series(single_time_series))).handle
+                for single_time_series in time_series]
+            shared_ranges = [[(handle, first_index, last_index) for handle, (first_index, last_index)
+                              in zip(handles, ranges)] for ranges, _ in chunks]
+            results = [(_unpack_chunk_result(packed_time_series), new_signal_values_id_mapping)
+                       for packed_time_series, new_signal_values_id_mapping
+                       in self._get_pool().map(_transform_shared_chunk, names, shared_ranges, chunk_properties)]
+        return self._stitch(results, additional_properties)
+
+    def close(self):
+        """
+        Shut down worker processes
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self.mp_context)
+        return self._pool
+
+    @staticmethod
+    def _stitch(results: list, additional_properties: Optional[List[PropertyIn]]):
+        first_time_series, _ = results[0]
+        # Chunk parameters limit output range, so the original parameters are returned with added ones
+        new_properties = list(additional_properties) if additional_properties is not None else []
+        added_keys = {additional_property.key for additional_property in new_properties}
+        new_properties.extend(additional_property for additional_property in first_time_series.additional_properties
+                              if additional_property.key not in added_keys and additional_property.key not in
+                              ("start_timestamp", "end_timestamp"))
+        new_signal_values = []
+        new_signal_values_id_mapping = []
+        for chunk_time_series, chunk_id_mapping in results:
+            new_signal_values.extend(chunk_time_series.signal_values)
+            new_signal_values_id_mapping.extend(chunk_id_mapping)
+        return TimeSeriesIn.construct(type=first_time_series.type,
+                                      additional_properties=new_properties,
+                                      signal_values=new_signal_values
+                                      ), new_signal_values_id_mapping
@@ -1,6 +1,8 @@
-from grisera.time_series.time_series_model import TransformationType
-from grisera.time_series.transformation.TimeSeriesTransformationQuadrants import TimeSeriesTransformationQuadrants
-from grisera.time_series.transformation.TimeSeriesTransformationResample import TimeSeriesTransformationResample
+# Built-in transformations register themselves on import
+from grisera.time_series.transformation import TimeSeriesTransformationBandPower, TimeSeriesTransformationQuadrants, \
+    TimeSeriesTransformationResample, TimeSeriesTransformationResampleLinear, \
+    TimeSeriesTransformationResamplePrevious, TimeSeriesTransformationWindow
+from grisera.time_series.transformation.TimeSeriesTransformationRegistry import transformation_registry
 
 
 class TimeSeriesTransformationFactory:
@@ -14,15 +16,25 @@ class TimeSeriesTransformationFactory:
         """
         Transform time series data
 
+        Transformations are taken from transformation_registry, so shared instances are returned.
+
         Args:
             transformation_name (str): Name of transformation
 
         Returns:
             New time series transformation class
         """
-        if transformation_name == TransformationType.RESAMPLE_NEAREST:
-            return TimeSeriesTransformationResample()
-        elif transformation_name == TransformationType.QUADRANTS:
-            return TimeSeriesTransformationQuadrants()
-        else:
-            raise Exception(f"transformation {transformation_name} is unknown")
+        return transformation_registry.get_transformation(transformation_name)
+
+    @staticmethod
+    def get_capabilities(transformation_name: str):
+        """
+        Get capabilities declared by transformation
+
+        Args:
+            transformation_name (str): Name of transformation
+
+        Returns:
+            Transformation capabilities
+        """
+        return transformation_registry.get_capabilities(transformation_name)
@@ -0,0 +1,155 @@
+from typing import List, Optional
+
+from grisera.property.property_model import PropertyIn
+from grisera.time_series.ts_alignment import align_ticks, first_tick_at_or_after
+from grisera.time_series.ts_chunks import split_output_range, split_with_neighbours
+from grisera.time_series.ts_columns import SignalColumns
+from grisera.time_series.ts_helpers import get_additional_parameter
+from grisera.time_series.time_series_model import TimeSeriesOut, TimeSeriesIn, Type, SignalIn, TransformationType, \
+    SignalValueNodesIn
+from grisera.time_series.transformation.TimeSeriesTransformation import TimeSeriesTransformation
+
+DEFAULT_CHUNK_SIZE = 100000
+
+
+class TimeSeriesTransformationInterpolation(TimeSeriesTransformation):
+    """
+    Abstract class with logic shared by resampling transformations computing output value from signal values
+    surrounding every output timestamp
+
+    Output timestamps before the first signal value are skipped. Epoch signal values are treated as holding their
+    value from start to end timestamp and should not overlap.
+
+    Attributes:
+        transformation_name (TransformationType): Name of transformation stored in output time series
+        extrapolate (bool): Transform output timestamps after the last signal value
+    """
+
+    transformation_name: TransformationType = None
+    extrapolate: bool = False
+
+    def transform(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]]):
+        """
+        Transform time series data.
+
+        Get signal values with new sampling period.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series to be transformed
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+
+        Returns:
+            New time series object
+        """
+        new_time_series, new_signal_values_id_mapping = None, []
+        for chunk, chunk_id_mapping in self.transform_chunks(time_series, additional_properties, chunk_size=None):
+            if new_time_series is None:
+                new_time_series = chunk
+            else:
+                new_time_series.signal_values.extend(chunk.signal_values)
+            new_signal_values_id_mapping.extend(chunk_id_mapping)
+        return new_time_series, new_signal_values_id_mapping
+
+    def transform_chunks(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]],
+                         chunk_size: Optional[int] = DEFAULT_CHUNK_SIZE):
+        """
+        Transform time series data in chunks of output signal values.
+
+        Chunks share additional properties, so the first chunk can be saved as a new time series and the following
+        ones appended to it without keeping the whole output in memory.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series to be transformed
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+            chunk_size (Optional[int]): The greatest number of signal values in chunk, unlimited if None
+
+        Returns:
+            Iterator of (time series object, id mapping) tuples, at least one
+        """
+        assert len(time_series) == 1, "Number of time series should equals 1 for resample transformation"
+        period = get_additional_parameter(additional_properties, "period")
+        assert period is not None, "period additional parameter is required"
+        period = int(period)
+        assert period > 0, "period additional parameter should be positive"
+        start_timestamp = get_additional_parameter(additional_properties, "start_timestamp")
+        end_timestamp = get_additional_parameter(additional_properties, "end_timestamp")
+        start_timestamp = int(start_timestamp) if start_timestamp is not None else 0
+
+        columns = SignalColumns.from_time_series(time_series[0])
+        if len(columns) > 0:
+            last_end_timestamp = max(columns.end_timestamps[-1], columns.timestamps[-1])
+            end_timestamp = int(end_timestamp) if end_timestamp is not None else last_end_timestamp + 1
+            if not self.extrapolate:
+                end_timestamp = min(end_timestamp, last_end_timestamp + 1)
+            start_timestamp = first_tick_at_or_after(columns.timestamps[0], start_timestamp, period)
+        else:
+            end_timestamp = start_timestamp
+
+        if additional_properties is None:
+            additional_properties = []
+        additional_properties.append(PropertyIn(key="transformation_name", value=self.transformation_name))
+
+        new_signal_values = []
+        new_signal_values_id_mapping = []
+        # Index is the number of signal values with begin timestamp less or equal to output timestamp
+        for current_time, signal_value_index in align_ticks(columns.timestamps, start_timestamp, end_timestamp,
+                                                            period, right=True):
+            value, ids = self._interpolate(columns, current_time, signal_value_index - 1)
+            new_signal_values.append(SignalIn(signal_value=SignalValueNodesIn(value=value), timestamp=current_time))
+            new_signal_values_id_mapping.append(ids)
+            if chunk_size is not None and len(new_signal_values) >= chunk_size:
+                yield TimeSeriesIn(type=Type.timestamp, additional_properties=additional_properties,
+                                   signal_values=new_signal_values), new_signal_values_id_mapping
+                new_signal_values = []
+                new_signal_values_id_mapping = []
+        yield TimeSeriesIn(type=Type.timestamp, additional_properties=additional_properties,
+                           signal_values=new_signal_values), new_signal_values_id_mapping
+
+    def split(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]],
+              chunk_count: int):
+        """
+        Split transformation into chunks of output timestamps.
+
+        Each chunk gets signal values beginning in its range and one signal value before and after it, which are
+        enough to find signal values surrounding every output timestamp of the chunk.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series to be transformed
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+            chunk_count (int): The greatest number of chunks
+
+        Returns:
+            List of (signal value ranges of each time series, transformation parameters) tuples
+        """
+        assert len(time_series) == 1, "Number of time series should equals 1 for resample transformation"
+        period = get_additional_parameter(additional_properties, "period")
+        assert period is not None, "period additional parameter is required"
+        period = int(period)
+        columns = SignalColumns.from_time_series(time_series[0])
+        if len(columns) == 0:
+            return [([(0, 0)], additional_properties)]
+        start_timestamp = get_additional_parameter(additional_properties, "start_timestamp")
+        end_timestamp = get_additional_parameter(additional_properties, "end_timestamp")
+        start_timestamp = int(start_timestamp) if start_timestamp is not None else 0
+        last_end_timestamp = max(columns.end_timestamps[-1], columns.timestamps[-1])
+        end_timestamp = int(end_timestamp) if end_timestamp is not None else last_end_timestamp + 1
+        if not self.extrapolate:
+            end_timestamp = min(end_timestamp, last_end_timestamp + 1)
+        start_timestamp = first_tick_at_or_after(columns.timestamps[0], start_timestamp, period)
+
+        chunk_ranges = split_output_range(start_timestamp, end_timestamp, period, chunk_count)
+        return split_with_neighbours(columns.timestamps, chunk_ranges, additional_properties)
+
+    def _interpolate(self, columns: SignalColumns, current_time: int, previous_index: int):
+        """
+        Compute output value at output timestamp
+
+        Args:
+            columns (SignalColumns): Signal values columns
+            current_time (int): Output timestamp
+            previous_index (int): Index of the last signal value beginning at or before output timestamp
+
+        Returns:
+            Tuple of value and list of ids of signal values used to compute it
+        """
+        raise Exception("_interpolate not implemented yet")
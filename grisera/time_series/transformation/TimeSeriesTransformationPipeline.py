@@ -0,0 +1,108 @@
+from contextlib import ExitStack
+from typing import List, Optional
+
+from grisera.time_series.ts_columns import SignalColumns
+from grisera.time_series.time_series_model import TimeSeriesOut, TimeSeriesIn, Type, TimeSeriesTransformationStepIn
+from grisera.time_series.transformation.TimeSeriesTransformationExecutor import TimeSeriesTransformationExecutor
+from grisera.time_series.transformation.TimeSeriesTransformationFactory import TimeSeriesTransformationFactory
+
+# The least number of source signal values for which steps are transformed in parallel chunks by default
+PARALLEL_MIN_SIGNAL_VALUES = 200000
+
+
+class TimeSeriesTransformationPipeline:
+    """
+    Class with logic of executing chain of time series transformations in memory
+
+    Steps are executed with TimeSeriesTransformationExecutor, which transforms large time series in parallel chunks.
+    When no executor is given, a new one is used for runs with at least parallel_min_signal_values source signal
+    values and smaller time series are transformed in the current process.
+
+    Attributes:
+        executor (Optional[TimeSeriesTransformationExecutor]): Executor of steps
+        parallel_min_signal_values (int): The least number of source signal values for a new executor
+    """
+
+    def __init__(self, executor: Optional[TimeSeriesTransformationExecutor] = None,
+                 parallel_min_signal_values: int = PARALLEL_MIN_SIGNAL_VALUES):
+        self.executor = executor
+        self.parallel_min_signal_values = parallel_min_signal_values
+
+    def run(self, time_series: List[TimeSeriesOut], steps: List[TimeSeriesTransformationStepIn]):
+        """
+        Execute transformation steps without saving intermediate time series.
+
+        Signal values of intermediate time series get temporary ids, which are replaced in id mappings of the
+        following steps with ids of signal values they were created from. So id mapping of the result refers only
+        to signal values of source time series.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Source time series
+            steps (List[TimeSeriesTransformationStepIn]): Transformations executed in order
+
+        Returns:
+            New time series object of the last step and id mapping to signal values of source time series
+        """
+        assert len(steps) > 0, "Pipeline should contain at least one step"
+        with ExitStack() as stack:
+            executor = self.executor
+            signal_value_count = sum(len(single_time_series.signal_values) for single_time_series in time_series)
+            if executor is None and signal_value_count >= self.parallel_min_signal_values:
+                executor = stack.enter_context(TimeSeriesTransformationExecutor())
+            return self._run_steps(time_series, steps, executor)
+
+    def _run_steps(self, time_series: List[TimeSeriesOut], steps: List[TimeSeriesTransformationStepIn],
+                   executor: Optional[TimeSeriesTransformationExecutor]):
+        available_time_series = list(time_series)
+        # Ids of source signal values for temporary ids of intermediate signal values
+        provenance = {}
+        new_time_series, new_signal_values_id_mapping = None, []
+        for step_index, step in enumerate(steps):
+            if step.inputs is not None:
+                inputs = step.inputs
+            elif step_index == 0:
+                inputs = list(range(len(time_series)))
+            else:
+                inputs = [len(available_time_series) - 1]
+            for input_index in inputs:
+                assert 0 <= input_index < len(available_time_series), \
+                    f"Input {input_index} of step {step_index} is not a source or output of a previous step"
+
+            additional_properties = list(step.additional_properties) if step.additional_properties is not None \
+                else None
+            step_time_series = [available_time_series[input_index] for input_index in inputs]
+            if executor is not None:
+                new_time_series, step_id_mapping = executor.transform(step.name, step_time_series,
+                                                                      additional_properties)
+            else:
+                transformation = TimeSeriesTransformationFactory().get_transformation(step.name)
+                new_time_series, step_id_mapping = transformation.transform(step_time_series, additional_properties)
+            new_signal_values_id_mapping = [self._compose_ids(ids, provenance) for ids in step_id_mapping]
+
+            if step_index < len(steps) - 1:
+                temporary_ids = [f"pipeline.{step_index}.{index}" for index in range(len(step_id_mapping))]
+                provenance.update(zip(temporary_ids, new_signal_values_id_mapping))
+                available_time_series.append(self._to_time_series_out(new_time_series, temporary_ids))
+
+        return new_time_series, new_signal_values_id_mapping
+
+    @staticmethod
+    def _compose_ids(ids: list, provenance: dict):
+        # Dictionary keeps order of ids and removes duplicates
+        composed_ids = {}
+        for signal_value_id in ids:
+            for source_id in provenance.get(signal_value_id, [signal_value_id]):
+                composed_ids[source_id] = None
+        return list(composed_ids)
+
+    @staticmethod
+    def _to_time_series_out(time_series: TimeSeriesIn, ids: List[str]):
+        if time_series.type == Type.epoch:
+            timestamps = [signal.start_timestamp for signal in time_series.signal_values]
+            end_timestamps = [signal.end_timestamp for signal in time_series.signal_values]
+        else:
+            timestamps = end_timestamps = [signal.timestamp for signal in time_series.signal_values]
+        values = [signal.signal_value.value for signal in time_series.signal_values]
+        columns = SignalColumns(time_series.type, timestamps, end_timestamps, values, ids)
+        return TimeSeriesOut(type=time_series.type, additional_properties=time_series.additional_properties,
+                             signal_values=columns.to_signal_values())
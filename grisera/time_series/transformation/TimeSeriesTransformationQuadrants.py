@@ -1,12 +1,16 @@
+from bisect import bisect_left, bisect_right
 from typing import List, Optional
 
 from grisera.property.property_model import PropertyIn
 from grisera.time_series.ts_helpers import get_node_property, get_additional_parameter
 from grisera.time_series.time_series_model import TimeSeriesOut, TimeSeriesIn, SignalIn, Type, TransformationType, \
-    SignalValueNodesIn
+    SignalValueNodesIn, TimeSeriesTransformationState
 from grisera.time_series.transformation.TimeSeriesTransformation import TimeSeriesTransformation
+from grisera.time_series.ts_columns import get_timestamp_labels
+from grisera.time_series.transformation.TimeSeriesTransformationRegistry import register_transformation
 
 
+@register_transformation(TransformationType.QUADRANTS, input_count=2, incremental=True, chunkable=True)
 class TimeSeriesTransformationQuadrants(TimeSeriesTransformation):
     """
     Class with logic of time series quadrants transformation
@@ -38,32 +42,136 @@ class TimeSeriesTransformationQuadrants(TimeSeriesTransformation):
             additional_properties = []
         additional_properties.append(PropertyIn(key="transformation_name", value=TransformationType.QUADRANTS))
 
+        timestamp_label = "timestamp" if time_series[0].type == Type.timestamp else "start_timestamp"
+        new_signal_values, new_signal_values_id_mapping, _ = self._match_signal_values(
+            time_series[0].signal_values, time_series[1].signal_values, origin_x, origin_y, timestamp_label)
+
+        return TimeSeriesIn(type=time_series[0].type,
+                            additional_properties=additional_properties,
+                            signal_values=new_signal_values
+                            ), new_signal_values_id_mapping
+
+    def transform_incremental(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]],
+                              state: Optional[TimeSeriesTransformationState], final: bool = False):
+        """
+        Transform signal values appended to time series since the previous call.
+
+        X signal value is transformed when any Y signal value has greater or equal timestamp, because until then
+        the matching Y signal value may be appended later. State keeps X signal values waiting for Y signal values
+        and Y signal values which can still be matched. The final call transforms all waiting X signal values.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series with appended signal values only
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+            state (Optional[TimeSeriesTransformationState]): State returned by the previous call
+            final (bool): Transform all waiting signal values
+
+        Returns:
+            New time series object with appended signal values, id mapping and new state
+        """
+        assert len(time_series) == 2, "Number of time series should equals 2 for quadrants transformation"
+        assert time_series[0].type == time_series[1].type, "Time series types should be equal"
+        origin_x = get_additional_parameter(additional_properties, "origin_x")
+        origin_y = get_additional_parameter(additional_properties, "origin_y")
+        origin_x = int(origin_x) if origin_x is not None else 0
+        origin_y = int(origin_y) if origin_y is not None else 0
+
+        if additional_properties is None:
+            additional_properties = []
+        additional_properties.append(PropertyIn(key="transformation_name", value=TransformationType.QUADRANTS))
+
+        if state is None:
+            state = TimeSeriesTransformationState(processed_counts=[0, 0], pending_signal_values=[[], []])
+        signal_values_x = list(state.pending_signal_values[0]) + list(time_series[0].signal_values)
+        signal_values_y = list(state.pending_signal_values[1]) + list(time_series[1].signal_values)
+        timestamp_label = "timestamp" if time_series[0].type == Type.timestamp else "start_timestamp"
+
+        # X signal values later than the last Y signal value wait for matching Y signal values
+        count_x = len(signal_values_x)
+        if not final:
+            last_timestamp_y = int(get_node_property(signal_values_y[-1]["timestamp"], timestamp_label)) \
+                if len(signal_values_y) > 0 else None
+            while count_x > 0 and (last_timestamp_y is None or int(
+                    get_node_property(signal_values_x[count_x - 1]["timestamp"], timestamp_label)) > last_timestamp_y):
+                count_x -= 1
+
+        new_signal_values, new_signal_values_id_mapping, signal_value_y_index = self._match_signal_values(
+            signal_values_x[:count_x], signal_values_y, origin_x, origin_y, timestamp_label)
+
+        new_state = TimeSeriesTransformationState(
+            processed_counts=[state.processed_counts[0] + len(time_series[0].signal_values),
+                              state.processed_counts[1] + len(time_series[1].signal_values)],
+            pending_signal_values=[signal_values_x[count_x:], signal_values_y[signal_value_y_index:]])
+
+        return TimeSeriesIn(type=time_series[0].type,
+                            additional_properties=additional_properties,
+                            signal_values=new_signal_values
+                            ), new_signal_values_id_mapping, new_state
+
+    def split(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]],
+              chunk_count: int):
+        """
+        Split transformation into chunks of X signal values.
+
+        Each chunk gets Y signal values with timestamps between the first and the last X signal value of the chunk.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series to be transformed
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+            chunk_count (int): The greatest number of chunks
+
+        Returns:
+            List of (signal value ranges of each time series, transformation parameters) tuples
+        """
+        assert len(time_series) == 2, "Number of time series should equals 2 for quadrants transformation"
+        timestamp_label, _ = get_timestamp_labels(time_series[0].type)
+        timestamps_x = [int(get_node_property(signal_value["timestamp"], timestamp_label))
+                        for signal_value in time_series[0].signal_values]
+        timestamps_y = [int(get_node_property(signal_value["timestamp"], timestamp_label))
+                        for signal_value in time_series[1].signal_values]
+        chunk_count = max(1, min(chunk_count, len(timestamps_x)))
+
+        chunks = []
+        for chunk in range(chunk_count):
+            first_index_x = len(timestamps_x) * chunk // chunk_count
+            last_index_x = len(timestamps_x) * (chunk + 1) // chunk_count
+            if first_index_x == last_index_x:
+                first_index_y = last_index_y = 0
+            else:
+                first_index_y = bisect_left(timestamps_y, timestamps_x[first_index_x])
+                last_index_y = bisect_right(timestamps_y, timestamps_x[last_index_x - 1], first_index_y)
+            chunks.append(([(first_index_x, last_index_x), (first_index_y, last_index_y)],
+                           list(additional_properties) if additional_properties is not None else None))
+        return chunks
+
+    @staticmethod
+    def _match_signal_values(signal_values_x: List[dict], signal_values_y: List[dict], origin_x: int, origin_y: int,
+                             timestamp_label: str):
         new_signal_values = []
         new_signal_values_id_mapping = []
         current_signal_value_y_index = 0
-        timestamp_label = "timestamp" if time_series[0].type == Type.timestamp else "start_timestamp"
         # Iterate over all X signal values
-        for current_signal_value_x in time_series[0].signal_values:
+        for current_signal_value_x in signal_values_x:
             # For current X signal value find first Y signal value with greater or equal timestamp value
             # If not found, return not existing index
-            while current_signal_value_y_index < len(time_series[1].signal_values) and \
-                    int(get_node_property(time_series[1].signal_values[current_signal_value_y_index]["timestamp"],
+            while current_signal_value_y_index < len(signal_values_y) and \
+                    int(get_node_property(signal_values_y[current_signal_value_y_index]["timestamp"],
                                           timestamp_label)) < int(
                 get_node_property(current_signal_value_x["timestamp"], timestamp_label)):
                 current_signal_value_y_index += 1
             # Check if X and Y signal timestamps are the same
-            if current_signal_value_y_index < len(time_series[1].signal_values) and \
+            if current_signal_value_y_index < len(signal_values_y) and \
                     get_node_property(current_signal_value_x["timestamp"], "timestamp") == get_node_property(
-                time_series[1].signal_values[current_signal_value_y_index]["timestamp"], "timestamp") and \
+                signal_values_y[current_signal_value_y_index]["timestamp"], "timestamp") and \
                     get_node_property(current_signal_value_x["timestamp"], "start_timestamp") == get_node_property(
-                time_series[1].signal_values[current_signal_value_y_index]["timestamp"], "start_timestamp") and \
+                signal_values_y[current_signal_value_y_index]["timestamp"], "start_timestamp") and \
                     get_node_property(current_signal_value_x["timestamp"], "end_timestamp") == get_node_property(
-                time_series[1].signal_values[current_signal_value_y_index]["timestamp"], "end_timestamp"):
+                signal_values_y[current_signal_value_y_index]["timestamp"], "end_timestamp"):
                 # Determine quadrant comparing X and Y signal values with origin point
                 x_positive = 1 if int(
                     get_node_property(current_signal_value_x["signal_value"], "value")) >= origin_x else 0
                 y_positive = 1 if int(
-                    get_node_property(time_series[1].signal_values[current_signal_value_y_index]["signal_value"],
+                    get_node_property(signal_values_y[current_signal_value_y_index]["signal_value"],
                                       "value")) >= origin_y else 0
                 quadrant = 1 + [(1, 1), (0, 1), (0, 0), (1, 0)].index((x_positive, y_positive))
                 new_signal_values.append(SignalIn(signal_value=SignalValueNodesIn(value=quadrant),
@@ -76,10 +184,6 @@ class TimeSeriesTransformationQuadrants(TimeSeriesTransformation):
                                                   ))
                 new_signal_values_id_mapping.append([
                     current_signal_value_x["signal_value"]["id"],
-                    time_series[1].signal_values[current_signal_value_y_index]["signal_value"]["id"]
+                    signal_values_y[current_signal_value_y_index]["signal_value"]["id"]
                 ])
-
-        return TimeSeriesIn(type=time_series[0].type,
-                            additional_properties=additional_properties,
-                            signal_values=new_signal_values
-                            ), new_signal_values_id_mapping
+        return new_signal_values, new_signal_values_id_mapping, current_signal_value_y_index
@@ -0,0 +1,234 @@
+import inspect
+import threading
+from importlib import metadata
+from typing import Callable, Dict, Optional, Union
+
+from pydantic import BaseModel
+
+from grisera.time_series.transformation.TimeSeriesTransformation import TimeSeriesTransformation
+
+ENTRY_POINT_GROUP = "grisera.transformations"
+
+
+class TransformationCapabilities(BaseModel):
+    """
+    Capabilities declared by registered transformation, used by executors to choose the fastest path
+
+    Attributes:
+        input_count (Optional[int]): Required number of input time series, any number if None
+        vectorized (bool): Transformation works on columns of signal values instead of single signal value nodes
+        streaming (bool): Transformation implements transform_chunks yielding output in chunks
+        incremental (bool): Transformation implements transform_incremental for appended signal values
+        parallel_safe (bool): The shared instance can transform different time series concurrently, otherwise new
+            instance is created for every transformation
+        chunkable (bool): Transformation implements split, so one transformation can be executed in parallel
+    """
+
+    input_count: Optional[int] = 1
+    vectorized: bool = False
+    streaming: bool = False
+    incremental: bool = False
+    parallel_safe: bool = True
+    chunkable: bool = False
+
+
+class TimeSeriesTransformationRegistry:
+    """
+    Registry of time series transformations available by name
+
+    Transformations are registered with register_transformation decorator or discovered from installed packages
+    exposing `grisera.transformations` entry points. An entry point may refer to a module registering its
+    transformations on import, a TimeSeriesTransformation subclass registered under the entry point name or a
+    function called with the registry. Each parallel safe transformation is instantiated once and reused, other
+    transformations are instantiated for every use.
+
+    Entry points failing to load are skipped, so one broken package does not hide other transformations, and
+    their errors are kept in entry_point_errors.
+
+    Attributes:
+        entry_point_group (str): Group of entry points with transformations
+        entry_point_errors (Dict[str, str]): Errors of entry points which failed to load by entry point name
+    """
+
+    def __init__(self, entry_point_group: str = ENTRY_POINT_GROUP):
+        self.entry_point_group = entry_point_group
+        self._factories: Dict[str, Callable[[], TimeSeriesTransformation]] = {}
+        self._capabilities: Dict[str, TransformationCapabilities] = {}
+        self._instances: Dict[str, TimeSeriesTransformation] = {}
+        self.entry_point_errors: Dict[str, str] = {}
+        self._entry_points_loaded = False
+        self._lock = threading.RLock()
+
+    def register(self, name: str, factory: Callable[[], TimeSeriesTransformation],
+                 capabilities: Optional[TransformationCapabilities] = None):
+        """
+        Register transformation under given name, replacing previous registration
+
+        Args:
+            name (str): Name of transformation used in requests
+            factory (Callable[[], TimeSeriesTransformation]): Transformation class or function creating instance
+            capabilities (Optional[TransformationCapabilities]): Declared capabilities, defaults if not given
+        """
+        name = str(getattr(name, "value", name))
+        with self._lock:
+            self._factories[name] = factory
+            self._capabilities[name] = capabilities if capabilities is not None else TransformationCapabilities()
+            self._instances.pop(name, None)
+
+    def is_registered(self, name: str):
+        """
+        Check if transformation is registered, discovering entry points if needed
+
+        Args:
+            name (str): Name of transformation
+
+        Returns:
+            True if transformation with given name exists
+        """
+        name = str(getattr(name, "value", name))
+        if name not in self._factories:
+            self.load_entry_points()
+        return name in self._factories
+
+    def get_transformation(self, name: str) -> TimeSeriesTransformation:
+        """
+        Get shared instance of transformation, or new instance if transformation is not parallel safe
+
+        Args:
+            name (str): Name of transformation
+
+        Returns:
+            Time series transformation instance
+        """
+        name = str(getattr(name, "value", name))
+        if not self.is_registered(name):
+            raise Exception(self.get_unknown_message(name))
+        with self._lock:
+            if not self._capabilities[name].parallel_safe:
+                return self._factories[name]()
+            if name not in self._instances:
+                self._instances[name] = self._factories[name]()
+            return self._instances[name]
+
+    def get_capabilities(self, name: str) -> TransformationCapabilities:
+        """
+        Get capabilities declared by transformation
+
+        Args:
+            name (str): Name of transformation
+
+        Returns:
+            Transformation capabilities
+        """
+        name = str(getattr(name, "value", name))
+        if not self.is_registered(name):
+            raise Exception(self.get_unknown_message(name))
+        return self._capabilities[name]
+
+    def check_input_count(self, name: str, input_count: int):
+        """
+        Check if transformation accepts given number of input time series
+
+        Args:
+            name (str): Name of transformation
+            input_count (int): Number of input time series
+
+        Raises:
+            ValueError: Transformation requires different number of input time series
+        """
+        required_count = self.get_capabilities(name).input_count
+        if required_count is not None and required_count != input_count:
+            raise ValueError(f"transformation {getattr(name, 'value', name)} requires {required_count} input time "
+                             f"series, {input_count} given")
+
+    def get_unknown_message(self, name: str):
+        """
+        Get error message for transformation which is not registered
+
+        Args:
+            name (str): Name of transformation
+
+        Returns:
+            Error message, with error of entry point with the same name if it failed to load
+        """
+        name = str(getattr(name, "value", name))
+        if name in self.entry_point_errors:
+            return f"transformation {name} failed to load: {self.entry_point_errors[name]}"
+        return f"transformation {name} is unknown"
+
+    def get_names(self):
+        """
+        Get names of all registered transformations
+
+        Returns:
+            Sorted list of transformation names
+        """
+        self.load_entry_points()
+        return sorted(self._factories)
+
+    def load_entry_points(self, force: bool = False):
+        """
+        Discover transformations of installed packages, once unless forced
+
+        Args:
+            force (bool): Load entry points again
+        """
+        with self._lock:
+            if self._entry_points_loaded and not force:
+                return
+            self._entry_points_loaded = True
+            self.entry_point_errors = {}
+            for entry_point in _get_entry_points(self.entry_point_group):
+                try:
+                    loaded = entry_point.load()
+                    if inspect.isclass(loaded) and issubclass(loaded, TimeSeriesTransformation):
+                        if entry_point.name not in self._factories:
+                            self.register(entry_point.name, loaded, getattr(loaded, "capabilities", None))
+                    elif callable(loaded):
+                        loaded(self)
+                except Exception as error:
+                    self.entry_point_errors[entry_point.name] = f"{type(error).__name__}: {error}"
+
+
+def _get_entry_points(group: str):
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return entry_points.select(group=group)
+    return entry_points.get(group, [])
+
+
+transformation_registry = TimeSeriesTransformationRegistry()
+
+
+def register_transformation(name: str, input_count: Optional[int] = 1, vectorized: bool = False,
+                            streaming: bool = False, incremental: bool = False, parallel_safe: bool = True,
+                            chunkable: bool = False,
+                            factory: Union[Callable[[], TimeSeriesTransformation], None] = None,
+                            registry: TimeSeriesTransformationRegistry = transformation_registry):
+    """
+    Class decorator registering transformation with declared capabilities
+
+    Args:
+        name (str): Name of transformation used in requests
+        input_count (Optional[int]): Required number of input time series, any number if None
+        vectorized (bool): Transformation works on columns of signal values
+        streaming (bool): Transformation implements transform_chunks
+        incremental (bool): Transformation implements transform_incremental
+        parallel_safe (bool): The shared instance can transform different time series concurrently
+        chunkable (bool): Transformation implements split
+        factory (Optional[Callable[[], TimeSeriesTransformation]]): Function creating instance, the decorated
+            class if not given
+        registry (TimeSeriesTransformationRegistry): Registry to register in
+
+    Returns:
+        Decorator returning the class unchanged
+    """
+    capabilities = TransformationCapabilities(input_count=input_count, vectorized=vectorized, streaming=streaming,
+                                              incremental=incremental, parallel_safe=parallel_safe,
+                                              chunkable=chunkable)
+
+    def decorator(transformation_class):
+        registry.register(name, factory if factory is not None else transformation_class, capabilities)
+        return transformation_class
+
+    return decorator
@@ -3,10 +3,17 @@ from typing import List, Optional
 from grisera.property.property_model import PropertyIn
 from grisera.time_series.ts_helpers import get_node_property, get_additional_parameter
 from grisera.time_series.time_series_model import TimeSeriesOut, TimeSeriesIn, Type, SignalIn, TransformationType, \
-    SignalValueNodesIn
+    SignalValueNodesIn, TimeSeriesTransformationState
 from grisera.time_series.transformation.TimeSeriesTransformation import TimeSeriesTransformation
+from grisera.time_series.transformation.TimeSeriesTransformationRegistry import register_transformation
+from grisera.time_series.ts_alignment import align_ticks
+from grisera.time_series.ts_chunks import split_output_range, split_with_neighbours
+from grisera.time_series.ts_columns import SignalColumns
+from grisera.time_series.ts_pyramid import TimeSeriesPyramid
 
 
+@register_transformation(TransformationType.RESAMPLE_NEAREST, vectorized=True, incremental=True,
+                         chunkable=True)
 class TimeSeriesTransformationResample(TimeSeriesTransformation):
     """
     Class with logic of time series resampling transformation
@@ -31,7 +38,6 @@ class TimeSeriesTransformationResample(TimeSeriesTransformation):
         period = get_additional_parameter(additional_properties, "period")
         assert period is not None, "period additional parameter is required"
         period = int(period)
-        begin_timestamp_label = "timestamp" if time_series[0].type == Type.timestamp else "start_timestamp"
         end_timestamp_label = "timestamp" if time_series[0].type == Type.timestamp else "end_timestamp"
         start_timestamp = get_additional_parameter(additional_properties, "start_timestamp")
         end_timestamp = get_additional_parameter(additional_properties, "end_timestamp")
@@ -46,38 +52,183 @@ class TimeSeriesTransformationResample(TimeSeriesTransformation):
 
         new_signal_values = []
         new_signal_values_id_mapping = []
-        current_time = start_timestamp
-        current_signal_value_index = 0
-        if len(time_series[0].signal_values) > 0:
-            while current_time < end_timestamp:
-                # For current timestamp find first signal value with greater or equal begin timestamp value
-                # If not found, return last signal value
-                while current_signal_value_index + 1 < len(time_series[0].signal_values) and \
-                        int(get_node_property(time_series[0].signal_values[current_signal_value_index]["timestamp"],
-                                              begin_timestamp_label)) < current_time:
-                    current_signal_value_index += 1
-                new_signal_value_index = current_signal_value_index
-                if current_signal_value_index > 0:
-                    # Get timestamps of found signal value (mostly greater or equal current_time)
-                    # and preceding signal value (less than current_time)
-                    after_signal_value_timestamp = int(
-                        get_node_property(time_series[0].signal_values[current_signal_value_index]["timestamp"],
-                                          begin_timestamp_label))
-                    before_signal_value_timestamp = int(
-                        get_node_property(time_series[0].signal_values[current_signal_value_index - 1]["timestamp"],
-                                          end_timestamp_label))
-                    # Determine which of two signal values is nearer
-                    if abs(current_time - before_signal_value_timestamp) <= abs(
-                            after_signal_value_timestamp - current_time):
-                        new_signal_value_index = current_signal_value_index - 1
-                new_signal_values.append(SignalIn(signal_value=SignalValueNodesIn(value=int(
-                    get_node_property(time_series[0].signal_values[new_signal_value_index]["signal_value"], "value"))),
-                    timestamp=current_time))
-                new_signal_values_id_mapping.append(
-                    [time_series[0].signal_values[new_signal_value_index]["signal_value"]["id"]])
-                current_time += period
+        columns = SignalColumns.from_time_series(time_series[0])
+        if len(columns) > 0:
+            last_index = len(columns) - 1
+            # For every timestamp find first signal value with greater or equal begin timestamp value
+            # If not found, take last signal value
+            for current_time, signal_value_index in align_ticks(columns.timestamps, start_timestamp, end_timestamp,
+                                                                period):
+                new_signal_value_index = min(signal_value_index, last_index)
+                # Determine which of found signal value (mostly greater or equal current_time) and preceding signal
+                # value (less than current_time) is nearer
+                if new_signal_value_index > 0 and abs(
+                        current_time - columns.end_timestamps[new_signal_value_index - 1]) <= abs(
+                        columns.timestamps[new_signal_value_index] - current_time):
+                    new_signal_value_index -= 1
+                new_signal_values.append(SignalIn(signal_value=SignalValueNodesIn(
+                    value=int(columns.values[new_signal_value_index])), timestamp=current_time))
+                new_signal_values_id_mapping.append([columns.ids[new_signal_value_index]])
 
         return TimeSeriesIn(type=Type.timestamp,
                             additional_properties=additional_properties,
                             signal_values=new_signal_values
                             ), new_signal_values_id_mapping
+
+    def transform_with_pyramid(self, time_series: List[TimeSeriesOut], pyramid: TimeSeriesPyramid,
+                               additional_properties: Optional[List[PropertyIn]]):
+        """
+        Transform time series data using its summary pyramid.
+
+        When output timestamps lie on bucket boundaries of any pyramid level (period and start_timestamp are
+        multiples of its bucket width), the nearest signal values are found in the pyramid in O(number of output
+        timestamps) time. Otherwise raw signal values are transformed. Results are the same in both cases.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series to be transformed
+            pyramid (TimeSeriesPyramid): Summary pyramid of the transformed time series
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+
+        Returns:
+            New time series object
+        """
+        assert len(time_series) == 1, "Number of time series should equals 1 for resample transformation"
+        period = get_additional_parameter(additional_properties, "period")
+        assert period is not None, "period additional parameter is required"
+        period = int(period)
+        start_timestamp = get_additional_parameter(additional_properties, "start_timestamp")
+        end_timestamp = get_additional_parameter(additional_properties, "end_timestamp")
+        start_timestamp = int(start_timestamp) if start_timestamp is not None else 0
+        if end_timestamp is not None:
+            end_timestamp = int(end_timestamp)
+        elif pyramid.sample_count > 0:
+            end_timestamp = period + pyramid.last_end_timestamp
+        else:
+            end_timestamp = start_timestamp
+
+        nearest_signal_values = pyramid.resample_nearest(start_timestamp, end_timestamp, period)
+        if nearest_signal_values is None:
+            return self.transform(time_series, additional_properties)
+
+        if additional_properties is None:
+            additional_properties = []
+        additional_properties.append(PropertyIn(key="transformation_name", value=TransformationType.RESAMPLE_NEAREST))
+
+        new_signal_values = [SignalIn(signal_value=SignalValueNodesIn(value=int(value)), timestamp=timestamp)
+                             for timestamp, value, _ in nearest_signal_values]
+        new_signal_values_id_mapping = [[signal_value_id] for _, _, signal_value_id in nearest_signal_values]
+
+        return TimeSeriesIn(type=Type.timestamp,
+                            additional_properties=additional_properties,
+                            signal_values=new_signal_values
+                            ), new_signal_values_id_mapping
+
+    def transform_incremental(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]],
+                              state: Optional[TimeSeriesTransformationState], final: bool = False):
+        """
+        Transform signal values appended to time series since the previous call.
+
+        Output timestamp is transformed when any signal value begins at or after it, because until then a future
+        signal value could be nearer. State keeps the next output timestamp and the last two signal values.
+        The final call transforms remaining output timestamps until end_timestamp.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series with appended signal values only
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+            state (Optional[TimeSeriesTransformationState]): State returned by the previous call
+            final (bool): Transform remaining output timestamps
+
+        Returns:
+            New time series object with appended signal values, id mapping and new state
+        """
+        assert len(time_series) == 1, "Number of time series should equals 1 for resample transformation"
+        period = get_additional_parameter(additional_properties, "period")
+        assert period is not None, "period additional parameter is required"
+        period = int(period)
+        begin_timestamp_label = "timestamp" if time_series[0].type == Type.timestamp else "start_timestamp"
+        end_timestamp_label = "timestamp" if time_series[0].type == Type.timestamp else "end_timestamp"
+        start_timestamp = get_additional_parameter(additional_properties, "start_timestamp")
+        end_timestamp = get_additional_parameter(additional_properties, "end_timestamp")
+        start_timestamp = int(start_timestamp) if start_timestamp is not None else 0
+        end_timestamp = int(end_timestamp) if end_timestamp is not None else None
+
+        if state is None:
+            state = TimeSeriesTransformationState(processed_counts=[0], next_timestamp=start_timestamp,
+                                                  pending_signal_values=[[]])
+        signal_values = list(state.pending_signal_values[0]) + list(time_series[0].signal_values)
+        if final and end_timestamp is None and len(signal_values) > 0:
+            end_timestamp = period + int(get_node_property(signal_values[-1]["timestamp"], end_timestamp_label))
+
+        if additional_properties is None:
+            additional_properties = []
+        additional_properties.append(PropertyIn(key="transformation_name", value=TransformationType.RESAMPLE_NEAREST))
+
+        new_signal_values = []
+        new_signal_values_id_mapping = []
+        current_time = state.next_timestamp
+        current_signal_value_index = 0
+        while len(signal_values) > 0 and (end_timestamp is None or current_time < end_timestamp):
+            # For current timestamp find first signal value with greater or equal begin timestamp value
+            while current_signal_value_index + 1 < len(signal_values) and \
+                    int(get_node_property(signal_values[current_signal_value_index]["timestamp"],
+                                          begin_timestamp_label)) < current_time:
+                current_signal_value_index += 1
+            if not final and int(get_node_property(signal_values[current_signal_value_index]["timestamp"],
+                                                   begin_timestamp_label)) < current_time:
+                # Nearest signal value may be appended later
+                break
+            new_signal_value_index = current_signal_value_index
+            if current_signal_value_index > 0:
+                after_signal_value_timestamp = int(
+                    get_node_property(signal_values[current_signal_value_index]["timestamp"], begin_timestamp_label))
+                before_signal_value_timestamp = int(
+                    get_node_property(signal_values[current_signal_value_index - 1]["timestamp"], end_timestamp_label))
+                if abs(current_time - before_signal_value_timestamp) <= abs(
+                        after_signal_value_timestamp - current_time):
+                    new_signal_value_index = current_signal_value_index - 1
+            new_signal_values.append(SignalIn(signal_value=SignalValueNodesIn(value=int(
+                get_node_property(signal_values[new_signal_value_index]["signal_value"], "value"))),
+                timestamp=current_time))
+            new_signal_values_id_mapping.append([signal_values[new_signal_value_index]["signal_value"]["id"]])
+            current_time += period
+
+        new_state = TimeSeriesTransformationState(
+            processed_counts=[state.processed_counts[0] + len(time_series[0].signal_values)],
+            next_timestamp=current_time,
+            pending_signal_values=[signal_values[-2:]])
+
+        return TimeSeriesIn(type=Type.timestamp,
+                            additional_properties=additional_properties,
+                            signal_values=new_signal_values
+                            ), new_signal_values_id_mapping, new_state
+
+    def split(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]],
+              chunk_count: int):
+        """
+        Split transformation into chunks of output timestamps.
+
+        Each chunk gets signal values beginning in its range and one signal value before and after it, which are
+        enough to find the nearest signal value of every output timestamp of the chunk.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series to be transformed
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+            chunk_count (int): The greatest number of chunks
+
+        Returns:
+            List of (signal value ranges of each time series, transformation parameters) tuples
+        """
+        assert len(time_series) == 1, "Number of time series should equals 1 for resample transformation"
+        period = get_additional_parameter(additional_properties, "period")
+        assert period is not None, "period additional parameter is required"
+        period = int(period)
+        columns = SignalColumns.from_time_series(time_series[0])
+        if len(columns) == 0:
+            return [([(0, 0)], additional_properties)]
+        start_timestamp = get_additional_parameter(additional_properties, "start_timestamp")
+        end_timestamp = get_additional_parameter(additional_properties, "end_timestamp")
+        start_timestamp = int(start_timestamp) if start_timestamp is not None else 0
+        end_timestamp = int(end_timestamp) if end_timestamp is not None else period + columns.end_timestamps[-1]
+
+        chunk_ranges = split_output_range(start_timestamp, end_timestamp, period, chunk_count)
+        return split_with_neighbours(columns.timestamps, chunk_ranges, additional_properties)
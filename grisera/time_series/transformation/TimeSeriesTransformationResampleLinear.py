@@ -0,0 +1,31 @@
+from grisera.time_series.ts_columns import SignalColumns
+from grisera.time_series.time_series_model import TransformationType
+from grisera.time_series.transformation.TimeSeriesTransformationInterpolation import \
+    TimeSeriesTransformationInterpolation
+from grisera.time_series.transformation.TimeSeriesTransformationRegistry import register_transformation
+
+
+@register_transformation(TransformationType.RESAMPLE_LINEAR, vectorized=True, streaming=True,
+                         chunkable=True)
+class TimeSeriesTransformationResampleLinear(TimeSeriesTransformationInterpolation):
+    """
+    Class with logic of time series linear interpolation resampling transformation
+
+    Output value is the value of signal value at output timestamp (equal timestamp or Epoch containing it) or the
+    linear interpolation between end of preceding and begin of following signal value. Output timestamps after
+    the last signal value are skipped.
+    """
+
+    transformation_name = TransformationType.RESAMPLE_LINEAR
+    extrapolate = False
+
+    def _interpolate(self, columns: SignalColumns, current_time: int, previous_index: int):
+        previous_end_timestamp = columns.end_timestamps[previous_index]
+        if current_time <= previous_end_timestamp:
+            return float(columns.values[previous_index]), [columns.ids[previous_index]]
+        next_index = previous_index + 1
+        previous_value = float(columns.values[previous_index])
+        next_value = float(columns.values[next_index])
+        fraction = (current_time - previous_end_timestamp) / (columns.timestamps[next_index] - previous_end_timestamp)
+        return previous_value + (next_value - previous_value) * fraction, \
+            [columns.ids[previous_index], columns.ids[next_index]]
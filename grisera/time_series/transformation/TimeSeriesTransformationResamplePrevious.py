@@ -0,0 +1,22 @@
+from grisera.time_series.ts_columns import SignalColumns
+from grisera.time_series.time_series_model import TransformationType
+from grisera.time_series.transformation.TimeSeriesTransformationInterpolation import \
+    TimeSeriesTransformationInterpolation
+from grisera.time_series.transformation.TimeSeriesTransformationRegistry import register_transformation
+
+
+@register_transformation(TransformationType.RESAMPLE_PREVIOUS, vectorized=True, streaming=True,
+                         chunkable=True)
+class TimeSeriesTransformationResamplePrevious(TimeSeriesTransformationInterpolation):
+    """
+    Class with logic of time series zero-order hold resampling transformation
+
+    Output value is the value of the last signal value beginning at or before output timestamp (as-of join).
+    Values are not converted, so non-numeric signals can be resampled. The last value is held until end_timestamp.
+    """
+
+    transformation_name = TransformationType.RESAMPLE_PREVIOUS
+    extrapolate = True
+
+    def _interpolate(self, columns: SignalColumns, current_time: int, previous_index: int):
+        return columns.values[previous_index], [columns.ids[previous_index]]
@@ -0,0 +1,184 @@
+import math
+from bisect import bisect_left
+from collections import deque
+from functools import partial
+from typing import List, Optional
+
+from grisera.property.property_model import PropertyIn
+from grisera.time_series.ts_alignment import first_tick_at_or_after
+from grisera.time_series.ts_chunks import split_output_range, replace_additional_parameters
+from grisera.time_series.ts_columns import SignalColumns
+from grisera.time_series.ts_helpers import get_additional_parameter
+from grisera.time_series.time_series_model import TimeSeriesOut, TimeSeriesIn, Type, SignalIn, TransformationType, \
+    SignalValueNodesIn
+from grisera.time_series.transformation.TimeSeriesTransformation import TimeSeriesTransformation
+from grisera.time_series.transformation.TimeSeriesTransformationRegistry import transformation_registry, \
+    TransformationCapabilities
+
+WINDOW_TRANSFORMATIONS = (TransformationType.WINDOW_MEAN, TransformationType.WINDOW_MIN,
+                          TransformationType.WINDOW_MAX, TransformationType.WINDOW_STD,
+                          TransformationType.WINDOW_COUNT)
+
+
+class TimeSeriesTransformationWindow(TimeSeriesTransformation):
+    """
+    Class with logic of time series window aggregation transformations
+
+    Attributes:
+        aggregation (TransformationType): Aggregation computed for each window, one of WINDOW_TRANSFORMATIONS
+    """
+
+    def __init__(self, aggregation: TransformationType = TransformationType.WINDOW_MEAN):
+        assert aggregation in WINDOW_TRANSFORMATIONS, f"{aggregation} is not a window transformation"
+        self.aggregation = aggregation
+
+    def transform(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]]):
+        """
+        Transform time series data.
+
+        Get aggregate of signal values in tumbling or sliding windows. Window with given size starts every step
+        milliseconds beginning at start_timestamp. Signal value belongs to window when its begin timestamp is
+        greater or equal to the window start and less than the window end. Windows without signal values are
+        omitted. Output is an Epoch time series with one signal value per window, mapped to ids of all aggregated
+        signal values. When step is less than window, consecutive windows overlap, so unlike time series created
+        by clients, signal values of the output are not disjoint.
+
+        Extremes come from monotonic deques. Mean and standard deviation are computed in two passes over values of
+        each window with exactly rounded sums, so the result of every window depends only on its own values and
+        does not drift with offset or length of the signal. Like the id mapping, this takes time proportional to
+        the total number of signal values in all windows, i.e. to the number of signal values for tumbling windows.
+        Standard deviation is the population standard deviation.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series to be transformed
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+
+        Returns:
+            New time series object
+        """
+        assert len(time_series) == 1, "Number of time series should equals 1 for window transformation"
+        window = get_additional_parameter(additional_properties, "window")
+        assert window is not None, "window additional parameter is required"
+        window = int(window)
+        assert window > 0, "window additional parameter should be positive"
+        step = get_additional_parameter(additional_properties, "step")
+        step = int(step) if step is not None else window
+        assert step > 0, "step additional parameter should be positive"
+        start_timestamp = get_additional_parameter(additional_properties, "start_timestamp")
+        end_timestamp = get_additional_parameter(additional_properties, "end_timestamp")
+        start_timestamp = int(start_timestamp) if start_timestamp is not None else 0
+
+        columns = SignalColumns.from_time_series(time_series[0])
+        timestamps = columns.timestamps
+        end_timestamp = int(end_timestamp) if end_timestamp is not None else (
+            timestamps[-1] + 1 if len(columns) > 0 else start_timestamp)
+
+        if additional_properties is None:
+            additional_properties = []
+        additional_properties.append(PropertyIn(key="transformation_name", value=self.aggregation))
+
+        values = columns.numeric_values() if self.aggregation != TransformationType.WINDOW_COUNT else []
+        extremes = deque()
+        if self.aggregation == TransformationType.WINDOW_MIN:
+            is_dominated = lambda previous, current: previous >= current
+        else:
+            is_dominated = lambda previous, current: previous <= current
+
+        new_signal_values = []
+        new_signal_values_id_mapping = []
+        first_index = last_index = 0
+        window_start = start_timestamp
+        while window_start < end_timestamp and first_index < len(columns):
+            window_end = window_start + window
+            while first_index < len(columns) and timestamps[first_index] < window_start:
+                first_index += 1
+            if first_index < len(columns) and timestamps[first_index] >= window_end:
+                # Skip windows without signal values
+                skipped = (timestamps[first_index] - window_end) // step + 1
+                window_start += skipped * step
+                continue
+            last_index = max(last_index, first_index)
+            while last_index < len(columns) and timestamps[last_index] < window_end:
+                if self.aggregation in (TransformationType.WINDOW_MIN, TransformationType.WINDOW_MAX):
+                    while extremes and is_dominated(values[extremes[-1]], values[last_index]):
+                        extremes.pop()
+                    extremes.append(last_index)
+                last_index += 1
+            while extremes and extremes[0] < first_index:
+                extremes.popleft()
+
+            count = last_index - first_index
+            if count > 0:
+                new_signal_values.append(SignalIn(signal_value=SignalValueNodesIn(
+                    value=self._aggregate(count, first_index, last_index, values, extremes)),
+                    start_timestamp=window_start, end_timestamp=window_end))
+                new_signal_values_id_mapping.append(list(columns.ids[first_index:last_index]))
+            window_start += step
+
+        return TimeSeriesIn(type=Type.epoch,
+                            additional_properties=additional_properties,
+                            signal_values=new_signal_values
+                            ), new_signal_values_id_mapping
+
+    def split(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]],
+              chunk_count: int):
+        """
+        Split transformation into chunks of window starts.
+
+        Each chunk gets signal values of all its windows, so signal values of windows overlapping chunk boundary
+        are passed to both chunks. Every window is aggregated from its own values, so chunks give the same
+        signal values as transform.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series to be transformed
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+            chunk_count (int): The greatest number of chunks
+
+        Returns:
+            List of (signal value ranges of each time series, transformation parameters) tuples
+        """
+        assert len(time_series) == 1, "Number of time series should equals 1 for window transformation"
+        window = get_additional_parameter(additional_properties, "window")
+        assert window is not None, "window additional parameter is required"
+        window = int(window)
+        step = get_additional_parameter(additional_properties, "step")
+        step = int(step) if step is not None else window
+        columns = SignalColumns.from_time_series(time_series[0])
+        timestamps = columns.timestamps
+        if len(columns) == 0:
+            return [([(0, 0)], additional_properties)]
+        start_timestamp = get_additional_parameter(additional_properties, "start_timestamp")
+        end_timestamp = get_additional_parameter(additional_properties, "end_timestamp")
+        start_timestamp = int(start_timestamp) if start_timestamp is not None else 0
+        end_timestamp = int(end_timestamp) if end_timestamp is not None else timestamps[-1] + 1
+        # Skip windows ending before the first signal value
+        start_timestamp = first_tick_at_or_after(timestamps[0] - window + 1, start_timestamp, step)
+
+        chunks = []
+        for chunk_start, chunk_end in split_output_range(start_timestamp, end_timestamp, step, chunk_count):
+            first_index = bisect_left(timestamps, chunk_start)
+            last_index = bisect_left(timestamps, chunk_end - 1 + window, first_index)
+            chunks.append(([(first_index, last_index)],
+                           replace_additional_parameters(additional_properties, start_timestamp=chunk_start,
+                                                         end_timestamp=chunk_end)))
+        return chunks
+
+    def _aggregate(self, count, first_index, last_index, values, extremes):
+        if self.aggregation == TransformationType.WINDOW_COUNT:
+            return count
+        if self.aggregation in (TransformationType.WINDOW_MIN, TransformationType.WINDOW_MAX):
+            return values[extremes[0]]
+        window_values = values[first_index:last_index]
+        mean = math.fsum(window_values) / count
+        if self.aggregation == TransformationType.WINDOW_MEAN:
+            return mean
+        return math.sqrt(math.fsum((value - mean) ** 2 for value in window_values) / count)
+
+
+def _register_window_transformations():
+    for aggregation in WINDOW_TRANSFORMATIONS:
+        transformation_registry.register(aggregation, partial(TimeSeriesTransformationWindow, aggregation),
+                                         TransformationCapabilities(vectorized=True, chunkable=True))
+
+
+_register_window_transformations()
@@ -0,0 +1,49 @@
+from bisect import bisect_left, bisect_right
+from typing import Sequence, Iterator, Tuple
+
+
+def align_ticks(timestamps: Sequence[int], start_timestamp: int, end_timestamp: int, period: int,
+                right: bool = False) -> Iterator[Tuple[int, int]]:
+    """
+    Find position of every output timestamp among sorted signal value timestamps
+
+    Output timestamps are start_timestamp + k * period less than end_timestamp. Positions are found with binary
+    search starting from the previous position, so consecutive output timestamps in dense or sparse regions are
+    both aligned in logarithmic time of the distance between them.
+
+    Args:
+        timestamps (Sequence[int]): Sorted begin timestamps of signal values
+        start_timestamp (int): First output timestamp
+        end_timestamp (int): Output timestamps are less than end timestamp
+        period (int): Difference between output timestamps
+        right (bool): Count signal values with timestamp equal to output timestamp as preceding it
+
+    Returns:
+        Iterator of (output timestamp, index) tuples, where index is the number of signal values preceding
+        output timestamp
+    """
+    search = bisect_right if right else bisect_left
+    size = len(timestamps)
+    index = 0
+    current_time = start_timestamp
+    while current_time < end_timestamp:
+        index = search(timestamps, current_time, index, size)
+        yield current_time, index
+        current_time += period
+
+
+def first_tick_at_or_after(timestamp: int, start_timestamp: int, period: int):
+    """
+    Get the first output timestamp greater or equal to timestamp
+
+    Args:
+        timestamp (int): Lower bound
+        start_timestamp (int): First output timestamp
+        period (int): Difference between output timestamps
+
+    Returns:
+        Output timestamp
+    """
+    if timestamp <= start_timestamp:
+        return start_timestamp
+    return start_timestamp + -((start_timestamp - timestamp) // period) * period
@@ -0,0 +1,83 @@
+from bisect import bisect_left
+from typing import List, Optional
+
+from grisera.property.property_model import PropertyIn
+from grisera.time_series.time_series_model import TimeSeriesOut
+
+
+def replace_additional_parameters(additional_properties: Optional[List[PropertyIn]], **parameters):
+    """
+    Copy transformation parameters replacing or adding given ones
+
+    Args:
+        additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+        **parameters: Replaced parameters
+
+    Returns:
+        New list of transformation parameters
+    """
+    new_properties = [additional_property for additional_property in additional_properties or []
+                      if additional_property.key not in parameters]
+    new_properties.extend(PropertyIn(key=key, value=str(value)) for key, value in parameters.items())
+    return new_properties
+
+
+def slice_time_series(time_series: TimeSeriesOut, first_index: int, last_index: int):
+    """
+    Get time series with signal values from first_index to last_index (exclusive) without copying signal values
+
+    Args:
+        time_series (TimeSeriesOut): Time series
+        first_index (int): First index
+        last_index (int): Index after the last one
+
+    Returns:
+        New time series object
+    """
+    return time_series.copy(update={"signal_values": time_series.signal_values[first_index:last_index]})
+
+
+def split_output_range(start_timestamp: int, end_timestamp: int, period: int, chunk_count: int):
+    """
+    Split range of regularly spaced output timestamps into chunks with boundaries on output timestamps
+
+    Args:
+        start_timestamp (int): First output timestamp
+        end_timestamp (int): Output timestamps are less than end timestamp
+        period (int): Difference between output timestamps
+        chunk_count (int): The greatest number of chunks
+
+    Returns:
+        List of (chunk start timestamp, chunk end timestamp) tuples, each containing at least one output timestamp
+    """
+    tick_count = max(0, -((start_timestamp - end_timestamp) // period))
+    chunk_count = max(1, min(chunk_count, tick_count))
+    boundaries = [start_timestamp + (tick_count * index // chunk_count) * period for index in range(chunk_count)]
+    boundaries.append(end_timestamp)
+    return [(boundaries[index], boundaries[index + 1]) for index in range(chunk_count)
+            if boundaries[index] < boundaries[index + 1]]
+
+
+def split_with_neighbours(timestamps: List[int], chunk_ranges: list, additional_properties: Optional[List[PropertyIn]],
+                          **parameters):
+    """
+    Split time series for chunks of regularly spaced output timestamps, keeping for each chunk signal values
+    beginning in its range and one neighbouring signal value on both sides
+
+    Args:
+        timestamps (List[int]): Begin timestamps of signal values
+        chunk_ranges (list): Ranges of output timestamps from split_output_range
+        additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+        **parameters: Parameters added to parameters of every chunk
+
+    Returns:
+        List of ([(first index, index after the last)], transformation parameters) tuples
+    """
+    chunks = []
+    for chunk_start, chunk_end in chunk_ranges:
+        first_index = max(0, bisect_left(timestamps, chunk_start) - 1)
+        last_index = min(len(timestamps), bisect_left(timestamps, chunk_end) + 1)
+        chunks.append(([(first_index, last_index)],
+                       replace_additional_parameters(additional_properties, start_timestamp=chunk_start,
+                                                     end_timestamp=chunk_end, **parameters)))
+    return chunks
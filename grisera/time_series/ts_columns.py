@@ -0,0 +1,169 @@
+from collections.abc import Sequence as SequenceABC
+from typing import List, Sequence, Union
+
+from grisera.time_series.time_series_model import Type, TimeSeriesOut
+from grisera.time_series.ts_helpers import get_node_property
+
+
+def get_timestamp_labels(time_series_type: Type):
+    """
+    Get names of begin and end timestamp properties of signal values of given time series type
+
+    Args:
+        time_series_type (Type): Type of time series
+
+    Returns:
+        Tuple of begin and end timestamp property names
+    """
+    if time_series_type == Type.timestamp:
+        return "timestamp", "timestamp"
+    return "start_timestamp", "end_timestamp"
+
+
+class SignalColumns:
+    """
+    Columnar view of time series signal values
+
+    Columns are any sequences indexed in the same order as signal values, e.g. lists, arrays or memoryviews.
+    For Timestamp series begin and end timestamps are the same column.
+
+    Attributes:
+        type (Type): Type of time series
+        timestamps (Sequence[int]): Begin timestamps of signal values
+        end_timestamps (Sequence[int]): End timestamps of signal values
+        values (Sequence[Union[str, float]]): Values of signal values
+        ids (Sequence[Union[int, str]]): Ids of signal value nodes
+    """
+
+    def __init__(self, type: Type, timestamps: Sequence[int], end_timestamps: Sequence[int],
+                 values: Sequence[Union[str, float]], ids: Sequence[Union[int, str]]):
+        self.type = type
+        self.timestamps = timestamps
+        self.end_timestamps = end_timestamps
+        self.values = values
+        self.ids = ids
+
+    @classmethod
+    def from_signal_values(cls, signal_values: List[dict], time_series_type: Type):
+        """
+        Create columns from signal values in the format returned by services
+
+        Args:
+            signal_values (List[dict]): Signal values with timestamp and signal value nodes
+            time_series_type (Type): Type of time series
+
+        Returns:
+            New signal columns
+        """
+        if isinstance(signal_values, ColumnSignalValues):
+            return signal_values.columns
+        begin_label, end_label = get_timestamp_labels(time_series_type)
+        timestamps = [int(get_node_property(signal_value["timestamp"], begin_label))
+                      for signal_value in signal_values]
+        if begin_label == end_label:
+            end_timestamps = timestamps
+        else:
+            end_timestamps = [int(get_node_property(signal_value["timestamp"], end_label))
+                              for signal_value in signal_values]
+        values = [get_node_property(signal_value["signal_value"], "value") for signal_value in signal_values]
+        ids = [signal_value["signal_value"]["id"] for signal_value in signal_values]
+        return cls(time_series_type, timestamps, end_timestamps, values, ids)
+
+    @classmethod
+    def from_time_series(cls, time_series: TimeSeriesOut):
+        """
+        Create columns from signal values of time series
+
+        Args:
+            time_series (TimeSeriesOut): Time series with signal values
+
+        Returns:
+            New signal columns
+        """
+        return cls.from_signal_values(time_series.signal_values, time_series.type)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def numeric_values(self):
+        """
+        Get values converted to floats
+
+        Returns:
+            List of float values
+        """
+        return [float(value) for value in self.values]
+
+    def slice(self, start: int, stop: int):
+        """
+        Get columns of signal values with indexes from start to stop (exclusive)
+
+        Args:
+            start (int): First index
+            stop (int): Index after the last one
+
+        Returns:
+            New signal columns
+        """
+        timestamps = self.timestamps[start:stop]
+        end_timestamps = timestamps if self.end_timestamps is self.timestamps else self.end_timestamps[start:stop]
+        return SignalColumns(self.type, timestamps, end_timestamps, self.values[start:stop], self.ids[start:stop])
+
+    def to_signal_values(self):
+        """
+        Create signal values in the format returned by services
+
+        Returns:
+            List of signal values
+        """
+        return [self.get_signal_value(index) for index in range(len(self))]
+
+    def get_signal_value(self, index: int):
+        """
+        Create single signal value in the format returned by services
+
+        Args:
+            index (int): Index of signal value
+
+        Returns:
+            Signal value with timestamp and signal value nodes
+        """
+        begin_label, end_label = get_timestamp_labels(self.type)
+        if begin_label == end_label:
+            timestamp_properties = [{"key": begin_label, "value": self.timestamps[index]}]
+        else:
+            timestamp_properties = [{"key": begin_label, "value": self.timestamps[index]},
+                                    {"key": end_label, "value": self.end_timestamps[index]}]
+        return {
+            "signal_value": {"id": self.ids[index], "properties": [{"key": "value", "value": self.values[index]}]},
+            "timestamp": {"properties": timestamp_properties}
+        }
+
+
+class ColumnSignalValues(SequenceABC):
+    """
+    Read-only sequence of signal values in the format returned by services, created on access from columns
+
+    Vectorized transformations get the underlying columns back from SignalColumns.from_time_series without
+    creating signal values, so columns backed by memory maps are read without copying. Slices are views too.
+
+    Attributes:
+        columns (SignalColumns): Columns of signal values
+    """
+
+    def __init__(self, columns: SignalColumns):
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self.columns))
+            assert step == 1, "Signal values can be sliced only with step 1"
+            return ColumnSignalValues(self.columns.slice(start, max(start, stop)))
+        if index < 0:
+            index += len(self.columns)
+        if not 0 <= index < len(self.columns):
+            raise IndexError("signal value index out of range")
+        return self.columns.get_signal_value(index)
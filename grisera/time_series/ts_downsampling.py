@@ -0,0 +1,194 @@
+import math
+from bisect import bisect_left
+from typing import Optional, List
+
+from grisera.time_series.time_series_model import DownsamplingMethod, Type
+from grisera.time_series.ts_columns import SignalColumns
+
+
+def select_time_range(columns: SignalColumns, start_timestamp: Optional[int] = None,
+                      end_timestamp: Optional[int] = None):
+    """
+    Find range of signal values in time window using binary search
+
+    Timestamp signal values are selected when start_timestamp <= timestamp < end_timestamp. Epoch signal values
+    are selected when they overlap the window. Signal values should be sorted by timestamps.
+
+    Args:
+        columns (SignalColumns): Signal values columns
+        start_timestamp (Optional[int]): Beginning of the window, unbounded if not given
+        end_timestamp (Optional[int]): End of the window (exclusive), unbounded if not given
+
+    Returns:
+        Tuple of first index and index after the last selected signal value
+    """
+    if start_timestamp is None:
+        first_index = 0
+    elif columns.end_timestamps is columns.timestamps:
+        first_index = bisect_left(columns.timestamps, start_timestamp)
+    else:
+        # Epochs ending exactly at the start of the window do not overlap it
+        first_index = bisect_left(columns.end_timestamps, start_timestamp + 1)
+    if end_timestamp is None:
+        last_index = len(columns)
+    else:
+        last_index = bisect_left(columns.timestamps, end_timestamp, first_index)
+    return first_index, max(first_index, last_index)
+
+
+def _numeric_value(value) -> Optional[float]:
+    """
+    Convert signal value to float
+
+    Args:
+        value: Signal value
+
+    Returns:
+        Float value or None when signal value is not numeric or it is NaN
+    """
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(value) else value
+
+
+def downsample_min_max(columns: SignalColumns, max_points: int, first_index: int = 0,
+                       last_index: Optional[int] = None) -> List[int]:
+    """
+    Select signal values with minimal and maximal value in equal time buckets
+
+    Range from first_index to last_index is divided into max_points // 2 buckets of equal duration. Both extremes
+    of each bucket are selected in time order, so plotted lines keep their envelope. Non-numeric values are
+    skipped, the first signal value is selected from buckets without numeric values.
+
+    Args:
+        columns (SignalColumns): Signal values columns
+        max_points (int): The greatest number of selected signal values
+        first_index (int): First index of downsampled range
+        last_index (Optional[int]): Index after the last signal value of downsampled range
+
+    Returns:
+        Sorted indexes of selected signal values
+    """
+    last_index = len(columns) if last_index is None else last_index
+    if last_index - first_index <= max_points:
+        return list(range(first_index, last_index))
+    bucket_count = max(1, max_points // 2)
+    timestamps = columns.timestamps
+    values = columns.values
+    begin = timestamps[first_index]
+    duration = timestamps[last_index - 1] - begin + 1
+
+    indexes = []
+    current_bucket = None
+    bucket_index = min_index = max_index = None
+    for index in range(first_index, last_index):
+        bucket = (timestamps[index] - begin) * bucket_count // duration
+        if bucket != current_bucket:
+            if current_bucket is not None:
+                indexes.extend(sorted({min_index, max_index}) if min_index is not None else [bucket_index])
+            current_bucket = bucket
+            bucket_index = index
+            min_index = max_index = None
+        value = _numeric_value(values[index])
+        if value is None:
+            continue
+        if min_index is None:
+            min_index = max_index = index
+            min_value = max_value = value
+        elif value < min_value:
+            min_index, min_value = index, value
+        elif value > max_value:
+            max_index, max_value = index, value
+    indexes.extend(sorted({min_index, max_index}) if min_index is not None else [bucket_index])
+    return indexes
+
+
+def downsample_lttb(columns: SignalColumns, max_points: int, first_index: int = 0,
+                    last_index: Optional[int] = None) -> List[int]:
+    """
+    Select signal values with Largest-Triangle-Three-Buckets algorithm
+
+    The first and the last signal values are always selected. From every other bucket of equal size the signal
+    value forming the largest triangle with the previously selected point and the average of the next bucket is
+    selected. Non-numeric values are skipped, signal values are selected with even stride when none is numeric.
+
+    Args:
+        columns (SignalColumns): Signal values columns
+        max_points (int): The greatest number of selected signal values
+        first_index (int): First index of downsampled range
+        last_index (Optional[int]): Index after the last signal value of downsampled range
+
+    Returns:
+        Sorted indexes of selected signal values
+    """
+    last_index = len(columns) if last_index is None else last_index
+    size = last_index - first_index
+    if size <= max_points or max_points < 3:
+        return list(range(first_index, last_index)) if size <= max_points else [first_index, last_index - 1]
+    numeric = [(index, _numeric_value(value))
+               for index, value in enumerate(columns.values[first_index:last_index], first_index)]
+    numeric = [(index, value) for index, value in numeric if value is not None]
+    if not numeric:
+        return sorted({first_index + i * (size - 1) // (max_points - 1) for i in range(max_points)})
+    if len(numeric) <= max_points:
+        return [index for index, _ in numeric]
+    timestamps = [columns.timestamps[index] for index, _ in numeric]
+    values = [value for _, value in numeric]
+    size = len(numeric)
+
+    bucket_size = (size - 2) / (max_points - 2)
+    indexes = [0]
+    selected = 0
+    for bucket in range(max_points - 2):
+        bucket_begin = int(bucket * bucket_size) + 1
+        bucket_end = int((bucket + 1) * bucket_size) + 1
+        next_begin = bucket_end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, size)
+        average_time = sum(timestamps[next_begin:next_end]) / (next_end - next_begin)
+        average_value = sum(values[next_begin:next_end]) / (next_end - next_begin)
+
+        selected_time = timestamps[selected]
+        selected_value = values[selected]
+        max_area = -1.0
+        for i in range(bucket_begin, bucket_end):
+            area = abs((selected_time - average_time) * (values[i] - selected_value)
+                       - (selected_time - timestamps[i]) * (average_value - selected_value))
+            if area > max_area:
+                max_area = area
+                candidate = i
+        selected = candidate
+        indexes.append(selected)
+    indexes.append(size - 1)
+    return [numeric[index][0] for index in indexes]
+
+
+def select_signal_values(signal_values: List[dict], time_series_type: Type, start_timestamp: Optional[int] = None,
+                         end_timestamp: Optional[int] = None, max_points: Optional[int] = None,
+                         method: DownsamplingMethod = DownsamplingMethod.min_max):
+    """
+    Select signal values in time window and downsample them to at most max_points
+
+    Args:
+        signal_values (List[dict]): Sorted signal values in the format returned by services
+        time_series_type (Type): Type of time series
+        start_timestamp (Optional[int]): Beginning of the window
+        end_timestamp (Optional[int]): End of the window (exclusive)
+        max_points (Optional[int]): The greatest number of returned signal values
+        method (DownsamplingMethod): Downsampling algorithm
+
+    Returns:
+        List of selected signal values
+    """
+    if start_timestamp is None and end_timestamp is None and (max_points is None or len(signal_values) <= max_points):
+        return signal_values
+    columns = SignalColumns.from_signal_values(signal_values, time_series_type)
+    first_index, last_index = select_time_range(columns, start_timestamp, end_timestamp)
+    if max_points is None or last_index - first_index <= max_points:
+        return signal_values[first_index:last_index]
+    if method == DownsamplingMethod.lttb:
+        indexes = downsample_lttb(columns, max_points, first_index, last_index)
+    else:
+        indexes = downsample_min_max(columns, max_points, first_index, last_index)
+    return [signal_values[index] for index in indexes]
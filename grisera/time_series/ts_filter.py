@@ -0,0 +1,234 @@
+import re
+from enum import Enum
+from typing import List, Optional, Union, Dict, Iterable, Tuple
+
+from pydantic import BaseModel, StrictInt, StrictFloat, StrictStr
+
+
+class FilterOperator(str, Enum):
+    """
+    Operators of time series filter conditions
+
+    Attributes:
+        eq (str): Property equals value
+        ne (str): Property is different from value
+        lt (str): Property is less than value
+        lte (str): Property is less than or equal to value
+        gt (str): Property is greater than value
+        gte (str): Property is greater than or equal to value
+        between (str): Property is in closed range of two values
+        in_ (str): Property equals one of values
+    """
+
+    eq = "eq"
+    ne = "ne"
+    lt = "lt"
+    lte = "lte"
+    gt = "gt"
+    gte = "gte"
+    between = "between"
+    in_ = "in"
+
+
+FilterValue = Union[StrictInt, StrictFloat, StrictStr]
+
+
+class FilterCondition(BaseModel):
+    """
+    Single condition of time series filter
+
+    Attributes:
+        entity (str): Name of entity connected to time series
+        property_name (str): Name of entity property, "id" for entity identity
+        operator (FilterOperator): Comparison operator
+        value (Union[FilterValue, List[FilterValue]]): Compared value, list of two values for between operator
+            and list of values for in operator
+        selectivity (float): Estimated fraction of time series matched by the condition
+    """
+
+    entity: str
+    property_name: str
+    operator: FilterOperator = FilterOperator.eq
+    value: Union[List[FilterValue], FilterValue]
+    selectivity: float = 1.0
+
+
+class TimeSeriesFilter(BaseModel):
+    """
+    Parsed filter of time series nodes
+
+    Attributes:
+        conditions (List[FilterCondition]): Conditions joined with AND, ordered from the most selective
+        entity_order (List[str]): Filtered entities ordered from the most selective, backends should start
+            traversal from the first one
+    """
+
+    conditions: List[FilterCondition] = []
+    entity_order: List[str] = []
+
+    def get_entity_conditions(self, entity: str):
+        """
+        Get conditions of given entity
+
+        Args:
+            entity (str): Name of entity
+
+        Returns:
+            List of conditions of entity
+        """
+        return [condition for condition in self.conditions if condition.entity == entity]
+
+
+# Supported entity names with relative number of time series connected to a single node of entity.
+# Entities connected to fewer time series are more selective when filtered by identity.
+ENTITY_FAN_OUT = {
+    "observableinformation": 1,
+    "recording": 2,
+    "participation": 4,
+    "participantstate": 4,
+    "participant": 8,
+    "activityexecution": 16,
+    "registereddata": 32,
+    "registeredchannel": 32,
+    "activity": 64,
+    "channel": 128,
+    "experiment": 256,
+}
+
+# Estimated fraction of entity nodes matched by a condition on property other than identity
+OPERATOR_SELECTIVITY = {
+    FilterOperator.eq: 0.1,
+    FilterOperator.in_: 0.1,
+    FilterOperator.between: 0.25,
+    FilterOperator.lt: 0.33,
+    FilterOperator.lte: 0.33,
+    FilterOperator.gt: 0.33,
+    FilterOperator.gte: 0.33,
+    FilterOperator.ne: 0.9,
+}
+
+# Properties of entities compared as numbers, values of other properties are compared as given strings
+NUMERIC_PROPERTIES = {
+    "participantstate": {"age"},
+}
+
+OPERATOR_SEPARATOR = "__"
+LIST_SEPARATOR = ","
+
+# Name of parameter documenting format of filter parameters, which is not a filter itself
+FILTER_FORMAT_PARAMETER = "entityname_property_name"
+
+_INTEGER_PATTERN = re.compile(r"^-?\d+$")
+_FLOAT_PATTERN = re.compile(r"^-?(\d+\.\d*|\.\d+|\d+)([eE][-+]?\d+)?$")
+
+
+def _parse_value(key: str, entity: str, property_name: str, value: str) -> FilterValue:
+    if property_name == "id" or property_name.endswith("_id"):
+        # Ids are converted like path parameters, numbers first
+        return int(value) if value.isdigit() else value
+    if property_name not in NUMERIC_PROPERTIES.get(entity, ()):
+        return value
+    if _INTEGER_PATTERN.match(value):
+        return int(value)
+    if _FLOAT_PATTERN.match(value):
+        return float(value)
+    raise ValueError(f"Filter parameter '{key}' requires numeric values")
+
+
+def _parse_condition(key: str, values: List[str]) -> FilterCondition:
+    name, _, operator_name = key.partition(OPERATOR_SEPARATOR)
+    entity, _, property_name = name.partition("_")
+    if entity not in ENTITY_FAN_OUT:
+        raise ValueError(f"Unknown entity '{entity}' in filter parameter '{key}'")
+    if property_name == "":
+        raise ValueError(f"Missing property name in filter parameter '{key}'")
+    try:
+        operator = FilterOperator(operator_name) if operator_name else FilterOperator.eq
+    except ValueError:
+        raise ValueError(f"Unknown operator '{operator_name}' in filter parameter '{key}'")
+
+    if operator in (FilterOperator.in_, FilterOperator.between):
+        value = [_parse_value(key, entity, property_name, single_value) for joined_values in values
+                 for single_value in joined_values.split(LIST_SEPARATOR)]
+        if operator == FilterOperator.between and len(value) != 2:
+            raise ValueError(f"Filter parameter '{key}' requires exactly two comma separated values")
+    elif len(values) > 1:
+        if operator != FilterOperator.eq:
+            raise ValueError(f"Filter parameter '{key}' can be given only once")
+        # Repeated equality parameter matches any of its values
+        operator = FilterOperator.in_
+        value = [_parse_value(key, entity, property_name, single_value) for single_value in values]
+    else:
+        value = _parse_value(key, entity, property_name, values[0])
+
+    return FilterCondition(entity=entity, property_name=property_name, operator=operator, value=value)
+
+
+def estimate_selectivity(condition: FilterCondition, entity_cardinalities: Optional[Dict[str, int]] = None):
+    """
+    Estimate fraction of time series matched by condition
+
+    Conditions on identity match time series of single node, estimated from entity fan-out or, when known, entity
+    cardinality (number of nodes of entity). Conditions on other properties match default fraction of entity nodes
+    depending on operator.
+
+    Args:
+        condition (FilterCondition): Filter condition
+        entity_cardinalities (Optional[Dict[str, int]]): Number of nodes of each entity
+
+    Returns:
+        Estimated selectivity between 0 and 1
+    """
+    if entity_cardinalities is not None and entity_cardinalities.get(condition.entity):
+        single_node_fraction = 1 / entity_cardinalities[condition.entity]
+    else:
+        single_node_fraction = ENTITY_FAN_OUT[condition.entity] / (2 * ENTITY_FAN_OUT["experiment"])
+    value_count = len(condition.value) if isinstance(condition.value, list) else 1
+
+    if condition.property_name == "id" and condition.operator in (FilterOperator.eq, FilterOperator.in_):
+        return min(1.0, single_node_fraction * value_count)
+    selectivity = OPERATOR_SELECTIVITY[condition.operator]
+    if condition.operator == FilterOperator.in_:
+        selectivity *= value_count
+    return min(1.0, selectivity)
+
+
+def parse_time_series_filter(params: Iterable[Tuple[str, str]],
+                             entity_cardinalities: Optional[Dict[str, int]] = None) -> TimeSeriesFilter:
+    """
+    Parse generic time series filter parameters
+
+    Parameter format is `entityname_property_name` with optional operator suffix `__operator`, for example
+    `participant_sex=male`, `participant_date_of_birth__gte=1990-01-01`, `recording_id__in=1,2,3` or
+    `participantstate_age__between=20,30`. Repeated equality parameters match any of the given values.
+    Identities and properties in NUMERIC_PROPERTIES are compared as numbers, other values as strings, so e.g.
+    `recording_source=007` keeps leading zeros. The `entityname_property_name` parameter, which only documents the
+    format, is ignored.
+
+    Args:
+        params (Iterable[Tuple[str, str]]): Filter parameters as key, value pairs, e.g. QueryParams.multi_items()
+        entity_cardinalities (Optional[Dict[str, int]]): Number of nodes of each entity used to order conditions
+
+    Returns:
+        Filter with conditions ordered from the most selective
+
+    Raises:
+        ValueError: When any parameter is invalid
+    """
+    grouped_values: Dict[str, List[str]] = {}
+    for key, value in params:
+        if key == FILTER_FORMAT_PARAMETER:
+            continue
+        grouped_values.setdefault(key, []).append(value)
+
+    conditions = [_parse_condition(key, values) for key, values in grouped_values.items()]
+    for condition in conditions:
+        condition.selectivity = estimate_selectivity(condition, entity_cardinalities)
+    conditions.sort(key=lambda condition: (condition.selectivity, ENTITY_FAN_OUT[condition.entity]))
+
+    entity_order = []
+    for condition in conditions:
+        if condition.entity not in entity_order:
+            entity_order.append(condition.entity)
+
+    return TimeSeriesFilter(conditions=conditions, entity_order=entity_order)
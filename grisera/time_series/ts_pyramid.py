@@ -0,0 +1,364 @@
+import statistics
+from typing import Optional, List
+
+from grisera.time_series.time_series_model import Type
+from grisera.time_series.ts_columns import SignalColumns, get_timestamp_labels
+
+# Median number of signal values in bucket of the finest level by default, so the pyramid is smaller than raw data
+DEFAULT_BASE_SAMPLES = 16
+
+# Columns of every pyramid level, each column has one value per bucket
+LEVEL_COLUMNS = ["count", "sum", "min_value", "min_id", "min_timestamp", "min_end_timestamp",
+                 "max_value", "max_id", "max_timestamp", "max_end_timestamp",
+                 "first_value", "first_id", "first_timestamp", "last_value", "last_id", "last_end_timestamp"]
+
+
+class PyramidLevel:
+    """
+    Summary of signal values in buckets of equal duration
+
+    Bucket i contains signal values with begin timestamp in [origin + i * bucket_width, origin + (i + 1) *
+    bucket_width). Empty buckets have count 0 and None in other columns.
+
+    Attributes:
+        bucket_width (int): Duration of bucket in milliseconds
+        columns (dict): Lists of bucket values by column name from LEVEL_COLUMNS
+    """
+
+    def __init__(self, bucket_width: int, columns: dict):
+        self.bucket_width = bucket_width
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns["count"])
+
+    @classmethod
+    def from_columns(cls, signal_columns: SignalColumns, origin: int, bucket_width: int):
+        bucket_count = (signal_columns.timestamps[-1] - origin) // bucket_width + 1
+        columns = {name: [0 if name in ("count", "sum") else None] * bucket_count for name in LEVEL_COLUMNS}
+        count, total = columns["count"], columns["sum"]
+        min_value, max_value = columns["min_value"], columns["max_value"]
+        for index in range(len(signal_columns)):
+            bucket = (signal_columns.timestamps[index] - origin) // bucket_width
+            value = float(signal_columns.values[index])
+            if count[bucket] == 0:
+                columns["first_value"][bucket] = signal_columns.values[index]
+                columns["first_id"][bucket] = signal_columns.ids[index]
+                columns["first_timestamp"][bucket] = signal_columns.timestamps[index]
+            if count[bucket] == 0 or value < min_value[bucket]:
+                min_value[bucket] = value
+                columns["min_id"][bucket] = signal_columns.ids[index]
+                columns["min_timestamp"][bucket] = signal_columns.timestamps[index]
+                columns["min_end_timestamp"][bucket] = signal_columns.end_timestamps[index]
+            if count[bucket] == 0 or value > max_value[bucket]:
+                max_value[bucket] = value
+                columns["max_id"][bucket] = signal_columns.ids[index]
+                columns["max_timestamp"][bucket] = signal_columns.timestamps[index]
+                columns["max_end_timestamp"][bucket] = signal_columns.end_timestamps[index]
+            columns["last_value"][bucket] = signal_columns.values[index]
+            columns["last_id"][bucket] = signal_columns.ids[index]
+            columns["last_end_timestamp"][bucket] = signal_columns.end_timestamps[index]
+            count[bucket] += 1
+            total[bucket] += value
+        return cls(bucket_width, columns)
+
+    def merge_pairs(self):
+        """
+        Create level with buckets twice as long by merging pairs of neighbouring buckets
+
+        Returns:
+            New pyramid level
+        """
+        bucket_count = (len(self) + 1) // 2
+        columns = {name: [0 if name in ("count", "sum") else None] * bucket_count for name in LEVEL_COLUMNS}
+        source = self.columns
+        for bucket in range(bucket_count):
+            parts = [part for part in (2 * bucket, 2 * bucket + 1) if part < len(self) and source["count"][part] > 0]
+            if not parts:
+                continue
+            first, last = parts[0], parts[-1]
+            low = min(parts, key=lambda part: source["min_value"][part])
+            high = max(parts, key=lambda part: source["max_value"][part])
+            columns["count"][bucket] = sum(source["count"][part] for part in parts)
+            columns["sum"][bucket] = sum(source["sum"][part] for part in parts)
+            for name in ("min_value", "min_id", "min_timestamp", "min_end_timestamp"):
+                columns[name][bucket] = source[name][low]
+            for name in ("max_value", "max_id", "max_timestamp", "max_end_timestamp"):
+                columns[name][bucket] = source[name][high]
+            for name in ("first_value", "first_id", "first_timestamp"):
+                columns[name][bucket] = source[name][first]
+            for name in ("last_value", "last_id", "last_end_timestamp"):
+                columns[name][bucket] = source[name][last]
+        return PyramidLevel(2 * self.bucket_width, columns)
+
+
+class TimeSeriesPyramid:
+    """
+    Multi-resolution summary of time series signal values
+
+    Level k summarizes signal values in buckets of base_width * 2^k milliseconds starting at origin (the first
+    begin timestamp). Every bucket stores count, sum, minimum, maximum and the first and the last signal value,
+    so coarse reads and resampling do not have to touch raw signal values.
+
+    The pyramid should be built when time series is saved or created by transformation and stored next to it,
+    e.g. serialized with to_dict. Signal values should be sorted by timestamps and have numeric values.
+
+    Attributes:
+        type (Type): Type of time series
+        origin (int): Begin timestamp of the first signal value
+        base_width (int): Bucket width of the finest level in milliseconds
+        sample_count (int): Number of signal values
+        tail (List[dict]): The last two signal values with begin, end, value and id
+        levels (List[PyramidLevel]): Levels from the finest
+    """
+
+    def __init__(self, type: Type, origin: int, base_width: int, sample_count: int, tail: List[dict],
+                 levels: List[PyramidLevel]):
+        self.type = type
+        self.origin = origin
+        self.base_width = base_width
+        self.sample_count = sample_count
+        self.tail = tail
+        self.levels = levels
+
+    @classmethod
+    def build(cls, signal_columns: SignalColumns, base_width: Optional[int] = None, max_levels: int = 32,
+              base_samples: int = DEFAULT_BASE_SAMPLES):
+        """
+        Build pyramid from signal values
+
+        Every bucket stores one value of each of LEVEL_COLUMNS, so by default buckets of the finest level summarize
+        base_samples signal values to keep the pyramid smaller than raw data.
+
+        Args:
+            signal_columns (SignalColumns): Sorted signal values
+            base_width (Optional[int]): Bucket width of the finest level, base_samples times median difference
+                between timestamps by default. Resampling periods which are multiples of it can use the pyramid.
+            max_levels (int): The greatest number of levels
+            base_samples (int): Median number of signal values in bucket of the finest level, when base_width is
+                not given
+
+        Returns:
+            New pyramid
+        """
+        size = len(signal_columns)
+        if size == 0:
+            return cls(signal_columns.type, 0, base_width or 1, 0, [], [])
+        if base_width is None:
+            differences = [signal_columns.timestamps[index + 1] - signal_columns.timestamps[index]
+                           for index in range(size - 1)]
+            base_width = max(1, int(statistics.median_low(differences)) * base_samples) if differences else 1
+        origin = signal_columns.timestamps[0]
+        tail = [{"begin": signal_columns.timestamps[index], "end": signal_columns.end_timestamps[index],
+                 "value": signal_columns.values[index], "id": signal_columns.ids[index]}
+                for index in range(max(0, size - 2), size)]
+
+        levels = [PyramidLevel.from_columns(signal_columns, origin, base_width)]
+        while len(levels[-1]) > 1 and len(levels) < max_levels:
+            levels.append(levels[-1].merge_pairs())
+        return cls(signal_columns.type, origin, base_width, size, tail, levels)
+
+    def to_dict(self):
+        """
+        Serialize pyramid to dictionary of JSON compatible values
+
+        Returns:
+            Dictionary with pyramid
+        """
+        return {"type": self.type, "origin": self.origin, "base_width": self.base_width,
+                "sample_count": self.sample_count, "tail": self.tail,
+                "levels": [{"bucket_width": level.bucket_width, "columns": level.columns} for level in self.levels]}
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Deserialize pyramid from dictionary created with to_dict
+
+        Args:
+            data (dict): Dictionary with pyramid
+
+        Returns:
+            Pyramid object
+        """
+        return cls(Type(data["type"]), data["origin"], data["base_width"], data["sample_count"], data["tail"],
+                   [PyramidLevel(level["bucket_width"], level["columns"]) for level in data["levels"]])
+
+    @property
+    def last_end_timestamp(self):
+        return self.tail[-1]["end"] if self.tail else None
+
+    def get_aligned_level(self, start_timestamp: int, period: int):
+        """
+        Find the coarsest level with bucket boundaries at every timestamp start_timestamp + i * period
+
+        Args:
+            start_timestamp (int): First timestamp
+            period (int): Difference between timestamps
+
+        Returns:
+            Pyramid level or None when no level is aligned
+        """
+        aligned_level = None
+        for level in self.levels:
+            if level.bucket_width > period:
+                break
+            if period % level.bucket_width == 0 and (start_timestamp - self.origin) % level.bucket_width == 0:
+                aligned_level = level
+        return aligned_level
+
+    def resample_nearest(self, start_timestamp: int, end_timestamp: int, period: int):
+        """
+        Find the nearest signal value for every timestamp from start_timestamp to end_timestamp (exclusive) with
+        given period, the same way as TimeSeriesTransformationResample does using raw signal values.
+
+        Each timestamp lies on the boundary of a bucket of the aligned level, so the nearest signal value is the
+        last signal value of the preceding non-empty bucket or the first signal value of the following one.
+        This takes O(number of timestamps) time for series without long gaps.
+
+        Args:
+            start_timestamp (int): First timestamp
+            end_timestamp (int): Timestamps are less than end timestamp
+            period (int): Difference between timestamps
+
+        Returns:
+            List of (timestamp, value, id) tuples or None when no level is aligned with timestamps
+        """
+        level = self.get_aligned_level(start_timestamp, period)
+        if level is None:
+            return None
+        result = []
+        if self.sample_count == 0:
+            return result
+        count = level.columns["count"]
+        bucket_count = len(level)
+        current_time = start_timestamp
+        while current_time < end_timestamp:
+            bucket = max(0, (current_time - self.origin) // level.bucket_width)
+            after = bucket
+            while after < bucket_count and count[after] == 0:
+                after += 1
+            if after < bucket_count:
+                before = min(bucket, bucket_count) - 1
+                while before >= 0 and count[before] == 0:
+                    before -= 1
+                after_value = (level.columns["first_timestamp"][after], level.columns["first_value"][after],
+                               level.columns["first_id"][after])
+                if before >= 0 and abs(current_time - level.columns["last_end_timestamp"][before]) <= abs(
+                        after_value[0] - current_time):
+                    result.append((current_time, level.columns["last_value"][before], level.columns["last_id"][before]))
+                else:
+                    result.append((current_time, after_value[1], after_value[2]))
+            else:
+                # All signal values begin before current time, the last one or the one before it is the nearest
+                last = self.tail[-1]
+                if len(self.tail) > 1 and abs(current_time - self.tail[0]["end"]) <= abs(last["begin"] - current_time):
+                    last = self.tail[0]
+                result.append((current_time, last["value"], last["id"]))
+            current_time += period
+        return result
+
+    def _get_level_for_window(self, start_timestamp: int, end_timestamp: int, max_buckets: int):
+        for level in self.levels:
+            if (end_timestamp - start_timestamp) / level.bucket_width <= max_buckets:
+                return level
+        return self.levels[-1]
+
+    def _get_bucket_range(self, level: PyramidLevel, start_timestamp: int, end_timestamp: int):
+        first_bucket = max(0, (start_timestamp - self.origin) // level.bucket_width)
+        last_bucket = min(len(level), (end_timestamp - self.origin - 1) // level.bucket_width + 1)
+        return first_bucket, last_bucket
+
+    def summarize(self, start_timestamp: Optional[int] = None, end_timestamp: Optional[int] = None,
+                  max_buckets: int = 1000):
+        """
+        Get summaries of buckets of the finest level with at most max_buckets buckets in time window
+
+        Args:
+            start_timestamp (Optional[int]): Beginning of time window, the first timestamp by default
+            end_timestamp (Optional[int]): End of time window (exclusive), after the last timestamp by default
+            max_buckets (int): The greatest number of buckets in time window
+
+        Returns:
+            List of dictionaries with start and end timestamp, count, min, max and mean of non-empty buckets
+        """
+        if self.sample_count == 0:
+            return []
+        start_timestamp = self.origin if start_timestamp is None else start_timestamp
+        end_timestamp = self.tail[-1]["begin"] + 1 if end_timestamp is None else end_timestamp
+        level = self._get_level_for_window(start_timestamp, end_timestamp, max_buckets)
+        first_bucket, last_bucket = self._get_bucket_range(level, start_timestamp, end_timestamp)
+        columns = level.columns
+        return [{"start_timestamp": self.origin + bucket * level.bucket_width,
+                 "end_timestamp": self.origin + (bucket + 1) * level.bucket_width,
+                 "count": columns["count"][bucket],
+                 "min": columns["min_value"][bucket],
+                 "max": columns["max_value"][bucket],
+                 "mean": columns["sum"][bucket] / columns["count"][bucket]}
+                for bucket in range(first_bucket, last_bucket) if columns["count"][bucket] > 0]
+
+    def can_downsample(self, start_timestamp: Optional[int] = None, end_timestamp: Optional[int] = None,
+                       max_points: int = 1000):
+        """
+        Check if downsample_min_max returns at most max_points signal values without merging more signal values
+        than downsampling of raw signal values would, i.e. the finest level has more than max_points / 2 buckets
+        in time window
+
+        Args:
+            start_timestamp (Optional[int]): Beginning of time window, the first timestamp by default
+            end_timestamp (Optional[int]): End of time window (exclusive), after the last timestamp by default
+            max_points (int): The greatest number of returned signal values
+
+        Returns:
+            True if the pyramid should be used for time window
+        """
+        if self.sample_count <= max_points or not self.levels:
+            return False
+        start_timestamp = self.origin if start_timestamp is None else start_timestamp
+        end_timestamp = self.tail[-1]["begin"] + 1 if end_timestamp is None else end_timestamp
+        first_bucket, last_bucket = self._get_bucket_range(self.levels[0], start_timestamp, end_timestamp)
+        return last_bucket - first_bucket > max_points // 2
+
+    def downsample_min_max(self, start_timestamp: Optional[int] = None, end_timestamp: Optional[int] = None,
+                           max_points: int = 1000):
+        """
+        Get signal values with minimal and maximal value of buckets in time window without reading raw signal
+        values. Buckets are aligned to pyramid levels, so the result is similar but not identical to
+        downsample_min_max from ts_downsampling module.
+
+        Args:
+            start_timestamp (Optional[int]): Beginning of time window, the first timestamp by default
+            end_timestamp (Optional[int]): End of time window (exclusive), after the last timestamp by default
+            max_points (int): The greatest number of returned signal values
+
+        Returns:
+            List of signal values in the format returned by services, sorted by timestamps
+        """
+        if self.sample_count == 0:
+            return []
+        start_timestamp = self.origin if start_timestamp is None else start_timestamp
+        end_timestamp = self.tail[-1]["begin"] + 1 if end_timestamp is None else end_timestamp
+        level = self._get_level_for_window(start_timestamp, end_timestamp, max(1, max_points // 2))
+        first_bucket, last_bucket = self._get_bucket_range(level, start_timestamp, end_timestamp)
+        begin_label, end_label = get_timestamp_labels(self.type)
+        columns = level.columns
+        signal_values = []
+        for bucket in range(first_bucket, last_bucket):
+            if columns["count"][bucket] == 0:
+                continue
+            # Minimum and maximum of a bucket with one signal value, or equal values, are the same signal value
+            extremes = {columns[prefix + "id"][bucket]: prefix for prefix in ("max_", "min_")}
+            for prefix in sorted(extremes.values(), key=lambda prefix: columns[prefix + "timestamp"][bucket]):
+                timestamp = columns[prefix + "timestamp"][bucket]
+                if not start_timestamp <= timestamp < end_timestamp:
+                    continue
+                if begin_label == end_label:
+                    timestamp_properties = [{"key": begin_label, "value": timestamp}]
+                else:
+                    timestamp_properties = [{"key": begin_label, "value": timestamp},
+                                            {"key": end_label, "value": columns[prefix + "end_timestamp"][bucket]}]
+                signal_values.append({
+                    "signal_value": {"id": columns[prefix + "id"][bucket],
+                                     "properties": [{"key": "value", "value": columns[prefix + "value"][bucket]}]},
+                    "timestamp": {"properties": timestamp_properties}
+                })
+        return signal_values
@@ -0,0 +1,197 @@
+import pickle
+from array import array
+from multiprocessing import shared_memory
+from typing import Sequence, List, Optional
+
+from grisera.time_series.time_series_model import Type
+from grisera.time_series.ts_columns import SignalColumns
+
+# Column encodings: 8 byte integers, 8 byte floats, UTF-8 strings with offsets or pickled chunks with offsets
+# for mixed types
+INTEGER_COLUMN = "int"
+FLOAT_COLUMN = "float"
+STRING_COLUMN = "str"
+PICKLED_COLUMN = "pickle"
+
+# Number of elements of pickled column in one pickle, so readers of a range unpickle only its chunks
+PICKLED_CHUNK_SIZE = 4096
+
+_ALIGNMENT = 8
+
+
+def encode_column(column: Sequence):
+    """
+    Encode column into bytes keeping exact types of its elements
+
+    Columns of mixed types are pickled in chunks of PICKLED_CHUNK_SIZE elements and offsets hold byte bounds of
+    the chunks.
+
+    Returns:
+        Tuple of encoding, data bytes and offsets bytes (only for strings and pickled chunks)
+    """
+    if all(type(element) is int for element in column):
+        try:
+            return INTEGER_COLUMN, array("q", column).tobytes(), b""
+        except OverflowError:
+            pass
+    elif all(type(element) is float for element in column):
+        return FLOAT_COLUMN, array("d", column).tobytes(), b""
+    elif all(type(element) is str for element in column):
+        encoded = [element.encode() for element in column]
+        offsets = array("q", [0])
+        for element in encoded:
+            offsets.append(offsets[-1] + len(element))
+        return STRING_COLUMN, b"".join(encoded), offsets.tobytes()
+    chunks = [pickle.dumps(list(column[begin:begin + PICKLED_CHUNK_SIZE]), protocol=pickle.HIGHEST_PROTOCOL)
+              for begin in range(0, len(column), PICKLED_CHUNK_SIZE)]
+    offsets = array("q", [0])
+    for chunk in chunks:
+        offsets.append(offsets[-1] + len(chunk))
+    return PICKLED_COLUMN, b"".join(chunks), offsets.tobytes()
+
+
+def decode_column(encoding: str, data: bytes, offsets: bytes) -> List:
+    """
+    Decode whole column encoded with encode_column
+
+    Args:
+        encoding (str): Encoding of column
+        data (bytes): Data bytes
+        offsets (bytes): Offsets bytes (only for strings and pickled chunks)
+
+    Returns:
+        List of elements
+    """
+    if encoding in (PICKLED_COLUMN, STRING_COLUMN):
+        bounds = array("q")
+        bounds.frombytes(offsets)
+    if encoding == PICKLED_COLUMN:
+        return [element for begin, end in zip(bounds, bounds[1:]) for element in pickle.loads(data[begin:end])]
+    if encoding == STRING_COLUMN:
+        return [data[begin:end].decode() for begin, end in zip(bounds, bounds[1:])]
+    column = array("q" if encoding == INTEGER_COLUMN else "d")
+    column.frombytes(data)
+    return column.tolist()
+
+
+class SharedColumnsHandle:
+    """
+    Small picklable description of signal columns stored in shared memory segment
+
+    Attributes:
+        name (str): Name of shared memory segment
+        type (Type): Type of time series
+        length (int): Number of signal values
+        layout (dict): Column name to (encoding, data offset, data size, offsets offset, offsets size) tuples
+    """
+
+    def __init__(self, name: str, type: Type, length: int, layout: dict):
+        self.name = name
+        self.type = type
+        self.length = length
+        self.layout = layout
+
+
+class SharedSignalColumns:
+    """
+    Signal columns copied to one shared memory segment, so worker processes can read them without pickling
+    signal value nodes
+
+    The creating process owns the segment and frees it with close, also when used as a context manager, so the
+    segment is released on completion and on failure. Workers read ranges of columns with read_shared_columns.
+
+    Attributes:
+        handle (SharedColumnsHandle): Description of segment passed to worker processes
+    """
+
+    def __init__(self, columns: SignalColumns):
+        encoded_columns = {"timestamps": encode_column(columns.timestamps),
+                           "values": encode_column(columns.values),
+                           "ids": encode_column(columns.ids)}
+        if columns.end_timestamps is not columns.timestamps:
+            encoded_columns["end_timestamps"] = encode_column(columns.end_timestamps)
+
+        layout = {}
+        size = 0
+        for column_name, (encoding, data, offsets) in encoded_columns.items():
+            data_offset = size
+            offsets_offset = _align(data_offset + len(data))
+            size = _align(offsets_offset + len(offsets))
+            layout[column_name] = (encoding, data_offset, len(data), offsets_offset, len(offsets))
+
+        self._memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            for column_name, (encoding, data, offsets) in encoded_columns.items():
+                _, data_offset, data_size, offsets_offset, offsets_size = layout[column_name]
+                self._memory.buf[data_offset:data_offset + data_size] = data
+                self._memory.buf[offsets_offset:offsets_offset + offsets_size] = offsets
+        except BaseException:
+            self.close()
+            raise
+        self.handle = SharedColumnsHandle(self._memory.name, columns.type, len(columns), layout)
+
+    def close(self):
+        """
+        Free shared memory segment
+        """
+        if self._memory is not None:
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _align(offset: int):
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _read_column(buffer, layout: tuple, first_index: int, last_index: int) -> List:
+    encoding, data_offset, data_size, offsets_offset, offsets_size = layout
+    if encoding == PICKLED_COLUMN:
+        first_chunk = first_index // PICKLED_CHUNK_SIZE
+        last_chunk = (last_index + PICKLED_CHUNK_SIZE - 1) // PICKLED_CHUNK_SIZE
+        with buffer[offsets_offset:offsets_offset + offsets_size].cast("q") as offsets:
+            bounds = offsets[first_chunk:last_chunk + 1].tolist()
+        elements = [element for begin, end in zip(bounds, bounds[1:])
+                    for element in pickle.loads(buffer[data_offset + begin:data_offset + end])]
+        skipped = first_chunk * PICKLED_CHUNK_SIZE
+        return elements[first_index - skipped:last_index - skipped]
+    if encoding == STRING_COLUMN:
+        with buffer[offsets_offset:offsets_offset + offsets_size].cast("q") as offsets:
+            bounds = offsets[first_index:last_index + 1].tolist()
+        data = bytes(buffer[data_offset + bounds[0]:data_offset + bounds[-1]]) if bounds else b""
+        return [data[begin - bounds[0]:end - bounds[0]].decode() for begin, end in zip(bounds, bounds[1:])]
+    with buffer[data_offset:data_offset + data_size].cast("q" if encoding == INTEGER_COLUMN else "d") as data:
+        return data[first_index:last_index].tolist()
+
+
+def read_shared_columns(handle: SharedColumnsHandle, first_index: int = 0,
+                        last_index: Optional[int] = None) -> SignalColumns:
+    """
+    Copy range of signal columns from shared memory segment
+
+    Args:
+        handle (SharedColumnsHandle): Description of segment
+        first_index (int): First index
+        last_index (Optional[int]): Index after the last one, the end of columns if not given
+
+    Returns:
+        New signal columns
+    """
+    last_index = handle.length if last_index is None else last_index
+    memory = shared_memory.SharedMemory(name=handle.name)
+    try:
+        with memory.buf[:] as buffer:
+            timestamps = _read_column(buffer, handle.layout["timestamps"], first_index, last_index)
+            end_timestamps = _read_column(buffer, handle.layout["end_timestamps"], first_index, last_index) \
+                if "end_timestamps" in handle.layout else timestamps
+            values = _read_column(buffer, handle.layout["values"], first_index, last_index)
+            ids = _read_column(buffer, handle.layout["ids"], first_index, last_index)
+    finally:
+        memory.close()
+    return SignalColumns(handle.type, timestamps, end_timestamps, values, ids)
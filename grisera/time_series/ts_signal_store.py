@@ -0,0 +1,408 @@
+import json
+import math
+import mmap
+import os
+import shutil
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Union, Sequence, Optional
+
+from grisera.time_series.time_series_model import Type, TimeSeriesIn, TimeSeriesOut
+from grisera.time_series.ts_columns import SignalColumns, ColumnSignalValues
+
+HEADER_FILE = "header.json"
+TIMESTAMPS_FILE = "timestamps.i8"
+END_TIMESTAMPS_FILE = "end_timestamps.i8"
+VALUES_FILE = "values"
+VALUE_OFFSETS_FILE = "value_offsets.i8"
+# Values of numeric time series converted to strings, named in header, so readers of the old header keep reading
+# numeric values file
+CONVERTED_VALUES_FILE = "values.str"
+
+# Value kinds with array type codes, strings are stored as UTF-8 bytes with offsets
+FLOAT_VALUES = "float"
+INTEGER_VALUES = "int"
+STRING_VALUES = "str"
+_VALUE_TYPECODES = {FLOAT_VALUES: "d", INTEGER_VALUES: "q"}
+
+DEFAULT_INDEX_STRIDE = 4096
+
+
+def _is_value_of_kind(value, value_kind: str):
+    # Strings are stored as numbers only when they are read back unchanged, e.g. "007" or "1e3" stay strings
+    if value_kind == STRING_VALUES:
+        return True
+    numeric_type = int if value_kind == INTEGER_VALUES else float
+    if isinstance(value, str):
+        try:
+            if value_kind == INTEGER_VALUES:
+                return str(int(value)) == value
+            return repr(float(value)) == value and math.isfinite(float(value))
+        except ValueError:
+            return False
+    return isinstance(value, (int, numeric_type)) and not isinstance(value, bool)
+
+
+def get_value_kind(values: Sequence):
+    """
+    Get the narrowest value kind storing all values without changing them
+
+    Numeric strings are stored as numbers only when their number is formatted back to the same string, so reading
+    them as strings gives the original values.
+
+    Args:
+        values (Sequence): Values of signal values
+
+    Returns:
+        "int" or "float" if every value is stored by the numeric column without changes, otherwise "str"
+    """
+    if len(values) == 0:
+        return FLOAT_VALUES
+    for value_kind in (INTEGER_VALUES, FLOAT_VALUES):
+        if all(_is_value_of_kind(value, value_kind) for value in values):
+            return value_kind
+    return STRING_VALUES
+
+
+class SignalStore:
+    """
+    Columnar on-disk store of signal values of time series, read through memory maps
+
+    Each time series is a directory with one file per column (begin timestamps, end timestamps of Epoch series
+    and values) and a small JSON header with type, value kind, number of signal values and sparse index of every
+    index_stride-th begin timestamp. Appends write to the end of column files and then atomically replace the
+    header, so readers never see partially appended signal values.
+
+    Appending values which the numeric column of time series can not store converts the time series to strings,
+    so values of any kind can be appended.
+
+    Signal values are identified by their index in time series. Numeric columns are returned as memoryviews of
+    memory maps without copying, so they can be passed to SignalColumns users like downsampling, pyramid building
+    or SharedSignalColumns.
+
+    Attributes:
+        directory (str): Root directory of the store
+        index_stride (int): Number of signal values between sparse index entries
+    """
+
+    def __init__(self, directory: str, index_stride: int = DEFAULT_INDEX_STRIDE):
+        self.directory = directory
+        self.index_stride = index_stride
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def create(self, time_series_id: Union[int, str], time_series_type: Type, value_kind: str = FLOAT_VALUES):
+        """
+        Create empty time series
+
+        Args:
+            time_series_id (Union[int, str]): Id of time series, e.g. id of its graph node
+            time_series_type (Type): Type of time series
+            value_kind (str): Kind of values, "float", "int" or "str"
+        """
+        assert value_kind in (FLOAT_VALUES, INTEGER_VALUES, STRING_VALUES), f"value kind {value_kind} is unknown"
+        path = self._path(time_series_id)
+        with self._lock:
+            assert not os.path.exists(path), f"time series {time_series_id} already exists"
+            os.makedirs(path)
+            file_names = [TIMESTAMPS_FILE, VALUES_FILE]
+            if time_series_type != Type.timestamp:
+                file_names.append(END_TIMESTAMPS_FILE)
+            if value_kind == STRING_VALUES:
+                file_names.append(VALUE_OFFSETS_FILE)
+            for file_name in file_names:
+                open(os.path.join(path, file_name), "wb").close()
+            if value_kind == STRING_VALUES:
+                with open(os.path.join(path, VALUE_OFFSETS_FILE), "wb") as file:
+                    array("q", [0]).tofile(file)
+            self._write_header(path, {"type": time_series_type.value, "value_kind": value_kind, "length": 0,
+                                      "index_stride": self.index_stride, "index": []})
+
+    def exists(self, time_series_id: Union[int, str]):
+        """
+        Check if time series exists in store
+
+        Args:
+            time_series_id (Union[int, str]): Id of time series
+
+        Returns:
+            True if time series exists
+        """
+        return os.path.exists(os.path.join(self._path(time_series_id), HEADER_FILE))
+
+    def delete(self, time_series_id: Union[int, str]):
+        """
+        Delete time series with all its signal values
+
+        Args:
+            time_series_id (Union[int, str]): Id of time series
+        """
+        with self._lock:
+            shutil.rmtree(self._path(time_series_id), ignore_errors=True)
+
+    def get_length(self, time_series_id: Union[int, str]):
+        """
+        Get number of signal values of time series
+
+        Args:
+            time_series_id (Union[int, str]): Id of time series
+
+        Returns:
+            Number of signal values
+        """
+        return self._read_header(self._path(time_series_id))["length"]
+
+    def append(self, time_series_id: Union[int, str], timestamps: Sequence[int], values: Sequence,
+               end_timestamps: Optional[Sequence[int]] = None):
+        """
+        Append signal values to the end of time series
+
+        Args:
+            time_series_id (Union[int, str]): Id of time series
+            timestamps (Sequence[int]): Ascending begin timestamps, not less than the last stored one
+            values (Sequence): Values of signal values
+            end_timestamps (Optional[Sequence[int]]): End timestamps, required for Epoch series
+        """
+        path = self._path(time_series_id)
+        with self._lock:
+            header = self._read_header(path)
+            length = header["length"]
+            assert len(values) == len(timestamps), "Number of values and timestamps should be equal"
+            has_end_timestamps = header["type"] != Type.timestamp.value
+            assert (end_timestamps is not None) == has_end_timestamps, \
+                "End timestamps should be given only for Epoch time series"
+            if len(timestamps) == 0:
+                return
+            last_timestamp = self._read_last_timestamp(path, length)
+            assert last_timestamp is None or timestamps[0] >= last_timestamp, \
+                "Appended timestamps should not be less than the last stored timestamp"
+            assert all(timestamps[index] <= timestamps[index + 1] for index in range(len(timestamps) - 1)), \
+                "Timestamps should be sorted"
+            if not all(_is_value_of_kind(value, header["value_kind"]) for value in values):
+                self._convert_to_strings(path, header)
+
+            # Column files are truncated to header length first, dropping leftovers of failed appends
+            self._append_array(os.path.join(path, TIMESTAMPS_FILE), length * 8, array("q", timestamps))
+            if has_end_timestamps:
+                self._append_array(os.path.join(path, END_TIMESTAMPS_FILE), length * 8, array("q", end_timestamps))
+            if header["value_kind"] == STRING_VALUES:
+                offsets = self._read_array(path, VALUE_OFFSETS_FILE, "q", 0, length + 1)
+                data_size = offsets[length]
+                encoded_values = [str(value).encode() for value in values]
+                new_offsets = array("q")
+                for encoded_value in encoded_values:
+                    data_size += len(encoded_value)
+                    new_offsets.append(data_size)
+                self._append_bytes(os.path.join(path, header.get("values_file", VALUES_FILE)), offsets[length],
+                                   b"".join(encoded_values))
+                self._append_array(os.path.join(path, VALUE_OFFSETS_FILE), (length + 1) * 8, new_offsets)
+            else:
+                typecode = _VALUE_TYPECODES[header["value_kind"]]
+                converted_values = [float(value) if typecode == "d" else int(value) for value in values]
+                self._append_array(os.path.join(path, VALUES_FILE), length * 8, array(typecode, converted_values))
+
+            stride = header["index_stride"]
+            first_indexed = -(-length // stride) * stride
+            header["index"].extend(timestamps[index - length]
+                                   for index in range(first_indexed, length + len(timestamps), stride))
+            header["length"] = length + len(timestamps)
+            self._write_header(path, header)
+            if header.get("values_file") == CONVERTED_VALUES_FILE and os.path.exists(os.path.join(path, VALUES_FILE)):
+                os.remove(os.path.join(path, VALUES_FILE))
+
+    def append_time_series(self, time_series_id: Union[int, str], time_series: TimeSeriesIn,
+                           value_kind: Optional[str] = None):
+        """
+        Append signal values of time series model, creating the time series when it does not exist
+
+        Values of signal values in models are strings after validation, so when value kind is not given, new time
+        series store numbers only if every value is read back as the same string, and strings otherwise.
+
+        Args:
+            time_series_id (Union[int, str]): Id of time series
+            time_series (TimeSeriesIn): Time series with signal values to append
+            value_kind (Optional[str]): Kind of values of new time series, "float", "int" or "str"
+        """
+        signal_values = time_series.signal_values
+        if not self.exists(time_series_id):
+            if value_kind is None:
+                value_kind = get_value_kind([signal.signal_value.value for signal in signal_values])
+            self.create(time_series_id, time_series.type, value_kind)
+        if time_series.type == Type.timestamp:
+            self.append(time_series_id, [signal.timestamp for signal in signal_values],
+                        [signal.signal_value.value for signal in signal_values])
+        else:
+            self.append(time_series_id, [signal.start_timestamp for signal in signal_values],
+                        [signal.signal_value.value for signal in signal_values],
+                        [signal.end_timestamp for signal in signal_values])
+
+    def read_columns(self, time_series_id: Union[int, str], first_index: int = 0,
+                     last_index: Optional[int] = None) -> SignalColumns:
+        """
+        Read range of signal values as columns
+
+        Timestamps and numeric values are memoryviews of memory maps, ids are a range of indexes.
+
+        Args:
+            time_series_id (Union[int, str]): Id of time series
+            first_index (int): First index
+            last_index (Optional[int]): Index after the last one, the end of time series if not given
+
+        Returns:
+            Signal columns
+        """
+        path = self._path(time_series_id)
+        header = self._read_header(path)
+        length = header["length"]
+        last_index = length if last_index is None else min(last_index, length)
+        first_index = min(first_index, last_index)
+        time_series_type = Type(header["type"])
+
+        timestamps = self._read_array(path, TIMESTAMPS_FILE, "q", first_index, last_index)
+        end_timestamps = timestamps if time_series_type == Type.timestamp else \
+            self._read_array(path, END_TIMESTAMPS_FILE, "q", first_index, last_index)
+        if header["value_kind"] == STRING_VALUES:
+            offsets = self._read_array(path, VALUE_OFFSETS_FILE, "q", first_index, last_index + 1)
+            data = self._read_bytes(path, header.get("values_file", VALUES_FILE), offsets[0], offsets[-1]) \
+                if len(offsets) else b""
+            values = [bytes(data[begin - offsets[0]:end - offsets[0]]).decode()
+                      for begin, end in zip(offsets, offsets[1:])]
+        else:
+            values = self._read_array(path, VALUES_FILE, _VALUE_TYPECODES[header["value_kind"]], first_index,
+                                      last_index)
+        return SignalColumns(time_series_type, timestamps, end_timestamps, values, range(first_index, last_index))
+
+    def find_range(self, time_series_id: Union[int, str], start_timestamp: Optional[int] = None,
+                   end_timestamp: Optional[int] = None):
+        """
+        Find range of signal values with begin timestamp in time window using sparse index and binary search
+
+        Args:
+            time_series_id (Union[int, str]): Id of time series
+            start_timestamp (Optional[int]): Beginning of the window, unbounded if not given
+            end_timestamp (Optional[int]): End of the window (exclusive), unbounded if not given
+
+        Returns:
+            Tuple of first index and index after the last signal value in window
+        """
+        path = self._path(time_series_id)
+        header = self._read_header(path)
+        timestamps = self._read_array(path, TIMESTAMPS_FILE, "q", 0, header["length"])
+        first_index = 0 if start_timestamp is None else \
+            self._search(timestamps, header, start_timestamp)
+        last_index = len(timestamps) if end_timestamp is None else \
+            self._search(timestamps, header, end_timestamp)
+        return first_index, max(first_index, last_index)
+
+    def read_time_series(self, time_series_id: Union[int, str], start_timestamp: Optional[int] = None,
+                         end_timestamp: Optional[int] = None) -> TimeSeriesOut:
+        """
+        Read signal values with begin timestamp in time window as time series in the format returned by services
+
+        Args:
+            time_series_id (Union[int, str]): Id of time series
+            start_timestamp (Optional[int]): Beginning of the window
+            end_timestamp (Optional[int]): End of the window (exclusive)
+
+        Returns:
+            Time series object with signal values identified by their indexes and created on access, vectorized
+            transformations read its columns without copying
+        """
+        first_index, last_index = self.find_range(time_series_id, start_timestamp, end_timestamp)
+        columns = self.read_columns(time_series_id, first_index, last_index)
+        return TimeSeriesOut.construct(id=time_series_id, type=columns.type,
+                                       signal_values=ColumnSignalValues(columns))
+
+    def _path(self, time_series_id: Union[int, str]):
+        name = str(time_series_id)
+        if not name or not all(character.isalnum() or character in "-_." for character in name) or \
+                name in (".", ".."):
+            raise ValueError(f"Invalid time series id {time_series_id}")
+        return os.path.join(self.directory, name)
+
+    @staticmethod
+    def _convert_to_strings(path: str, header: dict):
+        # Header is changed by the caller, new files are written next to numeric values file read with old header
+        length = header["length"]
+        if header["value_kind"] == STRING_VALUES:
+            return
+        if length == 0:
+            encoded_values = []
+        else:
+            values = SignalStore._read_array(path, VALUES_FILE, _VALUE_TYPECODES[header["value_kind"]], 0, length)
+            encoded_values = [(repr(value) if header["value_kind"] == FLOAT_VALUES else str(value)).encode()
+                              for value in values]
+        offsets = array("q", [0])
+        for encoded_value in encoded_values:
+            offsets.append(offsets[-1] + len(encoded_value))
+        with open(os.path.join(path, CONVERTED_VALUES_FILE), "wb") as file:
+            file.write(b"".join(encoded_values))
+        with open(os.path.join(path, VALUE_OFFSETS_FILE), "wb") as file:
+            offsets.tofile(file)
+        header["value_kind"] = STRING_VALUES
+        header["values_file"] = CONVERTED_VALUES_FILE
+
+    @staticmethod
+    def _search(timestamps, header: dict, timestamp: int):
+        # Sparse index narrows binary search to one stride of the memory map
+        stride = header["index_stride"]
+        block = bisect_left(header["index"], timestamp)
+        low = max(0, block - 1) * stride
+        high = min(len(timestamps), block * stride + 1)
+        return bisect_left(timestamps, timestamp, low, high)
+
+    @staticmethod
+    def _read_header(path: str):
+        try:
+            with open(os.path.join(path, HEADER_FILE)) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            raise KeyError(f"time series {os.path.basename(path)} not found in signal store")
+
+    @staticmethod
+    def _write_header(path: str, header: dict):
+        temporary_path = os.path.join(path, HEADER_FILE + ".tmp")
+        with open(temporary_path, "w") as file:
+            json.dump(header, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, os.path.join(path, HEADER_FILE))
+
+    @staticmethod
+    def _read_last_timestamp(path: str, length: int):
+        if length == 0:
+            return None
+        with open(os.path.join(path, TIMESTAMPS_FILE), "rb") as file:
+            file.seek((length - 1) * 8)
+            last = array("q")
+            last.frombytes(file.read(8))
+            return last[0]
+
+    @staticmethod
+    def _append_array(file_path: str, valid_size: int, data: array):
+        SignalStore._append_bytes(file_path, valid_size, data.tobytes())
+
+    @staticmethod
+    def _append_bytes(file_path: str, valid_size: int, data: bytes):
+        with open(file_path, "r+b") as file:
+            file.truncate(valid_size)
+            file.seek(valid_size)
+            file.write(data)
+
+    @staticmethod
+    def _map(path: str, file_name: str, size: int):
+        if size == 0:
+            return memoryview(b"")
+        with open(os.path.join(path, file_name), "rb") as file:
+            return memoryview(mmap.mmap(file.fileno(), size, access=mmap.ACCESS_READ))
+
+    @staticmethod
+    def _read_array(path: str, file_name: str, typecode: str, first_index: int, last_index: int):
+        if last_index <= first_index:
+            return memoryview(array(typecode))
+        return SignalStore._map(path, file_name, last_index * 8).cast(typecode)[first_index:last_index]
+
+    @staticmethod
+    def _read_bytes(path: str, file_name: str, first_offset: int, last_offset: int):
+        return SignalStore._map(path, file_name, last_offset)[first_offset:last_offset]
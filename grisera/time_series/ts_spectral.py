@@ -0,0 +1,107 @@
+import cmath
+import math
+from typing import List, Sequence, Tuple, Dict
+
+# Frequency ranges of EEG bands in Hz, lower bound inclusive and upper bound exclusive
+FREQUENCY_BANDS = {
+    "delta": (1.0, 4.0),
+    "theta": (4.0, 8.0),
+    "alpha": (8.0, 13.0),
+    "beta": (13.0, 30.0),
+    "gamma": (30.0, 45.0),
+}
+
+
+class FFTPlan:
+    """
+    Precomputed bit reversal permutation, twiddle factors and Hann window for radix-2 FFT of given size,
+    reused for every window of a batch
+
+    Attributes:
+        size (int): Number of samples, power of two
+        permutation (List[int]): Bit reversal permutation of sample indexes
+        twiddles (List[complex]): Twiddle factors exp(-2j * pi * k / size) for k < size / 2
+        window (List[float]): Hann window of given size
+        window_power (float): Sum of squared window coefficients
+    """
+
+    def __init__(self, size: int):
+        assert size > 1 and size & (size - 1) == 0, "FFT size should be a power of two"
+        self.size = size
+        bits = size.bit_length() - 1
+        self.permutation = [int(format(index, f"0{bits}b")[::-1], 2) for index in range(size)]
+        self.twiddles = [cmath.exp(-2j * math.pi * index / size) for index in range(size // 2)]
+        self.window = [0.5 - 0.5 * math.cos(2 * math.pi * index / size) for index in range(size)]
+        self.window_power = sum(coefficient * coefficient for coefficient in self.window)
+
+    def fft(self, samples: Sequence[float]) -> List[complex]:
+        """
+        Compute discrete Fourier transform of Hann windowed samples
+
+        Args:
+            samples (Sequence[float]): Samples, exactly size of them
+
+        Returns:
+            List of Fourier coefficients
+        """
+        window = self.window
+        spectrum = [complex(samples[index] * window[index]) for index in self.permutation]
+        size = self.size
+        half_length = 1
+        while half_length < size:
+            twiddle_step = size // (2 * half_length)
+            twiddles = self.twiddles[::twiddle_step]
+            for start in range(0, size, 2 * half_length):
+                for offset in range(half_length):
+                    even = spectrum[start + offset]
+                    odd = spectrum[start + offset + half_length] * twiddles[offset]
+                    spectrum[start + offset] = even + odd
+                    spectrum[start + offset + half_length] = even - odd
+            half_length *= 2
+        return spectrum
+
+
+def get_band_bins(bands: Dict[str, Tuple[float, float]], size: int, sampling_frequency: float):
+    """
+    Get indexes of one-sided spectrum bins of every band
+
+    Args:
+        bands (Dict[str, Tuple[float, float]]): Frequency ranges of bands
+        size (int): FFT size
+        sampling_frequency (float): Sampling frequency in Hz
+
+    Returns:
+        Dictionary of band names and lists of bin indexes
+    """
+    resolution = sampling_frequency / size
+    return {name: [index for index in range(1, size // 2 + 1) if low <= index * resolution < high]
+            for name, (low, high) in bands.items()}
+
+
+def compute_band_powers(plan: FFTPlan, samples: Sequence[float], band_bins: Dict[str, List[int]],
+                        sampling_frequency: float) -> Dict[str, float]:
+    """
+    Compute power of samples in frequency bands from one-sided periodogram of mean removed, Hann windowed samples
+
+    Args:
+        plan (FFTPlan): FFT plan of samples size
+        samples (Sequence[float]): Samples
+        band_bins (Dict[str, List[int]]): Bin indexes of every band from get_band_bins
+        sampling_frequency (float): Sampling frequency in Hz
+
+    Returns:
+        Dictionary of band names and powers in squared signal units
+    """
+    mean = sum(samples) / len(samples)
+    spectrum = plan.fft([sample - mean for sample in samples])
+    # Power spectral density multiplied by bin width; bins other than DC and Nyquist are doubled
+    scale = 1 / (plan.window_power * plan.size)
+    nyquist = plan.size // 2
+    powers = {}
+    for name, bins in band_bins.items():
+        power = 0.0
+        for index in bins:
+            coefficient = spectrum[index]
+            power += (coefficient.real ** 2 + coefficient.imag ** 2) * (1 if index == nyquist else 2)
+        powers[name] = power * scale
+    return powers
@@ -0,0 +1,321 @@
+import math
+from typing import Optional, List, Sequence
+
+from grisera.time_series.time_series_model import Type, TimeSeriesOut, TimeSeriesStatisticsOut
+from grisera.time_series.ts_columns import SignalColumns
+
+DEFAULT_PERCENTILES = [5, 25, 50, 75, 95]
+DEFAULT_COMPRESSION = 100
+
+
+class TDigest:
+    """
+    Mergeable sketch of distribution of values estimating quantiles in bounded memory
+
+    Values are buffered and merged into centroids sorted by mean. Centroids near both ends of the distribution
+    are kept small, so extreme quantiles are more accurate than the median. Memory use is proportional to
+    compression, independently of number of added values.
+
+    Attributes:
+        compression (int): Greater values keep more centroids and give more accurate quantiles
+        count (float): Total weight of added values
+        min_value (Optional[float]): The smallest added value
+        max_value (Optional[float]): The greatest added value
+    """
+
+    def __init__(self, compression: int = DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.count = 0.0
+        self.min_value = None
+        self.max_value = None
+        self._means = []
+        self._weights = []
+        self._buffer = []
+
+    def add(self, value: float, weight: float = 1.0):
+        """
+        Add value
+
+        Args:
+            value (float): Added value
+            weight (float): Weight of the value
+        """
+        self._buffer.append((value, weight))
+        self.count += weight
+        self.min_value = value if self.min_value is None else min(self.min_value, value)
+        self.max_value = value if self.max_value is None else max(self.max_value, value)
+        if len(self._buffer) >= 5 * self.compression:
+            self._compress()
+
+    def merge(self, other: "TDigest"):
+        """
+        Add all values of other digest
+
+        Args:
+            other (TDigest): Merged digest
+        """
+        other._compress()
+        if other.count == 0:
+            return
+        self._buffer.extend(zip(other._means, other._weights))
+        self.count += other.count
+        self.min_value = other.min_value if self.min_value is None else min(self.min_value, other.min_value)
+        self.max_value = other.max_value if self.max_value is None else max(self.max_value, other.max_value)
+        self._compress()
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """
+        Estimate quantile of added values, interpolating linearly between centroids
+
+        Args:
+            fraction (float): Fraction of values less than the quantile, from 0 to 1
+
+        Returns:
+            Estimated quantile or None if no values were added
+        """
+        self._compress()
+        if not self._means:
+            return None
+        if fraction <= 0:
+            return self.min_value
+        if fraction >= 1:
+            return self.max_value
+        target = fraction * self.count
+        # Each centroid is placed at the middle of its weight, the smallest and the greatest value at both ends
+        previous_position, previous_value = 0.0, self.min_value
+        position = 0.0
+        for mean, weight in zip(self._means, self._weights):
+            center = position + weight / 2
+            if target <= center:
+                return self._interpolate(previous_position, previous_value, center, mean, target)
+            previous_position, previous_value = center, mean
+            position += weight
+        return self._interpolate(previous_position, previous_value, self.count, self.max_value, target)
+
+    @staticmethod
+    def _interpolate(left_position: float, left_value: float, right_position: float, right_value: float,
+                     target: float):
+        if right_position <= left_position:
+            return right_value
+        return left_value + (right_value - left_value) * (target - left_position) / (right_position - left_position)
+
+    def _scale(self, fraction: float):
+        return self.compression / (2 * math.pi) * math.asin(2 * min(max(fraction, 0.0), 1.0) - 1)
+
+    def _compress(self):
+        if not self._buffer:
+            return
+        centroids = sorted([*zip(self._means, self._weights), *self._buffer])
+        self._buffer = []
+        means, weights = [centroids[0][0]], [centroids[0][1]]
+        total = sum(weight for _, weight in centroids)
+        position = 0.0
+        limit = self._scale(0.0) + 1
+        for mean, weight in centroids[1:]:
+            if self._scale((position + weights[-1] + weight) / total) <= limit:
+                merged_weight = weights[-1] + weight
+                means[-1] += (mean - means[-1]) * weight / merged_weight
+                weights[-1] = merged_weight
+            else:
+                position += weights[-1]
+                limit = self._scale(position / total) + 1
+                means.append(mean)
+                weights.append(weight)
+        self._means, self._weights = means, weights
+
+
+class TimeSeriesStatistics:
+    """
+    Statistics of signal values of time series computed in one pass
+
+    Signal values can be added in chunks of columns, e.g. read from SignalStore, and statistics of chunks computed
+    separately can be merged. Mean and variance of values and of intervals between consecutive timestamps are
+    updated with Welford's algorithm, percentiles are estimated with TDigest. Values which are not numbers are
+    only counted.
+
+    Attributes:
+        type (Optional[Type]): Type of time series
+        count (int): Number of signal values
+        numeric_count (int): Number of signal values with numeric values
+        min_value (Optional[float]): The smallest numeric value
+        max_value (Optional[float]): The greatest numeric value
+        start_timestamp (Optional[int]): Timestamp of the first signal value
+        end_timestamp (Optional[int]): End timestamp of the last signal value
+        digest (TDigest): Distribution of numeric values
+    """
+
+    def __init__(self, time_series_type: Optional[Type] = None, compression: int = DEFAULT_COMPRESSION):
+        self.type = time_series_type
+        self.count = 0
+        self.numeric_count = 0
+        self.min_value = None
+        self.max_value = None
+        self.start_timestamp = None
+        self.end_timestamp = None
+        self.digest = TDigest(compression)
+        self._mean = 0.0
+        self._square_deviations = 0.0
+        self._last_timestamp = None
+        self._interval_count = 0
+        self._interval_mean = 0.0
+        self._interval_square_deviations = 0.0
+
+    def add_columns(self, columns: SignalColumns):
+        """
+        Add signal values following those already added
+
+        Args:
+            columns (SignalColumns): Signal values as columns, ordered by timestamp
+        """
+        if self.type is None:
+            self.type = columns.type
+        if len(columns) == 0:
+            return
+        if self.start_timestamp is None:
+            self.start_timestamp = columns.timestamps[0]
+        self.end_timestamp = columns.end_timestamps[len(columns) - 1]
+        self._add_timestamps(columns.timestamps)
+        self._add_values(columns.values)
+        self.count += len(columns)
+
+    def merge(self, other: "TimeSeriesStatistics"):
+        """
+        Add statistics of signal values following those already added, computed separately
+
+        Args:
+            other (TimeSeriesStatistics): Statistics of following signal values
+        """
+        if other.count == 0:
+            return
+        if self.count > 0 and self._last_timestamp is not None:
+            self._add_interval(other.start_timestamp - self._last_timestamp)
+        self._interval_count, self._interval_mean, self._interval_square_deviations = self._combine(
+            (self._interval_count, self._interval_mean, self._interval_square_deviations),
+            (other._interval_count, other._interval_mean, other._interval_square_deviations))
+        self.numeric_count, self._mean, self._square_deviations = self._combine(
+            (self.numeric_count, self._mean, self._square_deviations),
+            (other.numeric_count, other._mean, other._square_deviations))
+        if other.min_value is not None:
+            self.min_value = other.min_value if self.min_value is None else min(self.min_value, other.min_value)
+            self.max_value = other.max_value if self.max_value is None else max(self.max_value, other.max_value)
+        self.digest.merge(other.digest)
+        if self.start_timestamp is None:
+            self.start_timestamp = other.start_timestamp
+        self.end_timestamp = other.end_timestamp
+        self._last_timestamp = other._last_timestamp
+        self.count += other.count
+        self.type = self.type if self.type is not None else other.type
+
+    def get_statistics(self, time_series_id=None, percentiles: Sequence[float] = DEFAULT_PERCENTILES):
+        """
+        Get computed statistics
+
+        Args:
+            time_series_id: Id of time series
+            percentiles (Sequence[float]): Estimated percentiles, from 0 to 100
+
+        Returns:
+            Statistics as time series statistics object
+        """
+        mean_interval = self._interval_mean if self._interval_count > 0 else None
+        interval_std = math.sqrt(self._interval_square_deviations / self._interval_count) \
+            if self._interval_count > 0 else None
+        return TimeSeriesStatisticsOut(
+            id=time_series_id, type=self.type, count=self.count, numeric_count=self.numeric_count,
+            mean=self._mean if self.numeric_count > 0 else None,
+            std=math.sqrt(self._square_deviations / self.numeric_count) if self.numeric_count > 0 else None,
+            min_value=self.min_value, max_value=self.max_value,
+            percentiles={_format_percentile(percentile): self.digest.quantile(percentile / 100)
+                         for percentile in percentiles} if self.numeric_count > 0 else {},
+            start_timestamp=self.start_timestamp, end_timestamp=self.end_timestamp,
+            duration=self.end_timestamp - self.start_timestamp if self.count > 0 else None,
+            mean_interval=mean_interval, interval_std=interval_std,
+            irregularity=interval_std / mean_interval if mean_interval else None)
+
+    def _add_timestamps(self, timestamps: Sequence[int]):
+        previous = self._last_timestamp
+        for timestamp in timestamps:
+            if previous is not None:
+                self._add_interval(timestamp - previous)
+            previous = timestamp
+        self._last_timestamp = previous
+
+    def _add_interval(self, interval: float):
+        self._interval_count += 1
+        delta = interval - self._interval_mean
+        self._interval_mean += delta / self._interval_count
+        self._interval_square_deviations += delta * (interval - self._interval_mean)
+
+    def _add_values(self, values: Sequence):
+        for value in values:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                continue
+            if math.isnan(value):
+                continue
+            self.numeric_count += 1
+            delta = value - self._mean
+            self._mean += delta / self.numeric_count
+            self._square_deviations += delta * (value - self._mean)
+            if self.min_value is None or value < self.min_value:
+                self.min_value = value
+            if self.max_value is None or value > self.max_value:
+                self.max_value = value
+            self.digest.add(value)
+
+    @staticmethod
+    def _combine(first: tuple, second: tuple):
+        # Chan's formula combining counts, means and sums of squared deviations of two parts
+        first_count, first_mean, first_deviations = first
+        second_count, second_mean, second_deviations = second
+        count = first_count + second_count
+        if count == 0:
+            return 0, 0.0, 0.0
+        delta = second_mean - first_mean
+        return count, first_mean + delta * second_count / count, \
+            first_deviations + second_deviations + delta ** 2 * first_count * second_count / count
+
+
+def _format_percentile(percentile: float):
+    return f"{percentile:g}"
+
+
+def compute_time_series_statistics(time_series: TimeSeriesOut, percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+                                   compression: int = DEFAULT_COMPRESSION):
+    """
+    Compute statistics of signal values of time series in one pass
+
+    Args:
+        time_series (TimeSeriesOut): Time series with signal values
+        percentiles (Sequence[float]): Estimated percentiles, from 0 to 100
+        compression (int): Compression of TDigest estimating percentiles
+
+    Returns:
+        Statistics as time series statistics object
+    """
+    statistics = TimeSeriesStatistics(time_series.type, compression)
+    statistics.add_columns(SignalColumns.from_time_series(time_series))
+    return statistics.get_statistics(time_series.id, percentiles)
+
+
+def parse_percentiles(percentiles: Optional[str]) -> List[float]:
+    """
+    Parse comma separated percentiles
+
+    Args:
+        percentiles (Optional[str]): Comma separated numbers from 0 to 100, default percentiles if not given
+
+    Returns:
+        List of percentiles
+
+    Raises:
+        ValueError: When any percentile is not a number from 0 to 100
+    """
+    if percentiles is None or not percentiles.strip():
+        return list(DEFAULT_PERCENTILES)
+    parsed_percentiles = [float(percentile) for percentile in percentiles.split(",")]
+    for percentile in parsed_percentiles:
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"percentile {percentile:g} should be between 0 and 100")
+    return parsed_percentiles
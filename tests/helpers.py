@@ -0,0 +1,104 @@
+import asyncio
+import json
+import math
+import random
+
+from grisera.services.not_implemented_service_factory import NotImplementedServiceFactory
+from grisera.time_series.time_series_model import TimeSeriesIn, TimeSeriesOut, Type
+from grisera.time_series.time_series_service import TimeSeriesService
+
+
+def generate_time_series(size: int, series_type: Type = Type.timestamp, period: int = 4, seed: int = 0):
+    """
+    Generate time series of a sine wave with noise sampled every `period` milliseconds with a small jitter
+
+    Args:
+        size (int): Number of signal values
+        series_type (Type): Type of the time series, epoch signal values last half of the period
+        period (int): Mean difference between timestamps in milliseconds
+        seed (int): Seed of random generator
+
+    Returns:
+        Time series object
+    """
+    generator = random.Random(seed)
+    signal_values = []
+    timestamp = 0
+    for index in range(size):
+        timestamp += period + generator.randint(-period // 4, period // 4) if index > 0 else 0
+        value = round(100 * math.sin(index / 50) + generator.gauss(0, 10), 3)
+        if series_type == Type.timestamp:
+            timestamp_properties = [{"key": "timestamp", "value": timestamp}]
+        else:
+            timestamp_properties = [{"key": "start_timestamp", "value": timestamp},
+                                    {"key": "end_timestamp", "value": timestamp + period // 2}]
+        signal_values.append({
+            "signal_value": {"labels": ["Signal Value"], "id": 2 * index + 2,
+                             "properties": [{"key": "value", "value": value}]},
+            "timestamp": {"labels": ["Timestamp"], "id": 2 * index + 1, "properties": timestamp_properties}
+        })
+    return TimeSeriesOut(id=0, type=series_type, signal_values=signal_values)
+
+
+class InMemoryTimeSeriesService(TimeSeriesService):
+    """
+    Time series service keeping saved time series in a dictionary
+
+    Attributes:
+        time_series (dict): Time series by id
+    """
+
+    def __init__(self):
+        self.time_series = {}
+
+    def save_time_series(self, time_series: TimeSeriesIn):
+        time_series_id = len(self.time_series)
+        self.time_series[time_series_id] = TimeSeriesOut(id=time_series_id, type=time_series.type,
+                                                         additional_properties=time_series.additional_properties)
+        return self.time_series[time_series_id]
+
+
+class InMemoryServiceFactory(NotImplementedServiceFactory):
+    def __init__(self, time_series_service: TimeSeriesService):
+        self.time_series_service = time_series_service
+
+    def get_time_series_service(self) -> TimeSeriesService:
+        return self.time_series_service
+
+
+def call_app(app, method: str, path: str, body=None, query_string: str = ""):
+    """
+    Call ASGI application in process without a server
+
+    Args:
+        app: ASGI application
+        method (str): HTTP method
+        path (str): Request path
+        body: Object sent as JSON body
+        query_string (str): Query string without leading question mark
+
+    Returns:
+        Tuple of status code and response body
+    """
+    request_body = json.dumps(body).encode() if body is not None else b""
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method, "scheme": "http",
+             "path": path, "root_path": "", "query_string": query_string.encode(), "server": ("test", 80),
+             "headers": [(b"content-type", b"application/json")]}
+    messages = []
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": request_body, "more_body": False}
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    status = next(message["status"] for message in messages if message["type"] == "http.response.start")
+    response_body = b"".join(message.get("body", b"") for message in messages
+                             if message["type"] == "http.response.body")
+    return status, response_body
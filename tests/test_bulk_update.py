@@ -0,0 +1,39 @@
+import json
+
+from fastapi import FastAPI
+
+from grisera.measure.measure_model import MeasureOut
+from grisera.measure.measure_router import router as measure_router
+from grisera.measure.measure_service import MeasureService
+from grisera.models.not_found_model import NotFoundByIdModel
+from grisera.services.not_implemented_service_factory import NotImplementedServiceFactory
+from grisera.services.service import service
+from helpers import call_app
+
+
+class FoundMeasureService(MeasureService):
+    def update_measure_relationships(self, measure_id, measure):
+        if str(measure_id) != "1":
+            return NotFoundByIdModel(id=measure_id, errors={"errors": "measure not found"})
+        return MeasureOut(id=measure_id, datatype="Time series", range="Unlimited")
+
+
+class MeasureServiceFactory(NotImplementedServiceFactory):
+    def get_measure_service(self) -> MeasureService:
+        return FoundMeasureService()
+
+
+def test_bulk_update_with_found_and_not_found_ids():
+    app = FastAPI()
+    app.include_router(measure_router)
+    app.dependency_overrides[service.get_service_factory] = MeasureServiceFactory
+
+    status, body = call_app(app, "PUT", "/measures/relationships",
+                            [{"id": 1, "relationships": {}}, {"id": 2, "relationships": {}}])
+
+    response = json.loads(body)
+    assert status == 404
+    assert response["error_count"] == 1
+    assert response["errors"] == [{"index": 1, "errors": {"errors": "measure not found"}}]
+    assert response["results"][0]["datatype"] == "Time series"
+    assert response["results"][1] == {"id": 2, "errors": {"errors": "measure not found"}, "links": None}
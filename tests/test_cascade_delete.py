@@ -0,0 +1,73 @@
+from grisera.models.base_model_out import BaseModelOut
+from grisera.observable_information.observable_information_model import ObservableInformationOut
+from grisera.observable_information.observable_information_service import ObservableInformationService
+from grisera.recording.recording_model import RecordingOut
+from grisera.recording.recording_service import RecordingService
+from grisera.services.cascade_delete import CascadeDeleter, TIME_SERIES, OBSERVABLE_INFORMATION, RECORDING
+from grisera.services.not_implemented_service_factory import NotImplementedServiceFactory
+from grisera.time_series.time_series_service import TimeSeriesService
+
+
+class GraphRecordingService(RecordingService):
+    def get_recording(self, recording_id, depth=0):
+        return RecordingOut.construct(id=recording_id, errors=None, observable_informations=[{"id": 10}])
+
+    def delete_recording(self, recording_id):
+        return BaseModelOut()
+
+
+class GraphObservableInformationService(ObservableInformationService):
+    def get_observable_information(self, observable_information_id, depth=0):
+        return ObservableInformationOut.construct(id=observable_information_id, errors=None,
+                                                  timeSeries=[{"id": 100}, {"id": 200}])
+
+    def delete_observable_information(self, observable_information_id):
+        return BaseModelOut()
+
+
+class GraphTimeSeriesService(TimeSeriesService):
+    def __init__(self):
+        self.deleted = []
+        self.relationships = {}
+
+    def get_time_series_observable_information_ids(self, time_series_id):
+        # Time series 200 is shared with observable information of another recording
+        return [10] if time_series_id == 100 else [10, 11]
+
+    def count_time_series_signal_values(self, time_series_id):
+        return 5
+
+    def delete_time_series(self, time_series_id):
+        self.deleted.append(time_series_id)
+        return BaseModelOut()
+
+    def update_time_series_relationships(self, time_series_id, time_series):
+        self.relationships[time_series_id] = time_series.observable_information_ids
+        return BaseModelOut()
+
+
+class GraphServiceFactory(NotImplementedServiceFactory):
+    def __init__(self):
+        self.time_series_service = GraphTimeSeriesService()
+
+    def get_recording_service(self):
+        return GraphRecordingService()
+
+    def get_observable_information_service(self):
+        return GraphObservableInformationService()
+
+    def get_time_series_service(self):
+        return self.time_series_service
+
+
+def test_time_series_shared_with_kept_observable_information_is_unlinked():
+    service_factory = GraphServiceFactory()
+
+    result = CascadeDeleter(service_factory).delete_recording(1)
+
+    assert result.errors is None
+    assert result.nodes[TIME_SERIES] == ["100"]
+    assert result.kept == {TIME_SERIES: ["200"]}
+    assert result.deleted[OBSERVABLE_INFORMATION] == 1 and result.deleted[RECORDING] == 1
+    assert service_factory.time_series_service.deleted == ["100"]
+    assert service_factory.time_series_service.relationships == {200: ["11"]}
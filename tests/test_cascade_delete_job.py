@@ -0,0 +1,60 @@
+import time
+
+from grisera.job.job_handlers import CASCADE_DELETE
+from grisera.job.job_model import JobStatus
+from grisera.job.job_service import JobService
+from grisera.models.cascade_delete_model import CascadeDeleteJobIn
+from grisera.services.cascade_delete import TIME_SERIES, SIGNAL_VALUE
+from grisera.services.not_implemented_service_factory import NotImplementedServiceFactory
+from grisera.services.service import service
+from grisera.time_series.time_series_model import TimeSeriesOut, Type
+from grisera.time_series.time_series_service import TimeSeriesService
+
+
+class BatchDeletingTimeSeriesService(TimeSeriesService):
+    def __init__(self, signal_value_count):
+        self.signal_value_count = signal_value_count
+        self.deleted = False
+
+    def count_time_series_signal_values(self, time_series_id):
+        return self.signal_value_count
+
+    def delete_time_series_signal_values(self, time_series_id, limit):
+        batch_count = min(limit, self.signal_value_count)
+        self.signal_value_count -= batch_count
+        return batch_count
+
+    def delete_time_series(self, time_series_id):
+        self.deleted = True
+        return TimeSeriesOut(id=time_series_id, type=Type.timestamp)
+
+
+class TimeSeriesServiceFactory(NotImplementedServiceFactory):
+    def __init__(self, time_series_service):
+        self.time_series_service = time_series_service
+
+    def get_time_series_service(self) -> TimeSeriesService:
+        return self.time_series_service
+
+
+def test_cascade_delete_job_deletes_time_series_in_batches():
+    time_series_service = BatchDeletingTimeSeriesService(25000)
+    previous_service_factory = service.service_factory
+    service.service_factory = TimeSeriesServiceFactory(time_series_service)
+    job_service = JobService(worker_count=1)
+    try:
+        job = job_service.submit_job(CASCADE_DELETE, CascadeDeleteJobIn(label=TIME_SERIES, id=1))
+        deadline = time.monotonic() + 10
+        while job_service.get_job(job.id).status not in (JobStatus.succeeded, JobStatus.failed) \
+                and time.monotonic() < deadline:
+            time.sleep(0.01)
+        job = job_service.get_job(job.id)
+    finally:
+        job_service.stop()
+        service.service_factory = previous_service_factory
+
+    assert job.status == JobStatus.succeeded, job.errors
+    assert job.progress == 1
+    assert job.result["deleted"] == {TIME_SERIES: 1, SIGNAL_VALUE: 25000}
+    assert time_series_service.deleted
+    assert time_series_service.signal_value_count == 0
@@ -0,0 +1,28 @@
+from grisera.time_series.time_series_model import DownsamplingMethod, Type
+from grisera.time_series.ts_downsampling import select_signal_values
+
+
+def signal_values(values):
+    return [{"timestamp": {"properties": [{"key": "timestamp", "value": index}]},
+             "signal_value": {"id": index, "properties": [{"key": "value", "value": value}]}}
+            for index, value in enumerate(values)]
+
+
+def test_non_numeric_values_are_skipped():
+    values = signal_values(["a", 1, "b", 5, "c", 2, "d", 7] * 10)
+
+    for method in DownsamplingMethod:
+        selected = select_signal_values(values, Type.timestamp, max_points=10, method=method)
+
+        assert 0 < len(selected) <= 10
+        assert any(isinstance(value["signal_value"]["properties"][0]["value"], int) for value in selected)
+
+
+def test_string_series_is_downsampled():
+    values = signal_values([str(index) + "x" for index in range(100)])
+
+    for method in DownsamplingMethod:
+        selected = select_signal_values(values, Type.timestamp, max_points=10, method=method)
+
+        assert selected[0] == values[0]
+        assert 0 < len(selected) <= 10
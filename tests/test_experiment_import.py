@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from grisera.experiment.experiment_archive import ExperimentImporter, ARCHIVE_FORMAT, ARCHIVE_VERSION
+from grisera.experiment.experiment_model import ExperimentOut
+from grisera.experiment.experiment_service import ExperimentService
+from grisera.participant.participant_model import ParticipantOut
+from grisera.participant.participant_service import ParticipantService
+from grisera.participant_state.participant_state_model import ParticipantStateOut
+from grisera.participant_state.participant_state_service import ParticipantStateService
+from grisera.services.not_implemented_service_factory import NotImplementedServiceFactory
+
+
+class CreatingExperimentService(ExperimentService):
+    def save_experiment(self, experiment):
+        return ExperimentOut(id=1, **experiment.dict())
+
+
+class FailingParticipantService(ParticipantService):
+    def save_participant(self, participant):
+        return ParticipantOut(errors="participant was not saved")
+
+
+class RecordingParticipantStateService(ParticipantStateService):
+    def __init__(self):
+        self.saved = []
+
+    def save_participant_state(self, participant_state):
+        self.saved.append(participant_state)
+        return ParticipantStateOut(id=len(self.saved), **participant_state.dict())
+
+
+class ImportServiceFactory(NotImplementedServiceFactory):
+    def __init__(self):
+        self.participant_state_service = RecordingParticipantStateService()
+
+    def get_experiment_service(self):
+        return CreatingExperimentService()
+
+    def get_participant_service(self):
+        return FailingParticipantService()
+
+    def get_participant_state_service(self):
+        return self.participant_state_service
+
+
+def test_relation_to_node_which_was_not_created_is_dropped():
+    service_factory = ImportServiceFactory()
+    importer = ExperimentImporter(service_factory)
+    for record in [{"format": ARCHIVE_FORMAT, "version": ARCHIVE_VERSION},
+                   {"record": "node", "label": "Experiment", "id": 10, "properties": {"experiment_name": "test"}},
+                   {"record": "node", "label": "Participant", "id": 20, "properties": {"name": "test"}},
+                   {"record": "node", "label": "ParticipantState", "id": 30, "properties": {"participant_id": 20}}]:
+        importer.import_line(json.dumps(record))
+
+    assert importer.finish() == 1
+    assert service_factory.participant_state_service.saved[0].participant_id is None
+    assert {"label": "ParticipantState", "id": 30, "errors": "participant_id 20 was not created"} in importer.errors
+
+
+def test_unsupported_archive_is_rejected():
+    with pytest.raises(ValueError):
+        ExperimentImporter(ImportServiceFactory()).import_line(json.dumps({"format": "other"}))
@@ -0,0 +1,39 @@
+from grisera.property.property_model import PropertyIn
+from grisera.time_series.time_series_model import TimeSeriesOut
+from grisera.time_series.transformation.TimeSeriesTransformationQuadrants import TimeSeriesTransformationQuadrants
+from grisera.time_series.transformation.TimeSeriesTransformationResample import TimeSeriesTransformationResample
+from grisera.time_series.ts_columns import ColumnSignalValues, SignalColumns
+from helpers import generate_time_series
+
+
+def chunks(time_series, size, columns):
+    signal_values = time_series.signal_values
+    for begin in range(0, len(signal_values), size):
+        chunk = signal_values[begin:begin + size]
+        if columns:
+            chunk = ColumnSignalValues(SignalColumns.from_signal_values(chunk, time_series.type))
+        yield TimeSeriesOut.construct(type=time_series.type, signal_values=chunk)
+
+
+def transform_incremental(transformation, time_series, additional_properties, columns):
+    signal_values = []
+    state = None
+    parts = list(zip(*(chunks(single_time_series, 300, columns) for single_time_series in time_series)))
+    for index, part in enumerate(parts):
+        result, _, state = transformation.transform_incremental(list(part), list(additional_properties), state,
+                                                                final=index == len(parts) - 1)
+        signal_values.extend(result.signal_values)
+    return signal_values
+
+
+def test_incremental_transformations_accept_column_signal_values():
+    time_series = generate_time_series(1000, seed=1)
+    other_time_series = generate_time_series(1000, seed=2)
+    cases = [(TimeSeriesTransformationResample(), [time_series], [PropertyIn(key="period", value="7")]),
+             (TimeSeriesTransformationQuadrants(), [time_series, other_time_series], [])]
+
+    for transformation, sources, additional_properties in cases:
+        expected = transform_incremental(transformation, sources, additional_properties, columns=False)
+
+        assert expected
+        assert transform_incremental(transformation, sources, additional_properties, columns=True) == expected
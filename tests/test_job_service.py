@@ -0,0 +1,87 @@
+import threading
+import time
+
+from grisera.job.job_model import JobStatus
+from grisera.job.job_queue import SQLiteJobQueue, InMemoryJobQueue
+from grisera.job.job_service import JobService
+from grisera.models.base_model_out import BaseModelOut
+
+
+def wait_for_job(job_service, job_id, timeout=10):
+    deadline = time.monotonic() + timeout
+    job = job_service.get_job(job_id)
+    while job.status not in (JobStatus.succeeded, JobStatus.failed) and time.monotonic() < deadline:
+        time.sleep(0.01)
+        job = job_service.get_job(job_id)
+    return job
+
+
+def test_job_without_heartbeat_is_taken_by_another_worker(tmp_path):
+    queue = SQLiteJobQueue(str(tmp_path / "jobs.db"), poll_interval=0.01, stale_timeout=0.1)
+    job = queue.put("operation", {})
+
+    assert queue.take(timeout=0, worker_id="first")[0] == job.id
+    queue.heartbeat(job.id)
+    assert queue.take(timeout=0, worker_id="second") is None
+    time.sleep(0.2)
+    assert queue.take(timeout=0, worker_id="second")[0] == job.id
+
+
+class FailingOnceJobQueue(InMemoryJobQueue):
+    def __init__(self):
+        super().__init__()
+        self.failed = False
+
+    def take(self, timeout, worker_id=None):
+        if not self.failed:
+            self.failed = True
+            raise Exception("queue is not available")
+        return super().take(timeout, worker_id)
+
+
+def test_worker_survives_queue_errors():
+    job_service = JobService(FailingOnceJobQueue(), worker_count=1)
+    job_service.register_handler("operation", lambda service_factory, arguments, report_progress: BaseModelOut())
+    try:
+        job = job_service.submit_job("operation", BaseModelOut())
+        job = wait_for_job(job_service, job.id)
+    finally:
+        job_service.stop()
+
+    assert job.status == JobStatus.succeeded
+
+
+def test_restart_does_not_revive_stopped_workers():
+    released = threading.Event()
+    job_service = JobService(worker_count=1)
+    job_service.register_handler("operation",
+                                 lambda service_factory, arguments, report_progress: released.wait() and BaseModelOut())
+    job = job_service.submit_job("operation", BaseModelOut())
+    while job_service.get_job(job.id).status != JobStatus.running:
+        time.sleep(0.01)
+    old_workers = list(job_service._workers)
+    job_service.stop(timeout=0.01)
+    job_service.start()
+    released.set()
+    try:
+        for worker in old_workers:
+            worker.join(5)
+            assert not worker.is_alive()
+        assert wait_for_job(job_service, job.id).status == JobStatus.succeeded
+    finally:
+        job_service.stop()
+
+
+def test_worker_which_lost_job_does_not_change_it(tmp_path):
+    queue = SQLiteJobQueue(str(tmp_path / "jobs.db"), poll_interval=0.01, stale_timeout=0.1)
+    job = queue.put("operation", {})
+    queue.take(timeout=0, worker_id="first")
+    time.sleep(0.2)
+    queue.take(timeout=0, worker_id="second")
+
+    queue.heartbeat(job.id, "first")
+    queue.update(job.id, "first", status=JobStatus.failed.value, errors="lost")
+    assert queue.get(job.id).status == JobStatus.running
+
+    queue.update(job.id, "second", status=JobStatus.succeeded.value, result=1)
+    assert queue.get(job.id).status == JobStatus.succeeded
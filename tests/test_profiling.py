@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+from grisera.helpers.profiling import ProfilingMiddleware, profile_phase
+
+
+def busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+async def profiled_endpoint():
+    for _ in range(10):
+        with profile_phase("profiled"):
+            busy(0.02)
+        await asyncio.sleep(0)
+
+
+async def concurrent_endpoint():
+    for _ in range(10):
+        busy(0.02)
+        await asyncio.sleep(0)
+
+
+async def app(scope, receive, send):
+    if scope["path"] == "/profiled":
+        await profiled_endpoint()
+    else:
+        await concurrent_endpoint()
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+def test_concurrent_request_not_in_profile(tmp_path):
+    middleware = ProfilingMiddleware(app, output_dir=str(tmp_path), enabled=True, min_interval=0,
+                                     sampling_interval=0.001, formats=["collapsed"])
+
+    async def request(path):
+        scope = {"type": "http", "method": "GET", "path": path, "headers": []}
+
+        async def receive():
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            pass
+
+        await middleware(scope, receive, send)
+
+    async def run():
+        await asyncio.gather(request("/profiled"), request("/concurrent"))
+
+    asyncio.run(run())
+
+    profiles = list(tmp_path.iterdir())
+    assert len(profiles) == 1
+    lines = profiles[0].read_text().splitlines()
+    assert lines
+    assert all("concurrent_endpoint" not in line for line in lines)
+    assert all(line.startswith("[profiled]") for line in lines if "busy" in line)
@@ -0,0 +1,19 @@
+from grisera.time_series.time_series_model import Type
+from grisera.time_series.ts_columns import SignalColumns
+from grisera.time_series.ts_shared_memory import SharedSignalColumns, read_shared_columns, encode_column, \
+    decode_column, PICKLED_COLUMN, PICKLED_CHUNK_SIZE
+
+
+def test_mixed_column_ranges_read_from_pickled_chunks():
+    size = 2 * PICKLED_CHUNK_SIZE + 10
+    values = [str(index) if index % 3 else float(index) for index in range(size)]
+    encoding, data, offsets = encode_column(values)
+    assert encoding == PICKLED_COLUMN
+    assert decode_column(encoding, data, offsets) == values
+
+    columns = SignalColumns(Type.timestamp, list(range(size)), list(range(size)), values, list(range(size)))
+    with SharedSignalColumns(columns) as shared_columns:
+        for first_index, last_index in [(0, size), (PICKLED_CHUNK_SIZE - 1, PICKLED_CHUNK_SIZE + 1),
+                                        (PICKLED_CHUNK_SIZE, 2 * PICKLED_CHUNK_SIZE), (size - 1, size), (5, 5)]:
+            assert read_shared_columns(shared_columns.handle, first_index, last_index).values == \
+                values[first_index:last_index]
@@ -0,0 +1,26 @@
+import pytest
+
+from grisera.time_series.time_series_model import Type
+from grisera.time_series.ts_signal_store import SignalStore, get_value_kind, STRING_VALUES, INTEGER_VALUES, \
+    FLOAT_VALUES
+
+
+def test_value_kind_keeps_values_unchanged():
+    assert get_value_kind(["1", "2"]) == INTEGER_VALUES
+    assert get_value_kind(["1.5", "0.1"]) == FLOAT_VALUES
+    for values in (["007"], ["1e3"], ["nan"], [" 5"], ["1", "2.5"]):
+        assert get_value_kind(values) == STRING_VALUES
+
+
+def test_appending_strings_converts_numeric_time_series(tmp_path):
+    store = SignalStore(str(tmp_path))
+    store.create(1, Type.timestamp, get_value_kind(["1.5", "2"]))
+    store.append(1, [1, 2], ["1.5", "2.5"])
+    store.append(1, [3, 4], ["happy", "007"])
+
+    assert list(store.read_columns(1).values) == ["1.5", "2.5", "happy", "007"]
+
+
+def test_time_series_id_outside_store_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        SignalStore(str(tmp_path)).exists("../other")
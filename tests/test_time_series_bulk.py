@@ -0,0 +1,33 @@
+import json
+
+from fastapi import FastAPI
+
+from grisera.services.service import service
+from grisera.time_series.time_series_model import TimeSeriesIn, TimeSeriesOut
+from grisera.time_series.time_series_router import router as time_series_router
+from helpers import InMemoryTimeSeriesService, InMemoryServiceFactory, call_app
+
+
+class NonEmptyTimeSeriesService(InMemoryTimeSeriesService):
+    def save_time_series(self, time_series: TimeSeriesIn):
+        if not time_series.signal_values:
+            return TimeSeriesOut(type=time_series.type, errors="signal values are required")
+        return super().save_time_series(time_series)
+
+
+def test_bulk_create_with_valid_and_invalid_time_series():
+    time_series_service = NonEmptyTimeSeriesService()
+    app = FastAPI()
+    app.include_router(time_series_router)
+    app.dependency_overrides[service.get_service_factory] = lambda: InMemoryServiceFactory(time_series_service)
+
+    status, body = call_app(app, "POST", "/time_series/bulk", [
+        {"type": "Timestamp", "signal_values": [{"timestamp": 1, "signal_value": {"value": 5}}]},
+        {"type": "Timestamp", "signal_values": []}])
+
+    response = json.loads(body)
+    assert status == 422
+    assert response["error_count"] == 1
+    assert response["errors"] == [{"index": 1, "errors": "signal values are required"}]
+    assert response["results"][0]["id"] == 0
+    assert list(time_series_service.time_series) == [0]
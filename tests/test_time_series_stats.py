@@ -0,0 +1,30 @@
+import json
+
+from fastapi import FastAPI
+
+from grisera.services.service import service
+from grisera.time_series.time_series_router import router as time_series_router
+from helpers import InMemoryTimeSeriesService, InMemoryServiceFactory, call_app
+
+
+def get_statistics(query_string):
+    app = FastAPI()
+    app.include_router(time_series_router)
+    app.dependency_overrides[service.get_service_factory] = \
+        lambda: InMemoryServiceFactory(InMemoryTimeSeriesService())
+    status, body = call_app(app, "GET", "/time_series/stats", query_string=query_string)
+    return status, json.loads(body)
+
+
+def test_time_series_are_required():
+    status, response = get_statistics("percentiles=50")
+
+    assert status == 422
+    assert response["errors"] == "time_series_ids or filter parameters are required"
+
+
+def test_time_series_ids_cannot_be_combined_with_filter():
+    status, response = get_statistics("time_series_ids=1,2&participant_id=1")
+
+    assert status == 422
+    assert response["errors"] == "time_series_ids cannot be combined with filter parameters"
@@ -0,0 +1,22 @@
+from grisera.property.property_model import PropertyIn
+from grisera.time_series.time_series_model import TimeSeriesTransformationStepIn
+from grisera.time_series.transformation.TimeSeriesTransformationExecutor import TimeSeriesTransformationExecutor
+from grisera.time_series.transformation.TimeSeriesTransformationPipeline import TimeSeriesTransformationPipeline
+from helpers import generate_time_series
+
+
+def test_chunked_pipeline_equals_serial():
+    time_series = [generate_time_series(20000, seed=1)]
+    steps = [TimeSeriesTransformationStepIn(name="resample_nearest",
+                                            additional_properties=[PropertyIn(key="period", value="7")]),
+             TimeSeriesTransformationStepIn(name="window_mean",
+                                            additional_properties=[PropertyIn(key="window", value="50")])]
+
+    serial_time_series, serial_id_mapping = TimeSeriesTransformationPipeline(
+        parallel_min_signal_values=len(time_series[0].signal_values) + 1).run(time_series, steps)
+    with TimeSeriesTransformationExecutor(max_workers=4, min_chunk_size=2000) as executor:
+        chunked_time_series, chunked_id_mapping = TimeSeriesTransformationPipeline(executor).run(time_series, steps)
+
+    assert len(serial_time_series.signal_values) > 1000
+    assert chunked_time_series.signal_values == serial_time_series.signal_values
+    assert chunked_id_mapping == serial_id_mapping
@@ -0,0 +1,35 @@
+import pytest
+from pydantic import ValidationError
+
+from grisera.time_series.time_series_model import TimeSeriesTransformationIn, TimeSeriesTransformationPipelineIn
+from grisera.time_series.transformation.TimeSeriesTransformation import TimeSeriesTransformation
+from grisera.time_series.transformation.TimeSeriesTransformationRegistry import TimeSeriesTransformationRegistry, \
+    TransformationCapabilities
+
+
+class StatefulTransformation(TimeSeriesTransformation):
+    pass
+
+
+def test_instance_is_shared_only_when_parallel_safe():
+    registry = TimeSeriesTransformationRegistry(entry_point_group="grisera.tests")
+    registry.register("shared", StatefulTransformation)
+    registry.register("stateful", StatefulTransformation, TransformationCapabilities(parallel_safe=False))
+
+    assert registry.get_transformation("shared") is registry.get_transformation("shared")
+    assert registry.get_transformation("stateful") is not registry.get_transformation("stateful")
+
+
+def test_number_of_inputs_is_checked():
+    with pytest.raises(ValidationError, match="requires 2 input time series, 1 given"):
+        TimeSeriesTransformationIn(name="quadrants", source_time_series_ids=[1])
+    with pytest.raises(ValidationError, match="requires 1 input time series, 2 given"):
+        TimeSeriesTransformationPipelineIn(source_time_series_ids=[1, 2], steps=[{"name": "resample_nearest"}])
+    with pytest.raises(ValidationError, match="requires 2 input time series, 1 given"):
+        TimeSeriesTransformationPipelineIn(source_time_series_ids=[1, 2],
+                                           steps=[{"name": "resample_nearest", "inputs": [0]}, {"name": "quadrants"}])
+
+    TimeSeriesTransformationPipelineIn(source_time_series_ids=[1, 2],
+                                       steps=[{"name": "resample_nearest", "inputs": [0]},
+                                              {"name": "resample_nearest", "inputs": [1]},
+                                              {"name": "quadrants", "inputs": [2, 3]}])
@@ -0,0 +1,30 @@
+import pytest
+
+from grisera.time_series.ts_filter import parse_time_series_filter
+
+
+def test_values_are_strings_unless_property_is_numeric():
+    query_filter = parse_time_series_filter([("recording_source", "007"), ("participantstate_age__between", "20,30.5"),
+                                             ("recording_id__in", "1,a2")])
+    values = {condition.property_name: condition.value for condition in query_filter.conditions}
+
+    assert values == {"source": "007", "age": [20, 30.5], "id": [1, "a2"]}
+
+
+def test_numeric_property_requires_numbers():
+    with pytest.raises(ValueError):
+        parse_time_series_filter([("participantstate_age", "young")])
+
+
+def test_format_parameter_is_ignored():
+    query_filter = parse_time_series_filter([("entityname_property_name", "value"), ("participant_sex", "male")])
+
+    assert [condition.entity for condition in query_filter.conditions] == ["participant"]
+
+
+def test_conditions_are_ordered_by_entity_cardinalities():
+    params = [("experiment_id", "1"), ("participant_id", "1")]
+
+    assert parse_time_series_filter(params).entity_order == ["participant", "experiment"]
+    assert parse_time_series_filter(params, {"experiment": 1000, "participant": 10}).entity_order == \
+        ["experiment", "participant"]